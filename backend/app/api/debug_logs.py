@@ -39,3 +39,78 @@ async def get_picklist_logs(lines: int = 100):
     except Exception as e:
         logging.error(f"Error reading picklist logs: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error reading logs: {str(e)}")
+
+
+@router.get("/sheets-api", response_model=Dict[str, Any])
+async def get_sheets_api_timings():
+    """
+    Get per-operation timings for Google Sheets API calls.
+    This is a debugging endpoint to see how long Sheets requests take.
+    """
+    from app.services.sheets_service import get_sheets_api_stats
+
+    return {"status": "success", "stats": get_sheets_api_stats()}
+
+
+@router.get("/picklist-pool", response_model=Dict[str, Any])
+async def get_picklist_pool_stats():
+    """
+    Get warm picklist generator pool, dataset registry, result and prompt fragment cache statistics.
+    This is a debugging endpoint to see how often setup work is reused.
+    """
+    from app.services.dataset_registry import dataset_registry
+    from app.services.picklist_generator_pool import picklist_generator_pool
+    from app.services.picklist_result_cache import picklist_result_cache
+    from app.services.prompt_fragment_cache import prompt_fragment_cache
+
+    return {
+        "status": "success",
+        "pool": picklist_generator_pool.get_stats(),
+        "datasets": dataset_registry.get_stats(),
+        "results": picklist_result_cache.get_stats(),
+        "prompt_fragments": prompt_fragment_cache.get_stats(),
+    }
+
+
+@router.get("/llm-cache", response_model=Dict[str, Any])
+async def get_llm_cache_stats():
+    """
+    Get LLM response cache statistics.
+    This is a debugging endpoint to see how many completions are served from disk.
+    """
+    from app.services.llm_response_cache import llm_response_cache
+
+    return {"status": "success", "cache": llm_response_cache.get_stats()}
+
+
+@router.delete("/llm-cache", response_model=Dict[str, Any])
+async def clear_llm_cache():
+    """
+    Remove every cached LLM response so the next requests go to the API.
+    """
+    from app.services.llm_response_cache import llm_response_cache
+
+    removed = llm_response_cache.clear()
+    return {"status": "success", "removed": removed}
+
+
+@router.get("/jobs", response_model=Dict[str, Any])
+async def get_job_queue_stats():
+    """
+    Get background job queue statistics.
+    This is a debugging endpoint to see queued, running and finished jobs.
+    """
+    from app.services.job_queue import job_queue
+
+    return {"status": "success", "queue": job_queue.get_stats()}
+
+
+@router.get("/llm-gateway", response_model=Dict[str, Any])
+async def get_llm_gateway_stats():
+    """
+    Get OpenAI rate-limit gateway metrics.
+    This is a debugging endpoint to see queue depth per priority lane and remaining capacity.
+    """
+    from app.services.llm_gateway import llm_gateway
+
+    return {"status": "success", "gateway": llm_gateway.get_stats()}
@@ -1,9 +1,10 @@
 # backend/app/api/picklist_analysis.py
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 
+from app.services.metric_matrix_service import get_team_metric_table
 from app.services.picklist_analysis_service import PicklistAnalysisService
 
 router = APIRouter()
@@ -21,6 +22,21 @@ class PicklistAnalysisRequest(BaseModel):
     strategy_prompt: Optional[str] = None
 
 
+class WeightRankingRequest(BaseModel):
+    unified_dataset_path: str
+    weights: Dict[str, float]
+
+
+class RankSensitivityRequest(BaseModel):
+    unified_dataset_path: str
+    weights: Dict[str, float]
+    samples: int = Field(10000, ge=100, le=100000, description="Number of weight perturbations")
+    spread: float = Field(0.25, gt=0, le=2.0, description="Std. dev. of the log weight multipliers")
+    top_n: int = Field(8, ge=1, description="Cut-off for the top-N probability")
+    confidence: float = Field(0.9, gt=0, lt=1, description="Width of the rank interval")
+    seed: Optional[int] = None
+
+
 @router.post("/picklist/analyze")
 async def analyze_picklist_data(request: PicklistAnalysisRequest):
     """
@@ -54,7 +70,7 @@ async def analyze_picklist_data(request: PicklistAnalysisRequest):
         # If strategy prompt is provided, parse it into priorities using GPT
         parsed_priorities = None
         if request.strategy_prompt:
-            parsed_priorities = analysis_service.parse_strategy_prompt(request.strategy_prompt)
+            parsed_priorities = await analysis_service.parse_strategy_prompt(request.strategy_prompt)
 
         # Generate team rankings if priorities are provided
         team_rankings = None
@@ -92,6 +108,64 @@ async def analyze_picklist_data(request: PicklistAnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Error analyzing picklist data: {str(e)}")
 
 
+@router.post("/picklist/rank-weights")
+async def rank_teams_by_weights(request: WeightRankingRequest):
+    """
+    Re-rank teams for a set of metric weights.
+
+    This is a lightweight "what-if" endpoint for live priority sliders: it only
+    scores the precomputed team x metric table, so it returns team numbers and
+    scores without metric breakdowns.
+    """
+    try:
+        team_table = get_team_metric_table(request.unified_dataset_path)
+        rankings = team_table.rank(request.weights)
+
+        return {
+            "status": "success",
+            "rankings": rankings,
+            "unknown_metrics": [
+                metric_id for metric_id in request.weights if team_table.column_for(metric_id) is None
+            ],
+        }
+
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404, detail=f"Dataset not found at path: {request.unified_dataset_path}"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error ranking teams: {str(e)}")
+
+
+@router.post("/picklist/rank-sensitivity")
+async def analyze_rank_sensitivity(request: RankSensitivityRequest):
+    """
+    Monte Carlo rank stability for a set of metric weights.
+
+    Samples random perturbations around the given weights and reports, for
+    each team, its rank interval and probability of finishing in the top N.
+    """
+    try:
+        team_table = get_team_metric_table(request.unified_dataset_path)
+        analysis = team_table.weight_sensitivity(
+            request.weights,
+            samples=request.samples,
+            spread=request.spread,
+            top_n=request.top_n,
+            confidence=request.confidence,
+            seed=request.seed,
+        )
+
+        return {"status": "success", **analysis}
+
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404, detail=f"Dataset not found at path: {request.unified_dataset_path}"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analyzing rank sensitivity: {str(e)}")
+
+
 @router.post("/picklist/validate-enhanced-data")
 async def validate_enhanced_data_structure(request: PicklistAnalysisRequest):
     """
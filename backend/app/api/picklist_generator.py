@@ -1,13 +1,27 @@
 # backend/app/api/picklist_generator.py
 
+import asyncio
+import json
+
 from fastapi import APIRouter, HTTPException, Body
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Set, Union
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional, Set, Union
 
-from app.services.picklist_generator_service import PicklistGeneratorService
+from app.services.job_queue import JOB_PRIORITY_HIGH, JobQueueFullError, job_queue
+from app.services.picklist_generator_pool import picklist_generator_pool
+from app.services.picklist_generator_service import (
+    PICKLIST_MAX_CONCURRENT_BATCHES,
+    PicklistGeneratorService,
+)
+from app.services.picklist_gpt_service import PROMPT_ENCODINGS
+from app.services.progress_tracker import ProgressTracker
 
 router = APIRouter(prefix="/api/picklist", tags=["Picklist"])
 
+# How often a streaming request checks progress while no teams are arriving
+STREAM_PROGRESS_INTERVAL_SECONDS = 1.0
+
 
 class MetricPriority(BaseModel):
     id: str
@@ -24,8 +38,11 @@ class PicklistRequest(BaseModel):
     strategy_interpretation: Optional[str] = Field(
         None, description="Strategic interpretation from Parse Strategy to guide picklist generation"
     )
-    batch_size: int = Field(
-        20, ge=5, le=100, description="Number of teams in each batch (default: 20)"
+    batch_size: Optional[int] = Field(
+        None,
+        ge=5,
+        le=100,
+        description="Number of teams in each batch; omit to pack batches to the token budget",
     )
     reference_teams_count: int = Field(
         3, ge=1, le=10, description="Number of reference teams to include (default: 3)"
@@ -35,8 +52,23 @@ class PicklistRequest(BaseModel):
         description="Strategy for selecting reference teams",
         enum=["even_distribution", "percentile", "top_middle_bottom"],
     )
-    use_batching: bool = Field(
-        ..., description="Whether to use batch processing instead of one-shot generation"
+    use_batching: Optional[bool] = Field(
+        None,
+        description="Whether to use batch processing instead of one-shot generation; "
+        "omit to batch only when the teams do not fit one call's token budget",
+    )
+    parallel_batches: bool = Field(
+        False,
+        description="Run batches concurrently around anchor teams chosen from the local ranking",
+    )
+    rank_only: bool = Field(
+        False,
+        description="Batch and final-rerank calls return only the team order; fetch reasoning via /explain-teams",
+    )
+    prompt_encoding: str = Field(
+        "json",
+        description="How team data is written into prompts: 'json' objects or a compact 'table'",
+        enum=list(PROMPT_ENCODINGS),
     )
     cache_key: Optional[str] = Field(
         None, description="Optional cache key to use for progress tracking"
@@ -55,6 +87,15 @@ class UpdatePicklistRequest(BaseModel):
     user_rankings: List[UserRanking]
 
 
+class ExplainTeamsRequest(BaseModel):
+    unified_dataset_path: str
+    your_team_number: int
+    pick_position: str = Field(..., description="Options: 'first', 'second', or 'third'")
+    priorities: List[MetricPriority]
+    team_numbers: List[int] = Field(..., description="Teams to explain, e.g. the ones the user expanded")
+    ranked_team_numbers: List[int] = Field(..., description="Full picklist order, best first")
+
+
 class RankMissingTeamsRequest(BaseModel):
     unified_dataset_path: str
     missing_team_numbers: List[int]
@@ -151,6 +192,168 @@ async def get_picklist_generation_status(request: Dict[str, str] = Body(...)):
         )
 
 
+def _picklist_cache_key(request: PicklistRequest, generator_service: PicklistGeneratorService) -> str:
+    """
+    Get the cache key identifying a picklist request.
+
+    Args:
+        request: Picklist generation request
+        generator_service: Generator for the request's dataset (provides the dataset version)
+
+    Returns:
+        The request's own cache key, or a hash of its parameters and the dataset version
+    """
+    import logging
+
+    logger = logging.getLogger("picklist_api")
+    priorities = [{"id": p.id, "weight": float(p.weight)} for p in request.priorities]
+
+    # Use provided cache key or generate one for deduplication
+    if request.cache_key:
+        cache_key = request.cache_key
+        logger.info(f"Using provided cache key: {cache_key}")
+    else:
+        import hashlib
+        import json
+
+        # Create a deterministic representation of the request
+        cache_key_dict = {
+            "path": request.unified_dataset_path,
+            "team": request.your_team_number,
+            "position": request.pick_position,
+            "priorities": sorted([(p["id"], p["weight"]) for p in priorities]),
+            "exclude": sorted(request.exclude_teams) if request.exclude_teams else [],
+            "use_batching": request.use_batching,
+            "prompt_encoding": request.prompt_encoding,
+            # Strategy text is part of every prompt
+            "strategy": request.strategy_interpretation,
+            # New scouting data or game context must not reuse an old picklist
+            "version": generator_service.cache_version,
+        }
+
+        # Include batching parameters unless batching is disabled (auto mode may batch)
+        if request.use_batching is not False:
+            cache_key_dict.update(
+                {
+                    "batch_size": request.batch_size,
+                    "reference_teams_count": request.reference_teams_count,
+                    "reference_selection": request.reference_selection,
+                    "parallel_batches": request.parallel_batches,
+                    "rank_only": request.rank_only,
+                }
+            )
+
+        # Convert to a hash for quick comparison
+        cache_key = hashlib.md5(json.dumps(cache_key_dict, sort_keys=True).encode()).hexdigest()
+        logger.info(f"Generated cache key: {cache_key}")
+
+    return cache_key
+
+
+async def _run_picklist_generation(
+    request: PicklistRequest,
+    generator_service: PicklistGeneratorService,
+    request_id: int,
+    cache_key: Optional[str] = None,
+    on_partial: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run a picklist generation request on an acquired generator.
+
+    Args:
+        request: Picklist generation request
+        generator_service: Generator reserved for this request
+        request_id: Identifier used in log messages
+        cache_key: Precomputed cache key, derived from the request when omitted
+        on_partial: Optional callback receiving (rank, team) while the ranking streams in
+
+    Returns:
+        Generation result including the cache key used for status polling
+    """
+    import logging
+
+    logger = logging.getLogger("picklist_api")
+
+    # Convert priorities to plain dictionaries to avoid serialization issues
+    priorities = [
+        {"id": p.id, "weight": float(p.weight), "reason": p.reason} for p in request.priorities
+    ]
+
+    cache_key = cache_key or _picklist_cache_key(request, generator_service)
+
+    # Add batch processing parameters to log
+    logger.info(
+        f"Received use_batching={request.use_batching} (type: {type(request.use_batching)})"
+    )
+    logger.info(f"Raw request data: {request.dict()}")
+    if request.use_batching is None:
+        logger.info("Batching not specified, will decide from the token-budget batch plan")
+    elif request.use_batching:
+        logger.info(
+            f"Using batching with batch_size={request.batch_size}, reference_teams_count={request.reference_teams_count}"
+        )
+        logger.info(f"Reference selection strategy: {request.reference_selection}")
+    else:
+        logger.info("Batching is disabled, will use one-shot processing")
+
+    # Use the cache on the service to prevent duplicate work
+    # The generator_service has internal caching that should prevent duplicate work
+
+    result = await generator_service.generate_picklist(
+        your_team_number=request.your_team_number,
+        pick_position=request.pick_position,
+        priorities=priorities,  # Use the plain dict version
+        exclude_teams=request.exclude_teams,
+        strategy_interpretation=request.strategy_interpretation,  # Pass strategy interpretation
+        request_id=request_id,  # Pass the request ID for logging
+        cache_key=cache_key,  # Pass the cache key for deduplication and progress tracking
+        batch_size=request.batch_size,
+        reference_teams_count=request.reference_teams_count,
+        reference_selection=request.reference_selection,
+        use_batching=request.use_batching,  # Use the actual request value
+        parallel_batches=request.parallel_batches,
+        on_partial=on_partial,
+        rank_only=request.rank_only,
+        prompt_encoding=request.prompt_encoding,
+    )
+
+    # Add enhanced data structure information to response
+    try:
+        enhanced_info = {
+            "enhanced_labels_used": generator_service.gpt_service.has_enhanced_labels(),
+            "text_fields_processed": generator_service.gpt_service.has_text_data(),
+            "label_mapping_source": generator_service.data_service.get_label_mapping_source(),
+            "field_selections_available": bool(generator_service.data_service.field_selections),
+        }
+        result["enhanced_data_info"] = enhanced_info
+    except Exception as e:
+        logger.warning(f"Could not add enhanced data info: {e}")
+        # Don't fail the entire request if metadata gathering fails
+        pass
+
+    # Add the cache key to the response for status polling
+    result["cache_key"] = cache_key
+    return result
+
+
+def _validate_picklist_request(request: PicklistRequest) -> None:
+    """Reject requests with an unknown pick position or no priorities."""
+    if request.pick_position not in ["first", "second", "third"]:
+        raise HTTPException(
+            status_code=400, detail="Pick position must be 'first', 'second', or 'third'"
+        )
+
+    if not request.priorities:
+        raise HTTPException(
+            status_code=400, detail="At least one priority metric must be provided"
+        )
+
+    if request.prompt_encoding not in PROMPT_ENCODINGS:
+        raise HTTPException(
+            status_code=400, detail=f"Prompt encoding must be one of {', '.join(PROMPT_ENCODINGS)}"
+        )
+
+
 @router.post("/generate")
 async def generate_picklist(request: PicklistRequest):
     """
@@ -162,6 +365,7 @@ async def generate_picklist(request: PicklistRequest):
     Returns:
         Generated picklist with team rankings and explanations
     """
+    generator_service = None
     try:
         # Add request logging to track potential duplicate requests
         import logging
@@ -173,18 +377,10 @@ async def generate_picklist(request: PicklistRequest):
         )
 
         # Validate inputs
-        if request.pick_position not in ["first", "second", "third"]:
-            raise HTTPException(
-                status_code=400, detail="Pick position must be 'first', 'second', or 'third'"
-            )
-
-        if not request.priorities:
-            raise HTTPException(
-                status_code=400, detail="At least one priority metric must be provided"
-            )
+        _validate_picklist_request(request)
 
-        # Initialize the service
-        generator_service = PicklistGeneratorService(request.unified_dataset_path)
+        # Get a warm service for this dataset version
+        generator_service = picklist_generator_pool.acquire(request.unified_dataset_path)
 
         # Debug logging - check exactly what we're passing
         logger.info(
@@ -194,101 +390,263 @@ async def generate_picklist(request: PicklistRequest):
             f"API Layer - Full request values: batch_size={request.batch_size}, reference_teams_count={request.reference_teams_count}"
         )
 
-        # Convert priorities to plain dictionaries to avoid serialization issues
-        priorities = [
-            {"id": p.id, "weight": float(p.weight), "reason": p.reason} for p in request.priorities
-        ]
+        result = await _run_picklist_generation(request, generator_service, request_id)
 
-        # Use provided cache key or generate one for deduplication
-        if request.cache_key:
-            cache_key = request.cache_key
-            logger.info(f"Using provided cache key: {cache_key}")
-        else:
-            import hashlib
-            import json
-
-            # Create a deterministic representation of the request
-            cache_key_dict = {
-                "path": request.unified_dataset_path,
-                "team": request.your_team_number,
-                "position": request.pick_position,
-                "priorities": sorted([(p["id"], p["weight"]) for p in priorities]),
-                "exclude": sorted(request.exclude_teams) if request.exclude_teams else [],
-                "use_batching": request.use_batching,
-            }
+        if result.get("status") == "error":
+            raise HTTPException(
+                status_code=500, detail=result.get("message", "Error generating picklist")
+            )
 
-            # Include batching parameters if batching is enabled
-            if request.use_batching:
-                cache_key_dict.update(
-                    {
-                        "batch_size": request.batch_size,
-                        "reference_teams_count": request.reference_teams_count,
-                        "reference_selection": request.reference_selection,
-                    }
-                )
+        logger.info(f"Successfully generated picklist for request {request_id}")
+        return result
 
-            # Convert to a hash for quick comparison
-            cache_key = hashlib.md5(json.dumps(cache_key_dict, sort_keys=True).encode()).hexdigest()
-            logger.info(f"Generated cache key: {cache_key}")
+    except Exception as e:
+        logger.error(f"Error generating picklist: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating picklist: {str(e)}")
+    finally:
+        picklist_generator_pool.release(generator_service)
 
-        # Add batch processing parameters to log
-        logger.info(
-            f"Received use_batching={request.use_batching} (type: {type(request.use_batching)})"
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/generate-stream")
+async def stream_picklist(request: PicklistRequest):
+    """
+    Generate a picklist and push results as Server-Sent Events while GPT is still writing.
+
+    Events:
+        team: {"rank", "team_number", "nickname", "score", "reasoning"} as soon as a team
+            is ranked (one-shot generation only; a retried call restarts at rank 1)
+        progress: Progress tracker state whenever it changes, e.g. during batched runs
+        complete: The same result /generate returns
+        error: {"detail"} when generation fails
+
+    Args:
+        request: Picklist generation request with dataset path, team number, pick position, and priorities
+
+    Returns:
+        text/event-stream response
+    """
+    import logging
+
+    logger = logging.getLogger("picklist_api")
+    _validate_picklist_request(request)
+
+    generator_service = None
+    try:
+        generator_service = picklist_generator_pool.acquire(request.unified_dataset_path)
+        cache_key = _picklist_cache_key(request, generator_service)
+    except Exception as e:
+        picklist_generator_pool.release(generator_service)
+        logger.error(f"Error preparing picklist stream: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error preparing picklist stream: {str(e)}")
+
+    request_id = id(request)
+    events: asyncio.Queue = asyncio.Queue()
+
+    def on_partial(rank: int, team: Dict[str, Any]) -> None:
+        events.put_nowait(("team", {"rank": rank, **team}))
+
+    async def event_stream() -> AsyncIterator[str]:
+        task = asyncio.ensure_future(
+            _run_picklist_generation(request, generator_service, request_id, cache_key, on_partial)
         )
-        logger.info(f"Raw request data: {request.dict()}")
-        if request.use_batching:
-            logger.info(
-                f"Using batching with batch_size={request.batch_size}, reference_teams_count={request.reference_teams_count}"
-            )
-            logger.info(f"Reference selection strategy: {request.reference_selection}")
-        else:
-            logger.info("Batching is disabled, will use one-shot processing")
+        # The generator goes back to the pool once the generation has really stopped
+        task.add_done_callback(lambda _: picklist_generator_pool.release(generator_service))
+        getter = None
+        last_update = None
+        try:
+            while True:
+                if getter is None:
+                    getter = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait(
+                    {task, getter}, timeout=STREAM_PROGRESS_INTERVAL_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if getter in done:
+                    event, data = getter.result()
+                    getter = None
+                    yield _sse_event(event, data)
+                    continue
+                if task in done:
+                    break
+
+                progress = ProgressTracker.get_progress(cache_key)
+                if progress and progress.get("last_update") != last_update:
+                    last_update = progress.get("last_update")
+                    yield _sse_event("progress", {k: v for k, v in progress.items() if k != "result"})
+
+            while not events.empty():
+                event, data = events.get_nowait()
+                yield _sse_event(event, data)
+
+            result = task.result()
+            if result.get("status") == "error":
+                yield _sse_event("error", {"detail": result.get("error") or result.get("message", "Error generating picklist")})
+            else:
+                logger.info(f"Successfully streamed picklist for request {request_id}")
+                yield _sse_event("complete", result)
+        except Exception as e:
+            logger.error(f"Error streaming picklist: {str(e)}")
+            yield _sse_event("error", {"detail": f"Error generating picklist: {str(e)}"})
+        finally:
+            if getter is not None:
+                getter.cancel()
+            if not task.done():
+                # Client went away; stop spending tokens on a ranking nobody will read
+                task.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-        # Use the cache on the service to prevent duplicate work
-        # The generator_service has internal caching that should prevent duplicate work
 
-        result = await generator_service.generate_picklist(
-            your_team_number=request.your_team_number,
-            pick_position=request.pick_position,
-            priorities=priorities,  # Use the plain dict version
-            exclude_teams=request.exclude_teams,
-            strategy_interpretation=request.strategy_interpretation,  # Pass strategy interpretation
-            request_id=request_id,  # Pass the request ID for logging
-            cache_key=cache_key,  # Pass the cache key for deduplication and progress tracking
+@router.post("/generate-job")
+async def submit_picklist_job(request: PicklistRequest):
+    """
+    Queue a picklist generation and return immediately.
+
+    Progress and the finished picklist are available from /api/progress/{job_id};
+    the job can be cancelled with DELETE /api/progress/{job_id}. Identical requests
+    while a job is queued or running return the same job id.
+
+    Args:
+        request: Picklist generation request with dataset path, team number, pick position, and priorities
+
+    Returns:
+        Job id (also the picklist cache key) and its queue status
+    """
+    import logging
+
+    logger = logging.getLogger("picklist_api")
+    _validate_picklist_request(request)
+
+    generator_service = None
+    try:
+        # The cache key depends on the dataset version, which the generator knows
+        generator_service = picklist_generator_pool.acquire(request.unified_dataset_path)
+        cache_key = _picklist_cache_key(request, generator_service)
+    except Exception as e:
+        logger.error(f"Error preparing picklist job: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error preparing picklist job: {str(e)}")
+    finally:
+        picklist_generator_pool.release(generator_service)
+
+    request_id = id(request)
+
+    async def run_job():
+        job_generator = picklist_generator_pool.acquire(request.unified_dataset_path)
+        try:
+            return await _run_picklist_generation(request, job_generator, request_id, cache_key)
+        finally:
+            picklist_generator_pool.release(job_generator)
+
+    try:
+        job = job_queue.submit("picklist", run_job, job_id=cache_key, priority=JOB_PRIORITY_HIGH)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    logger.info(f"Picklist request {request_id} queued as job {job.job_id}")
+    return {"status": job.status, "job_id": job.job_id, "cache_key": cache_key}
+
+
+@router.post("/batch-plan")
+async def plan_picklist_batches(request: PicklistRequest):
+    """
+    Report how a picklist request would be split into GPT calls, without running it.
+
+    Token costs are measured from the same prompt fragments generation uses, so
+    the estimate matches what /generate will send.
+
+    Args:
+        request: Picklist generation request
+
+    Returns:
+        Whether the request would batch and the batch plan (teams, tokens, estimated seconds)
+    """
+    import logging
+
+    logger = logging.getLogger("picklist_api")
+    _validate_picklist_request(request)
+
+    generator_service = None
+    try:
+        generator_service = picklist_generator_pool.acquire(request.unified_dataset_path)
+        priorities = [{"id": p.id, "weight": float(p.weight)} for p in request.priorities]
+        teams_data = generator_service.data_service.get_teams_for_analysis(request.exclude_teams)
+        normalized_priorities = generator_service.priority_service.normalize_priorities(priorities)
+        batch_plan = generator_service.plan_batches(
+            teams_data, request.your_team_number, request.pick_position, normalized_priorities,
+            request.rank_only, request.prompt_encoding, request.strategy_interpretation,
             batch_size=request.batch_size,
-            reference_teams_count=request.reference_teams_count,
-            reference_selection=request.reference_selection,
-            use_batching=request.use_batching,  # Use the actual request value
         )
+        should_batch, reason = generator_service._determine_processing_strategy(
+            teams_data, request.use_batching, batch_plan
+        )
+    except Exception as e:
+        logger.error(f"Error planning picklist batches: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error planning picklist batches: {str(e)}")
+    finally:
+        picklist_generator_pool.release(generator_service)
+
+    concurrency = PICKLIST_MAX_CONCURRENT_BATCHES if request.parallel_batches else 1
+    return {
+        "status": "success",
+        "use_batching": should_batch,
+        "reason": reason,
+        "plan": batch_plan.to_dict(concurrency),
+    }
+
+
+@router.post("/explain-teams")
+async def explain_teams(request: ExplainTeamsRequest):
+    """
+    Get reasoning for teams of a picklist generated with rank_only.
 
-        if result.get("status") == "error":
-            raise HTTPException(
-                status_code=500, detail=result.get("message", "Error generating picklist")
-            )
+    Only the requested teams are explained, each against its neighbours in the
+    ranking; responses are cached, so expanding a team again is free.
 
-        logger.info(f"Successfully generated picklist for request {request_id}")
+    Args:
+        request: Teams to explain plus the picklist order and generation settings
 
-        # Add enhanced data structure information to response
-        try:
-            enhanced_info = {
-                "enhanced_labels_used": generator_service.gpt_service.has_enhanced_labels(),
-                "text_fields_processed": generator_service.gpt_service.has_text_data(),
-                "label_mapping_source": generator_service.data_service.get_label_mapping_source(),
-                "field_selections_available": bool(generator_service.data_service.field_selections),
-            }
-            result["enhanced_data_info"] = enhanced_info
-        except Exception as e:
-            logger.warning(f"Could not add enhanced data info: {e}")
-            # Don't fail the entire request if metadata gathering fails
-            pass
+    Returns:
+        Mapping of team number to reasoning
+    """
+    import logging
 
-        # Add the cache key to the response for status polling
-        result["cache_key"] = cache_key
-        return result
+    logger = logging.getLogger("picklist_api")
+    if not request.team_numbers:
+        raise HTTPException(status_code=400, detail="At least one team number must be provided")
 
+    generator_service = None
+    try:
+        generator_service = picklist_generator_pool.acquire(request.unified_dataset_path)
+        priorities = [
+            {"id": p.id, "weight": float(p.weight), "reason": p.reason} for p in request.priorities
+        ]
+        result = await generator_service.explain_picklist_teams(
+            team_numbers=request.team_numbers,
+            ranked_team_numbers=request.ranked_team_numbers,
+            your_team_number=request.your_team_number,
+            pick_position=request.pick_position,
+            priorities=priorities,
+        )
     except Exception as e:
-        logger.error(f"Error generating picklist: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error generating picklist: {str(e)}")
+        logger.error(f"Error explaining teams: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error explaining teams: {str(e)}")
+    finally:
+        picklist_generator_pool.release(generator_service)
+
+    if result.get("status") != "success":
+        raise HTTPException(
+            status_code=500, detail=f"Error explaining teams: {result.get('error', 'unknown error')}"
+        )
+    return {"status": "success", "reasoning": result["reasoning"]}
 
 
 @router.post("/update")
@@ -302,9 +660,10 @@ async def update_picklist(request: UpdatePicklistRequest):
     Returns:
         Updated picklist with new team order
     """
+    generator_service = None
     try:
-        # Initialize the service
-        generator_service = PicklistGeneratorService(request.unified_dataset_path)
+        # Get a warm service for this dataset version
+        generator_service = picklist_generator_pool.acquire(request.unified_dataset_path)
 
         # Convert user rankings to the format expected by the service
         user_rankings = [
@@ -328,6 +687,8 @@ async def update_picklist(request: UpdatePicklistRequest):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating picklist: {str(e)}")
+    finally:
+        picklist_generator_pool.release(generator_service)
 
 
 @router.post("/rank-missing-teams")
@@ -342,6 +703,7 @@ async def rank_missing_teams(request: RankMissingTeamsRequest):
     Returns:
         Rankings for the previously missing teams
     """
+    generator_service = None
     try:
         # Add request logging to track potential duplicate requests
         import logging
@@ -366,8 +728,8 @@ async def rank_missing_teams(request: RankMissingTeamsRequest):
         if not request.missing_team_numbers:
             raise HTTPException(status_code=400, detail="No missing teams to rank")
 
-        # Initialize the service
-        generator_service = PicklistGeneratorService(request.unified_dataset_path)
+        # Get a warm service for this dataset version
+        generator_service = picklist_generator_pool.acquire(request.unified_dataset_path)
 
         # Convert priorities to plain dictionaries
         priorities = [
@@ -413,6 +775,8 @@ async def rank_missing_teams(request: RankMissingTeamsRequest):
     except Exception as e:
         logger.error(f"Error ranking missing teams: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error ranking missing teams: {str(e)}")
+    finally:
+        picklist_generator_pool.release(generator_service)
 
 
 @router.post("/clear-cache")
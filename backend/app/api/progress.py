@@ -3,6 +3,7 @@
 
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException
+from app.services.job_queue import job_queue
 from app.services.progress_tracker import ProgressTracker
 
 router = APIRouter(
@@ -32,6 +33,25 @@ async def get_operation_progress(operation_id: str) -> Dict[str, Any]:
     return progress
 
 
+@router.delete("/{operation_id}")
+async def cancel_operation(operation_id: str) -> Dict[str, Any]:
+    """
+    Cancel a queued or running background job.
+
+    Args:
+        operation_id: The job's operation identifier
+
+    Returns:
+        Dictionary with the cancellation status
+
+    Raises:
+        HTTPException: If no queued or running job has this identifier
+    """
+    if not job_queue.cancel(operation_id):
+        raise HTTPException(status_code=404, detail=f"No active job {operation_id}")
+    return {"status": "cancelling", "operation_id": operation_id}
+
+
 @router.get("/")
 async def list_active_operations() -> Dict[str, Dict[str, Any]]:
     """
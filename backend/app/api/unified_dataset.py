@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from typing import Optional
 import uuid
 
+from app.services.job_queue import JOB_PRIORITY_NORMAL, JobQueueFullError, job_queue
 from app.services.unified_event_data_service import build_unified_dataset, get_unified_dataset_path
 
 # Initialize the router correctly
@@ -15,6 +16,7 @@ class UnifiedDatasetRequest(BaseModel):
     event_key: str
     year: int
     force_rebuild: Optional[bool] = False
+    incremental: Optional[bool] = False
 
 
 @router.post("/build")
@@ -23,23 +25,25 @@ async def build_dataset(request: UnifiedDatasetRequest):
     Build or update the unified dataset for an event.
 
     This is a long-running operation that will return immediately with an operation ID.
-    Progress can be tracked using the /progress/{operation_id} endpoint.
+    Progress can be tracked using the /progress/{operation_id} endpoint, and the
+    build can be cancelled with DELETE /progress/{operation_id}.
     """
     try:
         # Generate a unique operation ID
         operation_id = f"build_dataset_{request.event_key}_{uuid.uuid4().hex[:8]}"
 
-        # Start the dataset build process in the background
-        import asyncio
-
-        # Create a task that will run in the background
-        asyncio.create_task(
-            build_unified_dataset(
+        # Queue the build on the background job workers
+        job_queue.submit(
+            "dataset_build",
+            lambda: build_unified_dataset(
                 event_key=request.event_key,
                 year=request.year,
                 force_rebuild=request.force_rebuild,
                 operation_id=operation_id,
-            )
+                incremental=request.incremental,
+            ),
+            job_id=operation_id,
+            priority=JOB_PRIORITY_NORMAL,
         )
 
         return {
@@ -47,6 +51,8 @@ async def build_dataset(request: UnifiedDatasetRequest):
             "message": "Unified dataset build started",
             "operation_id": operation_id,
         }
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -86,7 +92,8 @@ async def get_dataset(path: str = None, event_key: str = None):
     At least one of the parameters must be provided.
     """
     import os
-    import json
+
+    from app.services.dataset_registry import dataset_registry
 
     try:
         # Determine which path to use
@@ -109,9 +116,8 @@ async def get_dataset(path: str = None, event_key: str = None):
                 status_code=404, detail=f"Dataset not found at path: {dataset_path}"
             )
 
-        # Read and return the dataset
-        with open(dataset_path, "r", encoding="utf-8") as f:
-            dataset = json.load(f)
+        # Return the shared parsed dataset (only reparsed when the file changes)
+        dataset = dataset_registry.get(dataset_path)
 
         return dataset
     except Exception as e:
@@ -0,0 +1,250 @@
+# backend/app/services/batch_planner.py
+
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("batch_planner")
+
+# Token budget of one ranking call: prompt (system + user) and expected completion
+PICKLIST_INPUT_TOKEN_BUDGET = int(os.getenv("PICKLIST_INPUT_TOKEN_BUDGET", "24000"))
+PICKLIST_OUTPUT_TOKEN_BUDGET = int(os.getenv("PICKLIST_OUTPUT_TOKEN_BUDGET", "4000"))
+# Completion tokens per ranked team with reasoning ([index,score,"comparative reason"])
+PICKLIST_OUTPUT_TOKENS_PER_TEAM = int(os.getenv("PICKLIST_OUTPUT_TOKENS_PER_TEAM", "40"))
+# Fraction of the input budget kept free for token estimation error
+PICKLIST_PLAN_SAFETY_MARGIN = float(os.getenv("PICKLIST_PLAN_SAFETY_MARGIN", "0.1"))
+# Latency model used for plan estimates: fixed overhead plus prompt and completion throughput
+LLM_LATENCY_BASE_SECONDS = float(os.getenv("LLM_LATENCY_BASE_SECONDS", "1.5"))
+LLM_INPUT_TOKENS_PER_SECOND = float(os.getenv("LLM_INPUT_TOKENS_PER_SECOND", "4000"))
+LLM_OUTPUT_TOKENS_PER_SECOND = float(os.getenv("LLM_OUTPUT_TOKENS_PER_SECOND", "50"))
+# Completion tokens for the response wrapper ({"p":[...],"s":"ok"})
+OUTPUT_BASE_TOKENS = 20
+
+
+def full_output_tokens(team_count: int) -> int:
+    """Expected completion tokens when every ranked team gets a reason."""
+    return OUTPUT_BASE_TOKENS + PICKLIST_OUTPUT_TOKENS_PER_TEAM * team_count
+
+
+@dataclass
+class PlannedBatch:
+    """One ranking call of a plan."""
+
+    team_numbers: List[int]
+    input_tokens: int
+    output_tokens: int
+    estimated_seconds: float
+
+
+@dataclass
+class BatchPlan:
+    """Teams packed into ranking calls, with token and latency estimates."""
+
+    batches: List[PlannedBatch]
+    fixed_input_tokens: int
+    input_budget: int
+    output_budget: int
+    fits_budget: bool
+    mode: str
+    anchor_team_numbers: List[int] = field(default_factory=list)
+
+    @property
+    def batch_count(self) -> int:
+        return len(self.batches)
+
+    def estimated_seconds(self, concurrency: int = 1) -> float:
+        """
+        Wall-clock estimate for running every batch.
+
+        Args:
+            concurrency: Batches running at the same time (1 = sequential)
+
+        Returns:
+            Estimated seconds, with batches taken longest first in waves of `concurrency`
+        """
+        durations = sorted((b.estimated_seconds for b in self.batches), reverse=True)
+        concurrency = max(1, concurrency)
+        return round(sum(durations[i] for i in range(0, len(durations), concurrency)), 1)
+
+    def to_dict(self, concurrency: int = 1) -> Dict[str, Any]:
+        """Plan summary for logs, progress messages and API responses."""
+        return {
+            "mode": self.mode,
+            "batch_count": self.batch_count,
+            "fits_budget": self.fits_budget,
+            "input_budget": self.input_budget,
+            "output_budget": self.output_budget,
+            "fixed_input_tokens": self.fixed_input_tokens,
+            "estimated_input_tokens": sum(b.input_tokens for b in self.batches),
+            "estimated_output_tokens": sum(b.output_tokens for b in self.batches),
+            "estimated_seconds": self.estimated_seconds(concurrency),
+            "anchor_team_numbers": self.anchor_team_numbers,
+            "batches": [
+                {
+                    "team_count": len(b.team_numbers),
+                    "team_numbers": b.team_numbers,
+                    "input_tokens": b.input_tokens,
+                    "output_tokens": b.output_tokens,
+                    "estimated_seconds": b.estimated_seconds,
+                }
+                for b in self.batches
+            ],
+        }
+
+
+class BatchPlanner:
+    """
+    Packs teams into the fewest ranking calls that fit a token budget.
+
+    Each team costs the tokens its data adds to the prompt; every call also
+    pays a fixed prompt overhead (system prompt, priorities, game context,
+    anchor teams) and produces a completion whose size grows with the number
+    of teams it ranks. Teams are spread over the smallest number of batches
+    whose input and output both stay within budget, largest teams first onto
+    the least loaded batch, so batches come out balanced rather than one full
+    batch followed by a small remainder.
+    """
+
+    def __init__(
+        self,
+        input_budget: int = PICKLIST_INPUT_TOKEN_BUDGET,
+        output_budget: int = PICKLIST_OUTPUT_TOKEN_BUDGET,
+        safety_margin: float = PICKLIST_PLAN_SAFETY_MARGIN,
+        latency_base_seconds: float = LLM_LATENCY_BASE_SECONDS,
+        input_tokens_per_second: float = LLM_INPUT_TOKENS_PER_SECOND,
+        output_tokens_per_second: float = LLM_OUTPUT_TOKENS_PER_SECOND,
+    ):
+        self.input_budget = input_budget
+        self.output_budget = output_budget
+        self.safety_margin = safety_margin
+        self.latency_base_seconds = latency_base_seconds
+        self.input_tokens_per_second = input_tokens_per_second
+        self.output_tokens_per_second = output_tokens_per_second
+
+    def estimate_seconds(self, input_tokens: int, output_tokens: int) -> float:
+        """Estimated duration of one call."""
+        seconds = (
+            self.latency_base_seconds
+            + input_tokens / max(self.input_tokens_per_second, 1e-9)
+            + output_tokens / max(self.output_tokens_per_second, 1e-9)
+        )
+        return round(seconds, 2)
+
+    def plan(
+        self,
+        team_costs: Sequence[Tuple[int, int]],
+        fixed_input_tokens: int,
+        output_tokens: Callable[[int], int] = full_output_tokens,
+        anchor_team_numbers: Optional[Sequence[int]] = None,
+        batch_size: Optional[int] = None,
+    ) -> BatchPlan:
+        """
+        Plan the batches for a set of teams.
+
+        Args:
+            team_costs: (team number, prompt tokens) pairs in the order teams were supplied
+            fixed_input_tokens: Prompt tokens paid by every call regardless of its teams
+            output_tokens: Expected completion tokens for a call ranking n teams
+            anchor_team_numbers: Teams repeated in every batch (must be in team_costs)
+            batch_size: Fixed teams per batch (anchors included) instead of packing by budget
+
+        Returns:
+            BatchPlan; batches list teams in their supplied order, anchors first
+        """
+        anchors = list(dict.fromkeys(anchor_team_numbers or []))
+        anchor_set = set(anchors)
+        cost_of = dict(team_costs)
+        anchor_cost = sum(cost_of.get(number, 0) for number in anchors)
+        teams = [(number, cost) for number, cost in team_costs if number not in anchor_set]
+        per_call_input = fixed_input_tokens + anchor_cost
+
+        if batch_size:
+            mode = "fixed"
+            per_batch = max(1, batch_size - len(anchors))
+            groups = [teams[i:i + per_batch] for i in range(0, len(teams), per_batch)]
+        else:
+            mode = "token_budget"
+            groups = self._pack(teams, per_call_input, len(anchors), output_tokens)
+
+        if not groups and anchors:
+            groups = [[]]
+
+        batches = []
+        for group in groups:
+            input_tokens = per_call_input + sum(cost for _, cost in group)
+            completion_tokens = output_tokens(len(anchors) + len(group))
+            batches.append(PlannedBatch(
+                team_numbers=anchors + [number for number, _ in group],
+                input_tokens=input_tokens,
+                output_tokens=completion_tokens,
+                estimated_seconds=self.estimate_seconds(input_tokens, completion_tokens),
+            ))
+
+        fits = all(
+            b.input_tokens <= self.input_budget and b.output_tokens <= self.output_budget for b in batches
+        )
+        plan = BatchPlan(
+            batches=batches,
+            fixed_input_tokens=fixed_input_tokens,
+            input_budget=self.input_budget,
+            output_budget=self.output_budget,
+            fits_budget=fits,
+            mode=mode,
+            anchor_team_numbers=anchors,
+        )
+        if not fits:
+            logger.warning(
+                f"Batch plan exceeds the token budget ({self.input_budget} in / {self.output_budget} out)"
+            )
+        return plan
+
+    def _pack(
+        self,
+        teams: List[Tuple[int, int]],
+        per_call_input: int,
+        anchor_count: int,
+        output_tokens: Callable[[int], int],
+    ) -> List[List[Tuple[int, int]]]:
+        """Spread teams over the fewest batches that fit the input and output budgets."""
+        if not teams:
+            return []
+
+        capacity = int(self.input_budget * (1.0 - self.safety_margin)) - per_call_input
+        max_teams = 0
+        while max_teams < len(teams) and output_tokens(anchor_count + max_teams + 1) <= self.output_budget:
+            max_teams += 1
+        if capacity <= 0 or max_teams == 0:
+            # Nothing fits alongside the fixed overhead; rank one team per call
+            return [[team] for team in teams]
+
+        total = sum(cost for _, cost in teams)
+        batch_count = max(math.ceil(total / capacity), math.ceil(len(teams) / max_teams), 1)
+        position = {number: i for i, (number, _) in enumerate(teams)}
+        largest_first = sorted(teams, key=lambda team: (-team[1], position[team[0]]))
+
+        while True:
+            groups: List[List[Tuple[int, int]]] = [[] for _ in range(batch_count)]
+            loads = [0] * batch_count
+            placed = True
+            for team in largest_first:
+                open_batches = [
+                    i for i in range(batch_count)
+                    if len(groups[i]) < max_teams and (loads[i] + team[1] <= capacity or not groups[i])
+                ]
+                if not open_batches:
+                    placed = False
+                    break
+                target = min(open_batches, key=lambda i: (loads[i], len(groups[i]), i))
+                groups[target].append(team)
+                loads[target] += team[1]
+            if placed:
+                break
+            batch_count += 1
+
+        for group in groups:
+            group.sort(key=lambda team: position[team[0]])
+        groups = [group for group in groups if group]
+        groups.sort(key=lambda group: position[group[0][0]])
+        return groups
@@ -7,6 +7,7 @@ import hashlib
 from typing import Any, Optional, Dict, Union, Callable
 import asyncio
 import functools
+import threading
 
 # Base directory for cache files
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -21,8 +22,9 @@ class CacheService:
     Service for caching expensive API calls and computation results.
     """
 
-    # In-memory cache
+    # In-memory cache, shared with executor threads (e.g. concurrent Statbotics lookups)
     _memory_cache: Dict[str, Dict[str, Any]] = {}
+    _memory_lock = threading.Lock()
 
     @staticmethod
     def _get_cache_key(key_parts: Union[str, Dict[str, Any], list, tuple]) -> str:
@@ -68,12 +70,13 @@ class CacheService:
             Cached data or None if not found or expired
         """
         # Check memory cache first
-        if cache_key in cls._memory_cache:
-            cache_data = cls._memory_cache[cache_key]
-            if time.time() - cache_data["timestamp"] <= max_age_seconds:
-                return cache_data["data"]
-            # Remove from memory if expired
-            del cls._memory_cache[cache_key]
+        with cls._memory_lock:
+            cache_data = cls._memory_cache.get(cache_key)
+            if cache_data is not None:
+                if time.time() - cache_data["timestamp"] <= max_age_seconds:
+                    return cache_data["data"]
+                # Remove from memory if expired
+                del cls._memory_cache[cache_key]
 
         # Check file cache
         cache_file = cls._get_cache_file_path(cache_key)
@@ -85,7 +88,8 @@ class CacheService:
                 # Check if cache is still valid
                 if time.time() - cache_data["timestamp"] <= max_age_seconds:
                     # Also add to memory cache for faster access next time
-                    cls._memory_cache[cache_key] = cache_data
+                    with cls._memory_lock:
+                        cls._memory_cache[cache_key] = cache_data
                     return cache_data["data"]
             except Exception as e:
                 print(f"Error reading cache file {cache_file}: {e}")
@@ -105,7 +109,8 @@ class CacheService:
         cache_data = {"timestamp": time.time(), "data": data}
 
         # Save to memory cache
-        cls._memory_cache[cache_key] = cache_data
+        with cls._memory_lock:
+            cls._memory_cache[cache_key] = cache_data
 
         # Also save to file if requested
         if persist:
@@ -131,19 +136,20 @@ class CacheService:
         current_time = time.time()
 
         # Clear memory cache
-        if older_than_seconds is None:
-            count += len(cls._memory_cache)
-            cls._memory_cache.clear()
-        else:
-            keys_to_remove = []
-            for key, data in cls._memory_cache.items():
-                if current_time - data["timestamp"] > older_than_seconds:
-                    keys_to_remove.append(key)
+        with cls._memory_lock:
+            if older_than_seconds is None:
+                count += len(cls._memory_cache)
+                cls._memory_cache.clear()
+            else:
+                keys_to_remove = []
+                for key, data in cls._memory_cache.items():
+                    if current_time - data["timestamp"] > older_than_seconds:
+                        keys_to_remove.append(key)
 
-            for key in keys_to_remove:
-                del cls._memory_cache[key]
+                for key in keys_to_remove:
+                    del cls._memory_cache[key]
 
-            count += len(keys_to_remove)
+                count += len(keys_to_remove)
 
         # Clear file cache
         for filename in os.listdir(CACHE_DIR):
@@ -174,6 +180,10 @@ def cached(max_age_seconds: int = 3600, persist: bool = True):
     """
     Decorator for caching function results.
 
+    Calls to the decorated function accept an extra `refresh_cache=True`
+    keyword that skips the cached copy, calls the function and stores the
+    fresh result under the usual key.
+
     Args:
         max_age_seconds: Maximum age of the cache in seconds
         persist: Whether to save to disk (True) or just memory (False)
@@ -184,15 +194,16 @@ def cached(max_age_seconds: int = 3600, persist: bool = True):
 
     def decorator(func):
         @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
+        async def async_wrapper(*args, refresh_cache: bool = False, **kwargs):
             # Generate a cache key from the function name and arguments
             cache_key_parts = {"func": func.__name__, "args": args, "kwargs": kwargs}
             cache_key = CacheService._get_cache_key(cache_key_parts)
 
             # Try to get from cache
-            cached_result = CacheService.get_cached_data(cache_key, max_age_seconds)
-            if cached_result is not None:
-                return cached_result
+            if not refresh_cache:
+                cached_result = CacheService.get_cached_data(cache_key, max_age_seconds)
+                if cached_result is not None:
+                    return cached_result
 
             # Not in cache, call the function
             result = await func(*args, **kwargs)
@@ -203,15 +214,16 @@ def cached(max_age_seconds: int = 3600, persist: bool = True):
             return result
 
         @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs):
+        def sync_wrapper(*args, refresh_cache: bool = False, **kwargs):
             # Generate a cache key from the function name and arguments
             cache_key_parts = {"func": func.__name__, "args": args, "kwargs": kwargs}
             cache_key = CacheService._get_cache_key(cache_key_parts)
 
             # Try to get from cache
-            cached_result = CacheService.get_cached_data(cache_key, max_age_seconds)
-            if cached_result is not None:
-                return cached_result
+            if not refresh_cache:
+                cached_result = CacheService.get_cached_data(cache_key, max_age_seconds)
+                if cached_result is not None:
+                    return cached_result
 
             # Not in cache, call the function
             result = func(*args, **kwargs)
@@ -5,6 +5,7 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
+from app.services.dataset_registry import dataset_registry
 from app.services.game_context_extractor_service import GameContextExtractorService
 from app.config.extraction_config import get_extraction_config
 
@@ -161,16 +162,17 @@ class DataAggregationService:
 
     def _load_dataset(self) -> Dict[str, Any]:
         """
-        Load the unified dataset from the JSON file.
+        Load the unified dataset through the shared dataset registry.
+        
+        The returned dictionary is shared with other services and must not be modified.
         
         Returns:
             Loaded dataset dictionary
         """
         try:
-            with open(self.dataset_path, "r", encoding="utf-8") as f:
-                dataset = json.load(f)
-                logger.info(f"Loaded dataset from {self.dataset_path}")
-                return dataset
+            dataset = dataset_registry.get(self.dataset_path)
+            logger.info(f"Loaded dataset from {self.dataset_path}")
+            return dataset
         except FileNotFoundError:
             logger.error(f"Dataset file not found: {self.dataset_path}")
             return {}
@@ -5,10 +5,26 @@ import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime
 
+from app.services.dataset_registry import dataset_registry
 
-def load_unified_dataset(path: str) -> Dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+
+def load_unified_dataset(path: str, mutable: bool = False) -> Dict:
+    """
+    Load a unified dataset through the shared dataset registry.
+
+    The default result is shared and read-only; pass mutable=True to get a
+    private copy that can be edited and written back with save_unified_dataset.
+    """
+    if mutable:
+        return dataset_registry.get_mutable(path)
+    return dataset_registry.get(path)
+
+
+def save_unified_dataset(path: str, dataset: Dict) -> None:
+    """Write a unified dataset and drop its cached registry snapshot."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dataset, f, indent=2)
+    dataset_registry.invalidate(path)
 
 
 def validate_event_completeness(unified_dataset_path: str) -> Dict:
@@ -489,7 +505,7 @@ def apply_correction(
     """
     Apply corrections to the unified dataset.
     """
-    dataset = load_unified_dataset(unified_dataset_path)
+    dataset = load_unified_dataset(unified_dataset_path, mutable=True)
     teams_data = dataset.get("teams", {})
 
     if str(team_number) not in teams_data:
@@ -551,8 +567,7 @@ def apply_correction(
         scouting_data[match_idx]["match_number"] = scouting_data[match_idx]["qual_number"]
 
     # Save the updated dataset
-    with open(unified_dataset_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, indent=2)
+    save_unified_dataset(unified_dataset_path, dataset)
 
     return {
         "status": "success",
@@ -582,7 +597,7 @@ def ignore_match(
     Returns:
         Dict with status and information about the operation
     """
-    dataset = load_unified_dataset(unified_dataset_path)
+    dataset = load_unified_dataset(unified_dataset_path, mutable=True)
     teams_data = dataset.get("teams", {})
 
     # Validate inputs
@@ -618,8 +633,7 @@ def ignore_match(
     )
 
     # Save the updated dataset
-    with open(unified_dataset_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, indent=2)
+    save_unified_dataset(unified_dataset_path, dataset)
 
     return {
         "status": "success",
@@ -645,7 +659,7 @@ def create_virtual_scout(
     Returns:
         Dict with status and information about the operation
     """
-    dataset = load_unified_dataset(unified_dataset_path)
+    dataset = load_unified_dataset(unified_dataset_path, mutable=True)
     teams_data = dataset.get("teams", {})
 
     # Check if team exists
@@ -742,8 +756,7 @@ def create_virtual_scout(
     scouting_data.append(virtual_scout)
 
     # Save the updated dataset
-    with open(unified_dataset_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, indent=2)
+    save_unified_dataset(unified_dataset_path, dataset)
 
     return {
         "status": "success",
@@ -889,7 +902,7 @@ def add_to_todo_list(
     Returns:
         Dict with status and information about the operation
     """
-    dataset = load_unified_dataset(unified_dataset_path)
+    dataset = load_unified_dataset(unified_dataset_path, mutable=True)
 
     # Initialize to-do list if it doesn't exist
     if "todo_list" not in dataset:
@@ -911,8 +924,7 @@ def add_to_todo_list(
     )
 
     # Save the updated dataset
-    with open(unified_dataset_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, indent=2)
+    save_unified_dataset(unified_dataset_path, dataset)
 
     return {
         "status": "success",
@@ -959,7 +971,7 @@ def update_todo_status(
     if new_status not in ["pending", "completed", "cancelled"]:
         return {"status": "error", "message": "Invalid status"}
 
-    dataset = load_unified_dataset(unified_dataset_path)
+    dataset = load_unified_dataset(unified_dataset_path, mutable=True)
 
     # Check if to-do list exists
     if "todo_list" not in dataset:
@@ -978,8 +990,7 @@ def update_todo_status(
         return {"status": "error", "message": "Entry not found in to-do list"}
 
     # Save the updated dataset
-    with open(unified_dataset_path, "w", encoding="utf-8") as f:
-        json.dump(dataset, f, indent=2)
+    save_unified_dataset(unified_dataset_path, dataset)
 
     return {
         "status": "success",
@@ -0,0 +1,194 @@
+# backend/app/services/dataset_registry.py
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("dataset_registry")
+
+
+@dataclass(frozen=True)
+class DatasetSnapshot:
+    """
+    One parsed version of a unified dataset file.
+
+    The data dictionary is shared by every caller holding this snapshot and
+    must be treated as read-only; use DatasetRegistry.get_mutable() to edit.
+    """
+
+    path: str
+    data: Dict[str, Any]
+    content_hash: str
+    mtime_ns: int
+    size: int
+    loaded_at: float
+
+    @property
+    def version(self) -> str:
+        """Short content-derived version identifier."""
+        return self.content_hash[:16]
+
+
+class DatasetRegistry:
+    """
+    Process-wide registry that parses each unified dataset file once.
+
+    Every lookup stats the file. Unchanged mtime and size return the cached
+    snapshot; otherwise the file is hashed and only re-parsed when its
+    content actually changed.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, DatasetSnapshot] = {}
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "loads": 0, "revalidations": 0}
+        self._listeners: List[Callable[[Optional[str]], Any]] = []
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        return os.path.abspath(path)
+
+    def add_invalidation_listener(self, listener: Callable[[Optional[str]], Any]) -> None:
+        """
+        Register a callback for dataset changes.
+
+        The callback receives the dataset path (None when every dataset is
+        invalidated) whenever a cached dataset is invalidated or its file
+        content is found to have changed.
+
+        Args:
+            listener: Callable taking the changed dataset path
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, path: Optional[str]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(path)
+            except Exception as e:
+                logger.warning(f"Dataset invalidation listener failed for {path}: {e}")
+
+    def get_snapshot(self, path: str) -> DatasetSnapshot:
+        """
+        Get the current snapshot of a dataset file, loading it if needed.
+
+        Args:
+            path: Path to the unified dataset JSON file
+
+        Returns:
+            DatasetSnapshot for the file's current content
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        path = self._normalize_path(path)
+        changed = False
+
+        with self._lock:
+            stat = os.stat(path)
+            snapshot = self._snapshots.get(path)
+            if snapshot and snapshot.mtime_ns == stat.st_mtime_ns and snapshot.size == stat.st_size:
+                self._stats["hits"] += 1
+                return snapshot
+
+            with open(path, "rb") as f:
+                content = f.read()
+            content_hash = hashlib.sha256(content).hexdigest()
+
+            if snapshot and snapshot.content_hash == content_hash:
+                # Touched but unchanged - keep the parsed data
+                self._stats["revalidations"] += 1
+                snapshot = DatasetSnapshot(
+                    path=path,
+                    data=snapshot.data,
+                    content_hash=content_hash,
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    loaded_at=snapshot.loaded_at,
+                )
+            else:
+                start = time.perf_counter()
+                data = json.loads(content.decode("utf-8"))
+                self._stats["loads"] += 1
+                changed = snapshot is not None
+                logger.info(
+                    f"Loaded dataset {path} ({len(content)} bytes) in "
+                    f"{(time.perf_counter() - start) * 1000:.0f} ms"
+                )
+                snapshot = DatasetSnapshot(
+                    path=path,
+                    data=data,
+                    content_hash=content_hash,
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    loaded_at=time.time(),
+                )
+
+            self._snapshots[path] = snapshot
+
+        if changed:
+            self._notify(path)
+        return snapshot
+
+    def get(self, path: str) -> Dict[str, Any]:
+        """
+        Get the shared, read-only parsed dataset for a file.
+
+        Args:
+            path: Path to the unified dataset JSON file
+
+        Returns:
+            The parsed dataset dictionary (do not modify)
+        """
+        return self.get_snapshot(path).data
+
+    def get_mutable(self, path: str) -> Dict[str, Any]:
+        """
+        Get a private deep copy of a dataset for callers that edit and save it.
+
+        Args:
+            path: Path to the unified dataset JSON file
+
+        Returns:
+            A copy of the parsed dataset that is safe to modify
+        """
+        return copy.deepcopy(self.get(path))
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached snapshots so the next lookup re-reads the file and notify listeners.
+
+        Args:
+            path: Dataset path to drop, or None to clear every snapshot
+        """
+        with self._lock:
+            if path is None:
+                self._snapshots.clear()
+            else:
+                path = self._normalize_path(path)
+                self._snapshots.pop(path, None)
+        self._notify(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with hit/load counters and the cached dataset versions
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "datasets": {path: snapshot.version for path, snapshot in self._snapshots.items()},
+            }
+
+
+# Shared registry used by every service that reads unified datasets
+dataset_registry = DatasetRegistry()
@@ -9,10 +9,11 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from openai import AsyncOpenAI
 import tiktoken
 
 from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_provider import LLM_PROVIDER, create_llm_client
 
 logger = logging.getLogger("game_context_extractor")
 
@@ -79,13 +80,13 @@ class GameContextExtractorService:
             cache_dir: Directory to store extracted context cache files
             
         Raises:
-            ValueError: If OpenAI API key is not configured
+            ValueError: If OpenAI API key is not configured and the stub provider is not in use
             OSError: If cache directory cannot be created
         """
-        if not OPENAI_API_KEY:
+        if not OPENAI_API_KEY and LLM_PROVIDER != "stub":
             raise ValueError("OpenAI API key not configured")
             
-        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        self.client = create_llm_client()
         
         # Handle tiktoken encoding with fallback for unsupported models
         try:
@@ -452,7 +453,8 @@ Return the structured JSON as specified in the system prompt."""
             logger.info(f"Extraction prompt token count: {total_tokens}")
             
             # Perform extraction
-            response = await self.client.chat.completions.create(
+            response = await llm_gateway.chat_completion(
+                self.client,
                 model=GPT_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
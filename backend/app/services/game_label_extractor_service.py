@@ -7,10 +7,12 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from openai import AsyncOpenAI
 import tiktoken
 
 from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_provider import LLM_PROVIDER, create_llm_client
+from app.services.llm_response_cache import cached_chat_completion
 
 logger = logging.getLogger("game_label_extractor")
 
@@ -57,13 +59,13 @@ class GameLabelExtractorService:
             data_dir: Directory to store extracted labels
             
         Raises:
-            ValueError: If OpenAI API key is not configured
+            ValueError: If OpenAI API key is not configured and the stub provider is not in use
             OSError: If data directory cannot be created
         """
-        if not OPENAI_API_KEY:
+        if not OPENAI_API_KEY and LLM_PROVIDER != "stub":
             raise ValueError("OpenAI API key not configured")
             
-        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        self.client = create_llm_client()
         
         # Handle tiktoken encoding with fallback for unsupported models
         try:
@@ -336,7 +338,8 @@ Return the structured JSON as specified in the system prompt."""
             logger.info(f"Label extraction prompt token count: {total_tokens}")
             
             # Perform extraction
-            response = await self.client.chat.completions.create(
+            content, finish_reason = await cached_chat_completion(
+                self.client,
                 model=GPT_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -347,9 +350,6 @@ Return the structured JSON as specified in the system prompt."""
                 response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content
-            finish_reason = response.choices[0].finish_reason
-            
             if finish_reason == "length":
                 return LabelExtractionResult(
                     success=False,
@@ -443,7 +443,8 @@ Return the structured JSON as specified in the system prompt."""
             
             logger.info("Calling GPT for label description generation")
             
-            response = await self.client.chat.completions.create(
+            response = await llm_gateway.chat_completion(
+                self.client,
                 model=GPT_MODEL,
                 messages=[{
                     'role': 'user',
@@ -92,5 +92,9 @@ class GoogleAuthService:
     @lru_cache(maxsize=1)
     def get_sheets_service(self):
         """Create and cache the Google Sheets service."""
+        return self.build_sheets_service()
+    
+    def build_sheets_service(self):
+        """Create a new, uncached Google Sheets service (one per thread for concurrent use)."""
         credentials = self.get_credentials()
-        return build("sheets", "v4", credentials=credentials)
\ No newline at end of file
+        return build("sheets", "v4", credentials=credentials, cache_discovery=False)
\ No newline at end of file
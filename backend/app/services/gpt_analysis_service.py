@@ -6,8 +6,10 @@ import json
 import logging
 from typing import Any, Dict, List
 
-from openai import AsyncOpenAI
-from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
+from app.config.openai_config import OPENAI_MODEL
+from app.services.llm_gateway import LLM_PRIORITY_INTERACTIVE
+from app.services.llm_provider import create_llm_client
+from app.services.llm_response_cache import cached_chat_completion
 
 logger = logging.getLogger("gpt_analysis_service")
 
@@ -16,7 +18,7 @@ class GPTAnalysisService:
     """Handles OpenAI GPT integration for team analysis."""
 
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        self.client = create_llm_client()
         self.model = OPENAI_MODEL
 
     async def get_initial_analysis(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
@@ -38,16 +40,16 @@ class GPTAnalysisService:
             logger.info("-" * 40)
         logger.info("=" * 80)
         
-        response = await self.client.chat.completions.create(
+        response_content, _ = await cached_chat_completion(
+            self.client,
             model=self.model,
             messages=messages,
             temperature=0.2,
             response_format={"type": "json_object"},
             max_tokens=2000,
+            priority=LLM_PRIORITY_INTERACTIVE,
         )
         
-        response_content = response.choices[0].message.content
-        
         # Log the strategy analysis response
         logger.info("=" * 80)
         logger.info("GPT STRATEGY ANALYSIS RESPONSE")
@@ -77,15 +79,15 @@ class GPTAnalysisService:
             logger.info("-" * 40)
         logger.info("=" * 80)
         
-        response = await self.client.chat.completions.create(
+        response_content, _ = await cached_chat_completion(
+            self.client,
             model=self.model,
             messages=messages,
             temperature=0.2,
             max_tokens=1500,
+            priority=LLM_PRIORITY_INTERACTIVE,
         )
         
-        response_content = response.choices[0].message.content
-        
         # Log the follow-up response
         logger.info("=" * 80)
         logger.info("GPT FOLLOW-UP RESPONSE")
@@ -0,0 +1,99 @@
+# backend/app/services/incremental_json_parser.py
+
+import json
+import logging
+import re
+from typing import Any, List, Tuple
+
+logger = logging.getLogger("incremental_json_parser")
+
+
+class IncrementalJSONArrayParser:
+    """
+    Extract the elements of one array from a JSON document that is still arriving.
+
+    Text is fed in chunks as a streamed completion produces it. Once the array
+    under `key` has started, every element that is an object or array is
+    decoded and returned as soon as its closing bracket arrives, so
+    {"p":[[1,9.5,"..."],[2,8.8,"..."]... yields the first team before the
+    rest of the response exists. Scalar elements are ignored.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.count = 0
+        self.done = False
+        self._key_pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._item_start = None
+
+    def feed(self, text: str) -> List[Tuple[int, Any]]:
+        """
+        Add streamed text and collect the elements it completed.
+
+        Args:
+            text: Next chunk of the JSON document
+
+        Returns:
+            List of (1-based position in the array, decoded element) tuples
+        """
+        items: List[Tuple[int, Any]] = []
+        if self.done or not text:
+            return items
+        self._buffer += text
+
+        if not self._started:
+            match = self._key_pattern.search(self._buffer)
+            if not match:
+                return items
+            self._started = True
+            self._pos = match.end()
+
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            ch = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "[{":
+                if self._depth == 0:
+                    self._item_start = i
+                self._depth += 1
+            elif ch in "]}":
+                if self._depth == 0:
+                    # End of the array itself
+                    self.done = True
+                    i += 1
+                    break
+                self._depth -= 1
+                if self._depth == 0:
+                    raw = buffer[self._item_start:i + 1]
+                    self._item_start = None
+                    try:
+                        value = json.loads(raw)
+                    except ValueError:
+                        logger.warning(f"Skipping undecodable streamed element: {raw[:80]}")
+                    else:
+                        self.count += 1
+                        items.append((self.count, value))
+            i += 1
+
+        # Keep only the unfinished element so the buffer stays small
+        keep_from = self._item_start if self._item_start is not None else i
+        self._buffer = buffer[keep_from:]
+        self._pos = i - keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+        return items
@@ -0,0 +1,246 @@
+# backend/app/services/job_queue.py
+
+import asyncio
+import itertools
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.services.progress_tracker import ProgressTracker
+
+logger = logging.getLogger("job_queue")
+
+# Jobs executed at the same time; further jobs wait in the queue
+JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", "2"))
+# Queued (not yet running) jobs accepted before submissions are rejected
+JOB_QUEUE_MAX_PENDING = int(os.getenv("JOB_QUEUE_MAX_PENDING", "50"))
+# Seconds finished jobs stay listed
+JOB_RETENTION_SECONDS = 3600
+
+# Lower values run first
+JOB_PRIORITY_HIGH = 0
+JOB_PRIORITY_NORMAL = 5
+JOB_PRIORITY_LOW = 10
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """A unit of background work and its lifecycle state."""
+
+    job_id: str
+    kind: str
+    priority: int
+    run: Callable[[], Awaitable[Any]]
+    submitted_at: float
+    status: str = "queued"
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    task: Optional["asyncio.Task"] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "priority": self.priority,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """
+    In-process priority queue of long-running jobs with a bounded worker pool.
+
+    Submitting returns immediately; progress, status and the job's result are
+    published through ProgressTracker under the job id, so clients poll
+    /api/progress/{job_id} exactly as for any other tracked operation.
+    """
+
+    def __init__(self, workers: int = JOB_QUEUE_WORKERS, max_pending: int = JOB_QUEUE_MAX_PENDING):
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self._jobs: Dict[str, Job] = {}
+        self._sequence = itertools.count()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_workers(self) -> None:
+        """Start the worker tasks on the running event loop the first time they are needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.PriorityQueue()
+        self._worker_tasks = [loop.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f"Started {self.workers} job workers")
+
+    def _pending_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == "queued")
+
+    def _prune_finished(self) -> None:
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        for job_id in [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+
+    def submit(
+        self,
+        kind: str,
+        run: Callable[[], Awaitable[Any]],
+        job_id: Optional[str] = None,
+        priority: int = JOB_PRIORITY_NORMAL,
+    ) -> Job:
+        """
+        Queue a job for background execution.
+
+        A job id that is already queued or running is not queued twice; the
+        existing job is returned instead.
+
+        Args:
+            kind: Short job type label, e.g. "picklist" or "dataset_build"
+            run: Zero-argument callable returning the coroutine to execute
+            job_id: Optional id (also the ProgressTracker operation id)
+            priority: Lower values run first
+
+        Returns:
+            The queued (or already active) Job
+
+        Raises:
+            JobQueueFullError: If max_pending jobs are already waiting
+        """
+        self._ensure_workers()
+        self._prune_finished()
+
+        job_id = job_id or f"{kind}_{uuid.uuid4().hex[:8]}"
+        existing = self._jobs.get(job_id)
+        if existing and existing.status in ("queued", "running"):
+            logger.info(f"Job {job_id} is already {existing.status}")
+            return existing
+
+        pending = self._pending_count()
+        if pending >= self.max_pending:
+            raise JobQueueFullError(f"Job queue is full ({pending} jobs waiting)")
+
+        job = Job(job_id=job_id, kind=kind, priority=priority, run=run, submitted_at=time.time())
+        self._jobs[job_id] = job
+
+        tracker = ProgressTracker.create_tracker(job_id)
+        tracker.update(0, f"Queued ({pending} jobs ahead)...", "queued", status="queued")
+
+        self._queue.put_nowait((priority, next(self._sequence), job_id))
+        logger.info(f"Queued {kind} job {job_id} with priority {priority}")
+        return job
+
+    async def _worker(self, worker_index: int) -> None:
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != "queued":
+                # Cancelled while waiting
+                continue
+
+            job.status = "running"
+            job.started_at = time.time()
+            job.task = asyncio.ensure_future(job.run())
+            logger.info(f"Worker {worker_index} started {job.kind} job {job_id}")
+
+            try:
+                result = await job.task
+            except asyncio.CancelledError:
+                if not job.task.cancelled():
+                    raise
+                self._finish(job, "cancelled")
+            except Exception as e:
+                logger.error(f"{job.kind} job {job_id} failed: {e}")
+                self._finish(job, "failed", error=str(e))
+            else:
+                self._finish(job, "completed", result=result)
+
+    def _finish(self, job: Job, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+        job.task = None
+
+        tracker = ProgressTracker(job.job_id)
+        if status == "completed":
+            ProgressTracker.set_result(job.job_id, result)
+            if isinstance(result, dict) and result.get("status") == "error":
+                job.status = "failed"
+                job.error = result.get("message") or result.get("error")
+                tracker.fail(f"Job failed: {job.error}")
+            else:
+                tracker.complete()
+        elif status == "cancelled":
+            tracker.cancel()
+        else:
+            tracker.fail(f"Job failed: {error}")
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Args:
+            job_id: Job to cancel
+
+        Returns:
+            True if the job was queued or running, False otherwise
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        if job.status == "queued":
+            self._finish(job, "cancelled")
+            return True
+        if job.status == "running" and job.task is not None:
+            job.task.cancel()
+            return True
+        return False
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job's state.
+
+        Args:
+            job_id: Job id
+
+        Returns:
+            Job summary, or None if unknown
+        """
+        job = self._jobs.get(job_id)
+        return job.to_dict() if job else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with worker count, job counts by status and job summaries
+        """
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "counts": counts,
+            "jobs": [job.to_dict() for job in self._jobs.values()],
+        }
+
+
+# Shared queue for picklist generations and dataset builds
+job_queue = JobQueue()
@@ -0,0 +1,305 @@
+# backend/app/services/llm_gateway.py
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("llm_gateway")
+
+# Account-wide OpenAI limits shared by every service in this process
+OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
+# Retries for rate limits, timeouts and server errors
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))
+LLM_BACKOFF_BASE_SECONDS = 1.0
+LLM_BACKOFF_MAX_SECONDS = 60.0
+
+# Priority lanes; lower values are admitted first
+LLM_PRIORITY_INTERACTIVE = 0
+LLM_PRIORITY_NORMAL = 5
+LLM_PRIORITY_BATCH = 10
+LANE_NAMES = {
+    LLM_PRIORITY_INTERACTIVE: "interactive",
+    LLM_PRIORITY_NORMAL: "normal",
+    LLM_PRIORITY_BATCH: "batch",
+}
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = {"APITimeoutError", "APIConnectionError", "RateLimitError", "InternalServerError"}
+
+
+class TokenBucket:
+    """Continuously refilling token bucket sized to one minute of capacity."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(1, per_minute))
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (requests larger than capacity wait for a full bucket)."""
+        self._refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float) -> None:
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+_encoders: Dict[str, Any] = {}
+
+
+def estimate_tokens(model: str, messages: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> int:
+    """
+    Estimate the tokens a chat completion will count against the per-minute limit.
+
+    Uses tiktoken when its encoding is available and roughly four characters per
+    token otherwise (the encoding files are downloaded on first use and may be
+    unavailable offline). The completion limit is reserved in full.
+
+    Args:
+        model: Model name
+        messages: Chat messages
+        max_tokens: Completion token limit
+
+    Returns:
+        Estimated prompt plus completion tokens
+    """
+    text = "".join(str(m.get("content") or "") for m in messages)
+    encoder = _encoders.get(model)
+    if encoder is None and model not in _encoders:
+        try:
+            import tiktoken
+
+            try:
+                encoder = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoder = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken unavailable for {model}, estimating tokens from length: {e}")
+            encoder = None
+        _encoders[model] = encoder
+
+    prompt_tokens = len(encoder.encode(text)) if encoder else len(text) // 4
+    # Per-message formatting overhead
+    prompt_tokens += 4 * len(messages)
+    return prompt_tokens + (max_tokens or 1000)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read Retry-After (or retry-after-ms) from an API error response, if present."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES or "429" in str(error)
+
+
+class LLMGateway:
+    """
+    Process-wide admission control for OpenAI chat completions.
+
+    Every call waits for both the requests-per-minute and tokens-per-minute
+    buckets. Waiters are admitted strictly by priority lane, then arrival, so
+    a long batch run cannot starve interactive calls. Rate limit responses
+    pause admission for everyone until the server's Retry-After has passed,
+    and retryable failures back off exponentially with jitter.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = OPENAI_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = OPENAI_TOKENS_PER_MINUTE,
+        max_retries: int = LLM_MAX_RETRIES,
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self._waiters: List[list] = []
+        self._sequence = itertools.count()
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._stats = {"requests": 0, "retries": 0, "rate_limited": 0, "failures": 0, "wait_seconds": 0.0}
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._waiters = []
+        return self._condition
+
+    def _admission_delay(self, tokens: int) -> float:
+        return max(
+            self.request_bucket.time_until(1),
+            self.token_bucket.time_until(tokens),
+            self._paused_until - time.monotonic(),
+        )
+
+    async def _acquire(self, tokens: int, priority: int) -> None:
+        """Wait until this call is at the head of the queue and both buckets have capacity."""
+        condition = self._get_condition()
+        entry = [priority, next(self._sequence), tokens]
+        start = time.monotonic()
+
+        async with condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    delay = None
+                    if self._waiters[0] is entry:
+                        delay = self._admission_delay(tokens)
+                        if delay <= 0:
+                            heapq.heappop(self._waiters)
+                            self.request_bucket.consume(1)
+                            self.token_bucket.consume(tokens)
+                            condition.notify_all()
+                            break
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    condition.notify_all()
+                raise
+
+        self._stats["wait_seconds"] += time.monotonic() - start
+
+    async def _pause(self, seconds: float) -> None:
+        """Hold back every waiter until the shared rate limit has recovered."""
+        condition = self._get_condition()
+        async with condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            condition.notify_all()
+
+    async def chat_completion(
+        self,
+        client: Any,
+        priority: int = LLM_PRIORITY_NORMAL,
+        **request_args: Any,
+    ) -> Any:
+        """
+        Run client.chat.completions.create(**request_args) under the shared limits.
+
+        Args:
+            client: AsyncOpenAI client
+            priority: Lane, e.g. LLM_PRIORITY_INTERACTIVE or LLM_PRIORITY_BATCH
+            **request_args: Arguments for chat.completions.create
+
+        Returns:
+            The chat completion response
+
+        Raises:
+            Exception: The API error once retries are exhausted or when it is not retryable
+        """
+        tokens = estimate_tokens(
+            request_args.get("model", ""), request_args.get("messages", []), request_args.get("max_tokens")
+        )
+
+        attempt = 0
+        while True:
+            await self._acquire(tokens, priority)
+            self._in_flight += 1
+            self._stats["requests"] += 1
+            try:
+                response = await client.chat.completions.create(**request_args)
+            except Exception as e:
+                if not _is_retryable(e) or attempt >= self.max_retries:
+                    self._stats["failures"] += 1
+                    raise
+
+                retry_after = _retry_after_seconds(e)
+                backoff = min(LLM_BACKOFF_MAX_SECONDS, LLM_BACKOFF_BASE_SECONDS * (2 ** attempt))
+                if retry_after is not None:
+                    delay = retry_after + random.uniform(0, 0.25 * backoff)
+                else:
+                    # Full jitter keeps retrying callers from synchronizing
+                    delay = random.uniform(0.5 * backoff, backoff)
+
+                attempt += 1
+                self._stats["retries"] += 1
+                if _status_code(e) == 429 or "429" in str(e):
+                    self._stats["rate_limited"] += 1
+                    await self._pause(delay)
+                logger.warning(
+                    f"OpenAI call failed ({e}); retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            finally:
+                self._in_flight -= 1
+
+            usage = getattr(response, "usage", None)
+            total_tokens = getattr(usage, "total_tokens", None)
+            if isinstance(total_tokens, int) and total_tokens < tokens:
+                # Give back the unused part of the completion reservation
+                self.token_bucket.refund(tokens - total_tokens)
+            return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get gateway metrics.
+
+        Returns:
+            Dictionary with queue depth per lane, in-flight calls, bucket levels and counters
+        """
+        depth: Dict[str, int] = {}
+        for priority, _, _ in self._waiters:
+            lane = LANE_NAMES.get(priority, str(priority))
+            depth[lane] = depth.get(lane, 0) + 1
+        self.request_bucket._refill()
+        self.token_bucket._refill()
+        return {
+            **self._stats,
+            "queue_depth": len(self._waiters),
+            "queue_depth_by_lane": depth,
+            "in_flight": self._in_flight,
+            "requests_available": round(self.request_bucket.tokens, 1),
+            "tokens_available": round(self.token_bucket.tokens),
+            "paused_for_seconds": round(max(0.0, self._paused_until - time.monotonic()), 1),
+        }
+
+
+# Shared gateway used by every service that calls the chat completions API
+llm_gateway = LLMGateway()
@@ -0,0 +1,325 @@
+# backend/app/services/llm_provider.py
+
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+logger = logging.getLogger("llm_provider")
+
+# Backend used for chat completions: "openai" or "stub" (offline, deterministic)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai").lower()
+# Stub behaviour for load tests and benchmarks
+LLM_STUB_LATENCY_MS = float(os.getenv("LLM_STUB_LATENCY_MS", "0"))
+LLM_STUB_LATENCY_JITTER_MS = float(os.getenv("LLM_STUB_LATENCY_JITTER_MS", "0"))
+LLM_STUB_ERROR_RATE = float(os.getenv("LLM_STUB_ERROR_RATE", "0"))
+LLM_STUB_ERROR_STATUS = int(os.getenv("LLM_STUB_ERROR_STATUS", "429"))
+LLM_STUB_SEED = os.getenv("LLM_STUB_SEED")
+# Characters per chunk when a streamed response is requested
+LLM_STUB_STREAM_CHUNK_CHARS = 24
+
+
+class StubAPIError(Exception):
+    """Injected failure shaped like openai.APIStatusError (status_code and response headers)."""
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"Error code: {status_code} - injected by local LLM stub")
+        self.status_code = status_code
+        headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+def _find_json_value(text: str, marker: str) -> Optional[Any]:
+    """Decode the JSON value that follows `marker` in a prompt, if any."""
+    position = text.find(marker)
+    if position < 0:
+        return None
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text[position + len(marker):].lstrip())
+        return value
+    except ValueError:
+        return None
+
+
+def _table_teams(text: str) -> Optional[List[Dict[str, Any]]]:
+    """Teams from a delimited TEAM_TABLE prompt block, if the prompt has one."""
+    position = text.find("TEAM_TABLE")
+    if position < 0:
+        return None
+    lines = text[position:].splitlines()
+    start = next((i for i, line in enumerate(lines) if line.startswith(("i|team|", "team|name|"))), None)
+    if start is None:
+        return None
+
+    header = lines[start].split("|")
+    teams = []
+    for line in lines[start + 1:]:
+        cells = line.split("|")
+        if len(cells) != len(header):
+            break
+        row = dict(zip(header, cells))
+        try:
+            team = {"team_number": int(row["team"]), "weighted_score": float(row.get("score") or 0)}
+            if "i" in row:
+                team["index"] = int(row["i"])
+        except ValueError:
+            continue
+        teams.append(team)
+    return teams
+
+
+def _prompt_teams(text: str) -> List[Dict[str, Any]]:
+    """Teams listed in a picklist or comparison prompt, with their precomputed scores."""
+    teams = _find_json_value(text, "AVAILABLE_TEAMS =")
+    if isinstance(teams, list):
+        return [t for t in teams if isinstance(t, dict) and "team_number" in t]
+
+    teams = _table_teams(text)
+    if teams is not None:
+        return teams
+
+    # Plain "Team 254: Nickname" listings
+    return [
+        {"team_number": int(number), "weighted_score": 0.0}
+        for number in dict.fromkeys(re.findall(r"^Team (\d+):", text, flags=re.MULTILINE))
+    ]
+
+
+def _ranked(teams: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Teams ordered by their local weighted score with a 0-10 score attached."""
+    top = max((t.get("weighted_score") or 0.0 for t in teams), default=0.0) or 1.0
+    ranked = sorted(
+        enumerate(teams), key=lambda item: (-(item[1].get("weighted_score") or 0.0), item[0])
+    )
+    return [
+        {**team, "stub_score": round(10.0 * (team.get("weighted_score") or 0.0) / top, 2)}
+        for _, team in ranked
+    ]
+
+
+def _respond_compact_picklist(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"p":[[index' not in system:
+        return None
+    teams = _ranked(_prompt_teams(user))
+    return {
+        "p": [
+            [t.get("index", i), t["stub_score"], "Local stub: ranked by weighted score"]
+            for i, t in enumerate(teams, start=1)
+        ],
+        "s": "ok",
+    }
+
+
+def _respond_rank_only_picklist(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"r":[index' not in system:
+        return None
+    teams = _ranked(_prompt_teams(user))
+    return {"r": [t.get("index", i) for i, t in enumerate(teams, start=1)], "s": "ok"}
+
+
+def _respond_team_reasons(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"reasons"' not in system:
+        return None
+    team_numbers = _find_json_value(user, "TEAMS_TO_EXPLAIN =") or []
+    return {
+        "reasons": [
+            {"team_number": number, "reasoning": f"Local stub: Team {number} placed by weighted score"}
+            for number in team_numbers
+        ],
+        "s": "ok",
+    }
+
+
+def _respond_standard_picklist(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"teams": [{"team_number"' not in system:
+        return None
+    return {
+        "teams": [
+            {"team_number": t["team_number"], "score": t["stub_score"], "reasoning": "Local stub: ranked by weighted score"}
+            for t in _ranked(_prompt_teams(user))
+        ],
+        "status": "ok",
+    }
+
+
+def _respond_comparison(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"ranking"' not in system:
+        return None
+    teams = _ranked(_prompt_teams(user))
+    metric_names = list((teams[0].get("metrics") or {}).keys())[:5] if teams else []
+    return {
+        "ranking": [
+            {"team_number": t["team_number"], "rank": rank, "score": t["stub_score"], "brief_reason": "Local stub"}
+            for rank, t in enumerate(teams, start=1)
+        ],
+        "summary": "Local stub analysis: teams are ordered by their precomputed weighted score.",
+        "key_metrics": metric_names,
+    }
+
+
+def _respond_game_context(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"scoring_summary"' not in system:
+        return None
+    phase = {"duration_seconds": 0, "key_objectives": [], "point_values": {}, "strategic_notes": ""}
+    return {
+        "game_year": 0,
+        "game_name": "Local Stub Game",
+        "extraction_version": "1.0",
+        "scoring_summary": {"autonomous": phase, "teleop": phase, "endgame": phase},
+        "strategic_elements": [],
+        "alliance_considerations": [],
+        "key_metrics": [],
+    }
+
+
+def _respond_labels(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"labels"' not in system + user:
+        return None
+    return {"labels": []}
+
+
+def _respond_manual_sections(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"sections"' not in user:
+        return None
+    return {"game_name": "Local Stub Game", "sections": []}
+
+
+def _respond_scouting_variables(system: str, user: str) -> Optional[Dict[str, Any]]:
+    if '"auto_phase"' not in user:
+        return None
+    variables = {"auto_phase": [], "teleop_phase": [], "endgame": [], "strategy": []}
+    if '"field_elements"' in user:
+        return {"game_name": "Local Stub Game", "field_elements": [], "scoring_actions": [], "scouting_variables": variables}
+    return variables
+
+
+# Tried in order; each returns a JSON-serializable response or None when the prompt is not its kind
+STUB_RESPONDERS: List[Callable[[str, str], Optional[Dict[str, Any]]]] = [
+    _respond_compact_picklist,
+    _respond_rank_only_picklist,
+    _respond_team_reasons,
+    _respond_standard_picklist,
+    _respond_comparison,
+    _respond_game_context,
+    _respond_labels,
+    _respond_manual_sections,
+    _respond_scouting_variables,
+]
+
+
+class LocalStubProvider:
+    """
+    Offline chat completion backend with the AsyncOpenAI call surface.
+
+    Recognizes the prompts this app sends (picklist ranking, team comparison,
+    game context, label and manual extraction) and answers with schema-valid
+    JSON built from the prompt itself - teams are ranked by the precomputed
+    weighted score. Latency and failures can be injected to benchmark
+    batching, retry and rate-limit behaviour without an API key.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = LLM_STUB_LATENCY_MS,
+        latency_jitter_ms: float = LLM_STUB_LATENCY_JITTER_MS,
+        error_rate: float = LLM_STUB_ERROR_RATE,
+        error_status: int = LLM_STUB_ERROR_STATUS,
+        seed: Optional[str] = LLM_STUB_SEED,
+    ):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create_chat_completion))
+
+    def _content_for(self, messages: List[Dict[str, Any]], json_mode: bool) -> str:
+        system = "\n".join(str(m.get("content") or "") for m in messages if m.get("role") == "system")
+        user = "\n".join(str(m.get("content") or "") for m in messages if m.get("role") != "system")
+        for responder in STUB_RESPONDERS:
+            response = responder(system, user)
+            if response is not None:
+                return json.dumps(response)
+        return "{}" if json_mode else "Local stub response."
+
+    async def create_chat_completion(self, **request_args: Any) -> Any:
+        """
+        Answer a chat completion request locally.
+
+        Args:
+            **request_args: Arguments as passed to AsyncOpenAI.chat.completions.create
+
+        Returns:
+            Response object with choices[0].message.content, finish_reason and usage,
+            or an async iterator of delta chunks when stream=True
+
+        Raises:
+            StubAPIError: With probability error_rate
+        """
+        self.calls += 1
+        delay_ms = self.latency_ms + self._random.uniform(-1, 1) * self.latency_jitter_ms
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise StubAPIError(self.error_status, retry_after=1.0 if self.error_status == 429 else None)
+
+        messages = request_args.get("messages", [])
+        json_mode = (request_args.get("response_format") or {}).get("type") == "json_object"
+        content = self._content_for(messages, json_mode)
+        if request_args.get("stream"):
+            return self._stream(content)
+
+        prompt_tokens = sum(len(str(m.get("content") or "")) for m in messages) // 4
+        completion_tokens = len(content) // 4
+        return SimpleNamespace(
+            model=request_args.get("model"),
+            choices=[SimpleNamespace(message=SimpleNamespace(role="assistant", content=content), finish_reason="stop")],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
+
+    async def _stream(self, content: str) -> AsyncIterator[Any]:
+        """Yield the content as chat completion chunks, the last one carrying finish_reason."""
+        for start in range(0, len(content), LLM_STUB_STREAM_CHUNK_CHARS):
+            piece = content[start:start + LLM_STUB_STREAM_CHUNK_CHARS]
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece), finish_reason=None)])
+            await asyncio.sleep(0)
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None), finish_reason="stop")])
+
+
+def create_llm_client(provider: Optional[str] = None) -> Any:
+    """
+    Create the chat completion client for the configured provider.
+
+    Every provider exposes the AsyncOpenAI call surface used by the services
+    (client.chat.completions.create), so callers and the rate-limit gateway do
+    not depend on which backend is active.
+
+    Args:
+        provider: "openai" or "stub"; defaults to the LLM_PROVIDER setting
+
+    Returns:
+        AsyncOpenAI client or LocalStubProvider
+    """
+    provider = (provider or LLM_PROVIDER).lower()
+    if provider == "stub":
+        logger.info("Using local LLM stub provider")
+        return LocalStubProvider()
+    if provider != "openai":
+        logger.warning(f"Unknown LLM_PROVIDER '{provider}', using openai")
+
+    from openai import AsyncOpenAI
+
+    from app.config.openai_config import OPENAI_API_KEY
+
+    # The LLM gateway is the only retry layer, inside the shared rate limits
+    return AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=0)
@@ -0,0 +1,320 @@
+# backend/app/services/llm_response_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services.llm_gateway import LLM_PRIORITY_NORMAL, llm_gateway
+from app.services.llm_provider import LocalStubProvider
+
+logger = logging.getLogger("llm_response_cache")
+
+# Base directory for cache files
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", os.path.join(BASE_DIR, "cache", "llm_responses"))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+# Total size of cached responses on disk, least recently used evicted first
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_MB", "200")) * 1024 * 1024
+# Age after which an entry is ignored; 0 keeps entries until evicted
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "0"))
+
+
+class LLMResponseCache:
+    """
+    Content-addressed on-disk cache of chat completion responses.
+
+    Entries are keyed by a hash of everything that determines the response
+    (model, sampling settings, messages, response format) and stored one file
+    per entry. Writes go through a temporary file and an atomic rename, so
+    several workers can share the directory; reads refresh the file's mtime,
+    which is what LRU eviction orders by.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = LLM_CACHE_DIR,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        enabled: bool = LLM_CACHE_ENABLED,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: Optional[float] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Build the cache key for a chat completion request.
+
+        Args:
+            model: Model name
+            messages: Chat messages (system prompt, user prompt, history)
+            temperature: Sampling temperature
+            response_format: OpenAI response_format argument
+            max_tokens: Completion token limit
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = {
+            "model": model,
+            "messages": [{"role": m.get("role"), "content": m.get("content")} for m in messages],
+            "temperature": temperature,
+            "response_format": response_format,
+            "max_tokens": max_tokens,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Entry with "content" and "finish_reason", or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+
+        if self.ttl_seconds and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            with self._lock:
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+            return None
+
+        try:
+            # Mark as recently used for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._stats["hits"] += 1
+        return entry
+
+    def put(self, key: str, content: str, finish_reason: Optional[str] = None, model: Optional[str] = None) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_key()
+            content: Message content returned by the model
+            finish_reason: Finish reason returned by the model
+            model: Model name, kept for inspection
+        """
+        if not self.enabled:
+            return
+
+        path = self._entry_path(key)
+        entry = {
+            "key": key,
+            "model": model,
+            "content": content,
+            "finish_reason": finish_reason,
+            "created_at": time.time(),
+        }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store LLM response in cache: {e}")
+            return
+
+        with self._lock:
+            self._stats["stores"] += 1
+            if self._total_bytes is not None:
+                self._total_bytes += size
+            over_limit = self._total_bytes is None or self._total_bytes > self.max_bytes
+        if over_limit:
+            self._evict()
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            # Another worker already removed it
+            return False
+
+    def _evict(self) -> None:
+        """Recount the directory and drop least recently used entries over the size limit."""
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        if total > self.max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                if self._remove(path):
+                    evicted += 1
+                total -= size
+        with self._lock:
+            self._total_bytes = total
+            self._stats["evictions"] += evicted
+        if evicted:
+            logger.info(f"Evicted {evicted} cached LLM responses ({total} bytes kept)")
+
+    def clear(self) -> int:
+        """
+        Remove every cached response.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = sum(1 for _, _, path in self._scan() if self._remove(path))
+        with self._lock:
+            self._total_bytes = 0
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and the cache configuration
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "enabled": self.enabled,
+                "cache_dir": self.cache_dir,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "total_bytes": self._total_bytes,
+            }
+
+
+# Shared cache used by every service that calls the chat completions API
+llm_response_cache = LLMResponseCache()
+
+
+async def cached_chat_completion(
+    client: Any,
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: Optional[float] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    max_tokens: Optional[int] = None,
+    cache: Optional[LLMResponseCache] = None,
+    priority: int = LLM_PRIORITY_NORMAL,
+    on_delta: Optional[Callable[[str], None]] = None,
+) -> Tuple[str, Optional[str]]:
+    """
+    Run a chat completion, answering repeated requests from the response cache.
+
+    Only complete responses (finish_reason "stop") are stored, so truncated
+    output and API errors are always retried against the API. Cache misses go
+    through the shared rate-limit gateway. With `on_delta`, misses are
+    streamed and each piece of content is passed on as it arrives; a cache hit
+    delivers the whole content in one piece.
+
+    Calls to the LocalStubProvider bypass the cache: stub answers must never
+    be served to a real client, and offline benchmarks need every call to go
+    through the stub's injected latency and errors.
+
+    Args:
+        client: AsyncOpenAI client
+        model: Model name
+        messages: Chat messages
+        temperature: Sampling temperature
+        response_format: OpenAI response_format argument
+        max_tokens: Completion token limit
+        cache: Cache to use, defaults to the shared llm_response_cache
+        priority: Gateway lane for cache misses
+        on_delta: Optional callback receiving the content incrementally
+
+    Returns:
+        Tuple of (message content, finish reason)
+    """
+    cache = cache or llm_response_cache
+    use_cache = not isinstance(client, LocalStubProvider)
+    key = cache.make_key(model, messages, temperature, response_format, max_tokens)
+
+    entry = cache.get(key) if use_cache else None
+    if entry is not None:
+        logger.info(f"LLM response cache hit ({key[:12]})")
+        if on_delta is not None:
+            on_delta(entry["content"])
+        return entry["content"], entry.get("finish_reason")
+
+    request_args: Dict[str, Any] = {"model": model, "messages": messages}
+    if temperature is not None:
+        request_args["temperature"] = temperature
+    if response_format is not None:
+        request_args["response_format"] = response_format
+    if max_tokens is not None:
+        request_args["max_tokens"] = max_tokens
+
+    if on_delta is not None:
+        stream = await llm_gateway.chat_completion(client, priority=priority, stream=True, **request_args)
+        parts: List[str] = []
+        finish_reason = None
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = getattr(choice.delta, "content", None)
+            if delta:
+                parts.append(delta)
+                on_delta(delta)
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+        content = "".join(parts)
+    else:
+        response = await llm_gateway.chat_completion(client, priority=priority, **request_args)
+        content = response.choices[0].message.content
+        finish_reason = response.choices[0].finish_reason
+
+    if use_cache and finish_reason == "stop" and content is not None:
+        cache.put(key, content, finish_reason, model)
+    return content, finish_reason
@@ -9,13 +9,14 @@ import fitz  # PyMuPDF
 import httpx
 from app.services.global_cache import cache
 from fastapi import UploadFile
-from openai import AsyncOpenAI
-from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
+from app.config.openai_config import OPENAI_MODEL
+from app.services.llm_provider import create_llm_client
+from app.services.llm_response_cache import cached_chat_completion
 
 GPT_MODEL = OPENAI_MODEL
 
 # Initialize OpenAI client
-client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+client = create_llm_client()
 
 
 async def extract_text_from_pdf(file_content: bytes) -> str:
@@ -293,7 +294,8 @@ Format your response as structured JSON:
 
     try:
         # Call the OpenAI API
-        response = await client.chat.completions.create(
+        content, _ = await cached_chat_completion(
+            client,
             model=GPT_MODEL,
             messages=[
                 {
@@ -307,7 +309,7 @@ Format your response as structured JSON:
         )
 
         # Parse the response
-        extracted_data = json.loads(response.choices[0].message.content)
+        extracted_data = json.loads(content)
 
         # Create a condensed version of all relevant sections for context
         relevant_sections = ""
@@ -399,7 +401,8 @@ Output structured JSON only, following this format:
 """
 
     try:
-        response = await client.chat.completions.create(
+        content, _ = await cached_chat_completion(
+            client,
             model=GPT_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
@@ -408,7 +411,7 @@ Output structured JSON only, following this format:
         )
 
         # Parse the response
-        extracted_info = json.loads(response.choices[0].message.content)
+        extracted_info = json.loads(content)
 
         # Save to cache for reference
         cache["game_analysis"] = extracted_info
@@ -461,7 +464,8 @@ Game Description:
 """
 
     try:
-        response = await client.chat.completions.create(
+        content, _ = await cached_chat_completion(
+            client,
             model=GPT_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
@@ -470,7 +474,7 @@ Game Description:
         )
 
         # Parse the response
-        variables_data = json.loads(response.choices[0].message.content)
+        variables_data = json.loads(content)
 
         # Ensure we have at least empty lists for each category
         default_categories = ["auto_phase", "teleop_phase", "endgame", "strategy"]
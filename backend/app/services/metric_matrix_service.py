@@ -0,0 +1,579 @@
+# backend/app/services/metric_matrix_service.py
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.dataset_registry import dataset_registry
+
+logger = logging.getLogger("metric_matrix_service")
+
+# Number of dataset versions whose matrices are kept in memory
+METRIC_MATRIX_CACHE_SIZE = int(os.getenv("METRIC_MATRIX_CACHE_SIZE", "4"))
+
+# Identifier fields that are numeric but are not performance metrics
+SCOUTING_ID_FIELDS = ("team_number", "match_number", "qual_number")
+SUPERSCOUTING_ID_FIELDS = SCOUTING_ID_FIELDS + ("robot_group",)
+
+# Minimum number of (value, win) pairs before a win correlation is reported
+MIN_WIN_CORRELATION_PAIRS = 6
+
+# Weight samples scored per matrix product in the rank sensitivity analysis
+SENSITIVITY_BATCH_SIZE = 2000
+
+
+def build_match_outcome_lookup(dataset: Dict[str, Any]) -> Dict[Tuple[Any, str], Optional[bool]]:
+    """
+    Precompute (match_number, alliance_color) -> won from the dataset's TBA matches.
+
+    Only the first TBA match with a given match number is used, and alliances
+    without result data are left out (outcome unknown).
+
+    Args:
+        dataset: Unified dataset dictionary
+
+    Returns:
+        Dictionary mapping (match_number, alliance_color) to the winner flag
+    """
+    lookup = {}
+    seen_match_numbers = set()
+    for tba_match in dataset.get("tba_matches", []):
+        match_number = tba_match.get("match_number")
+        if match_number in seen_match_numbers:
+            continue
+        seen_match_numbers.add(match_number)
+
+        for alliance_color, alliance_result in tba_match.get("alliances", {}).items():
+            if alliance_result:
+                # TBA marks the winner with "winner" field
+                lookup[(match_number, alliance_color)] = alliance_result.get("winner", False)
+    return lookup
+
+
+class MetricMatrix:
+    """
+    Dense team × match × metric matrix for one unified dataset version.
+
+    Every scouting and superscouting record becomes one row (tagged with its
+    team) and every numeric field one column; missing values are NaN. Match
+    outcomes are resolved once per row so win correlations are plain
+    vectorized reductions.
+    """
+
+    def __init__(self, dataset: Dict[str, Any]):
+        """
+        Build the matrix from a unified dataset.
+
+        Args:
+            dataset: Unified dataset dictionary (read only)
+        """
+        start = time.perf_counter()
+        outcomes = build_match_outcome_lookup(dataset)
+
+        self.metric_names: List[str] = []
+        self.metric_index: Dict[str, int] = {}
+        self.team_keys: List[str] = []
+        record_teams: List[int] = []
+        record_won: List[float] = []
+        cell_rows: List[int] = []
+        cell_columns: List[int] = []
+        cell_values: List[float] = []
+
+        for team_key, team_data in dataset.get("teams", {}).items():
+            team_position = len(self.team_keys)
+            self.team_keys.append(team_key)
+
+            for records, id_fields in (
+                (team_data.get("scouting_data", []), SCOUTING_ID_FIELDS),
+                (team_data.get("superscouting_data", []), SUPERSCOUTING_ID_FIELDS),
+            ):
+                for record in records:
+                    row = len(record_teams)
+                    record_teams.append(team_position)
+                    record_won.append(self._resolve_outcome(record, outcomes))
+
+                    for field, value in record.items():
+                        if isinstance(value, (int, float)) and field not in id_fields:
+                            column = self.metric_index.get(field)
+                            if column is None:
+                                column = len(self.metric_names)
+                                self.metric_index[field] = column
+                                self.metric_names.append(field)
+                            cell_rows.append(row)
+                            cell_columns.append(column)
+                            cell_values.append(float(value))
+
+        self.values = np.full((len(record_teams), len(self.metric_names)), np.nan)
+        if cell_values:
+            self.values[cell_rows, cell_columns] = cell_values
+        self.record_teams = np.array(record_teams, dtype=int)
+        self.won = np.array(record_won, dtype=float)
+        self._statistics: Optional[Dict[str, Dict[str, float]]] = None
+
+        logger.info(
+            f"Built metric matrix with {self.values.shape[0]} records x {self.values.shape[1]} metrics "
+            f"in {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+
+    @staticmethod
+    def _resolve_outcome(record: Dict[str, Any], outcomes: Dict[Tuple[Any, str], Optional[bool]]) -> float:
+        """Return 1.0/0.0 for a won/lost record, NaN when the outcome is unknown."""
+        alliance_color = record.get("alliance_color")
+        match_number = record.get("match_number") or record.get("qual_number")
+        if not match_number or not alliance_color:
+            return np.nan
+        try:
+            won_match = outcomes.get((match_number, alliance_color))
+        except TypeError:
+            return np.nan
+        if won_match is None:
+            return np.nan
+        return 1.0 if won_match else 0.0
+
+    def metric_statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Mean, standard deviation, min, max and win correlation for every metric.
+
+        Returns:
+            Dict with metric_id -> stats dictionary (computed once per matrix)
+        """
+        if self._statistics is not None:
+            return self._statistics
+
+        values = self.values
+        present = ~np.isnan(values)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            filled = np.where(present, values, 0.0)
+            counts = present.sum(axis=0)
+            means = filled.sum(axis=0) / counts
+            deviations = np.where(present, values - means, 0.0)
+            stds = np.sqrt((deviations**2).sum(axis=0) / counts)
+            minimums = np.where(present, values, np.inf).min(axis=0, initial=np.inf)
+            maximums = np.where(present, values, -np.inf).max(axis=0, initial=-np.inf)
+
+            # Pearson correlation over the rows where both the value and the outcome are known
+            paired = present & ~np.isnan(self.won)[:, None]
+            pair_counts = paired.sum(axis=0)
+            won = np.broadcast_to(self.won[:, None], values.shape)
+            value_means = np.where(paired, values, 0.0).sum(axis=0) / pair_counts
+            won_means = np.where(paired, won, 0.0).sum(axis=0) / pair_counts
+            value_deviations = np.where(paired, values - value_means, 0.0)
+            won_deviations = np.where(paired, won - won_means, 0.0)
+            correlations = (value_deviations * won_deviations).sum(axis=0) / np.sqrt(
+                (value_deviations**2).sum(axis=0) * (won_deviations**2).sum(axis=0)
+            )
+            correlations = np.clip(correlations, -1.0, 1.0)
+
+        # Undefined correlations (too few pairs or no variation) default to 0
+        correlations = np.where(
+            (pair_counts >= MIN_WIN_CORRELATION_PAIRS) & ~np.isnan(correlations), correlations, 0.0
+        )
+
+        self._statistics = {
+            metric: {
+                "mean": float(means[i]),
+                "std": float(stds[i]),
+                "min": float(minimums[i]),
+                "max": float(maximums[i]),
+                "correlation_to_win": float(correlations[i]),
+            }
+            for i, metric in enumerate(self.metric_names)
+        }
+        return self._statistics
+
+
+# Universal rating metrics and the fields they can be read from, in lookup order
+UNIVERSAL_RATING_FIELDS = {
+    "defense": ["defense", "defense_rating", "defensive_rating", "defense_skill"],
+    "driver_skill": ["driver_skill", "driver_rating", "driving_skill"],
+}
+UNIVERSAL_METRIC_IDS = ("reliability",) + tuple(UNIVERSAL_RATING_FIELDS)
+
+
+class TeamMetricTable:
+    """
+    Precomputed team × metric matrix used to rank teams by weighted priorities.
+
+    Each row is a team and each column either a per-team average of a scouting
+    metric (or a Statbotics value) or one of the universal metrics: reliability
+    (consistency score from the coefficient of variation), defense and driver
+    skill (resolved from their alias fields). Values keep the scale the
+    weighted ranking has always used; a missing value is NaN and contributes
+    nothing to a score. Ranking is then one matrix-vector product and a sort.
+    """
+
+    def __init__(self, dataset: Dict[str, Any]):
+        """
+        Build the table from a unified dataset.
+
+        Args:
+            dataset: Unified dataset dictionary (read only)
+        """
+        start = time.perf_counter()
+
+        self.team_numbers: List[int] = []
+        self.nicknames: List[str] = []
+        self.match_counts: List[int] = []
+        self.team_stats: List[Dict[str, float]] = []
+        self.reliability_metrics: List[List[str]] = []
+        self.column_index: Dict[str, int] = {}
+        team_rows: List[Dict[int, float]] = []
+
+        for team_key, team_data in dataset.get("teams", {}).items():
+            try:
+                team_number = int(team_key)
+            except ValueError:
+                continue  # Skip if team_key can't be converted to int
+
+            # Collect all numeric metrics for this team
+            team_metrics: Dict[str, List[float]] = {}
+            total_matches = 0
+            for match in team_data.get("scouting_data", []):
+                # Skip virtual scouts unless there are no real scouts
+                if match.get("is_virtual_scout") and total_matches > 0:
+                    continue
+
+                total_matches += 1
+                for field, value in match.items():
+                    if isinstance(value, (int, float)) and field not in SCOUTING_ID_FIELDS:
+                        team_metrics.setdefault(field, []).append(value)
+
+            avg_metrics = {
+                metric: sum(values) / len(values) for metric, values in team_metrics.items() if values
+            }
+            # Add EPA metrics if available
+            for key, value in team_data.get("statbotics_info", {}).items():
+                if isinstance(value, (int, float)):
+                    avg_metrics[key] = value
+
+            row = {self._column(metric): value for metric, value in avg_metrics.items()}
+
+            reliability, consistency_metrics = self._reliability(team_metrics)
+            if reliability is not None:
+                row[self._column("reliability", universal=True)] = reliability
+            for metric_id, fields in UNIVERSAL_RATING_FIELDS.items():
+                rating = self._rating(avg_metrics, team_data, fields)
+                if rating is not None:
+                    row[self._column(metric_id, universal=True)] = rating
+
+            self.team_numbers.append(team_number)
+            self.nicknames.append(team_data.get("nickname", f"Team {team_number}"))
+            self.match_counts.append(total_matches)
+            self.team_stats.append(avg_metrics)
+            self.reliability_metrics.append(consistency_metrics)
+            team_rows.append(row)
+
+        self.values = np.full((len(team_rows), len(self.column_index)), np.nan)
+        for team_position, row in enumerate(team_rows):
+            if row:
+                self.values[team_position, list(row.keys())] = list(row.values())
+
+        logger.info(
+            f"Built team metric table with {self.values.shape[0]} teams x {self.values.shape[1]} columns "
+            f"in {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+
+    def _column(self, metric_id: str, universal: bool = False) -> int:
+        # Universal metrics live under a separate key so a raw field with the same name never collides
+        key = f"universal:{metric_id}" if universal else metric_id
+        if key not in self.column_index:
+            self.column_index[key] = len(self.column_index)
+        return self.column_index[key]
+
+    @staticmethod
+    def _reliability(team_metrics: Dict[str, List[float]]) -> Tuple[Optional[float], List[str]]:
+        """Average 0-10 consistency score (inverse coefficient of variation) and the metrics used."""
+        consistency_score = 0.0
+        consistency_metrics = []
+        for key, values in team_metrics.items():
+            if len(values) > 1:
+                values_array = np.array(values, dtype=float)
+                mean = values_array.mean()
+                if mean != 0:
+                    # Coefficient of variation (lower is better), converted to an inverse 0-10 scale
+                    cv = values_array.std() / abs(mean)
+                    consistency_score += max(0, 10 - 10 * min(cv, 1))
+                    consistency_metrics.append(key)
+
+        if consistency_score > 0:
+            return consistency_score / len(consistency_metrics), consistency_metrics
+        return None, consistency_metrics
+
+    @staticmethod
+    def _rating(avg_metrics: Dict[str, float], team_data: Dict[str, Any], fields: List[str]) -> Optional[float]:
+        """Rating from the first averaged alias field, else the superscouting average."""
+        for field in fields:
+            if field in avg_metrics:
+                return avg_metrics[field]
+
+        ratings = [
+            entry[field]
+            for entry in team_data.get("superscouting_data") or []
+            for field in fields
+            if field in entry and isinstance(entry[field], (int, float))
+        ]
+        if ratings:
+            return sum(ratings) / len(ratings)
+        return None
+
+    def column_for(self, metric_id: str) -> Optional[int]:
+        """Column holding a priority metric, or None if no team has it."""
+        if metric_id in UNIVERSAL_METRIC_IDS:
+            return self.column_index.get(f"universal:{metric_id}")
+        return self.column_index.get(metric_id)
+
+    def weight_vector(self, weights: Dict[str, float]) -> np.ndarray:
+        """
+        Turn metric weights into a weight vector over the table's columns.
+
+        Args:
+            weights: Metric ID -> weight; unknown metrics are ignored
+
+        Returns:
+            Weight vector aligned with the table's columns
+        """
+        vector = np.zeros(len(self.column_index))
+        for metric_id, weight in weights.items():
+            column = self.column_for(metric_id)
+            if column is not None:
+                vector[column] += weight
+        return vector
+
+    def scores(self, weights: Dict[str, float]) -> np.ndarray:
+        """
+        Weighted score for every team.
+
+        Args:
+            weights: Metric ID -> weight
+
+        Returns:
+            Array of scores aligned with team_numbers
+        """
+        if not self.team_numbers:
+            return np.zeros(0)
+        return np.nan_to_num(self.values, nan=0.0) @ self.weight_vector(weights)
+
+    def order(self, scores: np.ndarray) -> np.ndarray:
+        """Team positions sorted by descending score, ties kept in dataset order."""
+        return np.argsort(-scores, kind="stable")
+
+    def rank(self, weights: Dict[str, float]) -> List[Dict[str, Any]]:
+        """
+        Rank teams by weights, returning only team numbers and scores.
+
+        Args:
+            weights: Metric ID -> weight
+
+        Returns:
+            List of {"team_number", "score"} dictionaries, best first
+        """
+        scores = self.scores(weights)
+        return [
+            {"team_number": self.team_numbers[i], "score": float(scores[i])}
+            for i in self.order(scores)
+        ]
+
+    def rank_teams(self, weights: Dict[str, float]) -> List[Dict[str, Any]]:
+        """
+        Rank teams by weights with per-metric contributions and team averages.
+
+        Args:
+            weights: Metric ID -> weight
+
+        Returns:
+            List of ranked teams with scores and details, best first
+        """
+        scores = self.scores(weights)
+        columns = [(metric_id, weight, self.column_for(metric_id)) for metric_id, weight in weights.items()]
+
+        ranked = []
+        for i in self.order(scores):
+            used_metrics = []
+            for metric_id, weight, column in columns:
+                if column is None or np.isnan(self.values[i, column]):
+                    continue
+                value = float(self.values[i, column])
+                contribution = {"id": metric_id, "value": value, "weighted_value": value * weight}
+                if metric_id == "reliability":
+                    # Include up to 3 example metrics
+                    contribution["metrics_used"] = self.reliability_metrics[i][:3]
+                used_metrics.append(contribution)
+
+            ranked.append(
+                {
+                    "team_number": self.team_numbers[i],
+                    "nickname": self.nicknames[i],
+                    "score": float(scores[i]),
+                    "stats": self.team_stats[i],
+                    "metrics_contribution": used_metrics,
+                    "match_count": self.match_counts[i],
+                }
+            )
+        return ranked
+
+    def weight_sensitivity(
+        self,
+        weights: Dict[str, float],
+        samples: int = 10000,
+        spread: float = 0.25,
+        top_n: int = 8,
+        confidence: float = 0.9,
+        seed: Optional[int] = None,
+        batch_size: int = SENSITIVITY_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Monte Carlo rank stability under random perturbations of the weights.
+
+        Each sample multiplies every weight by an independent log-normal factor
+        (sigma = spread) and re-ranks all teams. Samples are scored in batches
+        as one matrix product each, and ranks are accumulated into a
+        team x rank histogram, so memory does not grow with the sample count.
+
+        Args:
+            weights: Metric ID -> chosen weight
+            samples: Number of weight perturbations to evaluate
+            spread: Standard deviation of the log weight multipliers
+            top_n: Cut-off for the top-N probability
+            confidence: Width of the reported rank interval (e.g., 0.9 -> 5th-95th percentile)
+            seed: Optional random seed for reproducible results
+            batch_size: Number of samples scored per matrix product
+
+        Returns:
+            Dictionary with sampling settings and per-team rank statistics, in base rank order
+        """
+        team_count = len(self.team_numbers)
+        metric_columns = [
+            (metric_id, weight, self.column_for(metric_id)) for metric_id, weight in weights.items()
+        ]
+        used = [(metric_id, weight, column) for metric_id, weight, column in metric_columns if column is not None]
+        result = {
+            "samples": samples,
+            "spread": spread,
+            "top_n": top_n,
+            "confidence": confidence,
+            "metrics_used": [metric_id for metric_id, _, _ in used],
+            "teams": [],
+        }
+        if team_count == 0:
+            return result
+
+        values = np.nan_to_num(self.values[:, [column for _, _, column in used]], nan=0.0)
+        base_weights = np.array([weight for _, weight, _ in used], dtype=float)
+        base_order = self.order(values @ base_weights)
+        base_ranks = np.empty(team_count, dtype=int)
+        base_ranks[base_order] = np.arange(team_count)
+
+        rng = np.random.default_rng(seed)
+        rank_counts = np.zeros(team_count * team_count, dtype=np.int64)
+        team_offsets = np.arange(team_count) * team_count
+        remaining = samples
+        while remaining > 0:
+            batch = min(batch_size, remaining)
+            remaining -= batch
+
+            sampled_weights = base_weights * np.exp(rng.normal(0.0, spread, (batch, len(used))))
+            scores = sampled_weights @ values.T  # batch x teams
+            order = np.argsort(-scores, axis=1, kind="stable")
+            ranks = np.empty_like(order)
+            np.put_along_axis(ranks, order, np.arange(team_count)[None, :], axis=1)
+            rank_counts += np.bincount((ranks + team_offsets).ravel(), minlength=team_count * team_count)
+
+        histogram = rank_counts.reshape(team_count, team_count) / max(samples, 1)
+        cumulative = np.cumsum(histogram, axis=1)
+        tail = (1.0 - confidence) / 2.0
+        interval_low = np.argmax(cumulative >= tail - 1e-12, axis=1)
+        interval_high = np.argmax(cumulative >= 1.0 - tail - 1e-12, axis=1)
+        median = np.argmax(cumulative >= 0.5 - 1e-12, axis=1)
+        rank_positions = np.arange(team_count)
+        mean_ranks = histogram @ rank_positions
+        rank_stds = np.sqrt(np.maximum(histogram @ rank_positions**2 - mean_ranks**2, 0.0))
+        top_n_probability = cumulative[:, min(max(top_n, 1), team_count) - 1]
+
+        # Ranks are reported 1-based
+        result["teams"] = [
+            {
+                "team_number": self.team_numbers[i],
+                "nickname": self.nicknames[i],
+                "base_rank": int(base_ranks[i]) + 1,
+                "mean_rank": float(mean_ranks[i]) + 1,
+                "median_rank": int(median[i]) + 1,
+                "rank_std": float(rank_stds[i]),
+                "rank_interval": [int(interval_low[i]) + 1, int(interval_high[i]) + 1],
+                "top_n_probability": float(top_n_probability[i]),
+                "base_rank_probability": float(histogram[i, base_ranks[i]]),
+            }
+            for i in base_order
+        ]
+        return result
+
+
+_matrix_cache: "OrderedDict[str, MetricMatrix]" = OrderedDict()
+_team_table_cache: "OrderedDict[str, TeamMetricTable]" = OrderedDict()
+_matrix_lock = threading.Lock()
+
+
+def _get_cached(cache: OrderedDict, factory, unified_dataset_path: str, dataset: Optional[Dict[str, Any]]):
+    try:
+        snapshot = dataset_registry.get_snapshot(unified_dataset_path)
+    except Exception as e:
+        if dataset is None:
+            # Never score an empty table in place of a dataset that cannot be read
+            logger.error(f"Cannot load dataset {unified_dataset_path} for {factory.__name__}: {e}")
+            raise
+        logger.warning(f"Building uncached {factory.__name__} for {unified_dataset_path}: {e}")
+        return factory(dataset)
+
+    cache_key = f"{snapshot.path}:{snapshot.version}"
+    with _matrix_lock:
+        value = cache.get(cache_key)
+        if value is None:
+            value = factory(snapshot.data)
+            cache[cache_key] = value
+        cache.move_to_end(cache_key)
+        while len(cache) > max(1, METRIC_MATRIX_CACHE_SIZE):
+            cache.popitem(last=False)
+    return value
+
+
+def get_metric_matrix(unified_dataset_path: str, dataset: Optional[Dict[str, Any]] = None) -> MetricMatrix:
+    """
+    Get the metric matrix for a dataset, building it once per dataset version.
+
+    Args:
+        unified_dataset_path: Path to the unified dataset JSON file
+        dataset: Already loaded dataset, used uncached when the file cannot be read
+
+    Returns:
+        MetricMatrix for the dataset's current content
+
+    Raises:
+        FileNotFoundError: If the file does not exist and no dataset is given
+        json.JSONDecodeError: If the file is not valid JSON and no dataset is given
+    """
+    return _get_cached(_matrix_cache, MetricMatrix, unified_dataset_path, dataset)
+
+
+def get_team_metric_table(
+    unified_dataset_path: str, dataset: Optional[Dict[str, Any]] = None
+) -> TeamMetricTable:
+    """
+    Get the team ranking table for a dataset, building it once per dataset version.
+
+    Args:
+        unified_dataset_path: Path to the unified dataset JSON file
+        dataset: Already loaded dataset, used uncached when the file cannot be read
+
+    Returns:
+        TeamMetricTable for the dataset's current content
+
+    Raises:
+        FileNotFoundError: If the file does not exist and no dataset is given
+        json.JSONDecodeError: If the file is not valid JSON and no dataset is given
+    """
+    return _get_cached(_team_table_cache, TeamMetricTable, unified_dataset_path, dataset)
@@ -6,6 +6,9 @@ import time
 import statistics
 from typing import Any, Dict, List, Optional
 
+from app.services.batch_planner import BatchPlan
+from app.services.picklist_result_cache import PicklistResultCache
+
 logger = logging.getLogger("performance_optimization_service")
 
 
@@ -201,8 +204,13 @@ class PerformanceOptimizationService:
             "within_limits": total_with_margin < 100000
         }
 
-    def should_use_batching(self, teams_count: int, priorities_count: int) -> bool:
-        """ORIGINAL BATCHING DECISION LOGIC"""
+    def should_use_batching(
+        self, teams_count: int, priorities_count: int, batch_plan: Optional[BatchPlan] = None
+    ) -> bool:
+        """ORIGINAL BATCHING DECISION LOGIC; a measured batch plan takes precedence over the heuristics"""
+        
+        if batch_plan is not None:
+            return batch_plan.batch_count > 1
         
         # Estimate token usage
         estimation = self.estimate_token_usage(teams_count, priorities_count, use_ultra_compact=True)
@@ -226,12 +234,13 @@ class PerformanceOptimizationService:
         self, 
         teams_count: int, 
         priorities_count: int,
-        user_preference: Optional[bool] = None
+        user_preference: Optional[bool] = None,
+        batch_plan: Optional[BatchPlan] = None
     ) -> Dict[str, Any]:
         """COMPREHENSIVE PROCESSING STRATEGY RECOMMENDATION"""
         
         # Calculate recommendations
-        auto_batch_recommended = self.should_use_batching(teams_count, priorities_count)
+        auto_batch_recommended = self.should_use_batching(teams_count, priorities_count, batch_plan)
         token_estimation = self.estimate_token_usage(teams_count, priorities_count)
         
         # Determine final strategy
@@ -253,16 +262,29 @@ class PerformanceOptimizationService:
             else:
                 batch_size = 20
         
+        estimated_batches = (teams_count // batch_size) + (1 if teams_count % batch_size else 0) if use_batching else 1
+        reason = self._get_strategy_reason(teams_count, priorities_count, auto_batch_recommended)
+        if batch_plan is not None:
+            # Sizes measured from the actual prompt fragments replace the fixed estimates
+            if use_batching:
+                estimated_batches = batch_plan.batch_count
+                batch_size = max((len(b.team_numbers) for b in batch_plan.batches), default=batch_size)
+            reason = (
+                f"Token budget plan: {batch_plan.batch_count} batches within "
+                f"{batch_plan.input_budget} input / {batch_plan.output_budget} output tokens"
+            )
+        
         return {
             "use_batching": use_batching,
             "strategy_source": strategy_source,
             "batch_size": batch_size,
-            "estimated_batches": (teams_count // batch_size) + (1 if teams_count % batch_size else 0) if use_batching else 1,
+            "estimated_batches": estimated_batches,
             "token_estimation": token_estimation,
             "recommendations": {
                 "auto_batch_recommended": auto_batch_recommended,
-                "reason": self._get_strategy_reason(teams_count, priorities_count, auto_batch_recommended)
-            }
+                "reason": reason
+            },
+            **({"batch_plan": batch_plan.to_dict()} if batch_plan is not None else {})
         }
 
     def _get_strategy_reason(self, teams_count: int, priorities_count: int, recommended_batching: bool) -> str:
@@ -291,29 +313,44 @@ class PerformanceOptimizationService:
         priorities: List[Dict[str, Any]],
         exclude_teams: Optional[List[int]] = None,
         team_count: Optional[int] = None,
+        cache_version: Optional[str] = None,
+        strategy_interpretation: Optional[str] = None,
         **kwargs
     ) -> str:
-        """Generate deterministic cache key."""
+        """Generate deterministic cache key, scoped to the dataset/game context version and strategy text."""
         import json
         sorted_params = json.dumps({
             "team": your_team_number,
             "position": pick_position,
             "priorities": priorities,
             "exclude": exclude_teams or [],
-            "count": team_count
+            "count": team_count,
+            "version": cache_version,
+            "strategy": strategy_interpretation
         }, sort_keys=True)
         return hashlib.md5(sorted_params.encode()).hexdigest()[:16]
 
-    def get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Retrieve cached result"""
+    def get_cached_result(self, cache_key: str, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Retrieve cached result, ignoring results produced from another version"""
+        if isinstance(self._cache, PicklistResultCache):
+            return self._cache.get_result(cache_key, version)
         if self._cache is not None and cache_key in self._cache:
             logger.debug(f"Retrieved cached result for key: {cache_key}")
             return self._cache[cache_key]
         return None
 
-    def store_cached_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+    def store_cached_result(
+        self,
+        cache_key: str,
+        result: Dict[str, Any],
+        version: Optional[str] = None,
+        dataset_path: Optional[str] = None,
+    ) -> None:
         """Store result in performance cache"""
-        if self._cache is not None:
+        if isinstance(self._cache, PicklistResultCache):
+            self._cache.put_result(cache_key, result, version, dataset_path)
+            logger.debug(f"Cached result for key: {cache_key}")
+        elif self._cache is not None:
             self._cache[cache_key] = result
             logger.debug(f"Cached result for key: {cache_key}")
 
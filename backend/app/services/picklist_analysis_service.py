@@ -4,12 +4,13 @@ import json
 import logging
 import os
 import re
-from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import numpy as np
-from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
-from openai import OpenAI
+from app.config.openai_config import OPENAI_MODEL
+from app.services.dataset_registry import dataset_registry
+from app.services.llm_gateway import LLM_PRIORITY_INTERACTIVE, llm_gateway
+from app.services.llm_provider import create_llm_client
+from app.services.metric_matrix_service import get_metric_matrix, get_team_metric_table
 
 # Use centralized OpenAI configuration
 GPT_MODEL = OPENAI_MODEL
@@ -21,8 +22,8 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Initialize the chat completion client
+client = create_llm_client()
 
 
 class PicklistAnalysisService:
@@ -71,10 +72,9 @@ class PicklistAnalysisService:
         self.manual_info = self._load_manual_info()
 
     def _load_dataset(self) -> Dict[str, Any]:
-        """Load the unified dataset from the JSON file."""
+        """Load the unified dataset (shared, read-only) from the dataset registry."""
         try:
-            with open(self.dataset_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return dataset_registry.get(self.dataset_path)
         except Exception as e:
             print(f"Error loading unified dataset: {e}")
             return {}
@@ -476,110 +476,8 @@ class PicklistAnalysisService:
         if self.metric_cache.get("stats"):
             return self.metric_cache["stats"]
 
-        # Collect all numeric metrics from all teams
-        metric_values = defaultdict(list)
-        metric_win_pairs = defaultdict(list)
-
-        for team_key, team_data in self.teams_data.items():
-            scouting_data = team_data.get("scouting_data", [])
-
-            for match in scouting_data:
-                # Get match outcome (win/loss) if available
-                alliance_color = match.get("alliance_color")
-                match_number = match.get("match_number") or match.get("qual_number")
-
-                # Default to None if we can't determine win status
-                won_match = None
-
-                # Try to find match in TBA matches
-                if match_number and alliance_color:
-                    tba_matches = self.dataset.get("tba_matches", [])
-                    for tba_match in tba_matches:
-                        if tba_match.get("match_number") == match_number:
-                            # Check if this alliance won
-                            alliance_result = tba_match.get("alliances", {}).get(alliance_color, {})
-                            if alliance_result:
-                                # TBA marks the winner with "winner" field
-                                won_match = alliance_result.get("winner", False)
-                            break
-
-                # Collect values for each metric
-                for field, value in match.items():
-                    if isinstance(value, (int, float)) and field not in [
-                        "team_number",
-                        "match_number",
-                        "qual_number",
-                    ]:
-                        metric_values[field].append(value)
-
-                        # If we know the match outcome, record the value-win pair
-                        if won_match is not None:
-                            metric_win_pairs[field].append((value, 1 if won_match else 0))
-
-            # Now include superscouting numeric data
-            superscouting_data = team_data.get("superscouting_data", [])
-
-            for entry in superscouting_data:
-                # Get match outcome (win/loss) if available - similar to above
-                alliance_color = entry.get("alliance_color")
-                match_number = entry.get("match_number") or entry.get("qual_number")
-
-                # Default to None if we can't determine win status
-                won_match = None
-
-                # Try to find match in TBA matches
-                if match_number and alliance_color:
-                    tba_matches = self.dataset.get("tba_matches", [])
-                    for tba_match in tba_matches:
-                        if tba_match.get("match_number") == match_number:
-                            # Check if this alliance won
-                            alliance_result = tba_match.get("alliances", {}).get(alliance_color, {})
-                            if alliance_result:
-                                # TBA marks the winner with "winner" field
-                                won_match = alliance_result.get("winner", False)
-                            break
-
-                # Collect values for each numeric superscouting metric
-                for field, value in entry.items():
-                    if isinstance(value, (int, float)) and field not in [
-                        "team_number",
-                        "match_number",
-                        "qual_number",
-                        "robot_group",
-                    ]:
-                        # Prefix with "super_" to avoid collisions with regular metrics
-                        metric_id = field
-
-                        metric_values[metric_id].append(value)
-
-                        # If we know the match outcome, record the value-win pair
-                        if won_match is not None:
-                            metric_win_pairs[metric_id].append((value, 1 if won_match else 0))
-
-        # Calculate statistics for each metric
-        stats = {}
-        for metric, values in metric_values.items():
-            values_array = np.array(values, dtype=float)
-
-            # Calculate correlation with winning
-            win_correlation = 0
-            if metric in metric_win_pairs and len(metric_win_pairs[metric]) > 5:
-                # Unzip the pairs into separate arrays
-                metric_vals, win_vals = zip(*metric_win_pairs[metric])
-
-                # Calculate correlation coefficient
-                try:
-                    win_correlation = np.corrcoef(metric_vals, win_vals)[0, 1]
-                except Exception:
-                    win_correlation = 0  # Default to 0 if calculation fails
-
-            stats[metric] = {
-                "mean": float(np.mean(values_array)),
-                "std": float(np.std(values_array)),
-                "min": float(np.min(values_array)),
-                "max": float(np.max(values_array)),
-                "correlation_to_win": win_correlation,
-            }
+        # Statistics come from the per-dataset-version metric matrix (built once, vectorized)
+        stats = get_metric_matrix(self.dataset_path, self.dataset).metric_statistics()
 
         # Cache the results
         self.metric_cache["stats"] = stats
@@ -647,7 +545,7 @@ class PicklistAnalysisService:
         metrics_with_scores.sort(key=lambda x: x["importance_score"], reverse=True)
         return metrics_with_scores[:num_suggestions]
 
-    def parse_strategy_prompt(self, strategy_prompt: str) -> Dict[str, Any]:
+    async def parse_strategy_prompt(self, strategy_prompt: str) -> Dict[str, Any]:
         """
         Parse a natural language strategy description into specific metrics and weights
         using GPT to understand the strategy intent and map to available metrics.
@@ -814,8 +712,10 @@ Only include metrics from the provided lists above.
         """
 
         try:
-            # Call the OpenAI API
-            response = client.chat.completions.create(
+            # Call the chat completions API through the shared rate-limit gateway
+            response = await llm_gateway.chat_completion(
+                client,
+                priority=LLM_PRIORITY_INTERACTIVE,
                 model=GPT_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
@@ -1003,187 +903,9 @@ Only include metrics from the provided lists above.
         # Extract priority metrics and weights
         priority_weights = {p["id"]: p.get("weight", 1.0) for p in priorities}
 
-        # Calculate team scores based on weighted metrics
-        team_scores = []
-
-        for team_key, team_data in self.teams_data.items():
-            try:
-                team_number = int(team_key)
-            except ValueError:
-                continue  # Skip if team_key can't be converted to int
-
-            team_nickname = team_data.get("nickname", f"Team {team_number}")
-
-            # Collect all numeric metrics for this team
-            team_metrics = {}
-
-            # Process scouting data
-            total_matches = 0
-            for match in team_data.get("scouting_data", []):
-                # Skip virtual scouts unless there are no real scouts
-                if match.get("is_virtual_scout") and total_matches > 0:
-                    continue
-
-                total_matches += 1
-                for field, value in match.items():
-                    if isinstance(value, (int, float)) and field not in [
-                        "team_number",
-                        "match_number",
-                        "qual_number",
-                    ]:
-                        if field not in team_metrics:
-                            team_metrics[field] = []
-                        team_metrics[field].append(value)
-
-            # Calculate averages for each metric
-            avg_metrics = {}
-            for metric, values in team_metrics.items():
-                if values:
-                    avg_metrics[metric] = sum(values) / len(values)
-                    # Add EPA metrics if available
-            statbotics_info = team_data.get("statbotics_info", {})
-            for key, value in statbotics_info.items():
-                if isinstance(value, (int, float)):
-                    avg_metrics[key] = value
-
-            # Calculate the overall score based on weighted priorities
-            score = 0.0
-            used_metrics = []
-
-            for metric_id, weight in priority_weights.items():
-                # Handle universal metrics specially
-                if metric_id == "reliability":
-                    # Calculate reliability as inverse of standard deviation / mean
-                    consistency_score = 0
-                    consistency_metrics = []
-
-                    for key, values in team_metrics.items():
-                        if len(values) > 1:
-                            mean = sum(values) / len(values)
-                            if mean != 0:
-                                std = (sum((x - mean) ** 2 for x in values) / len(values)) ** 0.5
-                                # Coefficient of variation (lower is better)
-                                cv = std / abs(mean) if mean != 0 else 0
-                                # Convert to a 0-10 scale (inverse, since lower CV is better)
-                                metric_score = max(0, 10 - 10 * min(cv, 1))
-                                consistency_score += metric_score
-                                consistency_metrics.append(key)
-
-                    # Average across all metrics
-                    if consistency_score > 0:
-                        num_metrics = len(consistency_metrics)
-                        reliability = consistency_score / num_metrics if num_metrics > 0 else 0
-                        score += reliability * weight
-                        used_metrics.append(
-                            {
-                                "id": "reliability",
-                                "value": reliability,
-                                "weighted_value": reliability * weight,
-                                "metrics_used": consistency_metrics[
-                                    :3
-                                ],  # Include up to 3 example metrics
-                            }
-                        )
-
-                # Handle defense rating (often from superscout)
-                elif metric_id == "defense":
-                    defense_value = None
-
-                    # Check various possible field names for defense rating
-                    defense_fields = [
-                        "defense",
-                        "defense_rating",
-                        "defensive_rating",
-                        "defense_skill",
-                    ]
-                    for field in defense_fields:
-                        if field in avg_metrics:
-                            defense_value = avg_metrics[field]
-                            break
-
-                    # If direct field not found, check superscouting data
-                    if defense_value is None and team_data.get("superscouting_data"):
-                        defense_ratings = []
-                        for entry in team_data["superscouting_data"]:
-                            for field in defense_fields:
-                                if field in entry and isinstance(entry[field], (int, float)):
-                                    defense_ratings.append(entry[field])
-
-                        if defense_ratings:
-                            defense_value = sum(defense_ratings) / len(defense_ratings)
-
-                    # If we found a defense value, add it to the score
-                    if defense_value is not None:
-                        score += defense_value * weight
-                        used_metrics.append(
-                            {
-                                "id": "defense",
-                                "value": defense_value,
-                                "weighted_value": defense_value * weight,
-                            }
-                        )
-
-                # Handle driver skill (often from superscout)
-                elif metric_id == "driver_skill":
-                    skill_value = None
-
-                    # Check various possible field names for driver skill
-                    skill_fields = ["driver_skill", "driver_rating", "driving_skill"]
-                    for field in skill_fields:
-                        if field in avg_metrics:
-                            skill_value = avg_metrics[field]
-                            break
-
-                    # If direct field not found, check superscouting data
-                    if skill_value is None and team_data.get("superscouting_data"):
-                        skill_ratings = []
-                        for entry in team_data["superscouting_data"]:
-                            for field in skill_fields:
-                                if field in entry and isinstance(entry[field], (int, float)):
-                                    skill_ratings.append(entry[field])
-
-                        if skill_ratings:
-                            skill_value = sum(skill_ratings) / len(skill_ratings)
-
-                    # If we found a driver skill value, add it to the score
-                    if skill_value is not None:
-                        score += skill_value * weight
-                        used_metrics.append(
-                            {
-                                "id": "driver_skill",
-                                "value": skill_value,
-                                "weighted_value": skill_value * weight,
-                            }
-                        )
-
-                # Look for direct metric matches
-                elif metric_id in avg_metrics:
-                    metric_value = avg_metrics[metric_id]
-                    score += metric_value * weight
-                    used_metrics.append(
-                        {
-                            "id": metric_id,
-                            "value": metric_value,
-                            "weighted_value": metric_value * weight,
-                        }
-                    )
-
-            # Add team to ranking list
-            team_scores.append(
-                {
-                    "team_number": team_number,
-                    "nickname": team_nickname,
-                    "score": score,
-                    "stats": avg_metrics,
-                    "metrics_contribution": used_metrics,
-                    "match_count": total_matches,
-                }
-            )
-
-        # Sort teams by score in descending order
-        team_scores.sort(key=lambda x: x["score"], reverse=True)
-
-        return team_scores
+        # Score every team at once from the precomputed team x metric table
+        team_table = get_team_metric_table(self.dataset_path, self.dataset)
+        return team_table.rank_teams(priority_weights)
 
     def get_enhanced_field_metadata(self) -> Dict[str, Any]:
         """
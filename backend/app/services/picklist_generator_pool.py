@@ -0,0 +1,146 @@
+# backend/app/services/picklist_generator_pool.py
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services.dataset_registry import dataset_registry
+from app.services.picklist_generator_service import PicklistGeneratorService
+from app.services.picklist_result_cache import config_fingerprint
+
+logger = logging.getLogger("picklist_generator_pool")
+
+# Number of (dataset version, year) entries kept warm, least recently used evicted first
+PICKLIST_POOL_MAX_DATASETS = int(os.getenv("PICKLIST_POOL_MAX_DATASETS", "4"))
+# Idle generator instances kept per entry (concurrent requests each get their own)
+PICKLIST_POOL_MAX_IDLE = int(os.getenv("PICKLIST_POOL_MAX_IDLE", "2"))
+
+
+class PicklistGeneratorPool:
+    """
+    Pool of warm PicklistGeneratorService instances keyed by dataset version and year.
+
+    Constructing a generator loads label files, the token encoder and the game
+    context. The pool keeps constructed instances and hands each one to a single
+    request at a time, so per-request prompt state is never shared between
+    concurrent requests.
+    """
+
+    def __init__(
+        self,
+        max_datasets: int = PICKLIST_POOL_MAX_DATASETS,
+        max_idle_per_dataset: int = PICKLIST_POOL_MAX_IDLE,
+        factory: Callable[[str], Any] = PicklistGeneratorService,
+    ):
+        self.max_datasets = max(1, max_datasets)
+        self.max_idle_per_dataset = max(1, max_idle_per_dataset)
+        self.factory = factory
+        self._idle: "OrderedDict[Tuple, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _pool_key(self, unified_dataset_path: str) -> Tuple:
+        snapshot = dataset_registry.get_snapshot(unified_dataset_path)
+        year = snapshot.data.get("year", 2025)
+        # Edits to label, manual or game context files retire warm instances
+        return (snapshot.path, snapshot.version, year, config_fingerprint())
+
+    def acquire(self, unified_dataset_path: str) -> PicklistGeneratorService:
+        """
+        Get a generator for a dataset, reusing a warm instance when possible.
+
+        Every acquired instance must be handed back with release().
+
+        Args:
+            unified_dataset_path: Path to the unified dataset JSON file
+
+        Returns:
+            PicklistGeneratorService reserved for the caller
+        """
+        try:
+            key = self._pool_key(unified_dataset_path)
+        except Exception as e:
+            # Unreadable datasets are not pooled; the service reports the load error itself
+            logger.warning(f"Not pooling generator for {unified_dataset_path}: {e}")
+            return self.factory(unified_dataset_path)
+
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._idle.move_to_end(key)
+                self._stats["hits"] += 1
+                generator = idle.pop()
+                generator._pool_key = key
+                return generator
+            self._stats["misses"] += 1
+
+        generator = self.factory(unified_dataset_path)
+        generator._pool_key = key
+        return generator
+
+    def release(self, generator: Optional[PicklistGeneratorService]) -> None:
+        """
+        Return a generator to the pool after a request finished with it.
+
+        Args:
+            generator: Instance obtained from acquire(), or None
+        """
+        key = getattr(generator, "_pool_key", None)
+        if key is None:
+            return
+        generator._pool_key = None
+
+        try:
+            generator.reset_request_state()
+        except Exception as e:
+            logger.warning(f"Dropping generator that failed to reset: {e}")
+            return
+
+        with self._lock:
+            # Retire instances built from older versions of the same dataset
+            for stale_key in [k for k in self._idle if k[0] == key[0] and k != key]:
+                del self._idle[stale_key]
+                self._stats["evictions"] += 1
+
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_dataset:
+                idle.append(generator)
+            self._idle.move_to_end(key)
+
+            while len(self._idle) > self.max_datasets:
+                self._idle.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> int:
+        """
+        Drop every warm instance.
+
+        Returns:
+            Number of instances dropped
+        """
+        with self._lock:
+            dropped = sum(len(idle) for idle in self._idle.values())
+            self._idle.clear()
+        return dropped
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with hit/miss/eviction counters and idle instances per dataset
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": [
+                    {"path": key[0], "version": key[1], "year": key[2], "idle": len(idle)}
+                    for key, idle in self._idle.items()
+                ],
+            }
+
+
+# Shared pool used by the picklist endpoints
+picklist_generator_pool = PicklistGeneratorPool()
@@ -5,7 +5,7 @@ import json
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import tiktoken
 from app.services.progress_tracker import ProgressTracker
@@ -17,8 +17,12 @@ from app.services.data_aggregation_service import DataAggregationService
 from app.services.team_analysis_service import TeamAnalysisService
 from app.services.priority_calculation_service import PriorityCalculationService
 from app.services.batch_processing_service import BatchProcessingService
+from app.services.batch_planner import BatchPlan, BatchPlanner, full_output_tokens
 from app.services.performance_optimization_service import PerformanceOptimizationService
 from app.services.picklist_gpt_service import PicklistGPTService
+from app.services.metric_matrix_service import get_team_metric_table
+from app.services.dataset_registry import dataset_registry
+from app.services.picklist_result_cache import config_version, picklist_result_cache
 
 # Configure logging
 logging.basicConfig(
@@ -37,6 +41,9 @@ load_dotenv()
 # Allow model selection via environment with a sensible default
 GPT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1")
 
+# Maximum number of GPT batches in flight at once in parallel batch mode
+PICKLIST_MAX_CONCURRENT_BATCHES = int(os.getenv("PICKLIST_MAX_CONCURRENT_BATCHES", "3"))
+
 # Initialize OpenAI client
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
@@ -51,7 +58,10 @@ class PicklistGeneratorService:
     """
 
     # Class-level cache to share across instances (CRITICAL: Preserve for compatibility)
-    _picklist_cache = {}
+    # Bounded, persistent and dataset-version aware (see picklist_result_cache)
+    _picklist_cache = picklist_result_cache
+    # Futures of generations currently running, keyed by cache key (single-flight)
+    _inflight_generations: Dict[str, "asyncio.Future"] = {}
 
     def __init__(self, unified_dataset_path: str):
         """Initialize the picklist generator with the unified dataset."""
@@ -62,6 +72,7 @@ class PicklistGeneratorService:
         self.performance_service = PerformanceOptimizationService(self._picklist_cache)
         self.batch_service = BatchProcessingService(self._picklist_cache)
         self.gpt_service = PicklistGPTService()
+        self.batch_planner = BatchPlanner()
         
         # Preserve baseline attributes for API compatibility
         self.dataset_path = unified_dataset_path
@@ -71,6 +82,20 @@ class PicklistGeneratorService:
         self.event_key = self.data_service.event_key
         self.game_context = self.data_service.load_game_context()
         self.token_encoder = self.gpt_service.token_encoder
+        
+        # Cached picklists are only reused for the same dataset content and game configuration
+        try:
+            dataset_version = dataset_registry.get_snapshot(unified_dataset_path).version
+        except (OSError, ValueError):
+            dataset_version = None
+        self.cache_version = f"{dataset_version}:{config_version()}"
+        # Per-team prompt fragments are shared across batches and requests for the same version
+        if dataset_version is not None:
+            self.gpt_service.fragment_version = self.cache_version
+
+    def reset_request_state(self) -> None:
+        """Clear state left behind by a previous request before the instance is reused."""
+        self.gpt_service.reset_request_state()
 
     async def generate_picklist(
         self,
@@ -81,26 +106,85 @@ class PicklistGeneratorService:
         strategy_interpretation: Optional[str] = None,
         request_id: Optional[int] = None,
         cache_key: Optional[str] = None,
-        batch_size: int = 60,
+        batch_size: Optional[int] = None,
         reference_teams_count: int = 3,
         reference_selection: str = "top_middle_bottom",
-        use_batching: bool = False,
+        use_batching: Optional[bool] = False,
         final_rerank: bool = True,
+        parallel_batches: bool = False,
+        on_partial: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        rank_only: bool = False,
+        prompt_encoding: str = "json",
     ) -> Dict[str, Any]:
-        """Generate a ranked picklist for alliance selection."""
+        """
+        Generate a ranked picklist for alliance selection.
+
+        `on_partial` receives (rank, team) while a one-shot ranking is still
+        streaming in; cached results, batched and rank-only runs and callers
+        joining an in-flight generation only get the final result.
+
+        With `rank_only`, every ranking call (one-shot, batch and final rerank)
+        returns just the order of team indices; the teams carry
+        "reasoning_pending" and get reasoning on demand from explain_picklist_teams.
+
+        `prompt_encoding` chooses how team data is written into ranking prompts:
+        "json" (an object per team) or "table" (one compact delimited table).
+
+        Batches are packed to the token budget (see plan_batches) unless
+        `batch_size` fixes the number of teams per batch; batched results
+        include the plan as "batch_plan". With `use_batching=None` the plan
+        decides: teams are batched only when they need more than one call.
+        """
         start_time = time.time()
         
         # Cache management
         if not cache_key:
             cache_key = self.performance_service.generate_cache_key(
-                your_team_number, pick_position, priorities, exclude_teams, len(self.teams_data)
+                your_team_number, pick_position, priorities, exclude_teams, len(self.teams_data),
+                cache_version=self.cache_version, strategy_interpretation=strategy_interpretation
             )
         
-        cached_result = self.performance_service.get_cached_result(cache_key)
-        if cached_result and cached_result.get("status") == "success":
+        cached_result = self.performance_service.get_cached_result(cache_key, version=self.cache_version)
+        if isinstance(cached_result, dict) and cached_result.get("status") == "success":
             logger.info(f"Returning cached result for key: {cache_key}")
             return cached_result
         
+        # Single-flight: identical concurrent requests wait for the running generation
+        while cache_key in self._inflight_generations:
+            inflight = self._inflight_generations[cache_key]
+            logger.info(f"Joining in-flight picklist generation for key: {cache_key}")
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request running the generation was cancelled; take over
+                logger.info(f"In-flight generation for key {cache_key} was cancelled, restarting")
+        
+        inflight = asyncio.get_running_loop().create_future()
+        self._inflight_generations[cache_key] = inflight
+        try:
+            result = await self._run_picklist_generation(
+                start_time, cache_key, your_team_number, pick_position, priorities, exclude_teams,
+                strategy_interpretation, batch_size, reference_teams_count, reference_selection,
+                use_batching, final_rerank, parallel_batches, on_partial, rank_only, prompt_encoding
+            )
+            inflight.set_result(result)
+            return result
+        except BaseException:
+            inflight.cancel()
+            raise
+        finally:
+            if self._inflight_generations.get(cache_key) is inflight:
+                del self._inflight_generations[cache_key]
+
+    async def _run_picklist_generation(
+        self, start_time, cache_key, your_team_number, pick_position, priorities, exclude_teams,
+        strategy_interpretation, batch_size, reference_teams_count, reference_selection,
+        use_batching, final_rerank, parallel_batches, on_partial=None, rank_only=False,
+        prompt_encoding="json"
+    ) -> Dict[str, Any]:
+        """Run one picklist generation and store its result in the shared cache."""
         # Initialize progress tracking
         from app.services.progress_tracker import ProgressTracker
         progress_tracker = ProgressTracker.create_tracker(cache_key)
@@ -114,30 +198,43 @@ class PicklistGeneratorService:
             teams_data = self.data_service.get_teams_for_analysis(exclude_teams)
             normalized_priorities = self.priority_service.normalize_priorities(priorities)
             
-            # ORIGINAL AUTOMATIC BATCHING DECISION - EXACT RESTORATION
+            # Plan batches from measured token costs; it also drives the automatic batching decision
             progress_tracker.update(25, "Determining processing strategy...", "strategy_selection")
-            should_batch, batching_reason = self._determine_processing_strategy(teams_data, use_batching)
+            batch_plan = self.plan_batches(
+                teams_data, your_team_number, pick_position, normalized_priorities,
+                rank_only, prompt_encoding, strategy_interpretation, batch_size=batch_size
+            )
+            should_batch, batching_reason = self._determine_processing_strategy(teams_data, use_batching, batch_plan)
             
             if should_batch:
-                # Use batch_size from request parameters, or calculate optimal if not provided
-                optimal_batch_size = batch_size if batch_size else self._calculate_optimal_batch_size(len(teams_data), len(normalized_priorities))
-                logger.info(f"Using batch processing for {len(teams_data)} teams with batch size {optimal_batch_size}")
-                progress_tracker.update(35, f"Starting batch processing ({len(teams_data)} teams)...", "batch_processing")
-                result = await self._orchestrate_batch_processing(
-                    teams_data, your_team_number, pick_position, normalized_priorities,
-                    cache_key, optimal_batch_size, reference_teams_count, reference_selection, final_rerank,
-                    progress_tracker, strategy_interpretation
-                )
+                if parallel_batches:
+                    # Anchors join every batch, so the parallel path plans again once they are chosen
+                    result = await self._orchestrate_parallel_batch_processing(
+                        teams_data, your_team_number, pick_position, priorities, normalized_priorities,
+                        cache_key, batch_size, reference_teams_count, reference_selection, final_rerank,
+                        progress_tracker, strategy_interpretation, rank_only, prompt_encoding
+                    )
+                else:
+                    self._report_batch_plan(batch_plan, len(teams_data), progress_tracker)
+                    result = await self._orchestrate_batch_processing(
+                        teams_data, your_team_number, pick_position, normalized_priorities,
+                        cache_key, batch_plan, reference_teams_count, reference_selection, final_rerank,
+                        progress_tracker, strategy_interpretation, rank_only, prompt_encoding
+                    )
+                    result["batch_plan"] = batch_plan.to_dict()
             else:
                 logger.info(f"Using single processing for {len(teams_data)} teams")
                 progress_tracker.update(35, f"Starting single processing ({len(teams_data)} teams)...", "single_processing")
                 result = await self._orchestrate_single_processing(
-                    teams_data, your_team_number, pick_position, normalized_priorities, cache_key, strategy_interpretation
+                    teams_data, your_team_number, pick_position, normalized_priorities, cache_key, strategy_interpretation,
+                    on_partial, prompt_encoding, rank_only
                 )
                 progress_tracker.update(90, "Finalizing results...", "finalization")
             
             result["processing_time"] = time.time() - start_time
-            self.performance_service.store_cached_result(cache_key, result)
+            self.performance_service.store_cached_result(
+                cache_key, result, version=self.cache_version, dataset_path=self.dataset_path
+            )
             progress_tracker.complete("Picklist generation completed successfully")
             return result
             
@@ -148,7 +245,9 @@ class PicklistGeneratorService:
                 "status": "error", "error": str(e), "cache_key": cache_key,
                 "processing_time": time.time() - start_time
             }
-            self.performance_service.store_cached_result(cache_key, error_result)
+            self.performance_service.store_cached_result(
+                cache_key, error_result, version=self.cache_version, dataset_path=self.dataset_path
+            )
             return error_result
 
     async def rank_missing_teams(
@@ -289,14 +388,14 @@ class PicklistGeneratorService:
 
     async def _orchestrate_batch_processing(
         self, teams_data, your_team_number, pick_position, normalized_priorities,
-        cache_key, batch_size, reference_teams_count, reference_selection, final_rerank,
-        progress_tracker=None, strategy_interpretation=None
+        cache_key, batch_plan, reference_teams_count, reference_selection, final_rerank,
+        progress_tracker=None, strategy_interpretation=None, rank_only=False, prompt_encoding="json"
     ) -> Dict[str, Any]:
-        """Coordinate batch processing following baseline logic"""
-        # Create simple batches like baseline
-        team_batches = []
-        for i in range(0, len(teams_data), batch_size):
-            team_batches.append(teams_data[i:i + batch_size])
+        """Coordinate batch processing following baseline logic, one GPT call per planned batch"""
+        teams_by_number = {team["team_number"]: team for team in teams_data}
+        team_batches = [
+            [teams_by_number[number] for number in batch.team_numbers] for batch in batch_plan.batches
+        ]
         
         logger.info(f"Split teams into {len(team_batches)} batches")
         
@@ -304,6 +403,8 @@ class PicklistGeneratorService:
         batch_results = []
         combined_picklist = []
         reference_teams = []
+        failed_batches = []
+        batch_errors = []
         total_batches = len(team_batches)
         
         for batch_index, batch in enumerate(team_batches):
@@ -324,21 +425,19 @@ class PicklistGeneratorService:
             for index, team in enumerate(batch, 1):
                 team_index_map[index] = team["team_number"]
             
-            system_prompt = self.gpt_service.create_system_prompt(
-                pick_position, len(batch), self.game_context, use_ultra_compact=True
-            )
+            system_prompt, max_tokens = self._ranking_system_prompt(pick_position, len(batch), rank_only)
             
             # Use reference teams prompt if we have reference teams
             if reference_teams:
                 user_prompt = self.gpt_service.create_user_prompt_with_reference_teams(
                     your_team_number, pick_position, normalized_priorities, batch, reference_teams,
-                    team_index_map=team_index_map
+                    team_index_map=team_index_map, rank_only=rank_only, prompt_encoding=prompt_encoding
                 )
             else:
                 user_prompt, _ = self.gpt_service.create_user_prompt(
                     your_team_number, pick_position, normalized_priorities, batch,
                     team_numbers=[t["team_number"] for t in batch],
-                    force_index_mapping=True
+                    force_index_mapping=True, rank_only=rank_only, prompt_encoding=prompt_encoding
                 )
             
             # Process batch with GPT
@@ -347,7 +446,8 @@ class PicklistGeneratorService:
                 user_prompt=user_prompt,
                 teams_data=batch,
                 team_index_map=team_index_map,
-                strategy_interpretation=strategy_interpretation
+                strategy_interpretation=strategy_interpretation,
+                max_tokens=max_tokens
             )
             
             if batch_result.get("status") == "success":
@@ -362,72 +462,377 @@ class PicklistGeneratorService:
                     )
                     logger.info(f"Selected {len(reference_teams)} reference teams for next batch")
             else:
-                logger.error(f"Batch {batch_index + 1} failed: {batch_result.get('error', 'Unknown error')}")
+                failed_batches.append(batch_index + 1)
+                batch_errors.append(batch_result.get("error", "Unknown error"))
+                logger.error(f"Batch {batch_index + 1} failed: {batch_errors[-1]}")
+        
+        if not batch_results:
+            return self._all_batches_failed(cache_key, batch_errors)
+        
+        # Optional final reranking (a single batch already ranked every team together)
+        if final_rerank and len(combined_picklist) > 10 and len(team_batches) > 1:
+            combined_picklist = await self._final_rerank(
+                combined_picklist, your_team_number, pick_position, normalized_priorities,
+                progress_tracker, strategy_interpretation, rank_only, prompt_encoding
+            )
         
-        # Optional final reranking
-        if final_rerank and len(combined_picklist) > 10:
-            if progress_tracker:
-                progress_tracker.update(85, "Performing final reranking...", "final_reranking")
-            logger.info("Performing final reranking of combined results")
+        # Final progress update
+        if progress_tracker:
+            progress_tracker.update(95, "Finalizing batch processing results...", "finalization")
+        
+        result = {
+            "status": "success", "picklist": combined_picklist,
+            "total_teams": len(combined_picklist), "cache_key": cache_key,
+            "batch_processing": True, "batches_processed": len(batch_results)
+        }
+        self._report_failed_batches(result, teams_data, failed_batches)
+        return result
+
+    async def _final_rerank(
+        self, combined_picklist, your_team_number, pick_position, normalized_priorities,
+        progress_tracker=None, strategy_interpretation=None, rank_only=False, prompt_encoding="json"
+    ) -> List[Dict[str, Any]]:
+        """Rerank the combined batch results in one GPT call; keeps the input order on failure"""
+        if progress_tracker:
+            progress_tracker.update(85, "Performing final reranking...", "final_reranking")
+        logger.info("Performing final reranking of combined results")
+        
+        # Convert combined_picklist back to raw team data format for final reranking
+        final_teams_data = []
+        for result in combined_picklist:
+            team_number = result.get("team_number")
+            if team_number:
+                # Try both string and int keys since teams_data might use string keys
+                team_key = str(team_number)
+                if team_key in self.teams_data:
+                    final_teams_data.append(self.teams_data[team_key])
+                elif team_number in self.teams_data:
+                    final_teams_data.append(self.teams_data[team_number])
+                else:
+                    logger.warning(f"Team {team_number} not found in teams_data")
+        
+        # Only proceed with final reranking if we have teams
+        if len(final_teams_data) > 0:
+            # Create index mapping for final reranking
+            team_index_map = {}
+            for index, team in enumerate(final_teams_data, 1):
+                team_index_map[index] = team["team_number"]
             
-            # Convert combined_picklist back to raw team data format for final reranking
-            final_teams_data = []
-            for result in combined_picklist:
-                team_number = result.get("team_number")
-                if team_number:
-                    # Try both string and int keys since teams_data might use string keys
-                    team_key = str(team_number)
-                    if team_key in self.teams_data:
-                        final_teams_data.append(self.teams_data[team_key])
-                    elif team_number in self.teams_data:
-                        final_teams_data.append(self.teams_data[team_number])
-                    else:
-                        logger.warning(f"Team {team_number} not found in teams_data")
+            user_prompt, _ = self.gpt_service.create_user_prompt(
+                your_team_number, pick_position, normalized_priorities, final_teams_data,
+                team_numbers=[t["team_number"] for t in final_teams_data],
+                force_index_mapping=True, rank_only=rank_only, prompt_encoding=prompt_encoding
+            )
+            system_prompt, max_tokens = self._ranking_system_prompt(
+                pick_position, len(final_teams_data), rank_only
+            )
             
-            # Only proceed with final reranking if we have teams
-            if len(final_teams_data) > 0:
-                # Create index mapping for final reranking
-                team_index_map = {}
-                for index, team in enumerate(final_teams_data, 1):
-                    team_index_map[index] = team["team_number"]
-                
-                user_prompt, _ = self.gpt_service.create_user_prompt(
-                    your_team_number, pick_position, normalized_priorities, final_teams_data,
-                    team_numbers=[t["team_number"] for t in final_teams_data],
-                    force_index_mapping=True
-                )
-                
-                final_result = await self.gpt_service.analyze_teams(
-                    system_prompt=self.gpt_service.create_system_prompt(
-                        pick_position, len(final_teams_data), self.game_context
-                    ),
+            final_result = await self.gpt_service.analyze_teams(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                teams_data=final_teams_data,
+                team_index_map=team_index_map,
+                strategy_interpretation=strategy_interpretation,
+                max_tokens=max_tokens
+            )
+            if final_result.get("status") == "success":
+                combined_picklist = final_result["picklist"]
+        else:
+            logger.warning("No teams found for final reranking, skipping")
+        
+        return combined_picklist
+
+    async def _orchestrate_parallel_batch_processing(
+        self, teams_data, your_team_number, pick_position, priorities, normalized_priorities,
+        cache_key, batch_size, reference_teams_count, reference_selection, final_rerank,
+        progress_tracker=None, strategy_interpretation=None, rank_only=False, prompt_encoding="json"
+    ) -> Dict[str, Any]:
+        """
+        Run every GPT batch concurrently around shared anchor teams.
+
+        Anchor teams are picked up front from the local weighted ranking instead of
+        from the previous batch's GPT output, so no batch waits for another. Every
+        batch ranks the anchors alongside its own teams; each batch's scores are then
+        scaled so its anchors match their average score across all batches.
+        """
+        # Local ranking (same weighted scoring as the analysis service) decides the anchors
+        priority_weights = {p["id"]: p.get("weight", 1.0) for p in priorities if "id" in p}
+        local_order = get_team_metric_table(self.dataset_path, self.dataset).rank(priority_weights)
+        local_position = {entry["team_number"]: i for i, entry in enumerate(local_order)}
+        locally_ranked = sorted(
+            teams_data, key=lambda t: local_position.get(t["team_number"], len(local_position))
+        )
+        selected = self.team_analysis.select_reference_teams(
+            locally_ranked, reference_teams_count, reference_selection
+        )
+        anchor_numbers = list(dict.fromkeys(t["team_number"] for t in selected))
+        anchor_set = set(anchor_numbers)
+        anchor_teams = [t for t in locally_ranked if t["team_number"] in anchor_set]
+        logger.info(f"Selected anchor teams {anchor_numbers} from local ranking")
+        
+        # Each batch holds the anchors plus its share of the remaining teams
+        batch_plan = self.plan_batches(
+            teams_data, your_team_number, pick_position, normalized_priorities,
+            rank_only, prompt_encoding, strategy_interpretation,
+            anchor_team_numbers=[t["team_number"] for t in anchor_teams], batch_size=batch_size
+        )
+        self._report_batch_plan(batch_plan, len(teams_data), progress_tracker, PICKLIST_MAX_CONCURRENT_BATCHES)
+        teams_by_number = {team["team_number"]: team for team in teams_data}
+        team_batches = [
+            [teams_by_number[number] for number in batch.team_numbers] for batch in batch_plan.batches
+        ] or [anchor_teams]
+        total_batches = len(team_batches)
+        logger.info(f"Split teams into {total_batches} parallel batches")
+        
+        # Build every prompt up front; only the GPT calls run concurrently
+        batch_requests = []
+        for batch in team_batches:
+            team_index_map = {}
+            for index, team in enumerate(batch, 1):
+                team_index_map[index] = team["team_number"]
+            system_prompt, max_tokens = self._ranking_system_prompt(pick_position, len(batch), rank_only)
+            user_prompt, _ = self.gpt_service.create_user_prompt(
+                your_team_number, pick_position, normalized_priorities, batch,
+                team_numbers=[t["team_number"] for t in batch],
+                force_index_mapping=True, rank_only=rank_only, prompt_encoding=prompt_encoding
+            )
+            batch_requests.append((batch, system_prompt, user_prompt, team_index_map, max_tokens))
+        
+        semaphore = asyncio.Semaphore(max(1, PICKLIST_MAX_CONCURRENT_BATCHES))
+        completed_batches = 0
+        
+        async def run_batch(batch_index, batch, system_prompt, user_prompt, team_index_map, max_tokens):
+            nonlocal completed_batches
+            async with semaphore:
+                batch_result = await self.gpt_service.analyze_teams(
+                    system_prompt=system_prompt,
                     user_prompt=user_prompt,
-                    teams_data=final_teams_data,
+                    teams_data=batch,
                     team_index_map=team_index_map,
-                    strategy_interpretation=strategy_interpretation
+                    strategy_interpretation=strategy_interpretation,
+                    max_tokens=max_tokens
+                )
+            completed_batches += 1
+            if progress_tracker:
+                progress_tracker.update(
+                    35 + (completed_batches / total_batches) * 50,
+                    f"Completed batch {completed_batches}/{total_batches}...",
+                    f"batch_{batch_index + 1}"
                 )
-                if final_result.get("status") == "success":
-                    combined_picklist = final_result["picklist"]
+            return batch_result
+        
+        if progress_tracker:
+            progress_tracker.update(
+                35, f"Processing {total_batches} batches in parallel...", "batch_processing"
+            )
+        batch_results = await asyncio.gather(
+            *(run_batch(i, *request) for i, request in enumerate(batch_requests))
+        )
+        
+        batch_picklists = []
+        failed_batches = []
+        batch_errors = []
+        for batch_index, batch_result in enumerate(batch_results):
+            if batch_result.get("status") == "success":
+                batch_picklists.append(batch_result.get("picklist", []))
             else:
-                logger.warning("No teams found for final reranking, skipping")
+                failed_batches.append(batch_index + 1)
+                batch_errors.append(batch_result.get("error", "Unknown error"))
+                logger.error(f"Batch {batch_index + 1} failed: {batch_errors[-1]}")
+        
+        if not batch_picklists:
+            return self._all_batches_failed(cache_key, batch_errors)
+        
+        # Calibrate: each anchor's target score is its average across batches
+        anchor_scores = {team_number: [] for team_number in anchor_numbers}
+        anchor_entries = {}
+        for batch_picklist in batch_picklists:
+            for entry in batch_picklist:
+                team_number = entry.get("team_number")
+                if team_number in anchor_scores:
+                    anchor_scores[team_number].append(entry.get("score", 0.0))
+                    anchor_entries.setdefault(team_number, entry)
+        target_scores = {
+            team_number: sum(scores) / len(scores) for team_number, scores in anchor_scores.items() if scores
+        }
+        
+        calibrated_teams = {}
+        for batch_picklist in batch_picklists:
+            batch_anchors = [e for e in batch_picklist if e.get("team_number") in target_scores]
+            for entry in self.team_analysis.normalize_scores_with_reference_teams(
+                batch_picklist, batch_anchors, target_scores
+            ):
+                if entry.get("team_number") not in anchor_set:
+                    calibrated_teams.setdefault(entry.get("team_number"), entry)
+        for team_number, target_score in target_scores.items():
+            anchor_entry = dict(anchor_entries[team_number])
+            anchor_entry["score"] = round(target_score, 2)
+            calibrated_teams[team_number] = anchor_entry
+        
+        combined_picklist = sorted(
+            calibrated_teams.values(), key=lambda entry: entry.get("score", 0.0), reverse=True
+        )
+        
+        # Optional final reranking (a single batch already ranked every team together)
+        if final_rerank and len(combined_picklist) > 10 and len(team_batches) > 1:
+            combined_picklist = await self._final_rerank(
+                combined_picklist, your_team_number, pick_position, normalized_priorities,
+                progress_tracker, strategy_interpretation, rank_only, prompt_encoding
+            )
         
         # Final progress update
         if progress_tracker:
             progress_tracker.update(95, "Finalizing batch processing results...", "finalization")
         
-        return {
+        result = {
             "status": "success", "picklist": combined_picklist,
             "total_teams": len(combined_picklist), "cache_key": cache_key,
-            "batch_processing": True, "batches_processed": len(batch_results)
+            "batch_processing": True, "batches_processed": len(batch_picklists),
+            "parallel_batches": True, "anchor_teams": anchor_numbers,
+            "batch_plan": batch_plan.to_dict(PICKLIST_MAX_CONCURRENT_BATCHES)
         }
+        self._report_failed_batches(result, teams_data, failed_batches)
+        return result
 
-    def _determine_processing_strategy(self, teams_data: List[Dict[str, Any]], use_batching: Optional[bool] = None) -> Tuple[bool, str]:
-        """ORIGINAL AUTOMATIC BATCHING DECISION - EXACT RESTORATION"""
+    @staticmethod
+    def _all_batches_failed(cache_key, batch_errors) -> Dict[str, Any]:
+        """Error result for a batched run in which no batch succeeded"""
+        return {
+            "status": "error",
+            "error": f"All {len(batch_errors)} batches failed: {batch_errors[0]}",
+            "cache_key": cache_key
+        }
+
+    @staticmethod
+    def _report_failed_batches(result, teams_data, failed_batches) -> None:
+        """
+        Record failed batches and the teams they left out of the picklist.
+
+        Teams are listed under "missing_team_numbers", which clients can send to
+        rank_missing_teams; anchors ranked by another batch are not missing.
+        """
+        if not failed_batches:
+            return
+        ranked = {entry.get("team_number") for entry in result["picklist"]}
+        missing = sorted(t["team_number"] for t in teams_data if t["team_number"] not in ranked)
+        result["failed_batches"] = failed_batches
+        result["missing_team_numbers"] = missing
+        logger.warning(f"Batches {failed_batches} failed; {len(missing)} teams missing from picklist: {missing}")
+
+    def plan_batches(
+        self, teams_data, your_team_number, pick_position, normalized_priorities,
+        rank_only=False, prompt_encoding="json", strategy_interpretation=None,
+        anchor_team_numbers=None, batch_size=None
+    ) -> BatchPlan:
+        """
+        Plan ranking batches from the measured token cost of each team.
+
+        Per-team and fixed prompt costs come from the memoized prompt fragments,
+        the system prompt is counted once, and expected output follows the
+        response format (reasons or rank-only). Teams are then packed into the
+        fewest batches within the configured input/output budget.
+
+        Args:
+            teams_data: Teams to rank
+            your_team_number: The user's team number
+            pick_position: Pick position
+            normalized_priorities: Normalized priorities
+            rank_only: Whether calls return only the order
+            prompt_encoding: "json" or "table"
+            strategy_interpretation: Strategy text added to every call, if any
+            anchor_team_numbers: Teams included in every batch (parallel batching)
+            batch_size: Fixed teams per batch instead of packing to the budget
+
+        Returns:
+            BatchPlan with the teams of each batch and token/latency estimates
+        """
+        costs = self.gpt_service.measure_prompt_costs(
+            your_team_number, pick_position, normalized_priorities, teams_data,
+            rank_only, prompt_encoding, strategy_interpretation
+        )
+        system_prompt, _ = self._ranking_system_prompt(pick_position, len(teams_data), rank_only)
+        output_tokens = self.gpt_service.rank_only_max_tokens if rank_only else full_output_tokens
+        return self.batch_planner.plan(
+            [(t["team_number"], costs["team_tokens"].get(t["team_number"], 0)) for t in teams_data],
+            costs["fixed_tokens"] + self.gpt_service.count_tokens(system_prompt),
+            output_tokens,
+            anchor_team_numbers=anchor_team_numbers,
+            batch_size=batch_size,
+        )
+
+    def _report_batch_plan(self, batch_plan, team_count, progress_tracker=None, concurrency=1) -> None:
+        """Log the batch plan and announce it through the progress tracker before any batch runs."""
+        summary = batch_plan.to_dict(concurrency)
+        logger.info(
+            f"Batch plan ({summary['mode']}): {team_count} teams in {summary['batch_count']} batches "
+            f"of {[b['team_count'] for b in summary['batches']]} teams, "
+            f"~{summary['estimated_input_tokens']} input / ~{summary['estimated_output_tokens']} output tokens, "
+            f"~{summary['estimated_seconds']}s"
+        )
+        if progress_tracker:
+            progress_tracker.update(
+                35,
+                f"Starting batch processing ({team_count} teams in {summary['batch_count']} batches, "
+                f"~{summary['estimated_seconds']}s)...",
+                "batch_processing"
+            )
+
+    def _ranking_system_prompt(self, pick_position, team_count, rank_only=False) -> Tuple[str, int]:
+        """System prompt and completion token limit for a batch or final-rerank call."""
+        if rank_only:
+            return (
+                self.gpt_service.create_rank_only_system_prompt(pick_position, team_count, self.game_context),
+                self.gpt_service.rank_only_max_tokens(team_count),
+            )
+        system_prompt = self.gpt_service.create_system_prompt(
+            pick_position, team_count, self.game_context, use_ultra_compact=True
+        )
+        return system_prompt, 4000
+
+    async def explain_picklist_teams(
+        self,
+        team_numbers: List[int],
+        ranked_team_numbers: List[int],
+        your_team_number: int,
+        pick_position: str,
+        priorities: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Get reasoning for teams of a rank-only picklist, e.g. when the user expands them.
+
+        Args:
+            team_numbers: Teams to explain
+            ranked_team_numbers: Full picklist order, best first
+            your_team_number: The user's team number
+            pick_position: Pick position of the picklist
+            priorities: Priority metrics with weights
+
+        Returns:
+            Dictionary with status and a team number -> reasoning mapping
+        """
+        teams_data = self.data_service.get_teams_for_analysis()
+        normalized_priorities = self.priority_service.normalize_priorities(priorities)
+        return await self.gpt_service.explain_rankings(
+            team_numbers, ranked_team_numbers, your_team_number, pick_position,
+            normalized_priorities, teams_data
+        )
+
+    def _determine_processing_strategy(
+        self, teams_data: List[Dict[str, Any]], use_batching: Optional[bool] = None,
+        batch_plan: Optional[BatchPlan] = None
+    ) -> Tuple[bool, str]:
+        """ORIGINAL AUTOMATIC BATCHING DECISION, auto mode driven by the token-budget batch plan"""
         
         team_count = len(teams_data)
         
-        # UPDATED LOGIC: Automatic batching for >80 teams (more reasonable threshold)
-        if use_batching is None:
+        if use_batching is None and batch_plan is not None:
+            # Batch only when the teams do not fit one call's token budget
+            should_batch = batch_plan.batch_count > 1
+            reason = (
+                f"Auto-selected {'batching' if should_batch else 'single'} for {team_count} teams "
+                f"({batch_plan.batch_count} batches within {batch_plan.input_budget} input tokens)"
+            )
+        elif use_batching is None:
             # Auto-decide based on team count (UPDATED THRESHOLD FOR MODERN GPT)
             should_batch = team_count > 80
             reason = f"Auto-selected {'batching' if should_batch else 'single'} for {team_count} teams (threshold: 80)"
@@ -445,30 +850,9 @@ class PicklistGeneratorService:
         logger.info(f"Processing strategy: {reason}")
         return should_batch, reason
 
-    def _calculate_optimal_batch_size(self, team_count: int, priorities_count: int) -> int:
-        """ORIGINAL BATCH SIZE CALCULATION - EXACT RESTORATION"""
-        
-        # ORIGINAL CONSTANTS
-        base_batch_size = 20
-        max_batch_size = 25
-        min_batch_size = 15
-        
-        # Adjust based on priorities complexity (original had this logic)
-        if priorities_count > 5:
-            adjusted_size = base_batch_size - 2
-        elif priorities_count > 3:
-            adjusted_size = base_batch_size - 1
-        else:
-            adjusted_size = base_batch_size
-        
-        # Ensure within bounds
-        final_size = max(min_batch_size, min(max_batch_size, adjusted_size))
-        
-        logger.debug(f"Calculated batch size: {final_size} for {team_count} teams with {priorities_count} priorities")
-        return final_size
-
     async def _orchestrate_single_processing(
-        self, teams_data, your_team_number, pick_position, normalized_priorities, cache_key, strategy_interpretation=None
+        self, teams_data, your_team_number, pick_position, normalized_priorities, cache_key, strategy_interpretation=None,
+        on_partial=None, prompt_encoding="json", rank_only=False
     ) -> Dict[str, Any]:
         """ORIGINAL SINGLE PROCESSING WITH INDEX MAPPING - EXACT RESTORATION"""
         
@@ -479,15 +863,14 @@ class PicklistGeneratorService:
         
         logger.info(f"Single processing {len(teams_data)} teams with index mapping to prevent duplicates")
         
-        # Create prompts with index mapping
-        system_prompt = self.gpt_service.create_system_prompt(
-            pick_position, len(teams_data), self.game_context, use_ultra_compact=True
-        )
+        # Create prompts with index mapping; the output limit matches the planned response format
+        system_prompt, max_tokens = self._ranking_system_prompt(pick_position, len(teams_data), rank_only)
         
         user_prompt, _ = self.gpt_service.create_user_prompt(
             your_team_number, pick_position, normalized_priorities, teams_data,
             team_numbers=[t["team_number"] for t in teams_data],
-            force_index_mapping=True
+            force_index_mapping=True, rank_only=rank_only,
+            prompt_encoding=prompt_encoding
         )
         
         # Execute analysis with full error recovery
@@ -496,7 +879,9 @@ class PicklistGeneratorService:
             user_prompt=user_prompt,
             teams_data=teams_data,
             team_index_map=team_index_map,
-            strategy_interpretation=strategy_interpretation
+            strategy_interpretation=strategy_interpretation,
+            on_partial=on_partial,
+            max_tokens=max_tokens
         )
         
         if analysis_result.get("status") == "success":
@@ -1,22 +1,41 @@
 # backend/app/services/picklist_gpt_service.py
 
 import asyncio
+import hashlib
 import json
 import logging
+import math
 import os
 import re
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
+from app.config.openai_config import OPENAI_MODEL
+from app.services.incremental_json_parser import IncrementalJSONArrayParser
+from app.services.llm_gateway import LLM_PRIORITY_BATCH, LLM_PRIORITY_INTERACTIVE
+from app.services.llm_provider import create_llm_client
+from app.services.llm_response_cache import cached_chat_completion
+from app.services.prompt_fragment_cache import PromptFragment, priorities_hash, prompt_fragment_cache
 
 import tiktoken
-from openai import AsyncOpenAI
 
 logger = logging.getLogger("picklist_gpt_service")
 
 GPT_MODEL = OPENAI_MODEL
 
+# Output budget for rank-only responses: an index and a separator per team plus the wrapper
+RANK_ONLY_TOKENS_PER_TEAM = 4
+RANK_ONLY_BASE_TOKENS = 40
+# Output budget per team for on-demand reasoning
+REASONING_TOKENS_PER_TEAM = 120
+
+# Team data encodings for user prompts: JSON objects per team, or one delimited table
+PROMPT_ENCODINGS = ("json", "table")
+TABLE_DELIMITER = "|"
+# Recently counted prompts (system prompts, assembled user prompts) whose token counts are reused
+TOKEN_COUNT_MEMO_SIZE = 32
+
 
 class PicklistGPTService:
     """
@@ -26,7 +45,7 @@ class PicklistGPTService:
 
     def __init__(self):
         """Initialize the picklist GPT service with original configuration."""
-        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        self.client = create_llm_client()
         
         # Handle tiktoken encoding with fallback for unsupported models like gpt-4.1
         try:
@@ -39,6 +58,20 @@ class PicklistGPTService:
         self.max_tokens_limit = 100000
         self.game_context = None  # Can be set by external services
         self.scouting_labels = self._load_scouting_labels()  # Load scouting labels for context
+        # Dataset/config version set by the owning generator; enables the shared prompt fragment cache
+        self.fragment_version: Optional[str] = None
+        self._fragment_scope: Optional[Tuple[str, str, str]] = None
+        self._token_counts: "OrderedDict[str, int]" = OrderedDict()
+        self._current_priorities = None
+        self._current_teams_data = None
+        self._percentile_cache = {}
+
+    def reset_request_state(self) -> None:
+        """Forget per-request prompt state so a pooled instance starts fresh."""
+        self._current_priorities = None
+        self._current_teams_data = None
+        self._percentile_cache = {}
+        self._fragment_scope = None
 
     def _load_scouting_labels(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -335,8 +368,8 @@ class PicklistGPTService:
             max_tokens = self.max_tokens_limit
 
         try:
-            system_tokens = len(self.token_encoder.encode(system_prompt))
-            user_tokens = len(self.token_encoder.encode(user_prompt))
+            system_tokens = self.count_tokens(system_prompt)
+            user_tokens = self.count_tokens(user_prompt)
             total_tokens = system_tokens + user_tokens
 
             logger.info(
@@ -350,6 +383,35 @@ class PicklistGPTService:
         except Exception as e:
             logger.warning(f"Token counting failed: {str(e)}, proceeding without check")
 
+    def count_tokens(self, text: str) -> int:
+        """
+        Token count of a prompt, reusing the count of recently seen or assembled prompts.
+
+        User prompts built by create_user_prompt are registered with the sum of
+        their memoized team fragment counts, so checking them does not re-encode
+        the whole prompt.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            Number of tokens
+        """
+        tokens = self._token_counts.get(text)
+        if tokens is None:
+            tokens = len(self.token_encoder.encode(text))
+            self._remember_token_count(text, tokens)
+        else:
+            self._token_counts.move_to_end(text)
+        return tokens
+
+    def _remember_token_count(self, text: str, tokens: int) -> None:
+        """Record a prompt's token count for count_tokens."""
+        self._token_counts[text] = tokens
+        self._token_counts.move_to_end(text)
+        while len(self._token_counts) > TOKEN_COUNT_MEMO_SIZE:
+            self._token_counts.popitem(last=False)
+
     def create_system_prompt(
         self,
         pick_position: str,
@@ -408,6 +470,62 @@ EXAMPLE: {{"p":[[1,9.5,"Best overall, superior auto+teleop vs Team 34"],[2,8.8,"
             # Fallback to standard format for smaller requests
             return self._create_standard_format_prompt(pick_position, team_count, game_context)
 
+    def create_rank_only_system_prompt(
+        self, pick_position: str, team_count: int, game_context: Optional[str] = None
+    ) -> str:
+        """
+        Create a system prompt asking only for the ranked order of team indices.
+
+        Scores and reasoning make up most of the output tokens of a ranking call;
+        this format drops both. Reasoning is fetched later for the teams a user
+        actually looks at (see explain_rankings).
+
+        Args:
+            pick_position: Pick position being ranked
+            team_count: Number of teams in the prompt
+            game_context: Optional game context text
+
+        Returns:
+            System prompt for a {"r":[index,...],"s":"ok"} response
+        """
+        position_context = {
+            "first": "First pick teams should be overall powerhouse teams that excel in multiple areas.",
+            "second": "Second pick teams should complement the first pick and address specific needs.",
+            "third": "Third pick teams are more specialized, often focusing on a single critical function.",
+        }
+
+        context_note = position_context.get(pick_position, "")
+
+        prompt = f"""You are an FRC alliance strategist.
+Return one‑line minified JSON, best team first:
+{{"r":[index,index,…],"s":"ok"}}
+
+CRITICAL RULES
+• Rank all {team_count} indices, each exactly once.
+• Use indices 1-{team_count} from TEAM_INDEX_MAP exactly once.
+• Sort by weighted performance, then synergy with YOUR_TEAM_PROFILE for {pick_position} pick.
+• Output indices only: no scores, no reasons, no other fields.
+
+{context_note}"""
+
+        # Add scouting labels context if available
+        if self.scouting_labels:
+            labels_context = self._create_labels_context()
+            if labels_context:
+                prompt += f"\n\nSCOUTING METRICS GUIDE:\n{labels_context}"
+
+        if game_context:
+            prompt += f"\n\nGame Context:\n{game_context}\n"
+
+        prompt += """
+EXAMPLE: {"r":[3,1,4,2],"s":"ok"}"""
+
+        return prompt
+
+    def rank_only_max_tokens(self, team_count: int) -> int:
+        """Completion token limit for a rank-only response covering `team_count` teams."""
+        return RANK_ONLY_BASE_TOKENS + RANK_ONLY_TOKENS_PER_TEAM * team_count
+
     def _create_standard_format_prompt(self, pick_position: str, team_count: int, game_context: Optional[str] = None) -> str:
         """Create standard format system prompt for smaller requests."""
         position_context = {
@@ -454,8 +572,15 @@ CRITICAL: Return only valid JSON. Provide specific reasoning citing actual metri
         teams_data: List[Dict[str, Any]],
         team_numbers: Optional[List[int]] = None,
         force_index_mapping: bool = True,
+        rank_only: bool = False,
+        prompt_encoding: str = "json",
     ) -> Tuple[str, Optional[Dict[int, int]]]:
-        """ORIGINAL USER PROMPT WITH FORCED INDEX MAPPING - EXACT RESTORATION"""
+        """
+        ORIGINAL USER PROMPT WITH FORCED INDEX MAPPING - EXACT RESTORATION
+
+        `prompt_encoding="table"` replaces the per-team JSON objects with a
+        delimited TEAM_TABLE (see _table_teams_block).
+        """
 
         # OPTIMIZATION: Store priorities for metric filtering and teams data for percentile calculation
         self._current_priorities = priorities
@@ -477,22 +602,48 @@ CRITICAL: Return only valid JSON. Provide specific reasoning citing actual metri
         # EXACT RESTORATION OF ORIGINAL WARNING SYSTEM
         team_index_info = ""
         if team_index_map:
+            response_shape = '{"r":[3,1,2...]}' if rank_only else '[[1,score,"reason"],[2,score,"reason"]...]'
             team_index_info = f"""
 TEAM_INDEX_MAP = {json.dumps(team_index_map)}
 ⚠️ CRITICAL: Use indices 1 through {len(team_index_map)} from TEAM_INDEX_MAP exactly once.
-⚠️ Your response MUST use indices, NOT team numbers: [[1,score,"reason"],[2,score,"reason"]...]
+⚠️ Your response MUST use indices, NOT team numbers: {response_shape}
 ⚠️ Each index from 1 to {len(team_index_map)} must appear EXACTLY ONCE.
 """
 
+        teams_with_scores = self._prepare_teams_with_scores(teams_data, priorities, team_index_map)
+        if prompt_encoding == "table":
+            teams_block, teams_tokens = self._table_teams_block(teams_with_scores)
+            if logger.isEnabledFor(logging.DEBUG):
+                # Diagnostic only: renders the JSON encoding as well
+                stats = self.measure_team_encodings(teams_with_scores, teams_tokens)
+                logger.debug(
+                    f"Table encoding: {stats['table_tokens']} tokens vs {stats['json_tokens']} as JSON "
+                    f"({stats['saved_percent']}% saved)"
+                )
+        else:
+            teams_block, teams_tokens = self._json_teams_block(teams_with_scores)
+
         # RESTORE ORIGINAL CONDENSED FORMAT
-        prompt = f"""YOUR_TEAM_PROFILE = {json.dumps(your_team_info) if your_team_info else "{}"} 
+        profile_block = f"""YOUR_TEAM_PROFILE = {json.dumps(your_team_info) if your_team_info else "{}"} 
 PRIORITY_METRICS  = {json.dumps(priorities)}   # include weight field
 GAME_CONTEXT      = {json.dumps(self.game_context) if self.game_context else "null"}
-TEAM_NUMBERS_TO_INCLUDE = {json.dumps(team_numbers)}{team_index_info}
-AVAILABLE_TEAMS = {json.dumps(self._prepare_teams_with_scores(teams_data, priorities, team_index_map))}     # include pre‑computed weighted_score
+"""
+        request_block = f"""TEAM_NUMBERS_TO_INCLUDE = {json.dumps(team_numbers)}{team_index_info}
+"""
+        closing = """
 
 Please produce output following RULES.
 """
+        prompt = profile_block + request_block + teams_block + closing
+
+        # Budget by summation: the profile block repeats across batches and team fragments are memoized
+        self._remember_token_count(
+            prompt,
+            self.count_tokens(profile_block)
+            + len(self.token_encoder.encode(request_block))
+            + teams_tokens
+            + len(self.token_encoder.encode(closing)),
+        )
 
         return prompt, team_index_map
 
@@ -504,57 +655,323 @@ Please produce output following RULES.
     ) -> List[Dict[str, Any]]:
         """ORIGINAL TEAM PREPARATION WITH WEIGHTED SCORES + SCOUTING LABEL CONTEXT"""
 
+        self._begin_fragment_scope(teams_data, priorities)
+
+        # Create reverse map for quick lookup
+        team_to_index = {v: k for k, v in team_index_map.items()} if team_index_map else None
+
         teams_with_scores = []
+        for team in teams_data:
+            prepared = self._team_fragment(
+                team["team_number"], "prepared", lambda team=team: self._prepare_team(team, priorities)
+            )
+            if team_to_index is not None:
+                teams_with_scores.append({"index": team_to_index.get(team["team_number"], 0), **prepared})
+            else:
+                # Standard format without indices
+                teams_with_scores.append(dict(prepared))
 
-        if team_index_map:
-            # Create reverse map for quick lookup
-            team_to_index = {v: k for k, v in team_index_map.items()}
-
-            for team in teams_data:
-                weighted_score = self._calculate_weighted_score(team, priorities)
-                team_with_score = {
-                    "index": team_to_index.get(team["team_number"], 0),
-                    "team_number": team["team_number"],
-                    "nickname": team.get("nickname", f"Team {team['team_number']}"),
-                    "weighted_score": weighted_score,
-                }
+        return teams_with_scores
 
-                # Add metrics with enhanced labels and scouting label context
-                if "metrics" in team and isinstance(team["metrics"], dict):
-                    # First ensure enhanced label names are used
-                    enhanced_metrics = self._ensure_enhanced_metric_names(team["metrics"])
-                    # Then add additional context for GPT
-                    team_with_score["metrics"] = self._enhance_metrics_with_labels(enhanced_metrics)
-                
-                # OPTIMIZATION: Include optimized text data if available  
-                if "text_data" in team and isinstance(team["text_data"], dict):
-                    team_with_score["text_data"] = self._optimize_text_data(team["text_data"])
+    def _prepare_team(self, team: Dict[str, Any], priorities: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """One team's prompt entry (without index): weighted score, banded metrics and text insights."""
+        weighted_score = self._calculate_weighted_score(team, priorities)
+        team_with_score = {
+            "team_number": team["team_number"],
+            "nickname": team.get("nickname", f"Team {team['team_number']}"),
+            "weighted_score": weighted_score,
+        }
 
-                teams_with_scores.append(team_with_score)
-        else:
-            # Standard format without indices
-            for team in teams_data:
-                weighted_score = self._calculate_weighted_score(team, priorities)
-                team_with_score = {
-                    "team_number": team["team_number"],
-                    "nickname": team.get("nickname", f"Team {team['team_number']}"),
-                    "weighted_score": weighted_score,
-                }
+        # Add metrics with enhanced labels and scouting label context
+        if "metrics" in team and isinstance(team["metrics"], dict):
+            # First ensure enhanced label names are used
+            enhanced_metrics = self._ensure_enhanced_metric_names(team["metrics"])
+            # Then add additional context for GPT
+            team_with_score["metrics"] = self._enhance_metrics_with_labels(enhanced_metrics)
 
-                # Add metrics with enhanced labels and scouting label context
-                if "metrics" in team and isinstance(team["metrics"], dict):
-                    # First ensure enhanced label names are used
-                    enhanced_metrics = self._ensure_enhanced_metric_names(team["metrics"])
-                    # Then add additional context for GPT
-                    team_with_score["metrics"] = self._enhance_metrics_with_labels(enhanced_metrics)
-                
-                # OPTIMIZATION: Include optimized text data if available  
-                if "text_data" in team and isinstance(team["text_data"], dict):
-                    team_with_score["text_data"] = self._optimize_text_data(team["text_data"])
+        # OPTIMIZATION: Include optimized text data if available
+        if "text_data" in team and isinstance(team["text_data"], dict):
+            team_with_score["text_data"] = self._optimize_text_data(team["text_data"])
 
-                teams_with_scores.append(team_with_score)
+        return team_with_score
 
-        return teams_with_scores
+    def _begin_fragment_scope(self, teams_data: List[Dict[str, Any]], priorities: List[Dict[str, Any]]) -> None:
+        """
+        Fix the fragment cache scope for the teams about to be prepared.
+
+        A team's fragment depends on the dataset version, the priorities and the
+        percentile thresholds its metrics are banded with. Thresholds are computed
+        up front for every numeric metric of these teams (exactly as banding would
+        compute them lazily), so the scope can include a fingerprint of them.
+
+        Args:
+            teams_data: Teams about to be prepared (thresholds come from _current_teams_data)
+            priorities: Current priorities
+        """
+        if self.fragment_version is None:
+            self._fragment_scope = None
+            return
+
+        numeric_fields = {}
+        for team in teams_data:
+            metrics = team.get("metrics")
+            if isinstance(metrics, dict):
+                for name, value in metrics.items():
+                    if isinstance(value, (int, float)):
+                        numeric_fields[name] = value
+        for metric_name in self._ensure_enhanced_metric_names(numeric_fields):
+            try:
+                self._get_metric_percentiles(metric_name)
+            except Exception as e:
+                # Banding hits the same error and falls back to raw values, as without the cache
+                logger.debug(f"No percentiles for {metric_name}: {e}")
+
+        thresholds = repr(sorted((str(k), v) for k, v in self._percentile_cache.items()))
+        self._fragment_scope = (
+            self.fragment_version,
+            priorities_hash(priorities),
+            hashlib.sha256(thresholds.encode("utf-8")).hexdigest()[:16],
+        )
+
+    def _team_fragment(self, team_number: Any, mode: str, build: Callable[[], Any]) -> Any:
+        """
+        Memoized per-team prompt piece for the current fragment scope.
+
+        Args:
+            team_number: Team the piece belongs to
+            mode: "prepared" for the team entry, or the encoding of a rendered fragment
+            build: Builds the piece on a cache miss
+
+        Returns:
+            Cached or newly built piece (shared; do not mutate)
+        """
+        if self._fragment_scope is None:
+            return build()
+        version, priority_key, thresholds = self._fragment_scope
+        return prompt_fragment_cache.get_or_create(
+            (version, team_number, priority_key, mode, thresholds), build
+        )
+
+    def _render_fragment(self, text: str) -> PromptFragment:
+        """Wrap rendered team text with its token count."""
+        return PromptFragment(text, len(self.token_encoder.encode(text)))
+
+    def _json_team_fragments(self, teams_with_scores: List[Dict[str, Any]]) -> List[PromptFragment]:
+        """Memoized JSON object of each team, with its index spliced in front when present."""
+        fragments = []
+        for team in teams_with_scores:
+            body = {k: v for k, v in team.items() if k != "index"}
+            fragment = self._team_fragment(
+                team["team_number"], "json", lambda body=body: self._render_fragment(json.dumps(body))
+            )
+            if "index" in team:
+                # Same text json.dumps gives for the full entry, index first
+                index_text = f'{{"index": {json.dumps(team["index"])}, '
+                fragment = PromptFragment(
+                    index_text + fragment.text[1:],
+                    fragment.tokens + len(self.token_encoder.encode(index_text)) - 1,
+                )
+            fragments.append(fragment)
+        return fragments
+
+    def _json_teams_block(self, teams_with_scores: List[Dict[str, Any]]) -> Tuple[str, int]:
+        """
+        AVAILABLE_TEAMS line built from memoized per-team JSON fragments.
+
+        Args:
+            teams_with_scores: Teams from _prepare_teams_with_scores
+
+        Returns:
+            Tuple of (block text, estimated token count)
+        """
+        fragments = self._json_team_fragments(teams_with_scores)
+        prefix = "AVAILABLE_TEAMS = ["
+        suffix = "]     # include pre‑computed weighted_score"
+        text = prefix + ", ".join(f.text for f in fragments) + suffix
+        tokens = (
+            len(self.token_encoder.encode(prefix))
+            + sum(f.tokens for f in fragments)
+            + max(len(fragments) - 1, 0)
+            + len(self.token_encoder.encode(suffix))
+        )
+        return text, tokens
+
+    @staticmethod
+    def _metric_short_code(metric_name: str, used_codes: set) -> str:
+        """Initials of the metric's words (digits kept), made unique among `used_codes`."""
+        words = re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+", metric_name)
+        base = "".join(w if w.isdigit() else w[0].upper() for w in words) or "M"
+        code = base
+        suffix = 2
+        while code in used_codes:
+            code = f"{base}_{suffix}"
+            suffix += 1
+        used_codes.add(code)
+        return code
+
+    @staticmethod
+    def _table_cell(value: Any) -> str:
+        """Render one value for a TEAM_TABLE row."""
+        if value is None or value == "":
+            return "-"
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        if isinstance(value, float):
+            return f"{round(value, 2):g}"
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, separators=(",", ":"))
+        return " ".join(str(value).split()).replace(TABLE_DELIMITER, "/")
+
+    def _table_teams_block(self, teams_with_scores: List[Dict[str, Any]]) -> Tuple[str, int]:
+        """
+        Encode prepared teams as one delimited table instead of a JSON object per team.
+
+        Metric names appear once, as short codes in the header, with a legend that
+        maps each code to its metric and scouting label description. Each team is
+        then a single memoized row of values or performance bands.
+
+        Args:
+            teams_with_scores: Teams from _prepare_teams_with_scores
+
+        Returns:
+            Tuple of (block text, estimated token count)
+        """
+        head, rows = self._table_team_fragments(teams_with_scores)
+        text = head + "".join("\n" + row.text for row in rows)
+        return text, self.count_tokens(head) + sum(row.tokens for row in rows) + len(rows)
+
+    def _table_team_fragments(self, teams_with_scores: List[Dict[str, Any]]) -> Tuple[str, List[PromptFragment]]:
+        """TEAM_TABLE heading (legend and header row) and the memoized row of each team."""
+        metric_names: List[str] = []
+        for team in teams_with_scores:
+            for name in (team.get("metrics") or {}):
+                if name not in metric_names:
+                    metric_names.append(name)
+
+        used_codes = set()
+        codes = [self._metric_short_code(name, used_codes) for name in metric_names]
+
+        legend = []
+        for code, name in zip(codes, metric_names):
+            label_info = self.scouting_labels.get(name) if self.scouting_labels else None
+            description = f": {self._brief_label_description(label_info)}" if label_info else ""
+            legend.append(f"{code}={name}{description}")
+
+        has_index = any("index" in team for team in teams_with_scores)
+        has_notes = any(team.get("text_data") for team in teams_with_scores)
+        header = (["i"] if has_index else []) + ["team", "name", "score"] + codes + (["notes"] if has_notes else [])
+
+        # Rows only depend on the team and the column layout
+        layout = hashlib.sha256(json.dumps([metric_names, has_notes]).encode("utf-8")).hexdigest()[:16]
+        rows = []
+        for team in teams_with_scores:
+            row = self._team_fragment(
+                team["team_number"], f"table:{layout}",
+                lambda team=team: self._render_fragment(self._table_row(team, metric_names, has_notes)),
+            )
+            if has_index:
+                index_text = self._table_cell(team.get("index")) + TABLE_DELIMITER
+                row = PromptFragment(index_text + row.text, row.tokens + len(self.token_encoder.encode(index_text)))
+            rows.append(row)
+
+        legend_text = "\n".join(legend) if legend else "(no metrics)"
+        head = f"""TEAM_TABLE  # one row per team, "{TABLE_DELIMITER}"-delimited, "-" = no data; i = index, score = pre‑computed weighted_score
+LEGEND:
+{legend_text}
+""" + TABLE_DELIMITER.join(header)
+        return head, rows
+
+    def _table_row(self, team: Dict[str, Any], metric_names: List[str], has_notes: bool) -> str:
+        """One TEAM_TABLE row without the index cell."""
+        metrics = team.get("metrics") or {}
+        cells = [team.get("team_number"), team.get("nickname"), team.get("weighted_score")]
+        cells += [metrics.get(name) for name in metric_names]
+        if has_notes:
+            text_data = team.get("text_data") or {}
+            cells.append("; ".join(f"{k}: {v}" for k, v in text_data.items() if v))
+        return TABLE_DELIMITER.join(self._table_cell(cell) for cell in cells)
+
+    def measure_team_encodings(
+        self, teams_with_scores: List[Dict[str, Any]], table_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Count prompt tokens for the JSON and table encodings of the same teams.
+
+        Diagnostic: create_user_prompt only calls it when debug logging is enabled.
+
+        Args:
+            teams_with_scores: Teams from _prepare_teams_with_scores
+            table_tokens: Token count of the already encoded table, computed when omitted
+
+        Returns:
+            Dictionary with json_tokens, table_tokens, saved_tokens and saved_percent
+        """
+        _, json_tokens = self._json_teams_block(teams_with_scores)
+        if table_tokens is None:
+            _, table_tokens = self._table_teams_block(teams_with_scores)
+        saved = json_tokens - table_tokens
+        return {
+            "json_tokens": json_tokens,
+            "table_tokens": table_tokens,
+            "saved_tokens": saved,
+            "saved_percent": round(100.0 * saved / json_tokens, 1) if json_tokens else 0.0,
+        }
+
+    def measure_prompt_costs(
+        self,
+        your_team_number: int,
+        pick_position: str,
+        priorities: List[Dict[str, Any]],
+        teams_data: List[Dict[str, Any]],
+        rank_only: bool = False,
+        prompt_encoding: str = "json",
+        strategy_interpretation: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Split a ranking prompt's token count into per-team costs and a fixed remainder.
+
+        Builds the user prompt for all teams from memoized fragments, then charges
+        each team its fragment plus its share of TEAM_NUMBERS_TO_INCLUDE and
+        TEAM_INDEX_MAP. Everything else (profile, priorities, game context, table
+        legend, strategy context) is the fixed cost every batch pays. This also
+        fixes the request's performance bands to percentiles over all these teams.
+
+        Args:
+            your_team_number: Team number of the user's team
+            pick_position: Pick position
+            priorities: Normalized priorities
+            teams_data: Every team that will be ranked
+            rank_only: Whether prompts ask for the order only
+            prompt_encoding: "json" or "table"
+            strategy_interpretation: Strategy text prepended by analyze_teams, if any
+
+        Returns:
+            Dictionary with team_tokens (team number -> tokens) and fixed_tokens
+        """
+        team_numbers = [team["team_number"] for team in teams_data]
+        user_prompt, team_index_map = self.create_user_prompt(
+            your_team_number, pick_position, priorities, teams_data,
+            team_numbers=team_numbers, rank_only=rank_only, prompt_encoding=prompt_encoding
+        )
+        teams_with_scores = self._prepare_teams_with_scores(teams_data, priorities, team_index_map)
+        if prompt_encoding == "table":
+            _, fragments = self._table_team_fragments(teams_with_scores)
+        else:
+            fragments = self._json_team_fragments(teams_with_scores)
+
+        mapping_tokens = len(self.token_encoder.encode(json.dumps(team_numbers))) + len(
+            self.token_encoder.encode(json.dumps(team_index_map))
+        )
+        mapping_share = mapping_tokens / max(len(teams_data), 1)
+        team_tokens = {
+            team["team_number"]: int(math.ceil(fragment.tokens + 1 + mapping_share))
+            for team, fragment in zip(teams_with_scores, fragments)
+        }
+
+        fixed_tokens = self.count_tokens(user_prompt) - sum(team_tokens.values())
+        if strategy_interpretation:
+            fixed_tokens += self.count_tokens(self._strategy_context(strategy_interpretation))
+        return {"team_tokens": team_tokens, "fixed_tokens": max(fixed_tokens, 0)}
 
     def _enhance_metrics_with_labels(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -799,20 +1216,23 @@ Please produce output following RULES.
             metric_descriptions = []
             
             for metric_id, label_info in metrics:
-                description = label_info.get("description", "")
-                typical_range = label_info.get("typical_range", "")
-                
                 # Compact format: "metric_id: brief_description (range)"
-                brief_desc = description[:40] + "..." if len(description) > 40 else description
-                range_info = f" ({typical_range})" if typical_range else ""
-                
-                metric_descriptions.append(f"- {metric_id}: {brief_desc}{range_info}")
+                metric_descriptions.append(f"- {metric_id}: {self._brief_label_description(label_info)}")
             
             if metric_descriptions:
                 context_parts.append(f"{category_header}\n" + "\n".join(metric_descriptions))
         
         return "\n\n".join(context_parts)
     
+    @staticmethod
+    def _brief_label_description(label_info: Dict[str, Any]) -> str:
+        """Scouting label description shortened to 40 characters, with its typical range."""
+        description = label_info.get("description", "")
+        typical_range = label_info.get("typical_range", "")
+        brief_desc = description[:40] + "..." if len(description) > 40 else description
+        range_info = f" ({typical_range})" if typical_range else ""
+        return f"{brief_desc}{range_info}"
+
     def _get_essential_metrics(self) -> set:
         """
         Get essential metrics when no strategy is provided.
@@ -1048,57 +1468,48 @@ CRITICAL: Return only valid JSON."""
         teams_data: List[Dict[str, Any]],
         reference_teams: List[Dict[str, Any]],
         team_index_map: Optional[Dict[int, int]] = None,
+        rank_only: bool = False,
+        prompt_encoding: str = "json",
     ) -> str:
         """
         Create user prompt with reference teams for context.
 
+        The teams are encoded exactly as in create_user_prompt (same encoding,
+        index mapping and response shape); already ranked teams from earlier
+        batches are listed ahead of them so scores stay on one scale.
+
         Args:
             your_team_number: Analyzing team number
             pick_position: Pick position context
             priorities: Priority weights
             teams_data: Teams to analyze
             reference_teams: High-performing reference teams
-            team_index_map: Optional index mapping
+            team_index_map: Optional index mapping; must number teams_data from 1 in order
+            rank_only: Whether the prompt asks for the order only
+            prompt_encoding: "json" or "table"
 
         Returns:
             User prompt with reference team context
         """
-        prompt = (
-            f"Team {your_team_number} - {pick_position} pick analysis with reference context.\n\n"
+        prompt, _ = self.create_user_prompt(
+            your_team_number, pick_position, priorities, teams_data,
+            team_numbers=[team["team_number"] for team in teams_data],
+            force_index_mapping=team_index_map is not None,
+            rank_only=rank_only, prompt_encoding=prompt_encoding,
         )
 
-        # Reference teams section
-        prompt += "HIGH-PERFORMING REFERENCE TEAMS:\n"
-        for team in reference_teams[:5]:  # Show top 5 reference teams
-            prompt += f"Team {team.get('team_number', 0)}: {team.get('nickname', 'Unknown')}\n"
-            if "metrics" in team:
-                for metric, value in team["metrics"].items():
-                    prompt += f"  {metric}: {value}\n"
-            prompt += "\n"
-
-        # Priorities
-        if priorities:
-            prompt += "PRIORITIES:\n"
-            for priority in priorities:
-                prompt += f"- {priority.get('name', 'Unknown')} (weight: {priority.get('weight', 0.0):.2f})\n"
-            prompt += "\n"
-
-        # Teams to analyze
-        prompt += "TEAMS TO ANALYZE:\n"
-        for i, team in enumerate(teams_data):
-            team_num = team.get("team_number", 0)
-            display_ref = team_index_map.get(i, team_num) if team_index_map else team_num
-
-            prompt += f"Team {display_ref}: {team.get('nickname', f'Team {team_num}')}\n"
-
-            if "metrics" in team and isinstance(team["metrics"], dict):
-                for metric, value in team["metrics"].items():
-                    prompt += f"  {metric}: {value}\n"
-            prompt += "\n"
-
-        prompt += "Rank teams comparing against reference teams and considering priorities."
+        reference = [
+            [team.get("team_number"), team.get("nickname", ""), round(float(team.get("score") or 0.0), 2)]
+            for team in reference_teams[:5]  # Show top 5 reference teams
+        ]
+        reference_block = f"""REFERENCE_TEAMS = {json.dumps(reference)}
+# [team, nickname, score] already ranked in an earlier batch; not to be ranked again.
+# Rank teams comparing against reference teams and considering priorities; keep scores on their scale.
 
-        return prompt
+"""
+        full_prompt = reference_block + prompt
+        self._remember_token_count(full_prompt, self.count_tokens(reference_block) + self.count_tokens(prompt))
+        return full_prompt
 
     def parse_response_with_index_mapping(
         self,
@@ -1123,81 +1534,143 @@ CRITICAL: Return only valid JSON."""
         # Handle ultra-compact format {"p":[[team,score,"reason"]...],"s":"ok"}
         if "p" in response_data and isinstance(response_data["p"], list):
             for team_entry in response_data["p"]:
-                if len(team_entry) >= 3:
-                    first_value = int(team_entry[0])
+                team = self._picklist_entry(team_entry, teams_data, team_index_map)
+                if team is None:
+                    continue
 
-                    # Convert index to team number if mapping provided
-                    if team_index_map and first_value in team_index_map:
-                        team_number = team_index_map[first_value]
-                        logger.debug(f"Mapped index {first_value} to team {team_number}")
-                    else:
-                        team_number = first_value
+                # Skip duplicates
+                if team["team_number"] in seen_teams:
+                    logger.info(f"Skipping duplicate team {team['team_number']}")
+                    continue
 
-                    # Skip duplicates
-                    if team_number in seen_teams:
-                        logger.info(f"Skipping duplicate team {team_number}")
-                        continue
+                seen_teams.add(team["team_number"])
+                picklist.append(team)
 
-                    seen_teams.add(team_number)
-                    score = float(team_entry[1])
-                    reason = team_entry[2]
-
-                    # Get team nickname
-                    team_data = next(
-                        (t for t in teams_data if t.get("team_number") == team_number), None
-                    )
-                    nickname = (
-                        team_data.get("nickname", f"Team {team_number}")
-                        if team_data
-                        else f"Team {team_number}"
-                    )
-
-                    picklist.append(
-                        {
-                            "team_number": team_number,
-                            "nickname": nickname,
-                            "score": score,
-                            "reasoning": reason,
-                        }
-                    )
+        # Handle rank-only format {"r":[index,...],"s":"ok"}
+        elif "r" in response_data and isinstance(response_data["r"], list):
+            ranked_numbers = []
+            for value in response_data["r"]:
+                try:
+                    index = int(value)
+                except (TypeError, ValueError):
+                    continue
+                team_number = team_index_map.get(index, index) if team_index_map else index
+                if team_number in seen_teams:
+                    logger.info(f"Skipping duplicate team {team_number}")
+                    continue
+                seen_teams.add(team_number)
+                ranked_numbers.append(team_number)
+
+            for position, team_number in enumerate(ranked_numbers):
+                team = self._picklist_entry(
+                    [team_number, self._rank_only_score(position, len(ranked_numbers)), ""], teams_data
+                )
+                # Reasoning is fetched on demand through explain_rankings
+                team["reasoning_pending"] = True
+                picklist.append(team)
 
         return picklist
 
+    @staticmethod
+    def _rank_only_score(position: int, count: int) -> float:
+        """Score from 10 (first) down to 1 (last) for a rank-only response, so score-based merging still works."""
+        if count <= 1:
+            return 10.0
+        return round(10.0 - 9.0 * position / (count - 1), 2)
+
+    def _picklist_entry(
+        self,
+        team_entry: Any,
+        teams_data: List[Dict[str, Any]],
+        team_index_map: Optional[Dict[int, int]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Convert one ultra-compact [index_or_team, score, "reason"] entry to a picklist team.
+
+        Args:
+            team_entry: Entry from the "p" array of a GPT response
+            teams_data: Team data for nickname lookups
+            team_index_map: Optional mapping from indices to team numbers
+
+        Returns:
+            Team with number, nickname, score and reasoning, or None for malformed entries
+        """
+        if not isinstance(team_entry, list) or len(team_entry) < 3:
+            return None
+
+        first_value = int(team_entry[0])
+
+        # Convert index to team number if mapping provided
+        if team_index_map and first_value in team_index_map:
+            team_number = team_index_map[first_value]
+            logger.debug(f"Mapped index {first_value} to team {team_number}")
+        else:
+            team_number = first_value
+
+        # Get team nickname
+        team_data = next(
+            (t for t in teams_data if t.get("team_number") == team_number), None
+        )
+        nickname = (
+            team_data.get("nickname", f"Team {team_number}")
+            if team_data
+            else f"Team {team_number}"
+        )
+
+        return {
+            "team_number": team_number,
+            "nickname": nickname,
+            "score": float(team_entry[1]),
+            "reasoning": team_entry[2],
+        }
+
+    @staticmethod
+    def _strategy_context(strategy_interpretation: str) -> str:
+        """Preamble placing the strategy interpretation ahead of the ranking prompt."""
+        return f"""
+⚠️ CRITICAL STRATEGIC CONTEXT ⚠️
+STRATEGY_INTERPRETATION = "{strategy_interpretation}"
+
+This strategic interpretation is the PRIMARY consideration for all ranking decisions. 
+Use this as the guiding principle when evaluating teams. The metric weights provide 
+quantitative guidance, but this strategic interpretation defines the overall approach.
+
+ORIGINAL PROMPT:
+"""
+
     async def analyze_teams(
         self,
         system_prompt: str,
         user_prompt: str,
         teams_data: List[Dict[str, Any]],
         team_index_map: Optional[Dict[int, int]] = None,
-        max_retries: int = 3,
         strategy_interpretation: Optional[str] = None,
+        on_partial: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        max_tokens: int = 4000,
     ) -> Dict[str, Any]:
         """
-        Execute GPT analysis with retry logic.
+        Execute GPT analysis; rate limits and transient errors are retried by the LLM gateway.
 
         Args:
             system_prompt: System prompt for GPT
             user_prompt: User prompt with team data
             teams_data: Team data for response parsing
             team_index_map: Optional index mapping
-            max_retries: Maximum retry attempts
+            on_partial: Optional callback receiving (rank, team) for each team as soon as
+                the streamed response contains it
+            max_tokens: Completion token limit, e.g. rank_only_max_tokens() for rank-only prompts
 
         Returns:
             Analysis results with picklist and metadata
         """
         # Add strategy interpretation to user prompt if provided
         if strategy_interpretation:
-            strategy_context = f"""
-⚠️ CRITICAL STRATEGIC CONTEXT ⚠️
-STRATEGY_INTERPRETATION = "{strategy_interpretation}"
-
-This strategic interpretation is the PRIMARY consideration for all ranking decisions. 
-Use this as the guiding principle when evaluating teams. The metric weights provide 
-quantitative guidance, but this strategic interpretation defines the overall approach.
-
-ORIGINAL PROMPT:
-"""
-            user_prompt = strategy_context + user_prompt
+            strategy_context = self._strategy_context(strategy_interpretation)
+            combined_prompt = strategy_context + user_prompt
+            self._remember_token_count(
+                combined_prompt, self.count_tokens(strategy_context) + self.count_tokens(user_prompt)
+            )
+            user_prompt = combined_prompt
         
         # Log the prompts being sent to GPT for debugging
         logger.info("=" * 80)
@@ -1216,8 +1689,15 @@ ORIGINAL PROMPT:
         except ValueError as e:
             return {"status": "error", "error": str(e), "error_type": "token_limit_exceeded"}
 
-        # Use the proper exponential backoff retry method
-        result = await self._execute_api_call_with_retry(system_prompt, user_prompt, max_retries)
+        on_entry = None
+        if on_partial is not None:
+            def on_entry(position: int, team_entry: Any) -> None:
+                team = self._picklist_entry(team_entry, teams_data, team_index_map)
+                if team is not None:
+                    on_partial(position, team)
+
+        # Rate limits and transient failures are retried by the shared LLM gateway
+        result = await self._execute_api_call(system_prompt, user_prompt, on_entry, max_tokens)
 
         if result["status"] == "success":
             # Log the GPT response for debugging
@@ -1238,91 +1718,48 @@ ORIGINAL PROMPT:
                 "picklist": picklist,
                 "response_data": result["response_data"],
                 "processing_time": result["processing_time"],
-                "attempt": result.get("attempt", 1),
             }
         else:
             return result
 
-    async def _execute_api_call_with_retry(
-        self, system_prompt: str, user_prompt: str, max_retries: int = 3
+    async def _execute_api_call(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_entry: Optional[Callable[[int, Any], None]] = None,
+        max_tokens: int = 4000,
     ) -> Dict[str, Any]:
-        """ORIGINAL EXPONENTIAL BACKOFF RETRY LOGIC - EXACT RESTORATION"""
-        initial_delay = 1.0
-        retry_count = 0
-
-        while retry_count < max_retries:
-            try:
-                # Execute API call
-                result = await self._execute_api_call(system_prompt, user_prompt)
-
-                # Check for rate limiting specifically
-                if result.get("error_type") == "rate_limit" or "429" in str(
-                    result.get("error", "")
-                ):
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        # ORIGINAL EXPONENTIAL BACKOFF: 2s, 4s, 8s
-                        delay = initial_delay * (2**retry_count)
-                        logger.warning(
-                            f"Rate limit hit, retrying in {delay}s (attempt {retry_count}/{max_retries})"
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-                    else:
-                        logger.error(f"Rate limit exceeded after {max_retries} attempts")
-                        return {
-                            "status": "error",
-                            "error": f"Rate limit exceeded after {max_retries} attempts",
-                            "error_type": "rate_limit_exhausted",
-                            "attempts": retry_count,
-                        }
-                else:
-                    # Success or non-rate-limit error
-                    result["attempt"] = retry_count + 1
-                    return result
-
-            except Exception as e:
-                retry_count += 1
-                logger.error(f"API call attempt {retry_count} failed: {str(e)}")
+        """
+        Execute a single OpenAI chat completion call.
 
-                if retry_count < max_retries:
-                    delay = initial_delay * (2**retry_count)
-                    logger.info(f"Retrying in {delay}s...")
-                    await asyncio.sleep(delay)
-                else:
-                    return {
-                        "status": "error",
-                        "error": f"API call failed after {max_retries} attempts: {str(e)}",
-                        "error_type": "api_failure",
-                        "attempts": retry_count,
-                    }
+        With `on_entry` the completion is streamed and every entry of the "p"
+        array is passed on, with its position, as soon as it is complete.
+        """
+        start_time = time.time()
 
-        return {
-            "status": "error",
-            "error": "Unexpected retry loop exit",
-            "error_type": "unknown",
-            "attempts": retry_count,
-        }
+        on_delta = None
+        if on_entry is not None:
+            parser = IncrementalJSONArrayParser("p")
 
-    async def _execute_api_call(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
-        """Execute a single OpenAI chat completion call."""
-        start_time = time.time()
+            def on_delta(delta: str) -> None:
+                for position, team_entry in parser.feed(delta):
+                    on_entry(position, team_entry)
 
         try:
-            response = await self.client.chat.completions.create(
+            content, finish_reason = await cached_chat_completion(
+                self.client,
                 model=GPT_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt},
                 ],
                 temperature=0.2,
-                max_tokens=4000,
+                max_tokens=max_tokens,
                 response_format={"type": "json_object"},
+                priority=LLM_PRIORITY_BATCH,
+                on_delta=on_delta,
             )
 
-            content = response.choices[0].message.content
-            finish_reason = response.choices[0].finish_reason
-
             if finish_reason == "length":
                 return {
                     "status": "error",
@@ -1355,12 +1792,11 @@ ORIGINAL PROMPT:
             }
 
         except Exception as e:
-            error_str = str(e)
-            if "429" in error_str:
+            if getattr(e, "status_code", None) == 429:
                 return {
                     "status": "error",
-                    "error": f"Rate limit exceeded: {e}",
-                    "error_type": "rate_limit",
+                    "error": f"Rate limit exceeded after gateway retries: {e}",
+                    "error_type": "rate_limit_exhausted",
                 }
 
             return {
@@ -1369,6 +1805,130 @@ ORIGINAL PROMPT:
                 "error_type": "api_error",
             }
 
+    def create_reasoning_prompts(
+        self,
+        team_numbers: List[int],
+        ranked_team_numbers: List[int],
+        your_team_number: int,
+        pick_position: str,
+        priorities: List[Dict[str, Any]],
+        teams_data: List[Dict[str, Any]],
+    ) -> Tuple[str, str]:
+        """
+        Create prompts explaining the placement of a few teams in an existing ranking.
+
+        Each team is shown with its neighbours directly above and below, so the
+        prompt (and therefore its cache entry) depends only on that part of the list.
+
+        Args:
+            team_numbers: Teams to explain
+            ranked_team_numbers: Full picklist order, best first
+            your_team_number: The user's team number
+            pick_position: Pick position of the picklist
+            priorities: Priority metrics with weights
+            teams_data: Team data for the teams in the picklist
+
+        Returns:
+            Tuple of (system prompt, user prompt)
+        """
+        self._current_priorities = priorities
+        self._current_teams_data = teams_data
+
+        rank_of = {team_number: i for i, team_number in enumerate(ranked_team_numbers)}
+        context_positions = set()
+        for team_number in team_numbers:
+            if team_number in rank_of:
+                position = rank_of[team_number]
+                context_positions.update(
+                    p for p in (position - 1, position, position + 1) if 0 <= p < len(ranked_team_numbers)
+                )
+
+        data_by_number = {t["team_number"]: t for t in teams_data}
+        context_teams = []
+        for position in sorted(context_positions):
+            team = data_by_number.get(ranked_team_numbers[position])
+            if team is None:
+                continue
+            entry = self._prepare_teams_with_scores([team], priorities)[0]
+            entry["rank"] = position + 1
+            context_teams.append(entry)
+
+        system_prompt = f"""You are an FRC alliance strategist explaining an existing {pick_position} pick picklist for Team {your_team_number}.
+Return JSON:
+{{"reasons":[{{"team_number":int,"reasoning":"..."}}],"s":"ok"}}
+
+RULES
+• One entry for every team in TEAMS_TO_EXPLAIN and no others.
+• Do not change the ranking; explain why each team sits at its rank.
+• Be COMPARATIVE: cite metrics versus the teams ranked directly above and below, by TEAM NUMBER.
+• One or two sentences per team. NO repetitive words or phrases."""
+
+        user_prompt = f"""PRIORITY_METRICS = {json.dumps(priorities)}
+TEAMS_TO_EXPLAIN = {json.dumps([n for n in team_numbers if n in rank_of])}
+RANKED_TEAMS = {json.dumps(context_teams)}
+"""
+        return system_prompt, user_prompt
+
+    async def explain_rankings(
+        self,
+        team_numbers: List[int],
+        ranked_team_numbers: List[int],
+        your_team_number: int,
+        pick_position: str,
+        priorities: List[Dict[str, Any]],
+        teams_data: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Fetch reasoning for teams of a rank-only picklist when the user asks for it.
+
+        Responses go through the shared LLM response cache, so expanding the same
+        team again (with the same neighbours) costs no API call.
+
+        Args:
+            team_numbers: Teams to explain
+            ranked_team_numbers: Full picklist order, best first
+            your_team_number: The user's team number
+            pick_position: Pick position of the picklist
+            priorities: Priority metrics with weights
+            teams_data: Team data for the teams in the picklist
+
+        Returns:
+            Dictionary with status and a team number -> reasoning mapping
+        """
+        system_prompt, user_prompt = self.create_reasoning_prompts(
+            team_numbers, ranked_team_numbers, your_team_number, pick_position, priorities, teams_data
+        )
+
+        try:
+            content, finish_reason = await cached_chat_completion(
+                self.client,
+                model=GPT_MODEL,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.2,
+                max_tokens=RANK_ONLY_BASE_TOKENS + REASONING_TOKENS_PER_TEAM * len(team_numbers),
+                response_format={"type": "json_object"},
+                priority=LLM_PRIORITY_INTERACTIVE,
+            )
+            response_data = json.loads(content)
+        except Exception as e:
+            logger.error(f"Error fetching team reasoning: {e}")
+            return {"status": "error", "error": str(e)}
+
+        requested = set(team_numbers)
+        reasoning = {}
+        for entry in response_data.get("reasons", []):
+            try:
+                team_number = int(entry.get("team_number"))
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if team_number in requested and entry.get("reasoning"):
+                reasoning[team_number] = entry["reasoning"]
+
+        return {"status": "success", "reasoning": reasoning, "finish_reason": finish_reason}
+
     def has_enhanced_labels(self) -> bool:
         """
         Check if enhanced labels are available and being used.
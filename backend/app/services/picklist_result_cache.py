@@ -0,0 +1,386 @@
+# backend/app/services/picklist_result_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.services.dataset_registry import dataset_registry
+
+logger = logging.getLogger("picklist_result_cache")
+
+# Base directory setup for file operations
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+GAME_CONTEXT_CACHE_DIR = os.path.join(BASE_DIR, "cache", "game_context")
+PICKLIST_CACHE_DIR = os.getenv("PICKLIST_CACHE_DIR", os.path.join(BASE_DIR, "cache", "picklists"))
+
+# Bounds for the in-memory cache; persisted results are pruned to the same entry count
+PICKLIST_CACHE_MAX_ENTRIES = int(os.getenv("PICKLIST_CACHE_MAX_ENTRIES", "256"))
+PICKLIST_CACHE_MAX_BYTES = int(os.getenv("PICKLIST_CACHE_MAX_MB", "64")) * 1024 * 1024
+# Age after which a result is discarded; 0 keeps results until evicted
+PICKLIST_CACHE_TTL_SECONDS = int(os.getenv("PICKLIST_CACHE_TTL_SECONDS", "172800"))
+
+# Data files read while a generator is constructed; edits to them change generated picklists
+CONFIG_FILE_PREFIXES = ("field_selections_", "game_labels_", "field_metadata_", "manual_text_")
+
+
+def config_fingerprint() -> Tuple:
+    """
+    Modification times of the label, metadata, manual and game context files.
+
+    Returns:
+        Sorted tuple of (file name, mtime_ns) pairs
+    """
+    fingerprint = []
+    for directory, prefixes in (
+        (DATA_DIR, CONFIG_FILE_PREFIXES),
+        (GAME_CONTEXT_CACHE_DIR, ("",)),
+    ):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.startswith(prefixes):
+                        fingerprint.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(sorted(fingerprint))
+
+
+def config_version() -> str:
+    """Short identifier of the current game context and label files."""
+    return hashlib.sha256(repr(config_fingerprint()).encode("utf-8")).hexdigest()[:16]
+
+
+class _Entry:
+    __slots__ = ("value", "version", "dataset_path", "stored_at", "size")
+
+    def __init__(self, value: Any, version: Optional[str], dataset_path: Optional[str], stored_at: float, size: int):
+        self.value = value
+        self.version = version
+        self.dataset_path = dataset_path
+        self.stored_at = stored_at
+        self.size = size
+
+
+class PicklistResultCache(MutableMapping):
+    """
+    Bounded, persistent cache of picklist generation results.
+
+    Behaves like the plain dict it replaces (progress markers and batch status
+    are stored with ordinary item assignment), with LRU eviction by entry count
+    and approximate memory size, an optional TTL, and version tags: results
+    stored with put_result() are only returned for the same dataset/game context
+    version. Successful results are also written to disk so they survive a
+    server restart.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = PICKLIST_CACHE_DIR,
+        max_entries: int = PICKLIST_CACHE_MAX_ENTRIES,
+        max_bytes: int = PICKLIST_CACHE_MAX_BYTES,
+        ttl_seconds: int = PICKLIST_CACHE_TTL_SECONDS,
+    ):
+        self.cache_dir = cache_dir
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0, "disk_loads": 0}
+
+    # ------------------------------------------------------------------
+    # Persistence helpers
+    # ------------------------------------------------------------------
+
+    def _file_path(self, key: str) -> str:
+        # Keys may come from the frontend, so never use them as file names directly
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + ".json")
+
+    def _persist(self, key: str, entry: _Entry) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "key": key,
+                        "version": entry.version,
+                        "dataset_path": entry.dataset_path,
+                        "stored_at": entry.stored_at,
+                        "result": entry.value,
+                    },
+                    f,
+                    default=str,
+                )
+            os.replace(tmp_path, self._file_path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not persist picklist result {key}: {e}")
+            return
+        self._prune_disk()
+
+    def _load_from_disk(self, key: str) -> Optional[_Entry]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._file_path(key), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get("key") != key:
+            return None
+        self._stats["disk_loads"] += 1
+        return _Entry(
+            record.get("result"),
+            record.get("version"),
+            record.get("dataset_path"),
+            record.get("stored_at", 0.0),
+            self._estimate_size(record.get("result")),
+        )
+
+    def _remove_file(self, key: str) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            os.remove(self._file_path(key))
+        except OSError:
+            pass
+
+    def _iter_disk_records(self) -> Iterator[Tuple[str, float]]:
+        if not self.cache_dir:
+            return
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        try:
+                            yield entry.path, entry.stat().st_mtime
+                        except OSError:
+                            continue
+        except OSError:
+            return
+
+    def _prune_disk(self) -> None:
+        files = sorted(self._iter_disk_records(), key=lambda item: item[1])
+        for path, _ in files[: max(0, len(files) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # In-memory bookkeeping
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        if isinstance(value, (dict, list)):
+            try:
+                return len(json.dumps(value, default=str))
+            except (TypeError, ValueError):
+                return 1024
+        return 64
+
+    def _expired(self, entry: _Entry) -> bool:
+        return bool(self.ttl_seconds) and time.time() - entry.stored_at > self.ttl_seconds
+
+    def _insert(self, key: str, entry: _Entry) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._total_bytes -= old.size
+        self._entries[key] = entry
+        self._total_bytes += entry.size
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted.size
+            self._stats["evictions"] += 1
+
+    def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load_from_disk(key)
+            if entry is None:
+                return None
+            self._insert(key, entry)
+        if self._expired(entry):
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _discard(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+        self._remove_file(key)
+        return entry is not None
+
+    # ------------------------------------------------------------------
+    # Dict interface (progress markers, batch status, legacy callers)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                raise KeyError(key)
+            return entry.value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._insert(key, _Entry(value, None, None, time.time(), self._estimate_size(value)))
+            # A persisted result under this key has been superseded
+            self._remove_file(key)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if not self._discard(key):
+                raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return isinstance(key, str) and self._lookup(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached result, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            for path, _ in list(self._iter_disk_records()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    # ------------------------------------------------------------------
+    # Versioned results
+    # ------------------------------------------------------------------
+
+    def get_result(self, key: str, version: Optional[str] = None) -> Optional[Any]:
+        """
+        Get a stored result if it was produced from the given version.
+
+        Args:
+            key: Cache key
+            version: Dataset/game context version the caller is working from
+
+        Returns:
+            The cached value, or None when missing, expired or stale
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if version is not None and entry.version is not None and entry.version != version:
+                logger.info(f"Discarding stale picklist result {key} (version {entry.version} != {version})")
+                self._discard(key)
+                self._stats["stale"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            return entry.value
+
+    def put_result(
+        self, key: str, result: Dict[str, Any], version: Optional[str] = None, dataset_path: Optional[str] = None
+    ) -> None:
+        """
+        Store a generation result, persisting it when it succeeded.
+
+        Args:
+            key: Cache key
+            result: Generation result
+            version: Dataset/game context version the result was produced from
+            dataset_path: Unified dataset the result was produced from
+        """
+        entry = _Entry(
+            result,
+            version,
+            os.path.abspath(dataset_path) if dataset_path else None,
+            time.time(),
+            self._estimate_size(result),
+        )
+        with self._lock:
+            self._insert(key, entry)
+            if isinstance(result, dict) and result.get("status") == "success":
+                self._persist(key, entry)
+            else:
+                self._remove_file(key)
+
+    def invalidate_dataset(self, dataset_path: Optional[str] = None) -> int:
+        """
+        Drop results produced from a dataset.
+
+        Args:
+            dataset_path: Unified dataset path, or None to drop every versioned result
+
+        Returns:
+            Number of results dropped
+        """
+        target = os.path.abspath(dataset_path) if dataset_path else None
+        removed = 0
+        with self._lock:
+            for key in [
+                k for k, e in self._entries.items()
+                if e.dataset_path and (target is None or e.dataset_path == target)
+            ]:
+                self._discard(key)
+                removed += 1
+
+            for path, _ in list(self._iter_disk_records()):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        record_path = json.load(f).get("dataset_path")
+                except (OSError, ValueError):
+                    continue
+                if record_path and (target is None or record_path == target):
+                    try:
+                        os.remove(path)
+                        removed += 1
+                    except OSError:
+                        pass
+        if removed:
+            logger.info(f"Invalidated {removed} cached picklists for {dataset_path or 'all datasets'}")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters, size and configured limits
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "approx_bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+# Shared result cache used by the picklist generator; dataset changes drop its results
+picklist_result_cache = PicklistResultCache()
+dataset_registry.add_invalidation_listener(picklist_result_cache.invalidate_dataset)
@@ -75,10 +75,30 @@ class ProgressTracker:
         """
         List all tracked operations and their progress.
 
+        Results attached with set_result() are left out; fetch them per operation.
+
         Returns:
             Dictionary of operation_id -> progress data
         """
-        return {op_id: cls.get_progress(op_id) for op_id in cls._instances}
+        operations = {}
+        for op_id in list(cls._instances):
+            progress_data = cls.get_progress(op_id)
+            if progress_data is not None:
+                progress_data.pop("result", None)
+                operations[op_id] = progress_data
+        return operations
+
+    @classmethod
+    def set_result(cls, operation_id: str, result: Any) -> None:
+        """
+        Attach the final result of an operation so it can be fetched with its progress.
+
+        Args:
+            operation_id: Unique identifier for the operation
+            result: JSON-serializable result
+        """
+        if operation_id in cls._instances:
+            cls._instances[operation_id]["result"] = result
 
     @classmethod
     def clean_old_operations(cls, max_age_seconds: int = 3600) -> int:
@@ -96,7 +116,7 @@ class ProgressTracker:
 
         for op_id, data in cls._instances.items():
             if (
-                data["status"] in ["completed", "failed"]
+                data["status"] in ["completed", "failed", "cancelled"]
                 and (current_time - data["last_update"]) > max_age_seconds
             ):
                 to_remove.append(op_id)
@@ -125,7 +145,7 @@ class ProgressTracker:
             progress: Progress percentage (0-100)
             message: Current progress message
             current_step: Name of the current step
-            status: Operation status ("initializing", "active", "completed", "failed")
+            status: Operation status ("initializing", "queued", "active", "completed", "failed")
         """
         if self.operation_id not in self._instances:
             return
@@ -197,6 +217,20 @@ class ProgressTracker:
             {"status": "failed", "message": message, "last_update": time.time()}
         )
 
+    def cancel(self, message: str = "Operation cancelled") -> None:
+        """
+        Mark the operation as cancelled.
+
+        Args:
+            message: Cancellation message
+        """
+        if self.operation_id not in self._instances:
+            return
+
+        self._instances[self.operation_id].update(
+            {"status": "cancelled", "message": message, "last_update": time.time()}
+        )
+
     def to_json(self) -> str:
         """
         Convert the current progress to JSON.
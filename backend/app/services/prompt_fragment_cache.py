@@ -0,0 +1,136 @@
+# backend/app/services/prompt_fragment_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger("prompt_fragment_cache")
+
+# Upper bound on memoized team fragments (a team has one per encoding); least recently used evicted first
+PROMPT_FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv("PROMPT_FRAGMENT_CACHE_MAX_ENTRIES", "20000"))
+
+
+@dataclass(frozen=True)
+class PromptFragment:
+    """One team's rendered prompt text and its token count."""
+
+    text: str
+    tokens: int
+
+
+def priorities_hash(priorities: Optional[List[Dict[str, Any]]]) -> str:
+    """
+    Short, order-sensitive identifier of a priority list.
+
+    Args:
+        priorities: Priority metrics with weights, as passed to the prompt builders
+
+    Returns:
+        Hex digest prefix; equal priorities give equal hashes
+    """
+    encoded = json.dumps(priorities or [], sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class PromptFragmentCache:
+    """
+    In-memory LRU of per-team prompt fragments.
+
+    Keys are tuples built by the prompt builder, led by (dataset version, team,
+    priorities hash, encoding mode), so a team is rendered and token-counted
+    once per dataset and strategy no matter how many batches, reranks or
+    pooled generators include it. Values are PromptFragment objects or the
+    prepared team dictionaries they are rendered from, and are treated as
+    read-only by callers.
+    """
+
+    def __init__(self, max_entries: int = PROMPT_FRAGMENT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a fragment and mark it recently used.
+
+        Args:
+            key: Fragment key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a fragment, evicting the least recently used ones beyond max_entries.
+
+        Args:
+            key: Fragment key
+            value: Fragment or prepared team data
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, building and storing it on a miss.
+
+        Args:
+            key: Fragment key
+            factory: Builds the value when it is not cached
+
+        Returns:
+            Cached or newly built value
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> int:
+        """
+        Drop every fragment.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Shared by every PicklistGPTService so pooled generators reuse each other's fragments
+prompt_fragment_cache = PromptFragmentCache()
@@ -5,11 +5,12 @@ from typing import Dict, List
 
 from app.services.global_cache import cache
 from fastapi import UploadFile
-from openai import AsyncOpenAI
-from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
+from app.config.openai_config import OPENAI_MODEL
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_provider import create_llm_client
 
 GPT_MODEL = OPENAI_MODEL
-client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+client = create_llm_client()
 
 
 async def extract_game_tags_from_manual(manual_text: str) -> List[str]:
@@ -23,7 +24,8 @@ You are a technical assistant. Given the text of a FIRST Robotics Competition ga
 extract all standardized action and scoring tags (snake_case) that correspond to match data fields.
 Return a JSON list of strings, e.g. ["team_number", "auto_coral_l1", ...].
 """
-    response = await client.chat.completions.create(
+    response = await llm_gateway.chat_completion(
+        client,
         model=GPT_MODEL,
         messages=[{"role": "user", "content": prompt + "\nManual Text:\n" + manual_text}],
         temperature=0.2,
@@ -61,7 +63,8 @@ Return ONLY valid raw JSON in this format (no explanation, no markdown):
 Headers:
 {headers}
 """
-    response = await client.chat.completions.create(
+    response = await llm_gateway.chat_completion(
+        client,
         model=GPT_MODEL,
         messages=[{"role": "user", "content": prompt}],
         temperature=0.2,
@@ -3,11 +3,12 @@
 import os
 from typing import Any, Dict, List, Tuple
 
-from openai import AsyncOpenAI
-from app.config.openai_config import OPENAI_API_KEY, OPENAI_MODEL
+from app.config.openai_config import OPENAI_MODEL
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_provider import create_llm_client
 
 GPT_MODEL = OPENAI_MODEL
-client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+client = create_llm_client()
 
 SUPER_TAGS = [
     # Critical Fields
@@ -125,7 +126,8 @@ Headers:
 """
 
     # Mapping headers -> tags
-    response_map = await client.chat.completions.create(
+    response_map = await llm_gateway.chat_completion(
+        client,
         model=GPT_MODEL,
         messages=[{"role": "user", "content": prompt_mapping}],
         temperature=0.2,
@@ -147,7 +149,8 @@ Headers:
         mapping = {"error": "Failed to parse mapping output."}
 
     # Grouping offsets robot_1/2/3
-    response_offsets = await client.chat.completions.create(
+    response_offsets = await llm_gateway.chat_completion(
+        client,
         model=GPT_MODEL,
         messages=[{"role": "user", "content": prompt_offsets}],
         temperature=0.2,
@@ -199,7 +202,8 @@ Headers and sample data:
 
     try:
         # Call GPT for insights
-        response_insights = await client.chat.completions.create(
+        response_insights = await llm_gateway.chat_completion(
+            client,
             model=GPT_MODEL,
             messages=[{"role": "user", "content": prompt_insights}],
             temperature=0.2,
@@ -1,37 +1,48 @@
 # backend/app/services/scouting_parser.py
 
 import os
+import re
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from app.services.schema_loader import get_match_mapping
 
+# Legacy header -> label metadata consulted while parsing match rows
+HEADER_METADATA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "field_metadata_2025.json",
+)
 
-def parse_scouting_row(row: List[str], headers: List[str]) -> Dict[str, Any]:
+
+def coerce_cell_value(value: Any, strip: bool = True) -> Any:
     """
-    Parses a single row from the Match Scouting sheet.
+    Convert a raw sheet cell to int or float when it looks numeric.
 
     Args:
-        row (List[str]): The full list of cell values for the row.
-        headers (List[str]): The full list of headers from A1:Z1.
+        value: Raw cell value from Google Sheets
+        strip: Whether surrounding whitespace is removed before the numeric check
 
     Returns:
-        Dict[str, Any]: Structured scouting dictionary
+        The (stripped) value as int/float if numeric, otherwise the (stripped) string
     """
-
-    # Get schema mapping - ensure schemas are loaded first
-    from app.services.schema_loader import load_schemas
-    
-    # Load schemas if not already loaded
-    if not get_match_mapping():
+    if value is not None and isinstance(value, str):
+        if strip:
+            value = value.strip()
         try:
-            load_schemas(2025)  # Default to 2025, should be configurable
-        except Exception as e:
-            print(f"Warning: Could not load schemas: {e}")
-    
-    schema_data = get_match_mapping()
-    scouting_data = {}
+            # Check if it's an integer
+            if value.isdigit():
+                value = int(value)
+            # Check if it's a float
+            elif value.replace(".", "", 1).isdigit() and value.count(".") < 2:
+                value = float(value)
+        except (ValueError, TypeError):
+            # Keep as string if conversion fails
+            pass
+    return value
 
-    # Handle multiple possible formats of schema data
+
+def _resolve_match_mapping(schema_data: Any) -> Dict[str, str]:
+    """Return a private copy of the match mapping regardless of schema format."""
     match_mapping = {}
 
     # Check if the schema is directly a mapping dictionary
@@ -45,80 +56,121 @@ def parse_scouting_row(row: List[str], headers: List[str]) -> Dict[str, Any]:
     ):
         match_mapping = schema_data["mappings"]["match"]
 
-    print(f"\U0001f535 Schema structure: {type(schema_data)}")
-    print(f"\U0001f535 Using mapping with {len(match_mapping)} entries")
+    return dict(match_mapping)
+
+
+def _load_header_labels() -> Dict[str, str]:
+    """Load header -> enhanced label names from the legacy field metadata file."""
+    header_labels = {}
+    try:
+        if os.path.exists(HEADER_METADATA_PATH):
+            with open(HEADER_METADATA_PATH, "r", encoding="utf-8") as f:
+                field_metadata = json.load(f)
 
-    # Special handling for "Team Number" and "Qual Number" if they're missing from mapping
-    if "Team Number" not in match_mapping:
-        match_mapping["Team Number"] = "team_number"
-    if "Qual Number" not in match_mapping:
-        match_mapping["Qual Number"] = "match_number"
-
-    for header in headers:
-        if header not in match_mapping:
-            # Try case-insensitive match
-            matching_key = next(
-                (k for k in match_mapping.keys() if k.lower() == header.lower()), None
-            )
-            if matching_key:
-                header = matching_key
-            else:
+            for header, info in field_metadata.items():
+                if isinstance(info, dict) and "label" in info.get("label_mapping", {}):
+                    header_labels[header] = info["label_mapping"]["label"]
+    except Exception as e:
+        # If we can't load metadata, use the original field names
+        print(f"Warning: Could not load header label metadata: {e}")
+    return header_labels
+
+
+class CompiledScoutingParser:
+    """
+    Match Scouting row parser precompiled for one header row.
+
+    Header resolution, schema lookups and label metadata are worked out once in
+    the constructor; parse() is then a single pass over a fixed column plan.
+    """
+
+    def __init__(
+        self,
+        headers: List[str],
+        match_mapping: Dict[str, str],
+        header_labels: Optional[Dict[str, str]] = None,
+        field_metadata: Optional[Dict[str, Any]] = None,
+        converter: Callable[[Any], Any] = coerce_cell_value,
+    ):
+        """
+        Build the column plan.
+
+        Args:
+            headers: The full list of headers from the first sheet row
+            match_mapping: Schema mapping of header -> field category
+            header_labels: Header -> enhanced label names for mapped fields
+            field_metadata: Unified field metadata whose label mappings are
+                added to every parsed row under their label names
+            converter: Function applied to each raw cell value
+        """
+        self.headers = list(headers)
+        self.converter = converter
+        header_labels = header_labels or {}
+        match_mapping = dict(match_mapping)
+
+        # Special handling for "Team Number" and "Qual Number" if they're missing from mapping
+        match_mapping.setdefault("Team Number", "team_number")
+        match_mapping.setdefault("Qual Number", "match_number")
+        lowercase_keys = {}
+        for key in match_mapping:
+            lowercase_keys.setdefault(key.lower(), key)
+
+        # First column index for each header name (duplicate headers read the first column)
+        first_index = {}
+        for i, header in enumerate(self.headers):
+            first_index.setdefault(header, i)
+
+        # Plan entries: (column index, mapped field, output field name)
+        self.steps: List[Tuple[int, str, str]] = []
+        for column, header in enumerate(self.headers):
+            if header not in match_mapping:
+                lowered = header.lower()
+                if lowered in lowercase_keys:
+                    header = lowercase_keys[lowered]
                 # Handle common field names
-                if "team" in header.lower() and "number" in header.lower():
+                elif "team" in lowered and "number" in lowered:
                     match_mapping[header] = "team_number"
-                elif (
-                    "match" in header.lower() or "qual" in header.lower()
-                ) and "number" in header.lower():
+                elif ("match" in lowered or "qual" in lowered) and "number" in lowered:
                     match_mapping[header] = "match_number"
                 else:
-                    # print(f"Header '{header}' not found in mapping")
                     continue
 
-        mapped_field = match_mapping.get(header, "ignore")
-        if mapped_field == "ignore":
-            # print(f"Header '{header}' mapped to 'ignore'")
-            continue
+            mapped_field = match_mapping.get(header, "ignore")
+            if mapped_field == "ignore":
+                continue
+
+            index = first_index.get(header, column)
+            self.steps.append((index, mapped_field, header_labels.get(header, mapped_field)))
+
+        # Label-mapped raw columns appended after normal parsing: (column index, label)
+        self.label_steps: List[Tuple[int, str]] = []
+        for column, header in enumerate(self.headers):
+            info = (field_metadata or {}).get(header)
+            if isinstance(info, dict) and isinstance(info.get("label_mapping"), dict):
+                if "label" in info["label_mapping"]:
+                    self.label_steps.append((column, info["label_mapping"]["label"]))
+
+    def parse(self, row: List[str]) -> Dict[str, Any]:
+        """
+        Parse one Match Scouting row using the precompiled plan.
+
+        Args:
+            row: The full list of cell values for the row
+
+        Returns:
+            Structured scouting dictionary, or {} if the row has no team number
+        """
+        convert = self.converter
+        row_length = len(row)
+        scouting_data = {}
+
+        for index, mapped_field, output_field in self.steps:
+            value = convert(row[index]) if index < row_length else None
+
+            scouting_data[output_field] = value
 
-        try:
-            index = headers.index(header)
-            value = row[index] if index < len(row) else None
-
-            # Try to convert numeric values to integers or floats
-            if value is not None and isinstance(value, str):
-                value = value.strip()
-                try:
-                    # Check if it's an integer
-                    if value.isdigit():
-                        value = int(value)
-                    # Check if it's a float
-                    elif value.replace(".", "", 1).isdigit() and value.count(".") < 2:
-                        value = float(value)
-                except (ValueError, TypeError):
-                    # Keep as string if conversion fails
-                    pass
-
-            # Check if there's a label mapping for enhanced field names
-            enhanced_field_name = mapped_field
-            try:
-                # Load field metadata to get label mappings
-                data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data")
-                metadata_path = os.path.join(data_dir, "field_metadata_2025.json")
-                if os.path.exists(metadata_path):
-                    with open(metadata_path, "r", encoding="utf-8") as f:
-                        field_metadata = json.load(f)
-                    
-                    if header in field_metadata and "label_mapping" in field_metadata[header]:
-                        label_mapping = field_metadata[header]["label_mapping"]
-                        if "label" in label_mapping:
-                            enhanced_field_name = label_mapping["label"]
-            except Exception as e:
-                # If we can't load metadata, use the original field name
-                pass
-
-            scouting_data[enhanced_field_name] = value
-            
             # Also store with original mapped field name for backwards compatibility
-            if enhanced_field_name != mapped_field:
+            if output_field != mapped_field:
                 scouting_data[mapped_field] = value
 
             # Special case for "qual_number" -> also store as "match_number" for compatibility
@@ -128,36 +180,84 @@ def parse_scouting_row(row: List[str], headers: List[str]) -> Dict[str, Any]:
             elif mapped_field == "match_number" and "qual_number" not in scouting_data:
                 scouting_data["qual_number"] = value
 
-        except ValueError:
-            continue
-
-    # Only return entries that have a valid team_number
-    team_number = scouting_data.get("team_number")
-    if not team_number:
-        return {}
+        # Only return entries that have a valid team_number
+        team_number = scouting_data.get("team_number")
+        if not team_number:
+            return {}
 
-    # Try to convert team_number to integer if it's a string
-    if isinstance(team_number, str):
-        try:
+        # Try to convert team_number to integer if it's a string
+        if isinstance(team_number, str):
             # Remove emojis and non-digit characters, keeping only numbers
-            import re
-            clean_team_number = re.sub(r'[^\d]', '', team_number)
+            clean_team_number = re.sub(r"[^\d]", "", team_number)
             if clean_team_number:
                 scouting_data["team_number"] = int(clean_team_number)
-            else:
-                # If no digits found, keep original value
-                pass
-        except ValueError:
-            # Keep as string if integer conversion fails
-            pass
 
-    # Ensure match_number and qual_number are present and consistent
-    match_number = scouting_data.get("match_number")
-    qual_number = scouting_data.get("qual_number")
+        # Ensure match_number and qual_number are present and consistent
+        match_number = scouting_data.get("match_number")
+        qual_number = scouting_data.get("qual_number")
+
+        if match_number is not None and qual_number is None:
+            scouting_data["qual_number"] = match_number
+        elif qual_number is not None and match_number is None:
+            scouting_data["match_number"] = qual_number
+
+        # Add enhanced scouting label fields straight from the raw columns
+        for index, label in self.label_steps:
+            if index < row_length:
+                scouting_data[label] = convert(row[index])
+
+        return scouting_data
+
+
+def compile_scouting_parser(
+    headers: List[str], field_metadata: Optional[Dict[str, Any]] = None
+) -> CompiledScoutingParser:
+    """
+    Compile a Match Scouting row parser for a header row.
+
+    Args:
+        headers: The full list of headers from the first sheet row
+        field_metadata: Optional unified field metadata with label mappings
+
+    Returns:
+        CompiledScoutingParser that can be reused for every row with these headers
+    """
+    # Get schema mapping - ensure schemas are loaded first
+    from app.services.schema_loader import load_schemas
+
+    # Load schemas if not already loaded
+    if not get_match_mapping():
+        try:
+            load_schemas(2025)  # Default to 2025, should be configurable
+        except Exception as e:
+            print(f"Warning: Could not load schemas: {e}")
+
+    schema_data = get_match_mapping()
+    match_mapping = _resolve_match_mapping(schema_data)
+
+    print(f"\U0001f535 Schema structure: {type(schema_data)}")
+    print(f"\U0001f535 Using mapping with {len(match_mapping)} entries")
+
+    return CompiledScoutingParser(
+        headers,
+        match_mapping,
+        header_labels=_load_header_labels(),
+        field_metadata=field_metadata,
+    )
+
+
+def parse_scouting_row(row: List[str], headers: List[str]) -> Dict[str, Any]:
+    """
+    Parses a single row from the Match Scouting sheet.
 
-    if match_number is not None and qual_number is None:
-        scouting_data["qual_number"] = match_number
-    elif qual_number is not None and match_number is None:
-        scouting_data["match_number"] = qual_number
+    Compiles a parser for every call; use compile_scouting_parser() when
+    parsing many rows that share the same headers.
+
+    Args:
+        row (List[str]): The full list of cell values for the row.
+        headers (List[str]): The full list of headers from A1:Z1.
 
-    return scouting_data
+    Returns:
+        Dict[str, Any]: Structured scouting dictionary
+    """
+    return compile_scouting_parser(headers).parse(row)
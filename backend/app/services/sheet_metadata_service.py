@@ -1,34 +1,77 @@
 # backend/app/services/sheet_metadata_service.py
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import os
+import time
 from .google_auth_service import GoogleAuthService
+from .sheets_gateway import SheetsGateway
 
 logger = logging.getLogger("sheet_metadata_service")
 
+# How long spreadsheet metadata (tab names, grid sizes) is reused before refetching
+METADATA_CACHE_TTL_SECONDS = float(os.getenv("SHEETS_METADATA_TTL_SECONDS", "60"))
+
 class SheetMetadataService:
     """Handles sheet metadata operations like sheet discovery and tab validation."""
     
-    def __init__(self, auth_service: GoogleAuthService):
+    def __init__(
+        self,
+        auth_service: GoogleAuthService,
+        cache_ttl_seconds: float = METADATA_CACHE_TTL_SECONDS,
+        gateway: Optional[SheetsGateway] = None,
+    ):
         self.auth_service = auth_service
+        self.gateway = gateway or SheetsGateway(auth_service)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # spreadsheet_id -> (fetched_at, sheets metadata)
+        self._metadata_cache: Dict[str, Tuple[float, List[dict]]] = {}
     
-    async def get_all_sheets_metadata(self, spreadsheet_id: str) -> List[dict]:
+    async def get_all_sheets_metadata(self, spreadsheet_id: str, use_cache: bool = True) -> List[dict]:
         """
         Get metadata for all sheets in a spreadsheet, including their exact names.
 
+        Results are cached per spreadsheet for cache_ttl_seconds.
+
         Args:
             spreadsheet_id: The ID of the spreadsheet
+            use_cache: Whether a recently fetched copy may be returned
 
         Returns:
             List of sheet metadata dictionaries
+
+        Raises:
+            Exception: If the metadata cannot be fetched, so callers never mistake
+                an API error for a spreadsheet without tabs
         """
+        if use_cache:
+            cached = self._metadata_cache.get(spreadsheet_id)
+            if cached and time.time() - cached[0] <= self.cache_ttl_seconds:
+                return cached[1]
+
         try:
-            sheet = self.auth_service.get_sheets_service().spreadsheets()
-            response = sheet.get(spreadsheetId=spreadsheet_id).execute()
-            return response.get("sheets", [])
+            response = await self.gateway.call(
+                lambda service: service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute(),
+                "spreadsheets.get",
+            )
         except Exception as e:
             logger.exception(f"Error getting spreadsheet metadata: {str(e)}")
-            return []
+            raise
+        sheets = response.get("sheets", [])
+        self._metadata_cache[spreadsheet_id] = (time.time(), sheets)
+        return sheets
+    
+    def invalidate_metadata_cache(self, spreadsheet_id: Optional[str] = None) -> None:
+        """
+        Drop cached spreadsheet metadata.
+
+        Args:
+            spreadsheet_id: Spreadsheet to invalidate, or None to clear everything
+        """
+        if spreadsheet_id is None:
+            self._metadata_cache.clear()
+        else:
+            self._metadata_cache.pop(spreadsheet_id, None)
     
     async def get_all_sheet_names(self, spreadsheet_id: str) -> Dict[str, Any]:
         """
@@ -55,8 +98,10 @@ class SheetMetadataService:
             except Exception as metadata_error:
                 logger.error(f"Error getting sheet metadata: {str(metadata_error)}")
                 # Try direct API call as fallback
-                sheet = self.auth_service.get_sheets_service().spreadsheets()
-                metadata = sheet.get(spreadsheetId=spreadsheet_id).execute()
+                metadata = await self.gateway.call(
+                    lambda service: service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute(),
+                    "spreadsheets.get",
+                )
                 sheets = metadata.get("sheets", [])
                 sheet_names = [s.get("properties", {}).get("title", "") for s in sheets]
 
@@ -123,15 +168,28 @@ class SheetMetadataService:
         try:
             # Try to get the first row of the sheet
             range_name = f"{sheet_name}!A1:A1"
-            sheet = self.auth_service.get_sheets_service().spreadsheets()
-            result = sheet.values().get(spreadsheetId=spreadsheet_id, range=range_name).execute()
+            result = await self.gateway.call(
+                lambda service: service.spreadsheets()
+                .values()
+                .get(spreadsheetId=spreadsheet_id, range=range_name)
+                .execute(),
+                "values.get",
+            )
 
             # Get the spreadsheet title
-            metadata = sheet.get(spreadsheetId=spreadsheet_id, fields="properties.title").execute()
+            metadata = await self.gateway.call(
+                lambda service: service.spreadsheets()
+                .get(spreadsheetId=spreadsheet_id, fields="properties.title")
+                .execute(),
+                "spreadsheets.get",
+            )
             sheet_title = metadata.get("properties", {}).get("title", "Unknown")
 
             # Get all sheet names
-            sheet_metadata = sheet.get(spreadsheetId=spreadsheet_id).execute()
+            sheet_metadata = await self.gateway.call(
+                lambda service: service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute(),
+                "spreadsheets.get",
+            )
             sheets = sheet_metadata.get("sheets", [])
             sheet_names = [s.get("properties", {}).get("title", "") for s in sheets]
 
@@ -1,21 +1,41 @@
 # backend/app/services/sheet_reader_service.py
 
-from typing import Any, List, Dict, Optional
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
 import logging
 import os
 import asyncio
 from sqlalchemy.orm import Session
 from .google_auth_service import GoogleAuthService
 from .sheet_metadata_service import SheetMetadataService
+from .sheets_gateway import SheetsGateway
 
 logger = logging.getLogger("sheet_reader_service")
 
+# Number of sheet rows fetched per page when streaming whole tabs
+SHEETS_PAGE_ROWS = int(os.getenv("SHEETS_PAGE_ROWS", "500"))
+
+
+def column_letter(column_number: int) -> str:
+    """Convert a 1-based column number to its A1 column letters (1 -> A, 27 -> AA)."""
+    letters = ""
+    while column_number > 0:
+        column_number, remainder = divmod(column_number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters or "A"
+
+
 class SheetReaderService:
     """Handles Google Sheets read operations with caching and error handling."""
     
-    def __init__(self, auth_service: GoogleAuthService, metadata_service: SheetMetadataService):
+    def __init__(
+        self,
+        auth_service: GoogleAuthService,
+        metadata_service: SheetMetadataService,
+        gateway: Optional[SheetsGateway] = None,
+    ):
         self.auth_service = auth_service
         self.metadata_service = metadata_service
+        self.gateway = gateway or metadata_service.gateway
     
     async def get_active_spreadsheet_id(self, db: Optional[Session] = None) -> str:
         """
@@ -79,12 +99,7 @@ class SheetReaderService:
             logger.debug(f"Using provided spreadsheet ID: {sheet_id} for range {range_name}")
 
         # Process the range to extract tab name and range part
-        tab_name = range_name
-        cell_range = "A1:Z1"
-        if "!" in range_name:
-            parts = range_name.split("!", 1)
-            tab_name = parts[0].strip("'")  # Remove any quotes
-            cell_range = parts[1]
+        tab_name, cell_range = self._split_range(range_name)
 
         try:
             # Get actual sheet names from the spreadsheet to find the right one
@@ -102,8 +117,13 @@ class SheetReaderService:
             actual_range = f"{actual_tab_name}!{cell_range}"
             logger.debug(f"Using range: {actual_range}")
 
-            sheet = self.auth_service.get_sheets_service().spreadsheets()
-            result = sheet.values().get(spreadsheetId=sheet_id, range=actual_range).execute()
+            result = await self.gateway.call(
+                lambda service: service.spreadsheets()
+                .values()
+                .get(spreadsheetId=sheet_id, range=actual_range)
+                .execute(),
+                "values.get",
+            )
             values = result.get("values", [])
             return values
 
@@ -113,6 +133,136 @@ class SheetReaderService:
             logger.warning(f"Returning empty result for {range_name} due to error")
             return []
     
+    async def iter_sheet_pages(
+        self,
+        tab_names: List[str],
+        spreadsheet_id: Optional[str] = None,
+        db: Optional[Session] = None,
+        page_size: int = SHEETS_PAGE_ROWS,
+    ) -> AsyncIterator[Tuple[int, List[List[Any]]]]:
+        """
+        Stream whole tabs from a Google Sheet in pages of rows.
+
+        Tab bounds come from the grid properties in freshly fetched spreadsheet
+        metadata, so tabs of any length are read without a fixed A1:ZZ1000
+        range. Each round fetches the next page of every unfinished tab with a
+        single batchGet request. A tab finishes at its last grid row; blank
+        pages before that are skipped over. Only when the grid size is unknown
+        does the first page without any values end the tab.
+
+        Args:
+            tab_names: The tabs to read (e.g., ["Scouting", "SuperScouting"])
+            spreadsheet_id: Optional spreadsheet ID (will use active config if not provided)
+            db: Optional database session for getting active configuration
+            page_size: Number of rows requested per tab and round
+
+        Yields:
+            (index into tab_names, rows) tuples in sheet order; the first page of a
+            tab starts with its header row. Blank rows between pages are kept as
+            empty lists so row positions stay stable.
+
+        Raises:
+            ValueError: If no spreadsheet ID is provided or configured, or a tab
+                cannot be found in the spreadsheet
+            Exception: If the metadata or any page cannot be read, so a tab is
+                never returned empty or truncated
+        """
+        if not tab_names:
+            return
+
+        sheet_id = spreadsheet_id or await self.get_active_spreadsheet_id(db)
+        if not sheet_id:
+            logger.error("No active spreadsheet ID found")
+            raise ValueError("No spreadsheet ID provided and no active configuration found")
+
+        try:
+            # Fresh grid sizes: rows appended since the last cached fetch must not be cut off
+            sheets_metadata = await self.metadata_service.get_all_sheets_metadata(sheet_id, use_cache=False)
+        except Exception as e:
+            logger.exception(f"Error getting sheet metadata for {tab_names}: {str(e)}")
+            raise
+
+        properties_by_title = {
+            s.get("properties", {}).get("title", ""): s.get("properties", {}) for s in sheets_metadata
+        }
+        sheet_titles = list(properties_by_title.keys())
+
+        tabs = []
+        for index, tab_name in enumerate(tab_names):
+            actual_tab_name = self.metadata_service.find_matching_sheet_name(sheet_titles, tab_name)
+            if not actual_tab_name:
+                logger.error(f"No sheets found in spreadsheet {sheet_id}")
+                raise ValueError(f"Tab '{tab_name}' not found in spreadsheet {sheet_id}")
+
+            grid = properties_by_title.get(actual_tab_name, {}).get("gridProperties", {})
+            column_count = grid.get("columnCount")
+            tabs.append(
+                {
+                    "index": index,
+                    "name": actual_tab_name,
+                    "row_count": grid.get("rowCount"),
+                    "last_column": column_letter(column_count) if column_count else "ZZ",
+                    "next_row": 1,
+                    "blank_rows": 0,
+                }
+            )
+
+        page_size = max(1, page_size)
+        while tabs:
+            ranges = []
+            for tab in tabs:
+                tab["end_row"] = tab["next_row"] + page_size - 1
+                if tab["row_count"]:
+                    tab["end_row"] = min(tab["end_row"], tab["row_count"])
+                ranges.append(f"{tab['name']}!A{tab['next_row']}:{tab['last_column']}{tab['end_row']}")
+
+            logger.debug(f"Fetching sheet pages: {ranges}")
+            try:
+                result = await self.gateway.call(
+                    lambda service: service.spreadsheets()
+                    .values()
+                    .batchGet(spreadsheetId=sheet_id, ranges=ranges)
+                    .execute(),
+                    "values.batchGet",
+                )
+            except Exception as e:
+                logger.exception(f"Error reading sheet pages {ranges}: {str(e)}")
+                # Never hand back a silently empty or truncated tab
+                raise
+            value_ranges = result.get("valueRanges", [])
+
+            unfinished = []
+            for i, tab in enumerate(tabs):
+                rows = value_ranges[i].get("values", []) if i < len(value_ranges) else []
+                requested_rows = tab["end_row"] - tab["next_row"] + 1
+                tab["next_row"] = tab["end_row"] + 1
+
+                if rows:
+                    # The API omits trailing blank rows; restore them once more data follows
+                    yield tab["index"], [[] for _ in range(tab["blank_rows"])] + rows
+                    tab["blank_rows"] = requested_rows - len(rows)
+                elif tab["row_count"]:
+                    # A blank page inside the grid; later pages may still hold data
+                    tab["blank_rows"] += requested_rows
+                else:
+                    # Without grid bounds a blank page is taken as the end of the tab
+                    continue
+
+                if not tab["row_count"] or tab["next_row"] <= tab["row_count"]:
+                    unfinished.append(tab)
+            tabs = unfinished
+
+    @staticmethod
+    def _split_range(range_name: str) -> Tuple[str, str]:
+        """Split an A1 range into its tab name and cell range."""
+        tab_name = range_name
+        cell_range = "A1:Z1"
+        if "!" in range_name:
+            parts = range_name.split("!", 1)
+            tab_name = parts[0].strip("'")  # Remove any quotes
+            cell_range = parts[1]
+        return tab_name, cell_range
+    
     async def get_sheet_headers_async(
         self,
         tab: str,
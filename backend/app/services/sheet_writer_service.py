@@ -4,14 +4,16 @@ from typing import Any, List, Dict, Optional
 import logging
 from sqlalchemy.orm import Session
 from .google_auth_service import GoogleAuthService
+from .sheets_gateway import SheetsGateway
 
 logger = logging.getLogger("sheet_writer_service")
 
 class SheetWriterService:
     """Handles Google Sheets write operations."""
     
-    def __init__(self, auth_service: GoogleAuthService):
+    def __init__(self, auth_service: GoogleAuthService, gateway: Optional[SheetsGateway] = None):
         self.auth_service = auth_service
+        self.gateway = gateway or SheetsGateway(auth_service)
     
     async def get_active_spreadsheet_id(self, db: Optional[Session] = None) -> str:
         """
@@ -73,16 +75,17 @@ class SheetWriterService:
 
         try:
             body = {"values": values}
-            sheet = self.auth_service.get_sheets_service().spreadsheets()
-            result = (
-                sheet.values()
+            result = await self.gateway.call(
+                lambda service: service.spreadsheets()
+                .values()
                 .update(
                     spreadsheetId=sheet_id,
                     range=range_name,
                     valueInputOption="RAW",
                     body=body,
                 )
-                .execute()
+                .execute(),
+                "values.update",
             )
             return result
         except Exception as e:
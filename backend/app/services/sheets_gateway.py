@@ -0,0 +1,109 @@
+# backend/app/services/sheets_gateway.py
+
+from typing import Any, Callable, Dict, TypeVar
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .google_auth_service import GoogleAuthService
+
+logger = logging.getLogger("sheets_gateway")
+
+# Maximum number of Google Sheets API calls running at the same time
+SHEETS_MAX_CONCURRENCY = int(os.getenv("SHEETS_MAX_CONCURRENCY", "4"))
+
+T = TypeVar("T")
+
+
+class SheetsGateway:
+    """
+    Runs blocking Google Sheets API calls on a dedicated thread pool.
+
+    googleapiclient's execute() blocks and its HTTP transport is not thread-safe,
+    so every worker thread builds its own Sheets service object. The pool size is
+    the concurrency limit; each call is timed and aggregated per label.
+    """
+
+    def __init__(self, auth_service: GoogleAuthService, max_concurrency: int = SHEETS_MAX_CONCURRENCY):
+        self.auth_service = auth_service
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="sheets-api"
+        )
+        self._thread_local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._pending = 0
+
+    def _get_thread_service(self):
+        """Get the Sheets service object owned by the current worker thread."""
+        service = getattr(self._thread_local, "service", None)
+        if service is None:
+            service = self.auth_service.build_sheets_service()
+            self._thread_local.service = service
+        return service
+
+    def _run(self, operation: Callable[[Any], T], label: str) -> T:
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            result = operation(self._get_thread_service())
+            succeeded = True
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            self._record(label, elapsed, succeeded)
+            logger.debug(f"Sheets API {label} took {elapsed * 1000:.0f} ms")
+
+    async def call(self, operation: Callable[[Any], T], label: str = "call") -> T:
+        """
+        Run a Sheets API operation without blocking the event loop.
+
+        Args:
+            operation: Function receiving a Sheets service object and returning
+                the result of its request's execute()
+            label: Name used for timing statistics (e.g., "values.get")
+
+        Returns:
+            The value returned by operation
+        """
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        try:
+            return await loop.run_in_executor(self._executor, self._run, operation, label)
+        finally:
+            self._pending -= 1
+
+    def _record(self, label: str, elapsed: float, succeeded: bool) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                label, {"calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            stats["calls"] += 1
+            if not succeeded:
+                stats["errors"] += 1
+            stats["total_seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-operation timing statistics.
+
+        Returns:
+            Dictionary with concurrency settings, pending calls and per-label timings
+        """
+        with self._stats_lock:
+            operations = {
+                label: {
+                    **stats,
+                    "avg_seconds": stats["total_seconds"] / stats["calls"] if stats["calls"] else 0.0,
+                }
+                for label, stats in self._stats.items()
+            }
+        return {
+            "max_concurrency": self.max_concurrency,
+            "pending": self._pending,
+            "operations": operations,
+        }
@@ -1,6 +1,6 @@
 # backend/app/services/sheets_service.py
 
-from typing import Any, List, Dict, Optional
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
 import logging
 from sqlalchemy.orm import Session
 from .google_auth_service import GoogleAuthService
@@ -8,6 +8,7 @@ from .sheet_metadata_service import SheetMetadataService
 from .sheet_reader_service import SheetReaderService
 from .sheet_writer_service import SheetWriterService
 from .retry_service import RetryService
+from .sheets_gateway import SheetsGateway
 
 # Configure logging
 logger = logging.getLogger("sheets_service")
@@ -18,9 +19,13 @@ class SheetsService:
     
     def __init__(self):
         self.auth_service = GoogleAuthService()
-        self.metadata_service = SheetMetadataService(self.auth_service)
-        self.reader_service = SheetReaderService(self.auth_service, self.metadata_service)
-        self.writer_service = SheetWriterService(self.auth_service)
+        # One shared executor-backed gateway for every Google API call
+        self.gateway = SheetsGateway(self.auth_service)
+        self.metadata_service = SheetMetadataService(self.auth_service, gateway=self.gateway)
+        self.reader_service = SheetReaderService(
+            self.auth_service, self.metadata_service, gateway=self.gateway
+        )
+        self.writer_service = SheetWriterService(self.auth_service, gateway=self.gateway)
         self.retry_service = RetryService()
 
 
@@ -48,6 +53,12 @@ def get_sheets_service():
     return service.auth_service.get_sheets_service()
 
 
+def get_sheets_api_stats() -> Dict[str, Any]:
+    """Get timing statistics for Google Sheets API calls made through the gateway."""
+    service = _get_sheets_service_instance()
+    return service.gateway.get_stats()
+
+
 async def get_active_spreadsheet_id(db: Optional[Session] = None) -> str:
     """
     Get the active spreadsheet ID from the database configuration.
@@ -89,6 +100,30 @@ async def get_sheet_values(
     return await service.reader_service.get_sheet_values(range_name, spreadsheet_id, db)
 
 
+async def iter_sheet_pages(
+    tab_names: List[str],
+    spreadsheet_id: Optional[str] = None,
+    db: Optional[Session] = None,
+    page_size: Optional[int] = None,
+) -> AsyncIterator[Tuple[int, List[List[Any]]]]:
+    """
+    Stream whole tabs from a Google Sheet in pages of rows.
+
+    Args:
+        tab_names: The tabs to read (e.g., ["Scouting", "SuperScouting"])
+        spreadsheet_id: Optional spreadsheet ID (will use active config if not provided)
+        db: Optional database session for getting active configuration
+        page_size: Rows per page (defaults to SHEETS_PAGE_ROWS)
+
+    Yields:
+        (index into tab_names, rows) tuples; a tab's first page starts with its header row
+    """
+    service = _get_sheets_service_instance()
+    kwargs = {"page_size": page_size} if page_size else {}
+    async for page in service.reader_service.iter_sheet_pages(tab_names, spreadsheet_id, db, **kwargs):
+        yield page
+
+
 async def update_sheet_values(
     range_name: str,
     values: List[List[Any]],
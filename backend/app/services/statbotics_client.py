@@ -2,13 +2,24 @@
 
 import json
 import os
-from typing import Dict, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Optional
 from statbotics import Statbotics
 from app.services.cache_service import cached
 
 # Initialize Statbotics client
 sb = Statbotics()
 
+# Concurrency limits for the async EPA layer (the Statbotics client is blocking)
+STATBOTICS_MAX_WORKERS = int(os.getenv("STATBOTICS_MAX_WORKERS", "8"))
+STATBOTICS_TEAM_TIMEOUT = float(os.getenv("STATBOTICS_TEAM_TIMEOUT", "15"))
+
+# Dedicated pool so Statbotics fetches never run on the event loop thread
+_statbotics_executor = ThreadPoolExecutor(
+    max_workers=STATBOTICS_MAX_WORKERS, thread_name_prefix="statbotics"
+)
+
 # Base directory setup
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_DIR = os.path.normpath(os.path.join(BASE_DIR, "..", "config"))
@@ -69,3 +80,68 @@ def get_team_epa(team_key: int, year: int) -> Dict[str, Any]:
         print(f"❌ Error fetching team data for {team_key} in {year}: {e}")
         # Return basic info even on error
         return {"team_number": team_key, "team_name": f"Team {team_key}", "epa_total": None}
+
+
+async def get_team_epa_async(
+    team_key: int, year: int, timeout: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Non-blocking wrapper around get_team_epa that runs on the Statbotics thread pool.
+
+    Args:
+        team_key: Team number
+        year: Season year
+        timeout: Seconds to wait for this team before giving up
+
+    Returns:
+        Slimmed EPA dictionary, or None if the fetch timed out or failed
+    """
+    loop = asyncio.get_running_loop()
+    timeout = STATBOTICS_TEAM_TIMEOUT if timeout is None else timeout
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(_statbotics_executor, get_team_epa, team_key, year),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        print(f"⚠️ Statbotics request for team {team_key} timed out after {timeout}s")
+    except Exception as e:
+        print(f"❌ Error fetching Statbotics data for team {team_key}: {e}")
+    return None
+
+
+async def get_teams_epa(
+    team_numbers: Iterable[int],
+    year: int,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch EPA data for many teams concurrently without blocking the event loop.
+
+    Args:
+        team_numbers: Team numbers to fetch
+        year: Season year
+        max_concurrency: Maximum in-flight requests (defaults to STATBOTICS_MAX_WORKERS)
+        timeout: Per-team timeout in seconds (defaults to STATBOTICS_TEAM_TIMEOUT)
+        on_progress: Optional callback invoked with (completed, total) as teams finish
+
+    Returns:
+        Dictionary mapping team number to its EPA data for every successful fetch
+    """
+    team_numbers = list(team_numbers)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency or STATBOTICS_MAX_WORKERS))
+    completed = 0
+
+    async def fetch(team_number: int):
+        nonlocal completed
+        async with semaphore:
+            stats = await get_team_epa_async(team_number, year, timeout)
+        completed += 1
+        if on_progress:
+            on_progress(completed, len(team_numbers))
+        return team_number, stats
+
+    results = await asyncio.gather(*(fetch(team_number) for team_number in team_numbers))
+    return {team_number: stats for team_number, stats in results if stats}
@@ -3,7 +3,9 @@
 import os
 import json
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+from app.services.scouting_parser import coerce_cell_value
 
 # Determine project structure paths
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -69,94 +71,161 @@ except Exception as e:
     print(f"Warning: Could not load superscout configuration: {e}")
 
 
-def parse_superscout_row(row: List[str], headers: List[str]) -> List[Dict[str, Any]]:
+class CompiledSuperscoutParser:
     """
-    Parses a single row from the SuperScouting sheet into three robot-specific scouting entries.
-    ENHANCED VERSION: Auto-generates robot field mappings for all three robots.
+    SuperScouting row parser precompiled for one header row.
 
-    Args:
-        row (List[str]): The full list of cell values for the row.
-        headers (List[str]): The full list of headers from A1:Z1.
-
-    Returns:
-        List[Dict[str, Any]]: Three structured robot scouting dictionaries.
+    Robot groups, schema lookups and label mappings are resolved once, so each
+    row is walked once per robot plus once for the label-mapped columns.
     """
-    # If configuration hasn't been loaded yet, load it now
-    global FIELD_MAPPING, ROBOT_GROUPS
-    if not FIELD_MAPPING:
-        FIELD_MAPPING, ROBOT_GROUPS = load_superscout_config()
 
-    # Prepare data for all three robots
-    robot_entries = []
+    def __init__(
+        self,
+        headers: List[str],
+        field_mapping: Dict[str, str],
+        robot_groups: Dict[str, List[str]],
+        field_metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Build the per-robot column plans.
+
+        Args:
+            headers: The full list of headers from the first sheet row
+            field_mapping: Superscouting schema mapping of header -> field type
+            robot_groups: Robot label -> headers that belong to that robot
+            field_metadata: Optional unified field metadata with label mappings
+        """
+        self.headers = list(headers)
+
+        # First column index for each header name (duplicate headers read the first column)
+        first_index = {}
+        for i, header in enumerate(self.headers):
+            first_index.setdefault(header, i)
+
+        # Robot label -> [(column index, field key, field type)]
+        self.robot_plans: Dict[str, List[Tuple[int, str, str]]] = {}
+        # Robot label -> field_types template copied into every parsed entry
+        self.robot_field_types: Dict[str, Dict[str, str]] = {}
+
+        for robot_num in range(1, 4):
+            robot_label = f"robot_{robot_num}"
+            plan = []
+            field_types = {}
+            for header in robot_groups.get(robot_label, []):
+                mapped_field = field_mapping.get(header, "ignore")
+                if mapped_field == "ignore" or header not in first_index:
+                    continue  # Skip unmapped or irrelevant fields
 
-    # Auto-generate robot groups for all three robots
-    auto_robot_groups = generate_auto_robot_groups(headers)
+                # Create a standardized field key
+                field_key = header.replace(" ", "_").lower()
+                plan.append((first_index[header], field_key, mapped_field))
+                field_types[field_key] = mapped_field
+
+            self.robot_plans[robot_label] = plan
+            self.robot_field_types[robot_label] = field_types
+
+        # Label-mapped raw columns shared by all robots: (column index, label)
+        self.label_steps: List[Tuple[int, str]] = []
+        for column, header in enumerate(self.headers):
+            info = (field_metadata or {}).get(header)
+            if isinstance(info, dict) and isinstance(info.get("label_mapping"), dict):
+                if "label" in info["label_mapping"]:
+                    self.label_steps.append((column, info["label_mapping"]["label"]))
+
+    def parse(self, row: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse one SuperScouting row into robot-specific scouting entries.
+
+        Args:
+            row: The full list of cell values for the row
+
+        Returns:
+            Robot scouting dictionaries for every robot with a team number
+        """
+        row_length = len(row)
+
+        # Enhanced label fields are identical for every robot in the row
+        enhanced_fields = {}
+        for index, label in self.label_steps:
+            if index < row_length:
+                enhanced_fields[label] = coerce_cell_value(row[index])
+
+        robot_entries = []
+        for robot_label, plan in self.robot_plans.items():
+            robot_data = {"field_types": dict(self.robot_field_types[robot_label])}
+
+            for index, field_key, mapped_field in plan:
+                # Robot fields have never been stripped (" 3" stays text, notes keep their
+                # spacing), unlike label-mapped fields; keep both as they were
+                value = coerce_cell_value(row[index], strip=False) if index < row_length else None
 
-    # Process data for each robot (1, 2, 3)
-    for robot_num in range(1, 4):
-        robot_label = f"robot_{robot_num}"
-        robot_data = {}
+                # Store the actual data
+                robot_data[field_key] = value
 
-        # Add a field for storing categorization data
-        robot_data["field_types"] = {}
+                # For team_number and match_number, also store them under standardized keys
+                if mapped_field in ["team_number", "match_number"]:
+                    robot_data[mapped_field] = value
 
-        # Get robot-specific headers for this robot
-        robot_headers = auto_robot_groups.get(robot_label, [])
+            # Ensure team_number is present and valid
+            if "team_number" in robot_data and robot_data["team_number"] is not None:
+                # Make sure team_number is an integer if possible
+                try:
+                    if isinstance(robot_data["team_number"], str):
+                        robot_data["team_number"] = int(robot_data["team_number"])
+                except ValueError:
+                    pass
 
-        # Process all fields that apply to this robot
-        for header in robot_headers:
-            if header not in FIELD_MAPPING:
-                continue  # Ignore unmapped fields
+                # Add robot identifier for later reference
+                robot_data["robot_group"] = robot_label
 
-            mapped_field = FIELD_MAPPING.get(header, "ignore")
-            if mapped_field == "ignore":
-                continue  # Skip irrelevant fields
+                if enhanced_fields:
+                    robot_data.update(enhanced_fields)
 
-            try:
-                index = headers.index(header)
-                value = row[index] if index < len(row) else None
+                robot_entries.append(robot_data)
 
-                # Try to convert numeric values
-                if value is not None and isinstance(value, str):
-                    try:
-                        if value.isdigit():
-                            value = int(value)
-                        elif value.replace(".", "", 1).isdigit() and value.count(".") < 2:
-                            value = float(value)
-                    except (ValueError, TypeError):
-                        pass
+        return robot_entries
 
-                # Create a standardized field key
-                field_key = header.replace(" ", "_").lower()
 
-                # Store the actual data
-                robot_data[field_key] = value
+def compile_superscout_parser(
+    headers: List[str], field_metadata: Optional[Dict[str, Any]] = None
+) -> CompiledSuperscoutParser:
+    """
+    Compile a SuperScouting row parser for a header row.
 
-                # Store the field type for categorization
-                robot_data["field_types"][field_key] = mapped_field
+    Args:
+        headers: The full list of headers from the first sheet row
+        field_metadata: Optional unified field metadata with label mappings
 
-                # For team_number and match_number, also store them under standardized keys
-                if mapped_field in ["team_number", "match_number"]:
-                    robot_data[mapped_field] = value
+    Returns:
+        CompiledSuperscoutParser that can be reused for every row with these headers
+    """
+    # If configuration hasn't been loaded yet, load it now
+    global FIELD_MAPPING, ROBOT_GROUPS
+    if not FIELD_MAPPING:
+        FIELD_MAPPING, ROBOT_GROUPS = load_superscout_config()
+
+    # Auto-generate robot groups for all three robots
+    auto_robot_groups = generate_auto_robot_groups(headers)
 
-            except ValueError:
-                continue
+    return CompiledSuperscoutParser(headers, FIELD_MAPPING, auto_robot_groups, field_metadata)
 
-        # Ensure team_number is present and valid
-        if "team_number" in robot_data and robot_data["team_number"] is not None:
-            # Make sure team_number is an integer if possible
-            try:
-                if isinstance(robot_data["team_number"], str):
-                    robot_data["team_number"] = int(robot_data["team_number"])
-            except ValueError:
-                pass
 
-            # Add robot identifier for later reference
-            robot_data["robot_group"] = robot_label
+def parse_superscout_row(row: List[str], headers: List[str]) -> List[Dict[str, Any]]:
+    """
+    Parses a single row from the SuperScouting sheet into three robot-specific scouting entries.
+    ENHANCED VERSION: Auto-generates robot field mappings for all three robots.
 
-            robot_entries.append(robot_data)
+    Compiles a parser for every call; use compile_superscout_parser() when
+    parsing many rows that share the same headers.
 
-    return robot_entries
+    Args:
+        row (List[str]): The full list of cell values for the row.
+        headers (List[str]): The full list of headers from A1:Z1.
+
+    Returns:
+        List[Dict[str, Any]]: Three structured robot scouting dictionaries.
+    """
+    return compile_superscout_parser(headers).parse(row)
 
 
 def generate_auto_robot_groups(headers: List[str]) -> Dict[str, List[str]]:
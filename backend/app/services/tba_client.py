@@ -60,6 +60,13 @@ async def get_event_rankings(event_key: str) -> Optional[Dict[str, Any]]:
         return response.json()
 
 
+async def refresh_event_rankings(event_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Pulls fresh event rankings, bypassing and then updating the cached copy.
+    """
+    return await get_event_rankings(event_key, refresh_cache=True)
+
+
 async def get_match_detail(match_key: str) -> Dict[str, Any]:
     """
     Pulls detailed match breakdown for a specific match.
@@ -3,18 +3,25 @@
 import os
 import json
 import uuid
+import hashlib
+from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 import asyncio
+from app.services.dataset_registry import dataset_registry
 from app.services.progress_tracker import ProgressTracker
 
 from app.services.schema_loader import load_schemas
-from app.services.scouting_parser import parse_scouting_row
+from app.services.scouting_parser import compile_scouting_parser
 
 # Use the enhanced parser that preserves field categories
-from app.services.superscout_parser_enhanced import parse_superscout_row
-from app.services.tba_client import get_event_teams, get_event_matches, get_event_rankings
-from app.services.statbotics_client import get_team_epa
-from app.services.sheets_service import get_sheet_values
+from app.services.superscout_parser_enhanced import compile_superscout_parser
+from app.services.tba_client import (
+    get_event_teams,
+    get_event_matches,
+    get_event_rankings,
+    refresh_event_rankings,
+)
+from app.services.statbotics_client import get_teams_epa
 
 
 def load_field_metadata(event_key: str = None, year: int = None) -> Dict[str, Any]:
@@ -205,6 +212,22 @@ def apply_label_mappings(parsed_data: Dict[str, Any], field_metadata: Dict[str,
         return parsed_data
 
 
+def group_records_by_team(records: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group parsed scouting records by normalized team number in a single pass.
+
+    Args:
+        records: Parsed scouting or superscouting records
+
+    Returns:
+        Dictionary mapping str(team_number) to that team's records in original order
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        grouped.setdefault(str(record.get("team_number")), []).append(record)
+    return grouped
+
+
 def get_unified_dataset_path(event_key: str) -> str:
     """
     Get the path for a unified dataset based on the event key.
@@ -224,287 +247,223 @@ def get_unified_dataset_path(event_key: str) -> str:
     return os.path.join(data_dir, f"unified_event_{event_key}.json")
 
 
-def sanitize_for_json(obj: Any) -> Any:
+def get_row_state_path(event_key: str) -> str:
     """
-    Sanitize values for safe JSON serialization.
+    Get the path of the per-tab row state used for incremental rebuilds.
 
     Args:
-        obj: Any Python object to sanitize
+        event_key: The event key, e.g., "2025arc"
 
     Returns:
-        The sanitized object with None values replaced with empty strings
+        str: The full path to the row state JSON file
     """
-    if isinstance(obj, dict):
-        return {k: sanitize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [sanitize_for_json(item) for item in obj]
-    elif obj is None:
-        return ""
-    else:
-        return obj
+    return get_unified_dataset_path(event_key).replace(".json", "_rows.json")
 
 
-async def build_unified_dataset(
-    event_key: str,
-    year: int,
-    force_rebuild: bool = False,
-    scouting_tab: str = "Scouting",
-    superscout_tab: str = "SuperScouting",
-    operation_id: Optional[str] = None,
-) -> str:
+def load_row_state(event_key: str) -> Dict[str, Any]:
     """
-    Build a unified dataset combining scouting data, TBA data, and Statbotics data.
+    Load the row state saved by the previous build of an event.
 
     Args:
         event_key: The event key, e.g., "2025arc"
-        year: The season year, e.g., 2025
-        force_rebuild: Whether to rebuild even if dataset already exists
-        scouting_tab: Name of the scouting tab in Google Sheets
-        superscout_tab: Name of the superscouting tab in Google Sheets
-        operation_id: Optional unique identifier for progress tracking
 
     Returns:
-        str: Path to the unified dataset JSON file
+        Dictionary with "tabs" (tab state keyed by "scouting"/"superscouting") and
+        "event_context" (raw TBA and Statbotics data, if saved), or {} if none exists
     """
-    # Check if there's an active sheet configuration in the database
-    spreadsheet_id = None
-    db = None
+    state_path = get_row_state_path(event_key)
+    if not os.path.exists(state_path):
+        return {}
     try:
-        from app.database.db import get_db_session
-        from app.services.sheet_config_service import get_active_configuration
-
-        db = next(get_db_session())
-        config_result = await get_active_configuration(db, event_key, year)
-
-        if config_result["status"] == "success":
-            config = config_result["configuration"]
-            # Get the spreadsheet ID from configuration
-            spreadsheet_id = config["spreadsheet_id"]
-            # Override tab names with configured values if available
-            scouting_tab = config["match_scouting_sheet"] or scouting_tab
-            if config["super_scouting_sheet"]:
-                superscout_tab = config["super_scouting_sheet"]
-
-            print(
-                f"\U0001f535 Using configured tabs from database: scouting={scouting_tab}, superscout={superscout_tab}"
-            )
-            print(f"\U0001f535 Using spreadsheet ID from configuration: {spreadsheet_id}")
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
     except Exception as e:
-        print(f"\U0001f534 Error getting sheet configuration, using defaults: {str(e)}")
-    # Initialize progress tracking if operation_id is provided
-    tracker = None
-    if operation_id:
-        tracker = ProgressTracker.create_tracker(operation_id)
-        tracker.update(1, f"Building unified dataset for {event_key} ({year})", "Initializing")
-
-    print(f"\U0001f535 Loading schemas for {year}")
-    load_schemas(year)
-    if tracker:
-        tracker.update(5, "Loaded schemas", "Load schemas")
-    
-    # Load field metadata with label mappings
-    print(f"\U0001f535 Loading field metadata for {event_key} (fallback: {year})")
-    field_metadata = load_field_metadata(event_key=event_key, year=year)
-    if tracker:
-        tracker.update(7, "Loaded field metadata with label mappings", "Load field metadata")
-
-    # Check if dataset already exists and if we should rebuild
-    output_path = get_unified_dataset_path(event_key)
-    if os.path.exists(output_path) and not force_rebuild:
-        print(f"\u2705 Using existing unified dataset: {output_path}")
-        if tracker:
-            tracker.complete(f"Using existing unified dataset: {output_path}")
-        return output_path
-
-    # 1. Parse Match Scouting Data
-    print("\U0001f535 Fetching Match Scouting data...")
-    if tracker:
-        tracker.update(10, "Fetching match scouting data", "Fetch scouting data")
+        print(f"\u26a0\ufe0f Could not read row state {state_path}: {e}")
+        return {}
 
-    # First check if the tab exists
-    try:
-        # Check available tabs - make sure to pass the spreadsheet_id
-        from app.services.sheets_service import get_all_sheet_names
 
-        tabs_result = await get_all_sheet_names(spreadsheet_id, db)
-        available_tabs = (
-            tabs_result.get("sheet_names", []) if tabs_result.get("status") == "success" else []
-        )
+class TabRowState:
+    """
+    Row watermark and content hashes for one sheet tab.
 
-        print(f"\U0001f535 Available tabs in Google Sheet: {available_tabs}")
+    Each row is stored with the hash of its raw cells and the records it parsed
+    into, so an incremental rebuild only parses rows that are new or changed.
+    All previous rows are discarded when the headers or mapping signature change.
+    """
 
-        if scouting_tab not in available_tabs:
-            print(f"\U0001f534 WARNING: '{scouting_tab}' tab not found in Google Sheet")
-            scouting_raw = []
+    def __init__(self, tab_name: str, signature_parts: List[Any], previous: Optional[Dict] = None):
+        self.tab_name = tab_name
+        self.signature = hashlib.md5(
+            json.dumps(signature_parts, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        previous = previous or {}
+        if previous.get("tab") == tab_name and previous.get("signature") == self.signature:
+            self.previous_rows = previous.get("rows", [])
         else:
-            # Use a more specific range to avoid potential API issues
-            # Make sure to pass the spreadsheet_id
-            scouting_raw = await get_sheet_values(f"{scouting_tab}!A1:ZZ1000", spreadsheet_id, db)
-    except Exception as e:
-        print(f"\U0001f534 ERROR checking available tabs: {str(e)}")
-        # Try to fetch the data anyway - with spreadsheet_id
-        scouting_raw = await get_sheet_values(f"{scouting_tab}!A1:ZZ1000", spreadsheet_id, db)
-
-    # Enhanced logging to debug scouting data issues
-    print(f"\U0001f535 Scouting raw data received: {len(scouting_raw) if scouting_raw else 0} rows")
-
-    # Check for empty data
-    if not scouting_raw:
-        print("\U0001f534 ERROR: No scouting data received from Google Sheets")
-
-    headers = scouting_raw[0] if scouting_raw else []
-    scouting_rows = scouting_raw[1:] if scouting_raw else []
-
-    print(f"\U0001f535 Scouting headers: {len(headers)} columns")
-    print(f"\U0001f535 Scouting data rows: {len(scouting_rows)} rows")
-
-    if tracker:
-        tracker.update(
-            15, f"Processing {len(scouting_rows)} scouting records", "Process scouting data"
-        )
+            self.previous_rows = []
+        self.rows: List[Dict[str, Any]] = []
+        self.reused_count = 0
+
+    @staticmethod
+    def hash_row(row: List[Any]) -> str:
+        """Hash the raw cell values of a sheet row."""
+        return hashlib.md5(json.dumps(row, default=str).encode("utf-8")).hexdigest()
+
+    def lookup(self, index: int, row_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """Return (and keep) the previous records for a row if its content is unchanged."""
+        if index < len(self.previous_rows) and self.previous_rows[index].get("hash") == row_hash:
+            records = self.previous_rows[index].get("records", [])
+            self.rows.append({"hash": row_hash, "records": records})
+            self.reused_count += 1
+            return records
+        return None
+
+    def store(self, row_hash: str, records: List[Dict[str, Any]]) -> None:
+        """Record the freshly parsed records for a row."""
+        self.rows.append({"hash": row_hash, "records": records})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tab": self.tab_name,
+            "signature": self.signature,
+            "watermark": len(self.rows),
+            "rows": self.rows,
+        }
+
+
+class TabIngest(ABC):
+    """
+    Parses one sheet tab page by page as rows arrive from Google Sheets.
 
-    scouting_parsed = []
-    for i, row in enumerate(scouting_rows):
-        # Update progress every 10 rows to avoid too many updates
-        if tracker and i % 10 == 0 and scouting_rows:
-            progress_pct = 15 + (5 * i / len(scouting_rows))
-            tracker.update(
-                progress_pct,
-                f"Processed {i}/{len(scouting_rows)} scouting records",
-                "Process scouting data",
-            )
+    The first row received is the header row: it compiles the row parser and
+    sets up the tab's row state. Every following row is parsed immediately (or
+    reused from the previous build), so raw sheet pages are not kept around.
+    Subclasses supply the parser through _compile and _parse_row.
+    """
 
-        parsed = parse_scouting_row(row, headers)
-        
-        # Apply label mappings to enhance field names using original headers (Sprint 4 enhancement)
-        if field_metadata:
-            enhanced_fields = apply_label_mappings_to_raw_data(row, headers, field_metadata)
-            if parsed and enhanced_fields:
-                parsed.update(enhanced_fields)  # Add enhanced fields to parsed data
+    def __init__(self, tab_name: str, field_metadata: Dict[str, Any], previous_state: Optional[Dict] = None):
+        self.tab_name = tab_name
+        self.field_metadata = field_metadata
+        self.previous_state = previous_state
+        self.headers: List[str] = []
+        self.parser = None
+        self.state: Optional[TabRowState] = None
+        self.parsed: List[Dict[str, Any]] = []
+        self.row_count = 0
+
+    @abstractmethod
+    def _compile(self, headers: List[str]) -> List[Any]:
+        """Compile self.parser for the headers and return the row state signature parts."""
+
+    @abstractmethod
+    def _parse_row(self, index: int, row: List[Any]) -> List[Dict[str, Any]]:
+        """Parse one data row into the records it contributes."""
+
+    def _start(self, headers: List[str]) -> None:
+        self.headers = headers
+        signature_parts = self._compile(headers)
+        self.state = TabRowState(self.tab_name, signature_parts, self.previous_state)
+
+    def feed(self, rows: List[List[Any]]) -> None:
+        """
+        Parse the next page of rows.
+
+        Args:
+            rows: Consecutive sheet rows; the first page starts with the header row
+        """
+        if self.state is None:
+            if not rows:
+                return
+            self._start(rows[0])
+            rows = rows[1:]
+
+        for row in rows:
+            i = self.row_count
+            self.row_count += 1
+
+            # Reuse records for rows that are unchanged since the previous build
+            row_hash = self.state.hash_row(row)
+            cached_records = self.state.lookup(i, row_hash)
+            if cached_records is not None:
+                self.parsed.extend(cached_records)
+                continue
+
+            records = self._parse_row(i, row)
+            self.parsed.extend(records)
+            self.state.store(row_hash, records)
+
+    def finish(self) -> TabRowState:
+        """Finish ingestion and return the row state to save (also for empty tabs)."""
+        if self.state is None:
+            self._start([])
+        return self.state
+
+
+class ScoutingTabIngest(TabIngest):
+    """Match Scouting tab ingest using the compiled scouting row parser."""
+
+    def _compile(self, headers: List[str]) -> List[Any]:
+        # Compile the row parser once for this header row; label mappings are folded into the plan
+        self.parser = compile_scouting_parser(headers, self.field_metadata)
+        return [headers, self.parser.steps, self.parser.label_steps]
+
+    def _parse_row(self, index: int, row: List[Any]) -> List[Dict[str, Any]]:
+        parsed = self.parser.parse(row)
 
         # Debug logging for scouting parser
-        if i == 0:  # Log the first row parsing for debugging
+        if index == 0:  # Log the first row parsing for debugging
             print(f"\U0001f535 Sample row: {row[:5]}...")
             print(f"\U0001f535 Parsed result: {parsed}")
 
             # Extra debug for critical fields
             if not parsed or "team_number" not in parsed:
                 print("\U0001f534 ERROR: team_number not found in parsed data!")
-                print(f"\U0001f534 Headers: {headers[:5]}...")
+                print(f"\U0001f534 Headers: {self.headers[:5]}...")
                 # Check schema mapping
                 from app.services.schema_loader import get_match_mapping
 
                 match_mapping = get_match_mapping()
                 print(f"\U0001f534 Schema mapping: {match_mapping}")
 
-        if parsed:
-            # Ensure match_number is present and is an integer
-            if "match_number" in parsed and parsed["match_number"] is not None:
-                try:
-                    parsed["match_number"] = int(parsed["match_number"])
-                except (ValueError, TypeError):
-                    pass  # Keep as is if conversion fails
-            if "qual_number" in parsed and parsed["qual_number"] is not None:
-                try:
-                    parsed["qual_number"] = int(parsed["qual_number"])
-                except (ValueError, TypeError):
-                    pass  # Keep as is if conversion fails
-
-            # Ensure team_number is an integer
-            if "team_number" in parsed and parsed["team_number"] is not None:
-                try:
-                    parsed["team_number"] = int(parsed["team_number"])
-                except (ValueError, TypeError):
-                    pass  # Keep as is if conversion fails
-
-            scouting_parsed.append(parsed)
-
-    if tracker:
-        tracker.update(
-            20,
-            f"Completed processing {len(scouting_parsed)} scouting records",
-            "Process scouting data",
-        )
-
-    # 2. Parse SuperScouting Data
-    print("\U0001f535 Fetching SuperScouting data...")
-    if tracker:
-        tracker.update(25, "Fetching superscouting data", "Fetch superscouting data")
-
-    # Check if the SuperScouting tab exists
-    try:
-        # Re-use available_tabs from before if it was set
-        if "available_tabs" not in locals():
-            from app.services.sheets_service import get_all_sheet_names
-
-            tabs_result = await get_all_sheet_names(spreadsheet_id, db)
-            available_tabs = (
-                tabs_result.get("sheet_names", []) if tabs_result.get("status") == "success" else []
-            )
-            print(f"\U0001f535 Available tabs in Google Sheet: {available_tabs}")
-
-        if superscout_tab not in available_tabs:
-            print(f"\U0001f534 WARNING: '{superscout_tab}' tab not found in Google Sheet")
-            superscouting_raw = []
-        else:
-            # Use a more specific range to avoid potential API issues
-            # Make sure to pass the spreadsheet_id
-            superscouting_raw = await get_sheet_values(
-                f"{superscout_tab}!A1:ZZ1000", spreadsheet_id, db
-            )
-    except Exception as e:
-        print(f"\U0001f534 ERROR checking available tabs for superscouting: {str(e)}")
-        # Try to fetch the data anyway - with spreadsheet_id
-        superscouting_raw = await get_sheet_values(
-            f"{superscout_tab}!A1:ZZ1000", spreadsheet_id, db
-        )
-
-    # Enhanced logging to debug superscouting data issues
-    print(
-        f"\U0001f535 SuperScouting raw data received: {len(superscouting_raw) if superscouting_raw else 0} rows"
-    )
+        if not parsed:
+            return []
 
-    # Check for empty data
-    if not superscouting_raw:
-        print("\U0001f534 ERROR: No superscouting data received from Google Sheets")
+        # Ensure match_number is present and is an integer
+        if "match_number" in parsed and parsed["match_number"] is not None:
+            try:
+                parsed["match_number"] = int(parsed["match_number"])
+            except (ValueError, TypeError):
+                pass  # Keep as is if conversion fails
+        if "qual_number" in parsed and parsed["qual_number"] is not None:
+            try:
+                parsed["qual_number"] = int(parsed["qual_number"])
+            except (ValueError, TypeError):
+                pass  # Keep as is if conversion fails
 
-    superscouting_headers = superscouting_raw[0] if superscouting_raw else []
-    superscouting_rows = superscouting_raw[1:] if superscouting_raw else []
+        # Ensure team_number is an integer
+        if "team_number" in parsed and parsed["team_number"] is not None:
+            try:
+                parsed["team_number"] = int(parsed["team_number"])
+            except (ValueError, TypeError):
+                pass  # Keep as is if conversion fails
 
-    print(f"\U0001f535 SuperScouting headers: {len(superscouting_headers)} columns")
-    print(f"\U0001f535 SuperScouting data rows: {len(superscouting_rows)} rows")
+        return [parsed]
 
-    if tracker:
-        tracker.update(
-            30,
-            f"Processing {len(superscouting_rows)} superscouting records",
-            "Process superscouting data",
-        )
 
-    superscouting_parsed = []
-    for i, row in enumerate(superscouting_rows):
-        # Update progress every 10 rows to avoid too many updates
-        if tracker and i % 10 == 0 and superscouting_rows:
-            progress_pct = 30 + (5 * i / len(superscouting_rows))
-            tracker.update(
-                progress_pct,
-                f"Processed {i}/{len(superscouting_rows)} superscouting records",
-                "Process superscouting data",
-            )
+class SuperscoutingTabIngest(TabIngest):
+    """SuperScouting tab ingest using the compiled superscouting row parser."""
 
-        parsed_robots = parse_superscout_row(row, superscouting_headers)
+    def _compile(self, headers: List[str]) -> List[Any]:
+        # Compile robot groups and label mappings once for this header row
+        self.parser = compile_superscout_parser(headers, self.field_metadata)
+        return [headers, self.parser.robot_plans, self.parser.label_steps]
 
-        # Apply label mappings to enhance superscouting field names using original headers (Sprint 4 enhancement)
-        enhanced_superscout_fields = {}
-        if field_metadata:
-            enhanced_superscout_fields = apply_label_mappings_to_raw_data(row, superscouting_headers, field_metadata)
+    def _parse_row(self, index: int, row: List[Any]) -> List[Dict[str, Any]]:
+        # Label-mapped fields are already folded into each robot entry by the compiled plan
+        row_records = []
 
         # Each row can generate multiple robot entries due to robot grouping
-        for robot_data in parsed_robots:
-            # Add enhanced fields to robot data
-            if robot_data and enhanced_superscout_fields:
-                robot_data.update(enhanced_superscout_fields)
-                
+        for robot_data in self.parser.parse(row):
             # Only include entries with valid team numbers
             if "team_number" in robot_data and robot_data["team_number"]:
                 # Ensure match_number is present if available
@@ -521,16 +480,108 @@ async def build_unified_dataset(
                     except (ValueError, TypeError):
                         pass
 
-                # Add to parsed data
-                superscouting_parsed.append(robot_data)
+                row_records.append(robot_data)
+
+        return row_records
+
+
+def sanitize_for_json(obj: Any) -> Any:
+    """
+    Sanitize values for safe JSON serialization.
+
+    Args:
+        obj: Any Python object to sanitize
+
+    Returns:
+        The sanitized object with None values replaced with empty strings
+    """
+    if isinstance(obj, dict):
+        return {k: sanitize_for_json(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [sanitize_for_json(item) for item in obj]
+    elif obj is None:
+        return ""
+    else:
+        return obj
 
-    if tracker:
-        tracker.update(
-            35,
-            f"Completed processing {len(superscouting_parsed)} superscouting records",
-            "Process superscouting data",
-        )
 
+async def _ingest_scouting_tabs(
+    ingests: List["TabIngest"], spreadsheet_id: Optional[str], db: Any, tracker: Optional[ProgressTracker]
+) -> None:
+    """
+    Stream the scouting tabs from Google Sheets in row pages and feed each page to its ingest.
+
+    All tabs are read together, one batchGet request per page round.
+
+    Args:
+        ingests: Tab ingests to feed, e.g. Match Scouting and SuperScouting
+        spreadsheet_id: Spreadsheet ID from the active configuration, if any
+        db: Optional database session for getting active configuration
+        tracker: Optional progress tracker
+    """
+    from app.services.sheets_service import get_all_sheet_names, iter_sheet_pages
+
+    try:
+        # Check available tabs (served from cached spreadsheet metadata)
+        tabs_result = await get_all_sheet_names(spreadsheet_id, db)
+        if tabs_result.get("status") != "success":
+            raise RuntimeError(tabs_result.get("message", "Sheet names unavailable"))
+        available_tabs = tabs_result.get("sheet_names", [])
+
+        print(f"\U0001f535 Available tabs in Google Sheet: {available_tabs}")
+
+        wanted = []
+        for ingest in ingests:
+            if ingest.tab_name in available_tabs:
+                wanted.append(ingest)
+            else:
+                print(f"\U0001f534 WARNING: '{ingest.tab_name}' tab not found in Google Sheet")
+    except Exception as e:
+        print(f"\U0001f534 ERROR checking available tabs: {str(e)}")
+        # Try to fetch the data anyway - with spreadsheet_id
+        wanted = list(ingests)
+
+    pages = 0
+    if wanted:
+        async for tab_index, rows in iter_sheet_pages(
+            [ingest.tab_name for ingest in wanted], spreadsheet_id, db
+        ):
+            wanted[tab_index].feed(rows)
+            pages += 1
+            if tracker:
+                tracker.update(
+                    min(34, 10 + 4 * pages),
+                    "Processed "
+                    + ", ".join(f"{i.row_count} {i.tab_name} rows" for i in ingests),
+                    "Process scouting data",
+                )
+
+    for ingest in ingests:
+        # Enhanced logging to debug scouting data issues
+        print(f"\U0001f535 {ingest.tab_name} headers: {len(ingest.headers)} columns")
+        print(f"\U0001f535 {ingest.tab_name} data rows: {ingest.row_count} rows")
+        if not ingest.headers:
+            print(f"\U0001f534 ERROR: No data received from Google Sheets for '{ingest.tab_name}'")
+        if ingest.state and ingest.state.reused_count:
+            print(
+                f"\U0001f535 Reused {ingest.state.reused_count}/{ingest.row_count} unchanged {ingest.tab_name} rows"
+            )
+
+
+async def _fetch_event_context(
+    event_key: str, year: int, tracker: Optional[ProgressTracker]
+) -> tuple:
+    """
+    Fetch teams, schedule and rankings from TBA and EPA data from Statbotics.
+
+    Args:
+        event_key: The event key, e.g., "2025arc"
+        year: The season year, e.g., 2025
+        tracker: Optional progress tracker
+
+    Returns:
+        tuple: (event_teams, event_rankings, expected_matches, statbotics_data)
+    """
     # 3. Pull TBA Data
     print("\U0001f535 Fetching TBA Teams, Matches, Rankings...")
     if tracker:
@@ -587,27 +638,20 @@ async def build_unified_dataset(
             "Fetch Statbotics data",
         )
 
-    statbotics_data = {}
-
-    # Process teams in smaller batches to show progress
-    batch_size = max(1, len(event_teams) // 10)  # Split into ~10 progress updates
-    for i in range(0, len(event_teams), batch_size):
-        batch = event_teams[i : i + batch_size]
-
-        if tracker:
-            progress_pct = 60 + (10 * i / len(event_teams))
+    # Fetch all teams concurrently on the Statbotics thread pool so the event loop stays free
+    def report_statbotics_progress(completed: int, total: int) -> None:
+        if tracker and total and completed % max(1, total // 10) == 0:
             tracker.update(
-                progress_pct, f"Fetching team stats {i}/{len(event_teams)}", "Fetch Statbotics data"
+                60 + (10 * completed / total),
+                f"Fetching team stats {completed}/{total}",
+                "Fetch Statbotics data",
             )
 
-        for team in batch:
-            team_number = team.get("team_number")
-            try:
-                team_stats = get_team_epa(team_number, year)
-                if team_stats:
-                    statbotics_data[team_number] = team_stats
-            except Exception as e:
-                print(f"Error fetching Statbotics data for team {team_number}: {e}")
+    statbotics_data = await get_teams_epa(
+        [team.get("team_number") for team in event_teams],
+        year,
+        on_progress=report_statbotics_progress,
+    )
 
     if tracker:
         tracker.update(
@@ -616,11 +660,190 @@ async def build_unified_dataset(
             "Process Statbotics data",
         )
 
+    return event_teams, event_rankings, expected_matches, statbotics_data
+
+
+async def _refresh_event_context(
+    event_context: Dict[str, Any], event_key: str, tracker: Optional[ProgressTracker]
+) -> tuple:
+    """
+    Reuse the team list, schedule and EPA data saved by the previous build and refresh rankings.
+
+    Args:
+        event_context: Raw TBA and Statbotics data from the previous build's row state
+        event_key: The event key, e.g., "2025arc"
+        tracker: Optional progress tracker
+
+    Returns:
+        tuple: (event_teams, event_rankings, expected_matches, statbotics_data)
+    """
+    print("\U0001f535 Refreshing TBA rankings...")
+    if tracker:
+        tracker.update(40, "Refreshing rankings from The Blue Alliance", "Fetch TBA data")
+
+    event_teams = event_context.get("event_teams", [])
+    expected_matches = event_context.get("expected_matches", [])
+    # Saved as [team_number, epa] pairs since JSON object keys cannot be integers
+    statbotics_data = {team_number: info for team_number, info in event_context.get("statbotics", [])}
+
+    try:
+        event_rankings = await refresh_event_rankings(event_key)
+    except Exception as e:
+        print(f"\U0001f534 Error refreshing rankings, keeping previous rankings: {e}")
+        event_rankings = event_context.get("rankings")
+
+    if tracker:
+        tracker.update(
+            70,
+            f"Reused TBA and Statbotics data for {len(event_teams)} teams, refreshed rankings",
+            "Process TBA data",
+        )
+
+    return event_teams, event_rankings, expected_matches, statbotics_data
+
+
+async def build_unified_dataset(
+    event_key: str,
+    year: int,
+    force_rebuild: bool = False,
+    scouting_tab: str = "Scouting",
+    superscout_tab: str = "SuperScouting",
+    operation_id: Optional[str] = None,
+    incremental: bool = False,
+) -> str:
+    """
+    Build a unified dataset combining scouting data, TBA data, and Statbotics data.
+
+    Args:
+        event_key: The event key, e.g., "2025arc"
+        year: The season year, e.g., 2025
+        force_rebuild: Whether to rebuild even if dataset already exists
+        scouting_tab: Name of the scouting tab in Google Sheets
+        superscout_tab: Name of the superscouting tab in Google Sheets
+        operation_id: Optional unique identifier for progress tracking
+        incremental: Only parse new or changed sheet rows and reuse the previous
+            build's raw TBA teams, schedule and Statbotics data (rankings are refreshed).
+            Falls back to a full build when no previous build state exists.
+
+    Returns:
+        str: Path to the unified dataset JSON file
+    """
+    # Check if there's an active sheet configuration in the database
+    spreadsheet_id = None
+    db = None
+    try:
+        from app.database.db import get_db_session
+        from app.services.sheet_config_service import get_active_configuration
+
+        db = next(get_db_session())
+        config_result = await get_active_configuration(db, event_key, year)
+
+        if config_result["status"] == "success":
+            config = config_result["configuration"]
+            # Get the spreadsheet ID from configuration
+            spreadsheet_id = config["spreadsheet_id"]
+            # Override tab names with configured values if available
+            scouting_tab = config["match_scouting_sheet"] or scouting_tab
+            if config["super_scouting_sheet"]:
+                superscout_tab = config["super_scouting_sheet"]
+
+            print(
+                f"\U0001f535 Using configured tabs from database: scouting={scouting_tab}, superscout={superscout_tab}"
+            )
+            print(f"\U0001f535 Using spreadsheet ID from configuration: {spreadsheet_id}")
+    except Exception as e:
+        print(f"\U0001f534 Error getting sheet configuration, using defaults: {str(e)}")
+    # Initialize progress tracking if operation_id is provided
+    tracker = None
+    if operation_id:
+        tracker = ProgressTracker.create_tracker(operation_id)
+        tracker.update(1, f"Building unified dataset for {event_key} ({year})", "Initializing")
+
+    print(f"\U0001f535 Loading schemas for {year}")
+    load_schemas(year)
+    if tracker:
+        tracker.update(5, "Loaded schemas", "Load schemas")
+    
+    # Load field metadata with label mappings
+    print(f"\U0001f535 Loading field metadata for {event_key} (fallback: {year})")
+    field_metadata = load_field_metadata(event_key=event_key, year=year)
+    if tracker:
+        tracker.update(7, "Loaded field metadata with label mappings", "Load field metadata")
+
+    # Check if dataset already exists and if we should rebuild
+    output_path = get_unified_dataset_path(event_key)
+    if os.path.exists(output_path) and not force_rebuild and not incremental:
+        print(f"\u2705 Using existing unified dataset: {output_path}")
+        if tracker:
+            tracker.complete(f"Using existing unified dataset: {output_path}")
+        return output_path
+
+    # Load the previous build state for incremental mode
+    previous_state = {}
+    event_context = None
+    if incremental:
+        previous_state = load_row_state(event_key)
+        event_context = previous_state.get("event_context")
+        if event_context:
+            print(f"\U0001f535 Incremental rebuild from previous build state of {event_key}")
+        elif previous_state:
+            print("\U0001f535 Previous build state has no event context, fetching TBA and Statbotics data")
+        else:
+            print("\U0001f535 No previous build state found, doing a full rebuild")
+    previous_row_state = previous_state.get("tabs", {})
+
+    # 1-2. Stream Match Scouting and SuperScouting rows and parse them page by page
+    print("\U0001f535 Fetching Match Scouting and SuperScouting data...")
+    if tracker:
+        tracker.update(10, "Fetching scouting and superscouting data", "Fetch scouting data")
+
+    scouting_ingest = ScoutingTabIngest(
+        scouting_tab, field_metadata, previous_row_state.get("scouting")
+    )
+    superscouting_ingest = SuperscoutingTabIngest(
+        superscout_tab, field_metadata, previous_row_state.get("superscouting")
+    )
+    await _ingest_scouting_tabs(
+        [scouting_ingest, superscouting_ingest], spreadsheet_id, db, tracker
+    )
+
+    headers = scouting_ingest.headers
+    superscouting_headers = superscouting_ingest.headers
+    scouting_parsed = scouting_ingest.parsed
+    superscouting_parsed = superscouting_ingest.parsed
+    scouting_state = scouting_ingest.finish()
+    superscouting_state = superscouting_ingest.finish()
+
+    if tracker:
+        tracker.update(
+            35,
+            f"Completed processing {len(scouting_parsed)} scouting and "
+            f"{len(superscouting_parsed)} superscouting records",
+            "Process superscouting data",
+        )
+
+    # 3-4. Pull TBA schedule/rankings and Statbotics data
+    if event_context:
+        event_teams, event_rankings, expected_matches, statbotics_data = (
+            await _refresh_event_context(event_context, event_key, tracker)
+        )
+    else:
+        event_teams, event_rankings, expected_matches, statbotics_data = (
+            await _fetch_event_context(event_key, year, tracker)
+        )
+
     # 5. Merge all data
     print("\U0001f7e2 Merging datasets...")
     if tracker:
         tracker.update(75, "Merging all datasets", "Merge data")
 
+    # Index every source by team once so the merge is linear in the number of records
+    scouting_by_team = group_records_by_team(scouting_parsed)
+    superscouting_by_team = group_records_by_team(superscouting_parsed)
+    rankings_by_team_key = {
+        r.get("team_key"): r for r in reversed((event_rankings or {}).get("rankings") or [])
+    }
+
     unified_data = {}
 
     # Process teams in smaller batches to show progress
@@ -636,41 +859,14 @@ async def build_unified_dataset(
             team_number = team.get("team_number")
             team_key = f"frc{team_number}"
 
-            # Get team's scouting data - ensure we're using string versions of team_number for comparison
-            team_scouting = [
-                r for r in scouting_parsed if str(r.get("team_number")) == str(team_number)
-            ]
-
-            # Get team's superscouting data
-            team_superscouting = [
-                r for r in superscouting_parsed if str(r.get("team_number")) == str(team_number)
-            ]
-
-            # Get team's statbotics data
-            team_statbotics = statbotics_data.get(team_number, {})
-
-            # Get team's ranking data
-            team_ranking = (
-                next(
-                    (
-                        r
-                        for r in event_rankings.get("rankings", [])
-                        if r.get("team_key") == team_key
-                    ),
-                    {},
-                )
-                if event_rankings
-                else {}
-            )
-
             unified_data[str(team_number)] = {
                 "team_number": team_number,
                 "nickname": team.get("nickname"),
-                "scouting_data": team_scouting,
-                "superscouting_data": team_superscouting,
+                "scouting_data": scouting_by_team.get(str(team_number), []),
+                "superscouting_data": superscouting_by_team.get(str(team_number), []),
                 "tba_info": team,
-                "statbotics_info": team_statbotics,
-                "ranking_info": team_ranking,
+                "statbotics_info": statbotics_data.get(team_number, {}),
+                "ranking_info": rankings_by_team_key.get(team_key, {}),
             }
 
     # 6. Save unified data locally
@@ -686,24 +882,22 @@ async def build_unified_dataset(
         for record in team_data.get("scouting_data", []):
             all_scouting_records.append(record)
 
-    # Extract all matches from unified data
+    # Extract all matches from unified data, de-duplicated by match number in first-seen order
     all_matches = []
+    seen_match_numbers = set()
     for team_number, team_data in unified_data.items():
         for record in team_data.get("scouting_data", []):
             if "match_number" in record:
-                match_found = False
-                for match in all_matches:
-                    if match.get("match_number") == record.get("match_number"):
-                        match_found = True
-                        break
-
-                if not match_found:
-                    all_matches.append(
-                        {
-                            "match_number": record.get("match_number"),
-                            "comp_level": "qm",  # Assuming all are qualification matches
-                        }
-                    )
+                match_number = record.get("match_number")
+                if match_number in seen_match_numbers:
+                    continue
+                seen_match_numbers.add(match_number)
+                all_matches.append(
+                    {
+                        "match_number": match_number,
+                        "comp_level": "qm",  # Assuming all are qualification matches
+                    }
+                )
 
     print(f"\U0001f535 Extracted {len(all_scouting_records)} scouting records for validation")
     print(f"\U0001f535 Extracted {len(all_matches)} unique matches for validation")
@@ -717,6 +911,7 @@ async def build_unified_dataset(
             "scouting_headers": headers,
             "superscouting_headers": superscouting_headers,
             "created_timestamp": __import__("datetime").datetime.now().isoformat(),
+            "incremental": bool(event_context),
         },
         # Add top-level matches and scouting arrays for validation
         "matches": all_matches,
@@ -725,8 +920,32 @@ async def build_unified_dataset(
 
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(output_payload, f, indent=2)
+    dataset_registry.invalidate(output_path)
 
     print(f"\u2705 Unified dataset saved to: {output_path}")
+
+    # Save row watermarks and hashes so the next incremental build can skip unchanged rows,
+    # and the raw (unsanitized) TBA and Statbotics data it reuses
+    try:
+        with open(get_row_state_path(event_key), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "event_key": event_key,
+                    "tabs": {
+                        "scouting": scouting_state.to_dict(),
+                        "superscouting": superscouting_state.to_dict(),
+                    },
+                    "event_context": {
+                        "event_teams": event_teams,
+                        "expected_matches": expected_matches,
+                        "statbotics": [[number, info] for number, info in statbotics_data.items()],
+                        "rankings": event_rankings,
+                    },
+                },
+                f,
+            )
+    except Exception as e:
+        print(f"\U0001f534 Could not save row state for incremental rebuilds: {e}")
     print(f"\u2705 Dataset contains {len(expected_matches)} expected match-team combinations")
     print(f"\u2705 Dataset contains {len(unified_data)} teams")
 
@@ -0,0 +1,78 @@
+# backend/tests/test_services/test_batch_planner.py
+
+import os
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.batch_planner import BatchPlanner
+
+
+def output_tokens(team_count):
+    return 20 + 10 * team_count
+
+
+class TestBatchPlanner:
+    """Test suite for the token-budget batch planner."""
+
+    def test_everything_fits_in_one_batch(self):
+        """Teams that fit the budget together are ranked in a single call."""
+        planner = BatchPlanner(input_budget=10_000, output_budget=1000, safety_margin=0.0)
+        plan = planner.plan([(n, 100) for n in range(1, 31)], fixed_input_tokens=500, output_tokens=output_tokens)
+
+        assert plan.batch_count == 1
+        assert plan.batches[0].input_tokens == 3500
+        assert plan.batches[0].output_tokens == 320
+        assert plan.fits_budget
+
+    def test_packs_into_fewest_balanced_batches(self):
+        """Heavy teams are spread so every batch fits and loads stay even."""
+        costs = [(n, 400 if n % 4 == 0 else 100) for n in range(1, 41)]
+        planner = BatchPlanner(input_budget=3000, output_budget=10_000, safety_margin=0.0)
+        plan = planner.plan(costs, fixed_input_tokens=500, output_tokens=output_tokens)
+
+        # 7000 tokens of teams at 2500 per call needs at least three calls
+        assert plan.batch_count == 3
+        assert plan.fits_budget
+        assert sorted(n for b in plan.batches for n in b.team_numbers) == list(range(1, 41))
+        loads = [b.input_tokens for b in plan.batches]
+        assert max(loads) - min(loads) <= 400
+        for batch in plan.batches:
+            assert batch.team_numbers == sorted(batch.team_numbers)
+
+    def test_output_budget_limits_teams_per_batch(self):
+        """Cheap prompts still split when the completion would exceed the output budget."""
+        planner = BatchPlanner(input_budget=100_000, output_budget=220, safety_margin=0.0)
+        plan = planner.plan([(n, 5) for n in range(1, 51)], fixed_input_tokens=100, output_tokens=output_tokens)
+
+        # At most 20 teams per call (20 + 10 * 20 = 220)
+        assert plan.batch_count == 3
+        assert all(len(b.team_numbers) <= 20 for b in plan.batches)
+
+    def test_anchors_join_every_batch(self):
+        """Anchor teams are charged to, and listed first in, every batch."""
+        planner = BatchPlanner(input_budget=1500, output_budget=10_000, safety_margin=0.0)
+        plan = planner.plan(
+            [(n, 100) for n in range(1, 21)], fixed_input_tokens=300, output_tokens=output_tokens,
+            anchor_team_numbers=[5, 12],
+        )
+
+        # 1500 - 300 - 200 leaves room for 10 of the 18 other teams per call
+        assert plan.batch_count == 2
+        for batch in plan.batches:
+            assert batch.team_numbers[:2] == [5, 12]
+            assert batch.input_tokens <= 1500
+
+    def test_fixed_batch_size_and_report(self):
+        """A fixed batch size slices teams in order and the plan still reports estimates."""
+        planner = BatchPlanner(input_budget=900, output_budget=10_000, latency_base_seconds=1.0,
+                               input_tokens_per_second=1000, output_tokens_per_second=100)
+        plan = planner.plan([(n, 100) for n in range(1, 26)], fixed_input_tokens=0,
+                            output_tokens=output_tokens, batch_size=10)
+        summary = plan.to_dict(concurrency=2)
+
+        assert [b["team_count"] for b in summary["batches"]] == [10, 10, 5]
+        assert summary["mode"] == "fixed"
+        assert not summary["fits_budget"]
+        # Batches take 1 + 1.0 + 1.2 s (10 teams) and 1 + 0.5 + 0.7 s; two at a time
+        assert summary["estimated_seconds"] == 5.4
@@ -0,0 +1,89 @@
+# backend/tests/test_services/test_cache_service.py
+
+import asyncio
+import os
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.cache_service import CacheService, cached
+
+
+class TestCachedDecorator:
+    """Test suite for the cached decorator's refresh option."""
+
+    @pytest.fixture(autouse=True)
+    def memory_cache(self, monkeypatch):
+        monkeypatch.setattr(CacheService, "_memory_cache", {})
+
+    def test_refresh_cache_bypasses_and_updates_sync(self):
+        """refresh_cache=True calls the function and replaces the cached value."""
+        values = iter([1, 2, 3])
+
+        @cached(persist=False)
+        def next_value(key):
+            return next(values)
+
+        assert next_value("a") == 1
+        assert next_value("a") == 1
+        assert next_value("a", refresh_cache=True) == 2
+        assert next_value("a") == 2
+
+    def test_refresh_cache_bypasses_and_updates_async(self):
+        """Async functions support the same refresh keyword under the same cache key."""
+        calls = []
+
+        @cached(persist=False)
+        async def fetch_rankings(event_key):
+            calls.append(event_key)
+            return {"call": len(calls)}
+
+        async def run():
+            return [
+                await fetch_rankings("2099test"),
+                await fetch_rankings("2099test", refresh_cache=True),
+                await fetch_rankings("2099test"),
+            ]
+
+        assert asyncio.run(run()) == [{"call": 1}, {"call": 2}, {"call": 2}]
+        assert calls == ["2099test", "2099test"]
+
+
+class TestMemoryCache:
+    """Test suite for the in-memory cache shared with executor threads."""
+
+    @pytest.fixture(autouse=True)
+    def memory_cache(self, monkeypatch):
+        monkeypatch.setattr(CacheService, "_memory_cache", {})
+
+    def test_expired_entry_removed_once_across_threads(self, monkeypatch, tmp_path):
+        """Two threads finding the same expired entry do not both try to remove it."""
+        from app.services import cache_service as cache_module
+
+        missing_file = str(tmp_path / "missing.json")
+        monkeypatch.setattr(CacheService, "_get_cache_file_path", staticmethod(lambda key: missing_file))
+        CacheService.save_to_cache("epa-254", {"epa": 25.4}, persist=False)
+
+        # Hold every expiry check until both threads are inside it (or the lock keeps one out)
+        both_checking = threading.Barrier(2, timeout=0.2)
+
+        def clock():
+            try:
+                both_checking.wait()
+            except threading.BrokenBarrierError:
+                pass
+            return time.time()
+
+        monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=clock))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lookups = [
+                executor.submit(CacheService.get_cached_data, "epa-254", max_age_seconds=-1) for _ in range(2)
+            ]
+            assert [lookup.result() for lookup in lookups] == [None, None]
+        assert "epa-254" not in CacheService._memory_cache
@@ -0,0 +1,68 @@
+# backend/tests/test_services/test_dataset_registry.py
+
+import json
+import os
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.dataset_registry import DatasetRegistry
+
+
+class TestDatasetRegistry:
+    """Test suite for the shared unified dataset registry."""
+
+    @pytest.fixture
+    def dataset_file(self, tmp_path):
+        path = tmp_path / "unified_event_2025test.json"
+        path.write_text(json.dumps({"event_key": "2025test", "teams": {"254": {}}}))
+        return str(path)
+
+    def test_parses_once(self, dataset_file):
+        """Repeated lookups of an unchanged file share one parsed dataset."""
+        registry = DatasetRegistry()
+
+        first = registry.get(dataset_file)
+        second = registry.get(dataset_file)
+
+        assert first is second
+        assert registry.get_stats()["loads"] == 1
+        assert registry.get_stats()["hits"] == 1
+
+    def test_touched_file_is_not_reparsed(self, dataset_file):
+        """A new mtime with identical content only revalidates the hash."""
+        registry = DatasetRegistry()
+        first = registry.get(dataset_file)
+
+        stat = os.stat(dataset_file)
+        os.utime(dataset_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        assert registry.get(dataset_file) is first
+        assert registry.get_stats()["revalidations"] == 1
+
+    def test_changed_file_is_reloaded(self, dataset_file):
+        """Changed content produces a new snapshot and version."""
+        registry = DatasetRegistry()
+        old_version = registry.get_snapshot(dataset_file).version
+
+        with open(dataset_file, "w", encoding="utf-8") as f:
+            json.dump({"event_key": "2025test", "teams": {}, "year": 2025}, f)
+
+        snapshot = registry.get_snapshot(dataset_file)
+        assert snapshot.data["teams"] == {}
+        assert snapshot.version != old_version
+
+    def test_mutable_copy_is_private(self, dataset_file):
+        """Edits to a mutable copy never leak into the shared snapshot."""
+        registry = DatasetRegistry()
+
+        copy = registry.get_mutable(dataset_file)
+        copy["teams"]["254"]["edited"] = True
+
+        assert registry.get(dataset_file)["teams"]["254"] == {}
+
+    def test_missing_file(self, tmp_path):
+        """Missing files raise FileNotFoundError for callers to handle."""
+        with pytest.raises(FileNotFoundError):
+            DatasetRegistry().get(str(tmp_path / "missing.json"))
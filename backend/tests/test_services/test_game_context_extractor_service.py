@@ -313,7 +313,7 @@ class TestGameContextExtractorService:
     @pytest.mark.asyncio
     async def test_extract_game_context_success(self, temp_cache_dir, sample_manual_data, mock_openai_client):
         """Test successful game context extraction."""
-        with patch('app.services.game_context_extractor_service.AsyncOpenAI', return_value=mock_openai_client):
+        with patch('app.services.game_context_extractor_service.create_llm_client', return_value=mock_openai_client):
             service = GameContextExtractorService(cache_dir=temp_cache_dir)
             
             result = await service.extract_game_context(sample_manual_data)
@@ -346,7 +346,7 @@ class TestGameContextExtractorService:
     @pytest.mark.asyncio
     async def test_extract_game_context_force_refresh(self, temp_cache_dir, sample_manual_data, mock_openai_client):
         """Test extraction with force refresh bypasses cache."""
-        with patch('app.services.game_context_extractor_service.AsyncOpenAI', return_value=mock_openai_client):
+        with patch('app.services.game_context_extractor_service.create_llm_client', return_value=mock_openai_client):
             service = GameContextExtractorService(cache_dir=temp_cache_dir)
             
             # Cache a result first
@@ -393,10 +393,10 @@ class TestGameContextExtractorService:
     @pytest.mark.asyncio
     async def test_perform_extraction_api_error(self, temp_cache_dir, sample_manual_data):
         """Test extraction handling of API errors."""
-        with patch('app.services.game_context_extractor_service.AsyncOpenAI') as mock_openai:
+        with patch('app.services.game_context_extractor_service.create_llm_client') as mock_create_client:
             mock_client = AsyncMock()
             mock_client.chat.completions.create.side_effect = Exception("API Error")
-            mock_openai.return_value = mock_client
+            mock_create_client.return_value = mock_client
             
             service = GameContextExtractorService(cache_dir=temp_cache_dir)
             
@@ -408,7 +408,7 @@ class TestGameContextExtractorService:
     @pytest.mark.asyncio 
     async def test_perform_extraction_invalid_json(self, temp_cache_dir, sample_manual_data):
         """Test extraction handling of invalid JSON response."""
-        with patch('app.services.game_context_extractor_service.AsyncOpenAI') as mock_openai:
+        with patch('app.services.game_context_extractor_service.create_llm_client') as mock_create_client:
             mock_client = AsyncMock()
             mock_response = Mock()
             mock_choice = Mock()
@@ -419,7 +419,7 @@ class TestGameContextExtractorService:
             mock_choice.finish_reason = "stop"
             mock_response.choices = [mock_choice]
             mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
+            mock_create_client.return_value = mock_client
             
             service = GameContextExtractorService(cache_dir=temp_cache_dir)
             
@@ -431,7 +431,7 @@ class TestGameContextExtractorService:
     @pytest.mark.asyncio
     async def test_perform_extraction_truncated_response(self, temp_cache_dir, sample_manual_data):
         """Test extraction handling of truncated response."""
-        with patch('app.services.game_context_extractor_service.AsyncOpenAI') as mock_openai:
+        with patch('app.services.game_context_extractor_service.create_llm_client') as mock_create_client:
             mock_client = AsyncMock()
             mock_response = Mock()
             mock_choice = Mock()
@@ -439,7 +439,7 @@ class TestGameContextExtractorService:
             mock_choice.finish_reason = "length"  # Truncated due to length
             mock_response.choices = [mock_choice]
             mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
+            mock_create_client.return_value = mock_client
             
             service = GameContextExtractorService(cache_dir=temp_cache_dir)
             
@@ -0,0 +1,49 @@
+# backend/tests/test_services/test_incremental_json_parser.py
+
+import json
+import os
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.incremental_json_parser import IncrementalJSONArrayParser
+
+
+class TestIncrementalJSONArrayParser:
+    """Test suite for the streaming JSON array parser."""
+
+    RESPONSE = json.dumps({
+        "p": [
+            [3, 9.5, "Best auto, beats [Team 2] on \"endgame\""],
+            [1, 8.8, "Solid {teleop}"],
+            [2, 7.1, "Consistent"],
+        ],
+        "s": "ok",
+    })
+
+    def test_elements_emitted_as_soon_as_complete(self):
+        """Each entry is returned by the feed() call that completes it, whatever the chunking."""
+        parser = IncrementalJSONArrayParser("p")
+        emitted = []
+        first_entry_end = self.RESPONSE.index('"],') + 2
+
+        for i, ch in enumerate(self.RESPONSE):
+            for item in parser.feed(ch):
+                emitted.append((i, item))
+
+        assert [item for _, item in emitted] == [
+            (1, [3, 9.5, 'Best auto, beats [Team 2] on "endgame"']),
+            (2, [1, 8.8, "Solid {teleop}"]),
+            (3, [2, 7.1, "Consistent"]),
+        ]
+        assert emitted[0][0] == first_entry_end - 1
+        assert parser.done
+
+    def test_key_split_across_chunks(self):
+        """The array key may arrive split over several chunks."""
+        parser = IncrementalJSONArrayParser("teams")
+        text = '{"status": "ok", "teams": [{"team_number": 254}, {"team_number": 1678}]}'
+
+        items = parser.feed(text[:12]) + parser.feed(text[12:20]) + parser.feed(text[20:])
+
+        assert [value["team_number"] for _, value in items] == [254, 1678]
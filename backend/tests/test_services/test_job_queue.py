@@ -0,0 +1,109 @@
+# backend/tests/test_services/test_job_queue.py
+
+import asyncio
+import os
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.job_queue import JOB_PRIORITY_HIGH, JOB_PRIORITY_LOW, JobQueue, JobQueueFullError
+from app.services.progress_tracker import ProgressTracker
+
+
+async def wait_for(queue, job_id, statuses=("completed", "failed", "cancelled")):
+    for _ in range(200):
+        if queue.get_job(job_id)["status"] in statuses:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+class TestJobQueue:
+    """Test suite for the background job queue."""
+
+    def test_result_published_through_progress(self):
+        """Finished jobs expose their result through ProgressTracker."""
+        async def scenario():
+            queue = JobQueue(workers=1)
+
+            async def work():
+                return {"status": "success", "picklist": [254]}
+
+            job = queue.submit("picklist", work, job_id="test_job_result")
+            await wait_for(queue, job.job_id)
+            return ProgressTracker.get_progress(job.job_id)
+
+        progress = asyncio.run(scenario())
+
+        assert progress["status"] == "completed"
+        assert progress["result"]["picklist"] == [254]
+        assert "result" not in ProgressTracker.list_operations()["test_job_result"]
+
+    def test_priority_order(self):
+        """With one worker, higher priority jobs run before earlier low priority ones."""
+        async def scenario():
+            queue = JobQueue(workers=1)
+            order = []
+            gate = asyncio.Event()
+
+            async def blocker():
+                await gate.wait()
+
+            def record(name):
+                async def work():
+                    order.append(name)
+                return work
+
+            queue.submit("test", blocker, job_id="test_job_blocker")
+            await asyncio.sleep(0)
+            queue.submit("test", record("low"), job_id="test_job_low", priority=JOB_PRIORITY_LOW)
+            queue.submit("test", record("high"), job_id="test_job_high", priority=JOB_PRIORITY_HIGH)
+            gate.set()
+            await wait_for(queue, "test_job_low")
+            return order
+
+        assert asyncio.run(scenario()) == ["high", "low"]
+
+    def test_cancel_queued_and_running(self):
+        """Queued jobs never start and running jobs are interrupted."""
+        async def scenario():
+            queue = JobQueue(workers=1)
+            started = []
+
+            async def slow():
+                started.append(True)
+                await asyncio.sleep(10)
+
+            queue.submit("test", slow, job_id="test_job_running")
+            queue.submit("test", slow, job_id="test_job_queued")
+            await asyncio.sleep(0.01)
+
+            assert queue.cancel("test_job_queued")
+            assert queue.cancel("test_job_running")
+            await wait_for(queue, "test_job_running")
+            return started
+
+        assert asyncio.run(scenario()) == [True]
+        assert ProgressTracker.get_progress("test_job_running")["status"] == "cancelled"
+        assert ProgressTracker.get_progress("test_job_queued")["status"] == "cancelled"
+
+    def test_duplicate_and_full_queue(self):
+        """Active job ids are not queued twice and the pending limit is enforced."""
+        async def scenario():
+            queue = JobQueue(workers=1, max_pending=1)
+            gate = asyncio.Event()
+
+            async def blocker():
+                await gate.wait()
+
+            first = queue.submit("test", blocker, job_id="test_job_dup")
+            await asyncio.sleep(0)
+            assert queue.submit("test", blocker, job_id="test_job_dup") is first
+
+            queue.submit("test", blocker, job_id="test_job_pending")
+            with pytest.raises(JobQueueFullError):
+                queue.submit("test", blocker, job_id="test_job_rejected")
+            gate.set()
+
+        asyncio.run(scenario())
@@ -0,0 +1,115 @@
+# backend/tests/test_services/test_llm_gateway.py
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services import llm_gateway as gateway_module
+from app.services.llm_gateway import (
+    LLM_PRIORITY_BATCH,
+    LLM_PRIORITY_INTERACTIVE,
+    LLMGateway,
+    TokenBucket,
+)
+
+
+class APIError(Exception):
+    """Error shaped like openai.APIStatusError."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+class FakeClient:
+    """Stand-in for AsyncOpenAI that fails a given number of times first."""
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs["messages"][0]["content"])
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(usage=None)
+
+
+MESSAGES = [{"role": "user", "content": "rank teams"}]
+
+
+class TestLLMGateway:
+    """Test suite for the shared OpenAI rate-limit gateway."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Make backoff sleeps instant while keeping the delays observable."""
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay, *args):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(gateway_module.asyncio, "sleep", fake_sleep)
+        return delays
+
+    def test_token_bucket_wait(self):
+        """An empty bucket reports the time until enough tokens refill."""
+        bucket = TokenBucket(per_minute=60)
+        bucket.consume(60)
+
+        assert bucket.time_until(1) == pytest.approx(1.0, abs=0.05)
+        assert bucket.time_until(600) == pytest.approx(60.0, abs=0.5)
+
+    def test_retry_after_is_honoured(self, no_sleep):
+        """429 responses are retried after the server's Retry-After delay."""
+        gateway = LLMGateway(requests_per_minute=1000, tokens_per_minute=10_000_000)
+        client = FakeClient(errors=[APIError(429, {"retry-after": "0.2"})])
+
+        asyncio.run(gateway.chat_completion(client, model="gpt-4o", messages=MESSAGES, max_tokens=10))
+
+        assert len(client.calls) == 2
+        assert no_sleep[0] >= 0.2
+        assert gateway.get_stats()["rate_limited"] == 1
+
+    def test_non_retryable_error_raises(self):
+        """Client errors such as 400 are not retried."""
+        gateway = LLMGateway(requests_per_minute=1000, tokens_per_minute=10_000_000)
+        client = FakeClient(errors=[APIError(400)])
+
+        with pytest.raises(APIError):
+            asyncio.run(gateway.chat_completion(client, model="gpt-4o", messages=MESSAGES))
+        assert len(client.calls) == 1
+
+    def test_interactive_lane_admitted_first(self):
+        """When capacity frees up, interactive calls go ahead of queued batch calls."""
+        async def scenario():
+            gateway = LLMGateway(requests_per_minute=6000, tokens_per_minute=10_000_000)
+            gateway.request_bucket.consume(gateway.request_bucket.capacity)
+            client = FakeClient()
+
+            def call(name, priority):
+                messages = [{"role": "user", "content": name}]
+                return gateway.chat_completion(client, priority=priority, model="gpt-4o", messages=messages)
+
+            batch = [asyncio.ensure_future(call(f"batch{i}", LLM_PRIORITY_BATCH)) for i in range(3)]
+            for _ in range(5):
+                await asyncio.sleep(0)
+            interactive = asyncio.ensure_future(call("interactive", LLM_PRIORITY_INTERACTIVE))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert gateway.get_stats()["queue_depth_by_lane"] == {"batch": 3, "interactive": 1}
+
+            await asyncio.gather(interactive, *batch)
+            return client.calls
+
+        calls = asyncio.run(scenario())
+        assert calls[0] == "interactive"
@@ -0,0 +1,118 @@
+# backend/tests/test_services/test_llm_provider.py
+
+import asyncio
+import json
+import os
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services import llm_gateway as gateway_module
+from app.services.llm_gateway import LLMGateway
+from app.services.llm_provider import LocalStubProvider, StubAPIError, create_llm_client
+
+
+def picklist_messages(system_marker):
+    teams = [
+        {"index": 1, "team_number": 111, "weighted_score": 2.0},
+        {"index": 2, "team_number": 222, "weighted_score": 8.0},
+        {"index": 3, "team_number": 333, "weighted_score": 5.0},
+    ]
+    return [
+        {"role": "system", "content": f"Return JSON:\n{system_marker}"},
+        {"role": "user", "content": f"YOUR_TEAM_NUMBER = 999\nAVAILABLE_TEAMS = {json.dumps(teams)}     # scores"},
+    ]
+
+
+class TestLocalStubProvider:
+    """Test suite for the local LLM stub provider."""
+
+    def test_factory_selects_stub(self):
+        """LLM_PROVIDER=stub yields a client with the chat.completions.create surface."""
+        client = create_llm_client("stub")
+
+        assert isinstance(client, LocalStubProvider)
+        assert callable(client.chat.completions.create)
+
+    def test_openai_client_leaves_retries_to_gateway(self):
+        """The OpenAI SDK does not retry on its own, outside the gateway's rate limits."""
+        client = create_llm_client("openai")
+
+        assert client.max_retries == 0
+
+    def test_compact_picklist_ranked_by_weighted_score(self):
+        """Ultra-compact picklist prompts get every index back, best weighted score first."""
+        stub = LocalStubProvider()
+        response = asyncio.run(stub.chat.completions.create(
+            model="gpt-4o",
+            messages=picklist_messages('{"p":[[index,score,"reason"]…],"s":"ok"}'),
+            response_format={"type": "json_object"},
+        ))
+
+        data = json.loads(response.choices[0].message.content)
+        assert [entry[0] for entry in data["p"]] == [2, 3, 1]
+        assert data["s"] == "ok"
+        assert response.choices[0].finish_reason == "stop"
+        assert response.usage.total_tokens > 0
+
+    def test_standard_picklist_format(self):
+        """Standard picklist prompts get team numbers with scores and reasoning."""
+        stub = LocalStubProvider()
+        response = asyncio.run(stub.chat.completions.create(
+            model="gpt-4o",
+            messages=picklist_messages('{"teams": [{"team_number": int, "score": float}], "status": "ok"}'),
+        ))
+
+        data = json.loads(response.choices[0].message.content)
+        assert [team["team_number"] for team in data["teams"]] == [222, 333, 111]
+        assert data["teams"][0]["score"] == 10.0
+
+    def test_injected_errors_are_retried_by_gateway(self, monkeypatch):
+        """Injected 429s carry Retry-After and are absorbed by the gateway retries."""
+        stub = LocalStubProvider(error_rate=1.0, seed="errors")
+        with pytest.raises(StubAPIError) as error:
+            asyncio.run(stub.chat.completions.create(model="gpt-4o", messages=[]))
+        assert error.value.status_code == 429
+        assert error.value.response.headers["retry-after"] == "1.0"
+
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay, *args):
+            await real_sleep(0)
+
+        monkeypatch.setattr(gateway_module.asyncio, "sleep", fake_sleep)
+        flaky = LocalStubProvider(error_rate=0.5, seed="flaky")
+        gateway = LLMGateway(requests_per_minute=10_000, tokens_per_minute=10_000_000, max_retries=20)
+
+        response = asyncio.run(gateway.chat_completion(
+            flaky, model="gpt-4o", messages=[{"role": "user", "content": "hello"}]
+        ))
+
+        assert response.choices[0].message.content == "Local stub response."
+        assert flaky.calls == gateway.get_stats()["requests"]
+
+    def test_rank_only_picklist_format(self):
+        """Rank-only prompts get just the ordered indices."""
+        stub = LocalStubProvider()
+        response = asyncio.run(stub.chat.completions.create(
+            model="gpt-4o",
+            messages=picklist_messages('{"r":[index,index,…],"s":"ok"}'),
+            response_format={"type": "json_object"},
+        ))
+
+        assert json.loads(response.choices[0].message.content) == {"r": [2, 3, 1], "s": "ok"}
+
+    def test_table_encoded_prompt(self):
+        """Teams are read from a TEAM_TABLE block as well as from AVAILABLE_TEAMS JSON."""
+        stub = LocalStubProvider()
+        table = "TEAM_TABLE  # one row per team\nLEGEND:\nATP=Auto Total Points\ni|team|name|score|ATP\n1|111|A|2|Low\n2|222|B|8|High\n3|333|C|5|Med"
+        response = asyncio.run(stub.chat.completions.create(
+            model="gpt-4o",
+            messages=[
+                {"role": "system", "content": '{"r":[index,index,…],"s":"ok"}'},
+                {"role": "user", "content": table},
+            ],
+        ))
+
+        assert json.loads(response.choices[0].message.content)["r"] == [2, 3, 1]
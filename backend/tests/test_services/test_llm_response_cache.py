@@ -0,0 +1,144 @@
+# backend/tests/test_services/test_llm_response_cache.py
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.llm_provider import LocalStubProvider
+from app.services.llm_response_cache import LLMResponseCache, cached_chat_completion
+
+
+class FakeClient:
+    """Minimal stand-in for AsyncOpenAI that counts completion calls."""
+
+    def __init__(self, content="{}", finish_reason="stop"):
+        self.calls = 0
+        self.content = content
+        self.finish_reason = finish_reason
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        choice = SimpleNamespace(
+            message=SimpleNamespace(content=self.content), finish_reason=self.finish_reason
+        )
+        return SimpleNamespace(choices=[choice])
+
+
+class TestLLMResponseCache:
+    """Test suite for the on-disk LLM response cache."""
+
+    MESSAGES = [{"role": "system", "content": "rank"}, {"role": "user", "content": "teams"}]
+
+    def test_key_covers_request_settings(self):
+        """Any setting that changes the response changes the key."""
+        base = LLMResponseCache.make_key("gpt-4o", self.MESSAGES, 0.2, {"type": "json_object"})
+
+        assert base == LLMResponseCache.make_key("gpt-4o", list(self.MESSAGES), 0.2, {"type": "json_object"})
+        assert base != LLMResponseCache.make_key("gpt-4o", self.MESSAGES, 0.3, {"type": "json_object"})
+        assert base != LLMResponseCache.make_key("gpt-4.1", self.MESSAGES, 0.2, {"type": "json_object"})
+        assert base != LLMResponseCache.make_key("gpt-4o", self.MESSAGES, 0.2, None)
+
+    def test_repeat_request_served_from_disk(self, tmp_path):
+        """A second identical request does not reach the API."""
+        cache = LLMResponseCache(cache_dir=str(tmp_path))
+        client = FakeClient(content='{"p": []}')
+
+        for _ in range(2):
+            content, finish_reason = asyncio.run(
+                cached_chat_completion(client, "gpt-4o", self.MESSAGES, 0.2, cache=cache)
+            )
+
+        assert content == '{"p": []}'
+        assert finish_reason == "stop"
+        assert client.calls == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_truncated_response_not_cached(self, tmp_path):
+        """Responses cut off by the token limit are retried next time."""
+        cache = LLMResponseCache(cache_dir=str(tmp_path))
+        client = FakeClient(finish_reason="length")
+
+        for _ in range(2):
+            asyncio.run(cached_chat_completion(client, "gpt-4o", self.MESSAGES, cache=cache))
+
+        assert client.calls == 2
+
+    def test_ttl_expires_entries(self, tmp_path):
+        """Entries older than the TTL are treated as misses."""
+        cache = LLMResponseCache(cache_dir=str(tmp_path), ttl_seconds=60)
+        cache.put("ab" * 32, "old")
+
+        # Backdate the entry past the TTL
+        entry_path = cache._entry_path("ab" * 32)
+        with open(entry_path, "w", encoding="utf-8") as f:
+            f.write('{"content": "old", "created_at": %f}' % (time.time() - 120))
+
+        assert cache.get("ab" * 32) is None
+        assert cache.get_stats()["expired"] == 1
+        assert not os.path.exists(entry_path)
+
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used entries are evicted once the size limit is exceeded."""
+        cache = LLMResponseCache(cache_dir=str(tmp_path))
+        keys = [str(i) * 64 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, "x" * 150)
+            # Distinct mtimes so recency is unambiguous
+            os.utime(cache._entry_path(key), (1000 + i, 1000 + i))
+
+        # Room for three and a half entries
+        entry_size = os.path.getsize(cache._entry_path(keys[0]))
+        cache.max_bytes = entry_size * 7 // 2
+
+        # Touch the oldest entry so the second one becomes least recently used
+        assert cache.get(keys[0]) is not None
+        cache.put("9" * 64, "x" * 150)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get_stats()["evictions"] >= 1
+
+    def test_streamed_response_delivered_and_cached(self, tmp_path):
+        """With on_delta the response is streamed in pieces and the joined content is cached."""
+        cache = LLMResponseCache(cache_dir=str(tmp_path))
+        stub = LocalStubProvider()
+        # Same call surface as the stub, but not a stub, so responses are cached
+        client = SimpleNamespace(chat=stub.chat)
+        messages = [
+            {"role": "system", "content": '{"p":[[index,score,"reason"]],"s":"ok"}'},
+            {"role": "user", "content": 'AVAILABLE_TEAMS = [{"index": 1, "team_number": 254, "weighted_score": 9.0}]'},
+        ]
+        deltas = []
+
+        content, finish_reason = asyncio.run(
+            cached_chat_completion(client, "gpt-4o", messages, cache=cache, on_delta=deltas.append)
+        )
+
+        assert len(deltas) > 1
+        assert "".join(deltas) == content
+        assert finish_reason == "stop"
+
+        replayed = []
+        asyncio.run(cached_chat_completion(client, "gpt-4o", messages, cache=cache, on_delta=replayed.append))
+        assert replayed == [content]
+        assert stub.calls == 1
+
+    def test_stub_provider_bypasses_cache(self, tmp_path):
+        """Stub calls always reach the stub and never leave responses for real clients."""
+        cache = LLMResponseCache(cache_dir=str(tmp_path))
+        stub = LocalStubProvider()
+
+        for _ in range(2):
+            asyncio.run(cached_chat_completion(stub, "gpt-4o", self.MESSAGES, 0.2, cache=cache))
+        client = FakeClient(content='{"p": []}')
+        content, _ = asyncio.run(cached_chat_completion(client, "gpt-4o", self.MESSAGES, 0.2, cache=cache))
+
+        assert stub.calls == 2
+        assert client.calls == 1
+        assert content == '{"p": []}'
+        assert cache.get_stats()["stores"] == 1
@@ -0,0 +1,185 @@
+# backend/tests/test_services/test_metric_matrix_service.py
+
+import os
+import numpy as np
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.metric_matrix_service import (
+    MetricMatrix,
+    TeamMetricTable,
+    build_match_outcome_lookup,
+    get_team_metric_table,
+)
+
+
+class TestMetricMatrix:
+    """Test suite for the vectorized metric statistics engine."""
+
+    @pytest.fixture
+    def dataset(self):
+        """Two teams, eight matches, with TBA results for every match."""
+        tba_matches = [
+            {
+                "match_number": m,
+                "alliances": {"red": {"winner": m % 2 == 0}, "blue": {"winner": m % 2 == 1}},
+            }
+            for m in range(1, 9)
+        ]
+        teams = {
+            "254": {
+                "scouting_data": [
+                    {"team_number": 254, "match_number": m, "alliance_color": "red", "auto_points": 10 + m}
+                    for m in range(1, 9)
+                ],
+                "superscouting_data": [
+                    {"team_number": 254, "qual_number": 1, "robot_group": 1, "defense": 4}
+                ],
+            },
+            "118": {
+                "scouting_data": [
+                    {"team_number": 118, "match_number": m, "alliance_color": "blue", "auto_points": 5}
+                    for m in range(1, 9)
+                ],
+            },
+        }
+        return {"teams": teams, "tba_matches": tba_matches}
+
+    def test_outcome_lookup(self, dataset):
+        """Match outcomes are keyed by (match_number, alliance)."""
+        lookup = build_match_outcome_lookup(dataset)
+
+        assert lookup[(2, "red")] is True
+        assert lookup[(2, "blue")] is False
+        assert (9, "red") not in lookup
+
+    def test_matrix_shape_excludes_id_fields(self, dataset):
+        """Identifier fields are not metrics; missing cells are NaN."""
+        matrix = MetricMatrix(dataset)
+
+        assert matrix.metric_names == ["auto_points", "defense"]
+        assert matrix.values.shape == (17, 2)
+        assert np.isnan(matrix.values[0, matrix.metric_index["defense"]])
+
+    def test_statistics(self, dataset):
+        """Statistics match a direct NumPy computation over the same values."""
+        stats = MetricMatrix(dataset).metric_statistics()
+
+        values = np.array([10 + m for m in range(1, 9)] + [5] * 8, dtype=float)
+        wins = np.array([m % 2 == 0 for m in range(1, 9)] + [m % 2 == 1 for m in range(1, 9)], dtype=float)
+
+        assert stats["auto_points"]["mean"] == pytest.approx(values.mean())
+        assert stats["auto_points"]["std"] == pytest.approx(values.std())
+        assert stats["auto_points"]["min"] == 5.0
+        assert stats["auto_points"]["max"] == 18.0
+        assert stats["auto_points"]["correlation_to_win"] == pytest.approx(np.corrcoef(values, wins)[0, 1])
+
+    def test_correlation_needs_enough_pairs(self, dataset):
+        """Metrics with too few known outcomes report zero correlation."""
+        stats = MetricMatrix(dataset).metric_statistics()
+
+        assert stats["defense"]["correlation_to_win"] == 0.0
+        assert stats["defense"]["mean"] == 4.0
+
+    def test_empty_dataset(self):
+        """An empty dataset yields no statistics."""
+        assert MetricMatrix({}).metric_statistics() == {}
+
+
+class TestTeamMetricTable:
+    """Test suite for matrix-based team ranking."""
+
+    @pytest.fixture
+    def dataset(self):
+        return {
+            "teams": {
+                "254": {
+                    "nickname": "The Cheesy Poofs",
+                    "scouting_data": [
+                        {"team_number": 254, "match_number": 1, "auto_points": 10},
+                        {"team_number": 254, "match_number": 2, "auto_points": 10},
+                    ],
+                    "statbotics_info": {"epa": 40.0},
+                },
+                "118": {
+                    "scouting_data": [
+                        {"team_number": 118, "match_number": 1, "auto_points": 20},
+                        {"team_number": 118, "match_number": 2, "auto_points": 0, "is_virtual_scout": True},
+                    ],
+                    "superscouting_data": [{"defense": 4}, {"defense_rating": 2}],
+                },
+                "frc_bad": {"scouting_data": []},
+            }
+        }
+
+    def test_rank_orders_by_weighted_score(self, dataset):
+        """Direct metric weights decide the order; invalid team keys are skipped."""
+        table = TeamMetricTable(dataset)
+
+        assert [r["team_number"] for r in table.rank({"auto_points": 1.0})] == [118, 254]
+        assert [r["team_number"] for r in table.rank({"epa": 1.0})] == [254, 118]
+
+    def test_universal_columns(self, dataset):
+        """Reliability and defense come from their precomputed universal columns."""
+        table = TeamMetricTable(dataset)
+        ranked = {r["team_number"]: r for r in table.rank_teams({"reliability": 2.0, "defense": 1.0})}
+
+        # Constant auto points -> perfect consistency; virtual scout skipped for 118
+        assert ranked[254]["score"] == pytest.approx(20.0)
+        assert ranked[254]["metrics_contribution"][0]["metrics_used"] == ["auto_points"]
+        assert ranked[118]["score"] == pytest.approx(3.0)
+        assert ranked[118]["match_count"] == 1
+
+    def test_unknown_metric_is_ignored(self, dataset):
+        """Weights for metrics no team has do not change scores."""
+        table = TeamMetricTable(dataset)
+
+        assert table.column_for("missing") is None
+        assert all(r["score"] == 0.0 for r in table.rank({"missing": 3.0}))
+
+    def test_weight_sensitivity(self, dataset):
+        """Rank statistics are reported in base rank order and sum up consistently."""
+        table = TeamMetricTable(dataset)
+
+        analysis = table.weight_sensitivity(
+            {"auto_points": 1.0, "epa": 0.5}, samples=500, top_n=1, seed=7
+        )
+        teams = analysis["teams"]
+
+        assert [t["team_number"] for t in teams] == [254, 118]
+        assert teams[0]["base_rank"] == 1
+        assert sum(t["top_n_probability"] for t in teams) == pytest.approx(1.0)
+        for team in teams:
+            low, high = team["rank_interval"]
+            assert 1 <= low <= team["median_rank"] <= high <= 2
+
+    def test_unreadable_dataset_raises(self, tmp_path):
+        """A dataset file that cannot be loaded is an error, not an empty table."""
+        missing = str(tmp_path / "missing.json")
+
+        with pytest.raises(FileNotFoundError):
+            get_team_metric_table(missing)
+        assert get_team_metric_table(missing, {"teams": {}}).rank({"auto_points": 1.0}) == []
+
+    def test_rank_endpoints_report_missing_dataset(self, tmp_path):
+        """The what-if ranking endpoints answer 404 instead of an empty ranking."""
+        import asyncio
+        from fastapi import HTTPException
+        from app.api.picklist_analysis import (
+            RankSensitivityRequest,
+            WeightRankingRequest,
+            analyze_rank_sensitivity,
+            rank_teams_by_weights,
+        )
+
+        missing = str(tmp_path / "missing.json")
+        for endpoint, request_type in [
+            (rank_teams_by_weights, WeightRankingRequest),
+            (analyze_rank_sensitivity, RankSensitivityRequest),
+        ]:
+            request = request_type(unified_dataset_path=missing, weights={"epa": 1.0})
+            with pytest.raises(HTTPException) as error:
+                asyncio.run(endpoint(request))
+            assert error.value.status_code == 404
@@ -0,0 +1,134 @@
+# backend/tests/test_services/test_picklist_generator_pool.py
+
+import json
+import os
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.picklist_generator_pool import PicklistGeneratorPool
+
+
+class FakeGenerator:
+    """Generator stand-in that records its dataset path and reset calls."""
+
+    def __init__(self, unified_dataset_path):
+        self.dataset_path = unified_dataset_path
+        self.resets = 0
+
+    def reset_request_state(self):
+        self.resets += 1
+
+
+def write_dataset(path, teams, year=2099):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"event_key": "2099test", "year": year, "teams": teams}, f)
+
+
+class TestPicklistGeneratorPool:
+    """Test suite for the warm picklist generator pool."""
+
+    @pytest.fixture
+    def dataset_file(self, tmp_path):
+        path = str(tmp_path / "unified_event_2099test.json")
+        write_dataset(path, {"254": {"team_number": 254}})
+        return path
+
+    def test_released_instance_is_reused(self, dataset_file):
+        """A released generator is handed to the next request for the same dataset version."""
+        pool = PicklistGeneratorPool(factory=FakeGenerator)
+
+        first = pool.acquire(dataset_file)
+        pool.release(first)
+        second = pool.acquire(dataset_file)
+
+        assert second is first
+        assert first.resets == 1
+        stats = pool.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_concurrent_requests_get_separate_instances(self, dataset_file):
+        """An acquired instance is never handed out again until it is released."""
+        pool = PicklistGeneratorPool(factory=FakeGenerator, max_idle_per_dataset=1)
+
+        first = pool.acquire(dataset_file)
+        second = pool.acquire(dataset_file)
+        pool.release(first)
+        pool.release(second)
+
+        assert second is not first
+        assert pool.get_stats()["entries"][0]["idle"] == 1
+
+    def test_dataset_change_retires_instances(self, dataset_file):
+        """Instances built from an older version of a dataset are dropped and never reused."""
+        pool = PicklistGeneratorPool(factory=FakeGenerator)
+        old = pool.acquire(dataset_file)
+        pool.release(old)
+        old_version = pool.get_stats()["entries"][0]["version"]
+
+        write_dataset(dataset_file, {"254": {"team_number": 254}, "1678": {"team_number": 1678}})
+        new = pool.acquire(dataset_file)
+        pool.release(new)
+
+        assert new is not old
+        stats = pool.get_stats()
+        assert [entry["version"] for entry in stats["entries"]] != [old_version]
+        assert len(stats["entries"]) == 1
+        assert stats["evictions"] == 1
+        assert pool.acquire(dataset_file) is new
+
+    def test_least_recently_used_dataset_is_evicted(self, tmp_path):
+        """Only max_datasets dataset versions stay warm."""
+        pool = PicklistGeneratorPool(factory=FakeGenerator, max_datasets=1)
+        paths = [str(tmp_path / f"unified_event_{n}.json") for n in range(2)]
+        for path in paths:
+            write_dataset(path, {})
+            pool.release(pool.acquire(path))
+
+        assert [entry["path"] for entry in pool.get_stats()["entries"]] == [os.path.abspath(paths[1])]
+
+    def test_unreadable_dataset_is_not_pooled(self, tmp_path):
+        """A dataset that cannot be loaded gets a fresh, unpooled generator."""
+        pool = PicklistGeneratorPool(factory=FakeGenerator)
+        path = str(tmp_path / "missing.json")
+
+        generator = pool.acquire(path)
+        pool.release(generator)
+
+        assert generator.dataset_path == path
+        assert generator.resets == 0
+        assert pool.get_stats()["entries"] == []
+
+    def test_release_resets_request_state(self, dataset_file, monkeypatch):
+        """Prompt state of the previous request is cleared before a generator is reused."""
+        from app.services import picklist_gpt_service as gpt_module
+        from app.services.data_aggregation_service import DataAggregationService
+        from app.services.llm_provider import LocalStubProvider
+
+        class FakeEncoder:
+            def encode(self, text):
+                return text.split()
+
+        monkeypatch.setattr(gpt_module.tiktoken, "encoding_for_model", lambda model: FakeEncoder())
+        monkeypatch.setattr(gpt_module, "create_llm_client", lambda: LocalStubProvider())
+        monkeypatch.setattr(DataAggregationService, "load_game_context", lambda self: None)
+        pool = PicklistGeneratorPool()
+
+        generator = pool.acquire(dataset_file)
+        gpt_service = generator.gpt_service
+        priorities = [{"id": "auto_points", "weight": 1.0}]
+        teams_data = generator.data_service.get_teams_for_analysis()
+        gpt_service.create_user_prompt(254, "first", priorities, teams_data)
+        gpt_service._percentile_cache["auto_points"] = [1.0]
+        gpt_service._fragment_scope = ("version", "priorities", "teams")
+        assert gpt_service._current_priorities is not None
+        pool.release(generator)
+
+        reused = pool.acquire(dataset_file)
+
+        assert reused is generator
+        assert gpt_service._current_priorities is None
+        assert gpt_service._current_teams_data is None
+        assert gpt_service._percentile_cache == {}
+        assert gpt_service._fragment_scope is None
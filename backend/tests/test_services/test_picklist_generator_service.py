@@ -0,0 +1,296 @@
+# backend/tests/test_services/test_picklist_generator_service.py
+
+import asyncio
+import json
+import os
+import re
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.batch_planner import BatchPlanner
+from app.services.picklist_result_cache import PicklistResultCache
+from app.services.prompt_fragment_cache import PromptFragmentCache
+
+PRIORITIES = [{"id": "auto_points", "weight": 2.0}, {"id": "teleop_points", "weight": 1.0}]
+
+
+class FakeEncoder:
+    """Offline stand-in for a tiktoken encoding: one token per word or symbol."""
+
+    def encode(self, text):
+        return re.findall(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]", text)
+
+
+def write_dataset(path, team_count):
+    teams = {}
+    for n in range(team_count):
+        number = 1000 + n
+        teams[str(number)] = {
+            "team_number": number,
+            "nickname": f"Team {n}",
+            "scouting_data": [
+                {
+                    "team_number": number,
+                    "match_number": match,
+                    "auto_points": (n * 7 + match) % 19,
+                    "teleop_points": (n * 5 + match) % 23,
+                }
+                for match in range(1, 4)
+            ],
+            "superscouting_data": [],
+            "statbotics_info": {},
+            "ranking_info": {},
+        }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"event_key": "2099test", "year": 2099, "teams": teams}, f)
+
+
+class TestPicklistGeneratorService:
+    """Test suite for PicklistGeneratorService with the local stub provider."""
+
+    @pytest.fixture
+    def generator_module(self, monkeypatch):
+        from app.services import llm_response_cache as response_cache_module
+        from app.services import picklist_generator_service as generator_module
+        from app.services import picklist_gpt_service as gpt_module
+        from app.services.data_aggregation_service import DataAggregationService
+        from app.services.llm_provider import LocalStubProvider
+
+        monkeypatch.setattr(gpt_module.tiktoken, "encoding_for_model", lambda model: FakeEncoder())
+        monkeypatch.setattr(gpt_module, "create_llm_client", lambda: LocalStubProvider())
+        monkeypatch.setattr(gpt_module, "prompt_fragment_cache", PromptFragmentCache(max_entries=1000))
+        monkeypatch.setattr(response_cache_module.llm_response_cache, "enabled", False)
+        monkeypatch.setattr(DataAggregationService, "load_game_context", lambda self: None)
+        monkeypatch.setattr(
+            generator_module.PicklistGeneratorService, "_picklist_cache", PicklistResultCache(cache_dir=None)
+        )
+        monkeypatch.setattr(generator_module.PicklistGeneratorService, "_inflight_generations", {})
+        return generator_module
+
+    @pytest.fixture
+    def generator_factory(self, generator_module, tmp_path):
+        def build(team_count=40, input_budget=None):
+            path = str(tmp_path / f"unified_event_{team_count}.json")
+            write_dataset(path, team_count)
+            generator = generator_module.PicklistGeneratorService(path)
+            if input_budget is not None:
+                generator.batch_planner = BatchPlanner(input_budget=input_budget)
+            generator.llm_calls = []
+            generator.before_llm_call = None
+            execute = generator.gpt_service._execute_api_call
+
+            async def counting_execute(system_prompt, user_prompt, *args, **kwargs):
+                generator.llm_calls.append(user_prompt)
+                if generator.before_llm_call is not None:
+                    await generator.before_llm_call()
+                return await execute(system_prompt, user_prompt, *args, **kwargs)
+
+            generator.gpt_service._execute_api_call = counting_execute
+            return generator
+
+        return build
+
+    def test_auto_batching_follows_batch_plan(self, generator_factory):
+        """Without use_batching, teams are batched only when the plan needs several calls."""
+        tight = generator_factory(input_budget=2000)
+        roomy = generator_factory(input_budget=200000)
+
+        batched = asyncio.run(tight.generate_picklist(254, "first", PRIORITIES, use_batching=None))
+        single = asyncio.run(roomy.generate_picklist(254, "first", PRIORITIES, use_batching=None))
+
+        assert batched["status"] == "success"
+        assert batched["batch_plan"]["batch_count"] > 1
+        assert len(tight.llm_calls) > 1
+        assert single["status"] == "success"
+        assert "batch_plan" not in single
+        assert len(roomy.llm_calls) == 1
+        assert len(batched["picklist"]) == len(single["picklist"]) == 40
+
+    def test_explicit_batching_choice_is_honored(self, generator_factory):
+        """An explicit use_batching overrides the plan in both directions."""
+        generator = generator_factory(input_budget=2000)
+        teams_data = generator.data_service.get_teams_for_analysis()
+        plan = generator.plan_batches(teams_data, 254, "first", PRIORITIES)
+
+        assert plan.batch_count > 1
+        assert generator._determine_processing_strategy(teams_data, None, plan)[0] is True
+        assert generator._determine_processing_strategy(teams_data, False, plan)[0] is False
+        single_plan = generator_factory(input_budget=200000).plan_batches(teams_data, 254, "first", PRIORITIES)
+        assert generator._determine_processing_strategy(teams_data, None, single_plan)[0] is False
+        assert generator._determine_processing_strategy(teams_data, True, single_plan)[0] is True
+
+    def test_single_processing_honors_rank_only(self, generator_factory):
+        """A rank-only run that fits one call asks for the order only, at rank-only output limits."""
+        generator = generator_factory(input_budget=200000)
+        limits = []
+        execute = generator.gpt_service._execute_api_call
+
+        async def recording_execute(system_prompt, user_prompt, on_entry=None, max_tokens=4000):
+            limits.append(max_tokens)
+            return await execute(system_prompt, user_prompt, on_entry, max_tokens)
+
+        generator.gpt_service._execute_api_call = recording_execute
+
+        result = asyncio.run(generator.generate_picklist(
+            254, "first", PRIORITIES, use_batching=None, rank_only=True
+        ))
+
+        assert result["status"] == "success"
+        assert result["processing_strategy"] == "single_with_index_mapping"
+        assert limits == [generator.gpt_service.rank_only_max_tokens(40)]
+        assert '"r"' in generator.llm_calls[0]
+        assert len(result["picklist"]) == 40
+        assert all(team.get("reasoning_pending") for team in result["picklist"])
+
+    def test_strategy_text_is_part_of_the_cache_key(self, generator_factory):
+        """Requests that differ only in strategy text never share a cached picklist."""
+        generator = generator_factory(input_budget=200000)
+
+        for strategy in ("Prioritize defense", "Prioritize scoring", "Prioritize defense"):
+            result = asyncio.run(generator.generate_picklist(
+                254, "first", PRIORITIES, strategy_interpretation=strategy
+            ))
+            assert result["status"] == "success"
+
+        assert len(generator.llm_calls) == 2
+
+    def test_concurrent_identical_requests_share_one_run(self, generator_factory):
+        """A second identical request joins the running generation instead of calling GPT again."""
+        first, second = generator_factory(), generator_factory()
+
+        async def slow_call():
+            await asyncio.sleep(0.05)
+
+        first.before_llm_call = slow_call
+        second.before_llm_call = slow_call
+
+        async def run():
+            return await asyncio.gather(
+                first.generate_picklist(254, "first", PRIORITIES, cache_key="shared"),
+                second.generate_picklist(254, "first", PRIORITIES, cache_key="shared"),
+            )
+
+        first_result, second_result = asyncio.run(run())
+
+        assert first_result["status"] == "success"
+        assert second_result is first_result
+        assert len(first.llm_calls) + len(second.llm_calls) == 1
+        assert first.__class__._inflight_generations == {}
+
+    def test_cancelled_owner_hands_generation_to_waiter(self, generator_factory):
+        """When the request running a generation is cancelled, a waiting request takes over."""
+        owner, waiter = generator_factory(), generator_factory()
+
+        async def run():
+            call_started = asyncio.Event()
+
+            async def hang():
+                call_started.set()
+                await asyncio.Event().wait()
+
+            owner.before_llm_call = hang
+            owner_task = asyncio.ensure_future(
+                owner.generate_picklist(254, "first", PRIORITIES, cache_key="shared")
+            )
+            await call_started.wait()
+            waiter_task = asyncio.ensure_future(
+                waiter.generate_picklist(254, "first", PRIORITIES, cache_key="shared")
+            )
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+            owner_task.cancel()
+            result = await waiter_task
+            await asyncio.gather(owner_task, return_exceptions=True)
+            return owner_task, result
+
+        owner_task, result = asyncio.run(run())
+
+        assert owner_task.cancelled()
+        assert result["status"] == "success"
+        assert len(result["picklist"]) == 40
+        assert len(owner.llm_calls) == 1
+        assert len(waiter.llm_calls) == 1
+        assert owner.__class__._inflight_generations == {}
+
+    @staticmethod
+    def record_batches(generator, fail_team=None):
+        """Wrap analyze_teams to record each batch's teams and result, failing the batch holding fail_team."""
+        batches = []
+        analyze_teams = generator.gpt_service.analyze_teams
+
+        async def recording_analyze_teams(*args, **kwargs):
+            team_numbers = [t["team_number"] for t in kwargs["teams_data"]]
+            if fail_team in team_numbers:
+                result = {"status": "error", "error": "Rate limit exceeded"}
+            else:
+                result = await analyze_teams(*args, **kwargs)
+            batches.append((team_numbers, result))
+            return result
+
+        generator.gpt_service.analyze_teams = recording_analyze_teams
+        return batches
+
+    @staticmethod
+    async def failing_analyze_teams(*args, **kwargs):
+        return {"status": "error", "error": "Rate limit exceeded"}
+
+    def test_parallel_batches_share_calibrated_anchors(self, generator_factory):
+        """Every parallel batch ranks the same local-ranking anchors, scored by their average."""
+        generator = generator_factory(input_budget=2000)
+        batches = self.record_batches(generator)
+
+        result = asyncio.run(generator.generate_picklist(
+            254, "first", PRIORITIES, use_batching=True, parallel_batches=True, final_rerank=False
+        ))
+
+        assert result["status"] == "success"
+        anchors = result["anchor_teams"]
+        assert len(anchors) == 3
+        assert len(batches) == result["batch_plan"]["batch_count"] > 1
+        assert all(set(anchors) <= set(team_numbers) for team_numbers, _ in batches)
+
+        ranked = [entry["team_number"] for entry in result["picklist"]]
+        assert sorted(ranked) == list(range(1000, 1040))
+        scores = {entry["team_number"]: entry["score"] for entry in result["picklist"]}
+        for anchor in anchors:
+            batch_scores = [
+                entry["score"] for _, batch_result in batches
+                for entry in batch_result["picklist"] if entry["team_number"] == anchor
+            ]
+            assert len(batch_scores) == len(batches)
+            assert scores[anchor] == round(sum(batch_scores) / len(batch_scores), 2)
+        assert "missing_team_numbers" not in result
+
+    def test_failed_parallel_batch_reports_missing_teams(self, generator_factory):
+        """Teams of a failed batch are reported as missing instead of silently dropped."""
+        generator = generator_factory(input_budget=2000)
+        batches = self.record_batches(generator, fail_team=1039)
+
+        result = asyncio.run(generator.generate_picklist(
+            254, "first", PRIORITIES, use_batching=True, parallel_batches=True, final_rerank=False
+        ))
+
+        failed = [i + 1 for i, (_, batch_result) in enumerate(batches) if batch_result["status"] == "error"]
+        assert result["status"] == "success"
+        assert len(result["failed_batches"]) == len(failed) == 1
+        failed_teams = next(team_numbers for team_numbers, r in batches if r["status"] == "error")
+        expected_missing = sorted(set(failed_teams) - set(result["anchor_teams"]))
+        assert result["missing_team_numbers"] == expected_missing
+        ranked = {entry["team_number"] for entry in result["picklist"]}
+        assert ranked | set(expected_missing) == set(range(1000, 1040))
+
+    @pytest.mark.parametrize("parallel_batches", [True, False])
+    def test_all_batches_failing_is_an_error(self, generator_factory, parallel_batches):
+        """A batched run with no successful batch fails instead of returning an empty picklist."""
+        generator = generator_factory(input_budget=2000)
+        generator.gpt_service.analyze_teams = self.failing_analyze_teams
+
+        result = asyncio.run(generator.generate_picklist(
+            254, "first", PRIORITIES, use_batching=True, parallel_batches=parallel_batches
+        ))
+
+        assert result["status"] == "error"
+        assert "batches failed: Rate limit exceeded" in result["error"]
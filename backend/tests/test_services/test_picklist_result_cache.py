@@ -0,0 +1,75 @@
+# backend/tests/test_services/test_picklist_result_cache.py
+
+import os
+import time
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.picklist_result_cache import PicklistResultCache
+
+
+class TestPicklistResultCache:
+    """Test suite for the bounded, persistent picklist result cache."""
+
+    RESULT = {"status": "success", "picklist": [{"team_number": 254, "score": 9.5}]}
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        return str(tmp_path / "picklists")
+
+    def test_result_survives_restart(self, cache_dir):
+        """Successful results are read back by a fresh cache instance."""
+        PicklistResultCache(cache_dir=cache_dir).put_result("k", self.RESULT, "v1", "/data/a.json")
+
+        restarted = PicklistResultCache(cache_dir=cache_dir)
+
+        assert restarted.get_result("k", "v1") == self.RESULT
+        assert restarted.get_stats()["disk_loads"] == 1
+
+    def test_stale_version_is_a_miss(self, cache_dir):
+        """Results produced from another dataset version are discarded."""
+        cache = PicklistResultCache(cache_dir=cache_dir)
+        cache.put_result("k", self.RESULT, "v1")
+
+        assert cache.get_result("k", "v2") is None
+        assert cache.get_result("k", "v1") is None
+        assert cache.get_stats()["stale"] == 1
+
+    def test_errors_are_not_persisted(self, cache_dir):
+        """Only successful results are written to disk."""
+        PicklistResultCache(cache_dir=cache_dir).put_result("k", {"status": "error"}, "v1")
+
+        assert PicklistResultCache(cache_dir=cache_dir).get_result("k", "v1") is None
+
+    def test_lru_entry_limit(self):
+        """The least recently used entry is evicted past the entry limit."""
+        cache = PicklistResultCache(cache_dir=None, max_entries=2)
+        cache["a"] = 1.0
+        cache["b"] = 2.0
+        assert cache["a"] == 1.0
+        cache["c"] = 3.0
+
+        assert "b" not in cache
+        assert set(cache) == {"a", "c"}
+
+    def test_ttl(self):
+        """Entries older than the TTL are dropped on access."""
+        cache = PicklistResultCache(cache_dir=None, ttl_seconds=60)
+        cache.put_result("k", self.RESULT, "v1")
+        cache._entries["k"].stored_at = time.time() - 120
+
+        assert cache.get_result("k", "v1") is None
+        assert len(cache) == 0
+
+    def test_invalidate_dataset(self, cache_dir):
+        """Invalidating a dataset drops its results in memory and on disk only."""
+        cache = PicklistResultCache(cache_dir=cache_dir)
+        cache.put_result("a", self.RESULT, "v1", "/data/a.json")
+        cache.put_result("b", self.RESULT, "v1", "/data/b.json")
+
+        assert cache.invalidate_dataset("/data/a.json") == 1
+        restarted = PicklistResultCache(cache_dir=cache_dir)
+        assert restarted.get_result("a", "v1") is None
+        assert restarted.get_result("b", "v1") == self.RESULT
@@ -0,0 +1,146 @@
+# backend/tests/test_services/test_prompt_fragment_cache.py
+
+import os
+import re
+
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.prompt_fragment_cache import PromptFragment, PromptFragmentCache, priorities_hash
+
+
+class TestPromptFragmentCache:
+    """Test suite for the per-team prompt fragment cache."""
+
+    def test_get_or_create_builds_once(self):
+        """A fragment is rendered on the first lookup and reused afterwards."""
+        cache = PromptFragmentCache(max_entries=10)
+        builds = []
+
+        def build():
+            builds.append(1)
+            return PromptFragment('{"team_number": 254}', 6)
+
+        key = ("v1", 254, priorities_hash([{"id": "auto", "weight": 2.0}]), "json")
+        first = cache.get_or_create(key, build)
+        second = cache.get_or_create(key, build)
+
+        assert first is second
+        assert len(builds) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_least_recently_used_evicted(self):
+        """Entries beyond max_entries are dropped oldest-use first."""
+        cache = PromptFragmentCache(max_entries=2)
+        cache.put("a", PromptFragment("a", 1))
+        cache.put("b", PromptFragment("b", 1))
+        cache.get("a")
+        cache.put("c", PromptFragment("c", 1))
+
+        assert cache.get("b") is None
+        assert cache.get("a").text == "a"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_priorities_hash_tracks_weights(self):
+        """Different weights give different scopes; identical priorities share one."""
+        base = [{"id": "auto", "weight": 2.0}, {"id": "climb", "weight": 1.0}]
+
+        assert priorities_hash(base) == priorities_hash([dict(p) for p in base])
+        assert priorities_hash(base) != priorities_hash([{"id": "auto", "weight": 1.0}, base[1]])
+
+
+class FakeEncoder:
+    """Offline stand-in for a tiktoken encoding: one token per word or symbol."""
+
+    def encode(self, text):
+        return re.findall(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]", text)
+
+
+class TestPromptFragmentsInPrompts:
+    """Prompts assembled from cached fragments match freshly rendered ones."""
+
+    @pytest.fixture
+    def service_factory(self, monkeypatch):
+        from app.services import picklist_gpt_service as gpt_module
+        from app.services.llm_provider import LocalStubProvider
+
+        monkeypatch.setattr(gpt_module.tiktoken, "encoding_for_model", lambda model: FakeEncoder())
+        monkeypatch.setattr(gpt_module, "create_llm_client", lambda: LocalStubProvider())
+        monkeypatch.setattr(gpt_module, "prompt_fragment_cache", PromptFragmentCache(max_entries=1000))
+
+        def build(fragment_version=None):
+            service = gpt_module.PicklistGPTService()
+            service.fragment_version = fragment_version
+            return service
+
+        return build
+
+    @pytest.fixture
+    def teams(self):
+        return [
+            {
+                "team_number": 1000 + n,
+                "nickname": f"Team {n}",
+                "metrics": {"auto_points": (n * 7) % 13 + 0.5, "teleop_points": (n * 5) % 11, "climb": n % 2 == 0},
+                "text_data": {"scout_comments": "Good driver. Missed climb once. Strong intake"},
+            }
+            for n in range(24)
+        ]
+
+    @pytest.mark.parametrize("prompt_encoding", ["json", "table"])
+    def test_prompt_identical_with_and_without_cache(self, service_factory, teams, prompt_encoding):
+        """Batches, a repeated batch and an all-teams rerank render byte-identically."""
+        priorities = [{"id": "auto_points", "weight": 2.0}, {"id": "teleop_points", "weight": 1.0}]
+        cached, uncached = service_factory("v1:config"), service_factory()
+        batches = [teams[:12], teams[12:], teams[:12], teams]
+
+        for service in (cached, uncached):
+            service.reset_request_state()
+        for batch in batches:
+            numbers = [team["team_number"] for team in batch]
+            with_cache = cached.create_user_prompt(
+                254, "first", priorities, batch, team_numbers=numbers, prompt_encoding=prompt_encoding
+            )
+            without_cache = uncached.create_user_prompt(
+                254, "first", priorities, batch, team_numbers=numbers, prompt_encoding=prompt_encoding
+            )
+            assert with_cache == without_cache
+
+    def test_fresh_service_without_numeric_metrics(self, service_factory):
+        """A new instance can build prompts before any request state was reset."""
+        service = service_factory("v1:config")
+        teams = [{"team_number": 1, "nickname": "A", "metrics": {"role": "defense"}}]
+
+        prompt, index_map = service.create_user_prompt(254, "first", [], teams)
+
+        assert index_map == {1: 1}
+        assert '"role": "defense"' in prompt
+
+    @pytest.mark.parametrize("rank_only", [False, True])
+    def test_reference_prompt_keeps_encoding_and_response_shape(self, service_factory, teams, rank_only):
+        """Later sequential batches use the request's encoding and response shape."""
+        service = service_factory("v1:config")
+        priorities = [{"id": "auto_points", "weight": 2.0}]
+        batch = teams[12:]
+        index_map = {i: team["team_number"] for i, team in enumerate(batch, 1)}
+        reference = [{"team_number": 1000, "nickname": "Team 0", "score": 9.123, "reasoning": "best"}]
+
+        prompt = service.create_user_prompt_with_reference_teams(
+            254, "first", priorities, batch, reference,
+            team_index_map=index_map, rank_only=rank_only, prompt_encoding="table",
+        )
+        base_prompt, _ = service.create_user_prompt(
+            254, "first", priorities, batch, team_numbers=[team["team_number"] for team in batch],
+            rank_only=rank_only, prompt_encoding="table",
+        )
+
+        assert prompt.startswith('REFERENCE_TEAMS = [[1000, "Team 0", 9.12]]')
+        assert prompt.endswith(base_prompt)
+        assert "TEAM_TABLE" in prompt
+        assert ('{"r":[3,1,2...]}' in prompt) is rank_only
+        reference_block = prompt[: len(prompt) - len(base_prompt)]
+        assert service.count_tokens(prompt) == (
+            service.count_tokens(base_prompt) + len(FakeEncoder().encode(reference_block))
+        )
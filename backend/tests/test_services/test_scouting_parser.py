@@ -0,0 +1,94 @@
+# backend/tests/test_services/test_scouting_parser.py
+
+import os
+import pytest
+from unittest.mock import patch
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.scouting_parser import (
+    CompiledScoutingParser,
+    coerce_cell_value,
+    compile_scouting_parser,
+)
+
+
+class TestCompiledScoutingParser:
+    """Test suite for the precompiled Match Scouting row parser."""
+
+    @pytest.fixture
+    def match_mapping(self):
+        """Flat header -> category mapping like schema_2025.json."""
+        return {
+            "Qual Number": "match_number",
+            "Team Number": "team_number",
+            "Auto Score": "auto",
+            "Notes": "ignore",
+        }
+
+    @pytest.fixture
+    def headers(self):
+        return ["Timestamp", "Qual Number", "Team Number", "auto score", "Notes"]
+
+    def test_coerce_cell_value(self):
+        """Numeric strings are converted, everything else is stripped."""
+        assert coerce_cell_value(" 12 ") == 12
+        assert coerce_cell_value("2.5") == 2.5
+        assert coerce_cell_value("1.2.3") == "1.2.3"
+        assert coerce_cell_value(" text ") == "text"
+        assert coerce_cell_value(None) is None
+        assert coerce_cell_value(" 12", strip=False) == " 12"
+        assert coerce_cell_value("12", strip=False) == 12
+
+    def test_plan_skips_ignored_and_unmapped_columns(self, headers, match_mapping):
+        """Only mapped columns end up in the plan, case-insensitive headers included."""
+        parser = CompiledScoutingParser(headers, match_mapping)
+
+        assert [step[0] for step in parser.steps] == [1, 2, 3]
+        assert parser.steps[2] == (3, "auto", "auto")
+
+    def test_parse_row(self, headers, match_mapping):
+        """Rows are parsed with match/qual aliases and a cleaned team number."""
+        parser = CompiledScoutingParser(headers, match_mapping)
+
+        parsed = parser.parse(["t", "7", "🤖254", "12", "note"])
+
+        assert parsed == {"match_number": 7, "qual_number": 7, "team_number": 254, "auto": 12}
+
+    def test_parse_row_without_team_number(self, headers, match_mapping):
+        """Rows without a team number are dropped."""
+        parser = CompiledScoutingParser(headers, match_mapping)
+
+        assert parser.parse(["t", "7", ""]) == {}
+
+    def test_header_and_field_labels(self, headers, match_mapping):
+        """Header labels rename mapped fields and field metadata labels are appended."""
+        field_metadata = {
+            "Notes": {"category": "ignore", "label_mapping": {"label": "driver_notes"}},
+            "Timestamp": {"category": "ignore"},
+        }
+        parser = CompiledScoutingParser(
+            headers,
+            match_mapping,
+            header_labels={"Auto Score": "auto_points"},
+            field_metadata=field_metadata,
+        )
+
+        parsed = parser.parse(["t", "7", "254", "12", "fast"])
+
+        assert parsed["auto_points"] == 12
+        assert parsed["auto"] == 12
+        assert parsed["driver_notes"] == "fast"
+        assert "Timestamp" not in parsed
+
+    def test_compile_uses_schema_mapping(self, headers, match_mapping):
+        """compile_scouting_parser reads the loaded schema mapping once."""
+        with patch(
+            "app.services.scouting_parser.get_match_mapping", return_value=match_mapping
+        ), patch("app.services.scouting_parser._load_header_labels", return_value={}):
+            parser = compile_scouting_parser(headers)
+
+        assert parser.parse(["t", "3", "118"])["team_number"] == 118
+        # The shared schema mapping must not be mutated by compilation
+        assert "Team Number" in match_mapping and len(match_mapping) == 4
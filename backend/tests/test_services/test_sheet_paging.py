@@ -0,0 +1,229 @@
+# backend/tests/test_services/test_sheet_paging.py
+
+import asyncio
+import os
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.sheet_metadata_service import SheetMetadataService
+from app.services.sheet_reader_service import SheetReaderService
+from app.services.unified_event_data_service import TabIngest
+
+
+class FakeSheetsApi:
+    """Minimal spreadsheets().get() and values().batchGet() chains over in-memory tabs."""
+
+    def __init__(self, tabs, requests, known_size=True):
+        self.tabs = tabs
+        self.requests = requests
+        self.known_size = known_size
+        self._ranges = None
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId):
+        self._ranges = None
+        return self
+
+    def batchGet(self, spreadsheetId, ranges):
+        self.requests.append(list(ranges))
+        self._ranges = ranges
+        return self
+
+    def execute(self):
+        if self._ranges is None:
+            return {"sheets": [self._sheet_metadata(name, rows) for name, rows in self.tabs.items()]}
+
+        value_ranges = []
+        for a1_range in self._ranges:
+            tab_name, cells = a1_range.split("!", 1)
+            start, end = cells.split(":")
+            first_row = int(start.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+            last_row = int(end.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+            rows = self.tabs[tab_name][first_row - 1:last_row]
+            # Like the real API, trailing blank rows are omitted and an all-blank range has no values
+            while rows and not rows[-1]:
+                rows = rows[:-1]
+            value_ranges.append({"range": a1_range, "values": rows} if rows else {"range": a1_range})
+        return {"valueRanges": value_ranges}
+
+    def _sheet_metadata(self, name, rows):
+        properties = {"title": name}
+        if self.known_size:
+            properties["gridProperties"] = {"rowCount": len(rows), "columnCount": 3}
+        return {"properties": properties}
+
+
+class FakeGateway:
+    """Sheets gateway over FakeSheetsApi that can fail chosen calls."""
+
+    def __init__(self, tabs, known_size=True, fail_on=()):
+        self.tabs = tabs
+        self.known_size = known_size
+        self.fail_on = set(fail_on)
+        self.requests = []
+        self.metadata_calls = 0
+
+    async def call(self, func, label):
+        if label == "spreadsheets.get":
+            self.metadata_calls += 1
+        if label in self.fail_on:
+            raise RuntimeError("quota exceeded")
+        return func(FakeSheetsApi(self.tabs, self.requests, self.known_size))
+
+
+class RecordingIngest(TabIngest):
+    """Ingest that keeps each data row with the row index it was parsed at."""
+
+    def _compile(self, headers):
+        return [headers]
+
+    def _parse_row(self, index, row):
+        return [{"index": index, "row": row}] if row else []
+
+
+def make_reader(gateway):
+    return SheetReaderService(None, SheetMetadataService(None, gateway=gateway), gateway)
+
+
+def collect_pages(reader, tab_names, page_size):
+    async def collect():
+        return [
+            page
+            async for page in reader.iter_sheet_pages(tab_names, spreadsheet_id="sheet", page_size=page_size)
+        ]
+
+    return asyncio.run(collect())
+
+
+def read_pages(tabs, tab_names, page_size, known_size=True, fail_on=()):
+    gateway = FakeGateway(tabs, known_size, fail_on)
+    return collect_pages(make_reader(gateway), tab_names, page_size), gateway
+
+
+class TestIterSheetPages:
+    """Test suite for streaming sheet tabs page by page."""
+
+    @pytest.fixture
+    def tabs(self):
+        return {
+            "Scouting": [
+                ["Team", "Match", "Score"],
+                ["254", "1", "10"],
+                [],
+                [],
+                ["1678", "2", "12"],
+            ],
+            "SuperScouting": [
+                ["Team", "Notes"],
+                ["118", "fast"],
+            ],
+        }
+
+    def test_header_on_first_page_and_blank_rows_restored(self, tabs):
+        """Pages concatenate back to the tab, header first, blank rows kept in place."""
+        pages, gateway = read_pages(tabs, ["Scouting", "SuperScouting"], page_size=3)
+
+        scouting = [row for index, rows in pages if index == 0 for row in rows]
+        superscouting = [row for index, rows in pages if index == 1 for row in rows]
+
+        assert pages[0] == (0, [["Team", "Match", "Score"], ["254", "1", "10"]])
+        assert scouting == tabs["Scouting"]
+        assert superscouting == tabs["SuperScouting"]
+        # Both tabs share one batchGet per round; SuperScouting finishes after the first
+        assert gateway.requests == [
+            ["Scouting!A1:C3", "SuperScouting!A1:C2"],
+            ["Scouting!A4:C5"],
+        ]
+
+    def test_blank_page_inside_grid_does_not_end_tab(self):
+        """A fully blank page is skipped over while the grid still has rows."""
+        tabs = {"Scouting": [["Team"], ["254"], [], [], [], ["1678"]]}
+
+        pages, gateway = read_pages(tabs, ["Scouting"], page_size=2)
+
+        assert [row for _, rows in pages for row in rows] == tabs["Scouting"]
+        assert len(gateway.requests) == 3
+
+    def test_blank_page_ends_tab_without_grid_size(self):
+        """Without grid bounds the first blank page ends the tab."""
+        tabs = {"Scouting": [["Team"], ["254"], [], [], [], ["1678"]]}
+
+        pages, gateway = read_pages(tabs, ["Scouting"], page_size=2, known_size=False)
+
+        assert pages == [(0, [["Team"], ["254"]])]
+        assert len(gateway.requests) == 2
+
+    def test_rows_added_after_cached_metadata_are_read(self, tabs):
+        """Grid sizes are fetched fresh, so a tab that grew since the last read is read in full."""
+        gateway = FakeGateway(tabs)
+        reader = make_reader(gateway)
+        collect_pages(reader, ["Scouting"], page_size=3)
+
+        tabs["Scouting"].append(["118", "3", "8"])
+        pages = collect_pages(reader, ["Scouting"], page_size=3)
+
+        assert [row for _, rows in pages for row in rows] == tabs["Scouting"]
+        assert gateway.metadata_calls == 2
+
+    def test_first_page_error_raises(self, tabs):
+        """A failed first page is an error, not an empty tab."""
+        with pytest.raises(RuntimeError, match="quota exceeded"):
+            read_pages(tabs, ["Scouting"], page_size=3, fail_on=["values.batchGet"])
+
+    def test_metadata_error_raises(self, tabs):
+        """A failed metadata request is an error, not a spreadsheet without tabs."""
+        gateway = FakeGateway(tabs, fail_on=["spreadsheets.get"])
+
+        with pytest.raises(RuntimeError, match="quota exceeded"):
+            collect_pages(make_reader(gateway), ["Scouting"], page_size=3)
+        assert gateway.requests == []
+
+    def test_spreadsheet_without_tabs_raises(self):
+        """A requested tab that cannot be found is an error, not an empty tab."""
+        with pytest.raises(ValueError, match="Scouting"):
+            read_pages({}, ["Scouting"], page_size=3)
+
+
+class TestTabIngest:
+    """Test suite for page-by-page tab ingestion."""
+
+    def test_tab_ingest_is_abstract(self):
+        """The base ingest cannot be used without a parser."""
+        with pytest.raises(TypeError):
+            TabIngest("Scouting", {})
+
+    def test_paged_ingest_matches_single_page(self):
+        """Feeding pages gives the same headers, row indexes and records as one page."""
+        rows = [["Team", "Score"], ["254", "10"], [], ["1678", "12"], [], [], ["118", "8"]]
+
+        whole = RecordingIngest("Scouting", {})
+        whole.feed(rows)
+
+        paged = RecordingIngest("Scouting", {})
+        for start in range(0, len(rows), 2):
+            paged.feed(rows[start:start + 2])
+
+        assert paged.headers == ["Team", "Score"]
+        assert paged.row_count == whole.row_count == 6
+        assert paged.parsed == whole.parsed
+        assert [record["index"] for record in paged.parsed] == [0, 2, 5]
+
+    def test_paged_ingest_from_sheet_pages(self):
+        """Rows streamed by iter_sheet_pages keep their positions through ingestion."""
+        tabs = {"Scouting": [["Team"], ["254"], [], [], [], ["1678"], ["118"]]}
+        pages, _ = read_pages(tabs, ["Scouting"], page_size=2)
+
+        ingest = RecordingIngest("Scouting", {})
+        for _, page_rows in pages:
+            ingest.feed(page_rows)
+        state = ingest.finish()
+
+        assert [(r["index"], r["row"]) for r in ingest.parsed] == [(0, ["254"]), (4, ["1678"]), (5, ["118"])]
+        assert state.to_dict()["watermark"] == 6
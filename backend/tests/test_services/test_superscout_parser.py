@@ -0,0 +1,169 @@
+# backend/tests/test_services/test_superscout_parser.py
+
+import os
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services import superscout_parser_enhanced as superscout_module
+from app.services.superscout_parser_enhanced import (
+    CompiledSuperscoutParser,
+    generate_auto_robot_groups,
+)
+from app.services.unified_event_data_service import SuperscoutingTabIngest, apply_label_mappings_to_raw_data
+
+FIELD_MAPPING = {
+    "Match Number": "match_number",
+    "Robot 1 Team": "team_number",
+    "Robot 2 Team": "team_number",
+    "Robot 3 Team": "team_number",
+    "Robot 1 Defense": "strategy",
+    "Robot 2 Defense": "strategy",
+    "Robot 3 Defense": "strategy",
+    "Robot 1 Notes": "strategy",
+    "Robot 2 Notes": "ignore",
+}
+
+HEADERS = [
+    "Timestamp",
+    "Match Number",
+    "Robot 1 Team",
+    "Robot 1 Defense",
+    "Robot 1 Notes",
+    "Robot 2 Team",
+    "Robot 2 Defense",
+    "Robot 2 Notes",
+    "Robot 3 Team",
+    "Robot 3 Defense",
+    "Robot 1 Defense",  # Duplicate header: the first column wins
+    "Driver Rating",
+]
+
+FIELD_METADATA = {
+    "Driver Rating": {"category": "strategy", "label_mapping": {"label": "driver_skill_rating"}},
+    "Robot 1 Notes": {"category": "strategy", "label_mapping": {"label": "robot_1_comments"}},
+    "Timestamp": {"category": "ignore"},
+}
+
+ROWS = [
+    ["t", "12", "254", "4", "fast cycles ", "118", "2.5", "quiet", "1678", "1.2.3", "9", " 5 "],
+    ["t", "13", " 971", "", "  ", "abc", "3", "x", "", "2"],  # Short row, padded text, bad team
+    ["t", "14", "", "1", "n", "", "", "", "", ""],  # No team numbers at all
+    ["t", "15.0", "2056", None, "notes", "604", "0", "", "973", "7", "1", "10"],
+]
+
+
+def legacy_parse_superscout_row(row, headers, field_mapping):
+    """The per-row superscouting parser as it was before compiled plans."""
+    robot_entries = []
+    auto_robot_groups = generate_auto_robot_groups(headers)
+
+    for robot_num in range(1, 4):
+        robot_label = f"robot_{robot_num}"
+        robot_data = {"field_types": {}}
+
+        for header in auto_robot_groups.get(robot_label, []):
+            if header not in field_mapping:
+                continue
+            mapped_field = field_mapping.get(header, "ignore")
+            if mapped_field == "ignore":
+                continue
+            try:
+                index = headers.index(header)
+                value = row[index] if index < len(row) else None
+                if value is not None and isinstance(value, str):
+                    try:
+                        if value.isdigit():
+                            value = int(value)
+                        elif value.replace(".", "", 1).isdigit() and value.count(".") < 2:
+                            value = float(value)
+                    except (ValueError, TypeError):
+                        pass
+                field_key = header.replace(" ", "_").lower()
+                robot_data[field_key] = value
+                robot_data["field_types"][field_key] = mapped_field
+                if mapped_field in ["team_number", "match_number"]:
+                    robot_data[mapped_field] = value
+            except ValueError:
+                continue
+
+        if "team_number" in robot_data and robot_data["team_number"] is not None:
+            try:
+                if isinstance(robot_data["team_number"], str):
+                    robot_data["team_number"] = int(robot_data["team_number"])
+            except ValueError:
+                pass
+            robot_data["robot_group"] = robot_label
+            robot_entries.append(robot_data)
+
+    return robot_entries
+
+
+def legacy_superscouting_records(rows, headers, field_mapping, field_metadata):
+    """The per-row superscouting loop of build_unified_dataset before compiled plans."""
+    records = []
+    for row in rows:
+        parsed_robots = legacy_parse_superscout_row(row, headers, field_mapping)
+        enhanced_fields = {}
+        if field_metadata:
+            enhanced_fields = apply_label_mappings_to_raw_data(row, headers, field_metadata)
+        for robot_data in parsed_robots:
+            if robot_data and enhanced_fields:
+                robot_data.update(enhanced_fields)
+            if "team_number" in robot_data and robot_data["team_number"]:
+                for key in ("match_number", "qual_number"):
+                    if key in robot_data and robot_data[key] is not None:
+                        try:
+                            robot_data[key] = int(robot_data[key])
+                        except (ValueError, TypeError):
+                            pass
+                records.append(robot_data)
+    return records
+
+
+class TestCompiledSuperscoutParser:
+    """Test suite for the precompiled SuperScouting row parser."""
+
+    @pytest.mark.parametrize("row", ROWS)
+    def test_matches_legacy_parser(self, row):
+        """Compiled plans give the same robot entries as the per-row parser."""
+        parser = CompiledSuperscoutParser(HEADERS, FIELD_MAPPING, generate_auto_robot_groups(HEADERS))
+
+        assert parser.parse(row) == legacy_parse_superscout_row(row, HEADERS, FIELD_MAPPING)
+
+    @pytest.mark.parametrize("row", ROWS)
+    def test_label_mapping_matches_legacy(self, row):
+        """Label mappings folded into the plan match applying them to the raw row afterwards."""
+        parser = CompiledSuperscoutParser(
+            HEADERS, FIELD_MAPPING, generate_auto_robot_groups(HEADERS), FIELD_METADATA
+        )
+        expected = legacy_parse_superscout_row(row, HEADERS, FIELD_MAPPING)
+        enhanced = apply_label_mappings_to_raw_data(row, HEADERS, FIELD_METADATA)
+        for robot_data in expected:
+            robot_data.update(enhanced)
+
+        assert parser.parse(row) == expected
+
+    def test_robot_fields_are_not_stripped(self):
+        """Robot fields keep their spacing while label-mapped copies are stripped."""
+        parser = CompiledSuperscoutParser(
+            HEADERS, FIELD_MAPPING, generate_auto_robot_groups(HEADERS), FIELD_METADATA
+        )
+
+        first_robot = parser.parse(ROWS[0])[0]
+
+        assert first_robot["robot_1_notes"] == "fast cycles "
+        assert first_robot["robot_1_comments"] == "fast cycles"
+        assert first_robot["driver_skill_rating"] == 5
+
+    def test_tab_ingest_matches_legacy_loop(self, monkeypatch):
+        """Paged tab ingestion gives the same records as the old per-row build loop."""
+        monkeypatch.setattr(superscout_module, "FIELD_MAPPING", FIELD_MAPPING)
+        ingest = SuperscoutingTabIngest("SuperScouting", FIELD_METADATA)
+
+        ingest.feed([HEADERS] + ROWS[:2])
+        ingest.feed(ROWS[2:])
+
+        assert ingest.parsed == legacy_superscouting_records(ROWS, HEADERS, FIELD_MAPPING, FIELD_METADATA)
+        assert ingest.row_count == len(ROWS)
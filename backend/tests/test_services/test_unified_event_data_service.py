@@ -0,0 +1,211 @@
+# backend/tests/test_services/test_unified_event_data_service.py
+
+import asyncio
+import json
+import os
+import pytest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services import unified_event_data_service as unified_module
+from app.services.unified_event_data_service import TabRowState, build_unified_dataset
+
+HEADERS = ["Team Number", "Match Number", "Auto"]
+MATCH_MAPPING = {"Team Number": "team_number", "Match Number": "match_number", "Auto": "auto_points"}
+
+
+class TestTabRowState:
+    """Test suite for per-tab row watermarks and hashes."""
+
+    def test_unchanged_rows_are_reused(self):
+        """Rows with the same content at the same position return their previous records."""
+        first = TabRowState("Scouting", [HEADERS])
+        row = ["254", "1", "7"]
+        first.store(TabRowState.hash_row(row), [{"team_number": 254}])
+
+        second = TabRowState("Scouting", [HEADERS], first.to_dict())
+
+        assert second.lookup(0, TabRowState.hash_row(row)) == [{"team_number": 254}]
+        assert second.reused_count == 1
+        assert second.to_dict()["watermark"] == 1
+
+    def test_changed_or_new_rows_miss(self):
+        """A changed row or a row past the previous watermark is parsed again."""
+        first = TabRowState("Scouting", [HEADERS])
+        first.store(TabRowState.hash_row(["254", "1", "7"]), [{"team_number": 254}])
+
+        second = TabRowState("Scouting", [HEADERS], first.to_dict())
+
+        assert second.lookup(0, TabRowState.hash_row(["254", "1", "9"])) is None
+        assert second.lookup(1, TabRowState.hash_row(["118", "1", "3"])) is None
+        assert second.reused_count == 0
+
+    @pytest.mark.parametrize("tab_name, signature", [("Scouting", [["Team", "Auto"]]), ("Other", [HEADERS])])
+    def test_signature_or_tab_change_discards_rows(self, tab_name, signature):
+        """New headers, mappings or another tab invalidate every previous row."""
+        first = TabRowState("Scouting", [HEADERS])
+        row = ["254", "1", "7"]
+        first.store(TabRowState.hash_row(row), [{"team_number": 254}])
+
+        second = TabRowState(tab_name, signature, first.to_dict())
+
+        assert second.previous_rows == []
+        assert second.lookup(0, TabRowState.hash_row(row)) is None
+
+
+class TestIncrementalBuild:
+    """Test suite for incremental build_unified_dataset runs."""
+
+    @pytest.fixture
+    def sheet(self):
+        return {"Scouting": [HEADERS, ["254", "1", "7"], ["118", "1", "3"], ["254", "2", "9"]]}
+
+    @pytest.fixture
+    def environment(self, monkeypatch, tmp_path, sheet):
+        from app.database import db as database
+        from app.services import scouting_parser, sheet_config_service, sheets_service
+
+        calls = {"parsed_rows": 0, "event_teams": 0, "rankings_refreshed": 0}
+
+        async def get_all_sheet_names(spreadsheet_id=None, db=None):
+            return {"status": "success", "sheet_names": list(sheet)}
+
+        async def iter_sheet_pages(tab_names, spreadsheet_id=None, db=None, page_size=None):
+            for index, tab_name in enumerate(tab_names):
+                if tab_name in sheet:
+                    yield index, [list(row) for row in sheet[tab_name]]
+
+        async def get_event_teams(event_key):
+            calls["event_teams"] += 1
+            return [
+                {"team_number": 254, "nickname": "Cheesy Poofs", "city": None},
+                {"team_number": 118, "nickname": "Robonauts", "city": "Houston"},
+            ]
+
+        async def get_event_matches(event_key):
+            return [{"comp_level": "qm", "match_number": 1, "alliances": {"red": {"team_keys": ["frc254"]}}}]
+
+        rankings = {"rankings": [{"team_key": "frc254", "rank": 1, "dq": None}]}
+
+        async def get_event_rankings(event_key):
+            return rankings
+
+        async def refresh_event_rankings(event_key):
+            calls["rankings_refreshed"] += 1
+            return {"rankings": [{"team_key": "frc118", "rank": 1, "dq": None}]}
+
+        async def get_teams_epa(team_numbers, year, on_progress=None):
+            return {number: {"epa": number / 10, "district": None} for number in team_numbers}
+
+        def get_db_session():
+            yield None
+
+        async def get_active_configuration(db, event_key=None, year=None):
+            # No saved sheet configuration: the default tab names are read
+            return {"status": "error", "message": "No active configuration found"}
+
+        parse_row = unified_module.ScoutingTabIngest._parse_row
+
+        def counting_parse_row(self, index, row):
+            calls["parsed_rows"] += 1
+            return parse_row(self, index, row)
+
+        dataset_path = str(tmp_path / "unified_event_2099test.json")
+        monkeypatch.setattr(unified_module, "get_unified_dataset_path", lambda event_key: dataset_path)
+        monkeypatch.setattr(unified_module, "load_schemas", lambda year: None)
+        monkeypatch.setattr(unified_module, "load_field_metadata", lambda event_key=None, year=None: {})
+        monkeypatch.setattr(unified_module, "get_event_teams", get_event_teams)
+        monkeypatch.setattr(unified_module, "get_event_matches", get_event_matches)
+        monkeypatch.setattr(unified_module, "get_event_rankings", get_event_rankings)
+        monkeypatch.setattr(unified_module, "refresh_event_rankings", refresh_event_rankings)
+        monkeypatch.setattr(unified_module, "get_teams_epa", get_teams_epa)
+        monkeypatch.setattr(unified_module.ScoutingTabIngest, "_parse_row", counting_parse_row)
+        monkeypatch.setattr(database, "get_db_session", get_db_session)
+        monkeypatch.setattr(sheet_config_service, "get_active_configuration", get_active_configuration)
+        monkeypatch.setattr(sheets_service, "get_all_sheet_names", get_all_sheet_names)
+        monkeypatch.setattr(sheets_service, "iter_sheet_pages", iter_sheet_pages)
+        monkeypatch.setattr(scouting_parser, "get_match_mapping", lambda: MATCH_MAPPING)
+        monkeypatch.setattr(scouting_parser, "_load_header_labels", lambda: {})
+        return calls, dataset_path
+
+    @staticmethod
+    def build(incremental):
+        path = asyncio.run(build_unified_dataset("2099test", 2099, force_rebuild=True, incremental=incremental))
+        with open(path, "r", encoding="utf-8") as f:
+            dataset = json.load(f)
+        with open(unified_module.get_row_state_path("2099test"), "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return dataset, state
+
+    @staticmethod
+    def auto_points(dataset, team):
+        return [record["auto_points"] for record in dataset["teams"][team]["scouting_data"]]
+
+    def test_incremental_build_reuses_unchanged_rows(self, environment, sheet):
+        """Only changed and new rows are parsed; deleted rows drop out of the dataset."""
+        calls, _ = environment
+        full, state = self.build(incremental=True)  # No previous state: full build
+
+        assert calls["parsed_rows"] == 3
+        assert state["tabs"]["scouting"]["watermark"] == 3
+        assert self.auto_points(full, "254") == [7, 9]
+
+        sheet["Scouting"][2] = ["118", "1", "5"]  # changed
+        del sheet["Scouting"][3]  # deleted
+        sheet["Scouting"].append(["118", "2", "4"])  # new row at the deleted row's position
+        calls["parsed_rows"] = 0
+
+        incremental, state = self.build(incremental=True)
+
+        assert calls["parsed_rows"] == 2
+        assert state["tabs"]["scouting"]["watermark"] == 3
+        assert incremental["metadata"]["incremental"] is True
+        assert self.auto_points(incremental, "254") == [7]
+        assert self.auto_points(incremental, "118") == [5, 4]
+
+    def test_incremental_build_keeps_raw_event_context(self, environment):
+        """TBA and Statbotics data are reused unsanitized and rankings are refreshed."""
+        calls, _ = environment
+        self.build(incremental=False)
+
+        incremental, state = self.build(incremental=True)
+
+        assert calls["event_teams"] == 1
+        assert calls["rankings_refreshed"] == 1
+        context = state["event_context"]
+        assert context["event_teams"][0]["city"] is None
+        assert [254, {"epa": 25.4, "district": None}] in context["statbotics"]
+        assert incremental["teams"]["254"]["statbotics_info"] == {"epa": 25.4, "district": ""}
+        assert incremental["teams"]["118"]["ranking_info"]["rank"] == 1
+        assert incremental["teams"]["254"]["ranking_info"] == {}
+
+    def test_header_change_reparses_every_row(self, environment, sheet):
+        """A new header row changes the signature, so no previous row is reused."""
+        calls, _ = environment
+        self.build(incremental=False)
+        calls["parsed_rows"] = 0
+
+        sheet["Scouting"][0] = ["Team Number", "Match Number", "Auto", "Notes"]
+        _, state = self.build(incremental=True)
+
+        assert calls["parsed_rows"] == 3
+        assert state["tabs"]["scouting"]["watermark"] == 3
+
+    def test_state_without_event_context_fetches_it(self, environment):
+        """Row state from older builds without event context triggers a full TBA fetch."""
+        calls, _ = environment
+        self.build(incremental=False)
+        state_path = unified_module.get_row_state_path("2099test")
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        del state["event_context"]
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        calls["parsed_rows"] = 0
+
+        dataset, _ = self.build(incremental=True)
+
+        assert calls["event_teams"] == 2
+        assert calls["parsed_rows"] == 0
+        assert dataset["metadata"]["incremental"] is False